@@ -0,0 +1,95 @@
+"""Benchmark workflow startup latency for the worker's execution paths.
+
+Compares the time from handing off a claimed issue until the workflow code
+can run and report back:
+
+* subprocess: the default ``subprocess.run(cmd)`` path, launching
+  ``rouge-adw`` (or ``uv run rouge-adw``) as the worker does. ``--help`` is
+  passed so the CLI pays full interpreter startup and imports, then exits
+  without touching an issue.
+* warm pool: handing a no-op job to an idle runner of ``WarmRunnerPool``.
+  The pool is allowed to warm up between iterations, as it does while the
+  previous workflow runs; the one-off warm-up time is reported separately.
+
+Usage:
+    uv run python scripts/benchmark_worker_startup.py --iterations 20
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from rouge.worker.runner_pool import WarmRunnerPool
+
+
+def _noop_job(_issue_id: int, _adw_id: str, _workflow_type: str) -> bool:
+    """Stand-in workflow that returns immediately."""
+    return True
+
+
+def _adw_command() -> list[str]:
+    """Resolve the rouge-adw command the same way the worker does."""
+    if shutil.which("rouge-adw"):
+        return ["rouge-adw", "--help"]
+    if shutil.which("uv"):
+        return ["uv", "run", "rouge-adw", "--help"]
+    return [sys.executable, "-m", "rouge.adw.cli", "--help"]
+
+
+def bench_subprocess(iterations: int) -> list[float]:
+    """Time ``subprocess.run`` launches of rouge-adw."""
+    cmd = _adw_command()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_warm_pool(iterations: int) -> tuple[float, list[float]]:
+    """Time hand-offs to a warm runner; returns (initial warm-up, samples)."""
+    pool = WarmRunnerPool(1, job=_noop_job)
+    try:
+        start = time.perf_counter()
+        pool.start()
+        pool.wait_ready()
+        warm_up = time.perf_counter() - start
+
+        samples = []
+        for issue_id in range(1, iterations + 1):
+            pool.wait_ready()
+            start = time.perf_counter()
+            pool.submit(issue_id, f"bench{issue_id:03d}", "noop").wait()
+            samples.append(time.perf_counter() - start)
+        return warm_up, samples
+    finally:
+        pool.close()
+
+
+def _report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<12} median {statistics.median(samples) * 1000:8.1f} ms   "
+        f"p95 {p95 * 1000:8.1f} ms   mean {statistics.fmean(samples) * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10, help="launches per path")
+    args = parser.parse_args()
+
+    print(f"subprocess command: {' '.join(_adw_command())}")
+    _report("subprocess", bench_subprocess(args.iterations))
+    warm_up, samples = bench_warm_pool(args.iterations)
+    _report("warm pool", samples)
+    print(f"warm pool initial warm-up (off the claim path): {warm_up * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
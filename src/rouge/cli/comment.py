@@ -6,8 +6,21 @@ from typing import Optional
 
 import typer
 
-from rouge.core.database import fetch_comment, list_comments
-from rouge.core.models import Comment
+from rouge.cli.utils import echo_json_lines
+from rouge.core.database import (
+    DEFAULT_BLOB_BACKFILL_BATCH_SIZE,
+    DEFAULT_COMPACT_AFTER_DAYS,
+    DEFAULT_COMPACT_BATCH_SIZE,
+    compact_workflow_comments,
+    cursor_for,
+    externalize_artifact_comment_blobs,
+    fetch_comment,
+    iter_comments,
+    list_comments,
+    resolve_comment_blobs,
+)
+from rouge.core.models import Comment, CommentSummary
+from rouge.core.notifications.spool import CommentSpool, get_spool_dir
 
 app = typer.Typer(help="Comment management commands")
 
@@ -182,15 +195,31 @@ def list_command(
         10, "--limit", help="Maximum number of comments to return", show_default=True
     ),
     offset: int = typer.Option(0, "--offset", help="Number of comments to skip", show_default=True),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Stream every matching comment as JSON lines (ignores --limit)"
+    ),
+    cursor: Optional[str] = typer.Option(
+        None,
+        "--cursor",
+        help="Resume after this cursor; output is JSON lines",
+        callback=validate_string_option,
+    ),
 ) -> None:
     """List comments with optional filters and pagination.
 
     Fetches comments from the database ordered by creation date (newest first).
 
+    With --all or --cursor, comments are written as JSON lines, one comment
+    object per line with an extra "cursor" key. Pass a line's cursor back
+    with --cursor to continue after that comment; unlike --offset, this
+    stays fast however deep the listing goes.
+
     Examples:
         rouge comment list
         rouge comment list --issue-id 5
         rouge comment list --source agent --type plan --limit 5 --offset 10
+        rouge comment list --issue-id 5 --all
+        rouge comment list --cursor <cursor> --limit 100
     """
     validate_positive_int(issue_id, "--issue-id")
     if limit < 1:
@@ -199,14 +228,40 @@ def list_command(
     if offset < 0:
         typer.echo("Error: --offset must be at least 0", err=True)
         raise typer.Exit(1)
+    if offset and (all_pages or cursor is not None):
+        typer.echo("Error: --offset cannot be combined with --all or --cursor", err=True)
+        raise typer.Exit(1)
 
     try:
+        if all_pages or cursor is not None:
+            if all_pages:
+                pages = iter_comments(
+                    issue_id=issue_id, source=source, comment_type=comment_type, cursor=cursor
+                )
+            else:
+                pages = iter(
+                    list_comments(
+                        issue_id=issue_id,
+                        source=source,
+                        comment_type=comment_type,
+                        limit=limit,
+                        cursor=cursor,
+                    )
+                )
+            echo_json_lines(
+                {**comment.model_dump(mode="json"), "cursor": cursor_for(comment)}
+                for comment in pages
+            )
+            return
+
+        # The table only shows a preview, so skip the raw artifact payload
         comments = list_comments(
             issue_id=issue_id,
             source=source,
             comment_type=comment_type,
             limit=limit,
             offset=offset,
+            projection=CommentSummary,
         )
 
         if not comments:
@@ -268,7 +323,9 @@ def read_command(
     """
     validate_positive_int(comment_id, "comment_id")
     try:
-        comment = fetch_comment(comment_id)
+        # Large payload strings are stored once in artifact_blobs; fetch them
+        # only here, where the full payload is shown
+        comment = resolve_comment_blobs(fetch_comment(comment_id))
 
         if format == OutputFormat.JSON:
             # JSON format: output the comment as JSON
@@ -285,3 +342,117 @@ def read_command(
     except Exception as e:
         typer.echo(f"Unexpected error: {e}", err=True)
         raise typer.Exit(1)
+
+
+@app.command("flush")
+def flush_command() -> None:
+    """Insert comments spooled while Supabase was unreachable.
+
+    Failed comment inserts are kept in a local spool (``.rouge/spool/comments``
+    or ``ROUGE_COMMENT_SPOOL_DIR``). This replays the backlog in bulk; comments
+    that were already inserted are skipped, so it is safe to run repeatedly.
+    Workers also replay the spool while idle.
+
+    Exits with status 1 if comments are still spooled afterwards.
+
+    Examples:
+        rouge comment flush
+    """
+    try:
+        spool = CommentSpool(get_spool_dir())
+        replayed, remaining = spool.replay()
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(1)
+
+    if remaining:
+        typer.echo(
+            f"Replayed {replayed} comment(s); {remaining} still spooled in {spool.directory}",
+            err=True,
+        )
+        raise typer.Exit(1)
+    typer.echo(f"Replayed {replayed} comment(s)")
+
+
+@app.command("compact")
+def compact_command(
+    older_than_days: int = typer.Option(
+        DEFAULT_COMPACT_AFTER_DAYS,
+        "--older-than-days",
+        min=0,
+        help="Only compact issues completed or failed at least this many days ago",
+    ),
+    batch_size: int = typer.Option(
+        DEFAULT_COMPACT_BATCH_SIZE, "--batch-size", min=1, help="Issues compacted per transaction"
+    ),
+    max_batches: Optional[int] = typer.Option(
+        None, "--max-batches", min=1, help="Stop after this many batches (default: until done)"
+    ),
+) -> None:
+    """Collapse workflow progress comments of long-finished issues.
+
+    For each issue that completed or failed more than --older-than-days ago,
+    the per-step "workflow" progress comments of every run are replaced by a
+    single "workflow-summary" comment that keeps the per-step timings.
+    Artifact comments, pull request entries, and other comment types are
+    left intact. Issues are processed in small batches, each in its own
+    short transaction, so the job can run alongside workers.
+
+    Examples:
+        rouge comment compact
+        rouge comment compact --older-than-days 90 --batch-size 20
+    """
+    try:
+        result = compact_workflow_comments(
+            older_than_days, batch_size=batch_size, max_batches=max_batches
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(
+        f"Compacted {result.comments_removed} comment(s) on {result.issues} issue(s) "
+        f"in {result.batches} batch(es), reclaiming about {result.bytes_reclaimed} bytes"
+    )
+
+
+@app.command("externalize-blobs")
+def externalize_blobs_command(
+    batch_size: int = typer.Option(
+        DEFAULT_BLOB_BACKFILL_BATCH_SIZE,
+        "--batch-size",
+        min=1,
+        help="Comments rewritten per transaction",
+    ),
+    max_batches: Optional[int] = typer.Option(
+        None, "--max-batches", min=1, help="Stop after this many batches (default: until done)"
+    ),
+) -> None:
+    """Move large strings of existing artifact comments to artifact_blobs.
+
+    Artifact comments are deduplicated as they are inserted; this rewrites
+    the ones stored before that, so each large plan or implementation text
+    is kept once. Comments are processed in small batches, each in its own
+    short transaction, so the job can run alongside workers. Running it
+    again is safe.
+
+    Examples:
+        rouge comment externalize-blobs
+        rouge comment externalize-blobs --batch-size 50 --max-batches 10
+    """
+    try:
+        result = externalize_artifact_comment_blobs(batch_size=batch_size, max_batches=max_batches)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(
+        f"Rewrote {result.comments_rewritten} of {result.comments_scanned} artifact comment(s) "
+        f"in {result.batches} batch(es), reclaiming about {result.bytes_reclaimed} bytes"
+    )
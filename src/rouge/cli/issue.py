@@ -1,5 +1,6 @@
 """CLI commands for issue management."""
 
+import csv
 import json
 import logging
 from enum import Enum
@@ -9,15 +10,19 @@ from typing import Any, Optional
 import typer
 
 from rouge.cli.reset import reset
-from rouge.cli.utils import validate_issue_id
+from rouge.cli.utils import echo_json_lines, validate_issue_id
 from rouge.core.database import (
+    DEFAULT_BULK_CHUNK_SIZE,
     create_issue,
+    create_issues_bulk,
+    cursor_for,
     delete_issue,
     fetch_all_issues,
     fetch_issue,
+    iter_issues,
     update_issue,
 )
-from rouge.core.models import VALID_ISSUE_STATUSES
+from rouge.core.models import VALID_ISSUE_STATUSES, IssueSummary
 
 app = typer.Typer(help="Issue management commands")
 
@@ -71,6 +76,13 @@ class OutputFormat(str, Enum):
     JSON = "json"
 
 
+class ImportFormat(str, Enum):
+    """Input formats for import command."""
+
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
 def generate_title(description: Optional[str]) -> str:
     """Generate a short title from a description.
 
@@ -361,6 +373,13 @@ def create(
         help="Parent issue ID for patch issues (mutually exclusive with --branch for patch issues)",
         show_default=True,
     ),
+    priority: Optional[int] = typer.Option(
+        None,
+        "--priority",
+        "-p",
+        help="Claim priority from -100 to 100; higher is claimed first (default: 0)",
+        show_default=False,
+    ),
 ) -> None:
     """Create a new issue.
 
@@ -387,6 +406,7 @@ def create(
         rouge issue create --spec-file patch-spec.txt --title "Bug fix" \\
             --type patch --branch my-branch
         rouge issue create "Fix typo" --type patch --parent-issue-id 123
+        rouge issue create "Fix prod outage" --type patch --branch hotfix --priority 50
     """
     validate_new_args(
         description, spec_file, title, branch, assigned_to, parent_issue_id, issue_type
@@ -418,6 +438,7 @@ def create(
             issue_type=issue_type.value,
             branch=normalized_branch,
             assigned_to=normalized_assigned_to,
+            priority=priority,
         )
         typer.echo(f"{issue.id}")  # Output only the ID for scripting
 
@@ -432,6 +453,207 @@ def create(
         raise typer.Exit(1)
 
 
+def read_import_rows(
+    path: Path, file_format: ImportFormat
+) -> tuple[list[tuple[int, dict[str, Any]]], list[tuple[int, str]]]:
+    """Read issue rows from a JSON lines or CSV file.
+
+    JSON lines files hold one issue object per line; blank lines are skipped.
+    CSV files have a header row naming the fields, and empty cells count as
+    missing. Rows are identified by the line they start on.
+
+    Args:
+        path: File to read
+        file_format: Format of the file
+
+    Returns:
+        A tuple of (line, row) pairs for readable rows and (line, error)
+        pairs for rows that could not be parsed
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    rows: list[tuple[int, dict[str, Any]]] = []
+    errors: list[tuple[int, str]] = []
+    with path.open(encoding="utf-8", newline="") as f:
+        if file_format == ImportFormat.JSONL:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    value = json.loads(line)
+                except json.JSONDecodeError as e:
+                    errors.append((line_number, f"Invalid JSON: {e.msg}"))
+                    continue
+                if not isinstance(value, dict):
+                    errors.append((line_number, "Expected a JSON object"))
+                    continue
+                rows.append((line_number, value))
+            return rows, errors
+
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None:  # reading the header row; None if the file is empty
+            return rows, errors
+        line_number = reader.line_num
+        for record in reader:
+            # line_num is the last line read; a row starts after the previous one
+            start, line_number = line_number + 1, reader.line_num
+            if None in record:
+                errors.append((start, "More cells than header fields"))
+                continue
+            row: dict[str, Any] = {key: value for key, value in record.items() if value}
+            try:
+                for key in ("priority", "parent_issue_id"):
+                    if key in row:
+                        row[key] = int(row[key])
+            except ValueError:
+                errors.append((start, f"Field '{key}' must be an integer"))
+                continue
+            rows.append((start, row))
+    return rows, errors
+
+
+def prepare_import_row(
+    row: dict[str, Any], parent_branches: dict[int, Optional[str]]
+) -> dict[str, Any]:
+    """Apply the create command's input rules to one imported row.
+
+    Strips the description and title, generates a missing title from the
+    description, and resolves ``parent_issue_id`` to the parent's branch for
+    patch issues. Field validation is left to create_issues_bulk().
+
+    Args:
+        row: Raw row from the import file
+        parent_branches: Branches of parent issues already fetched, updated
+            in place so each parent is read once
+
+    Returns:
+        Row ready for create_issues_bulk()
+
+    Raises:
+        ValueError: If the row breaks a create command rule
+    """
+    row = dict(row)
+    description = row.get("description")
+    if isinstance(description, str):
+        row["description"] = description.strip()
+    title = row.get("title")
+    if isinstance(title, str):
+        row["title"] = title.strip() or None
+    if row.get("title") is None and isinstance(row.get("description"), str):
+        row["title"] = generate_title(row["description"]) or None
+
+    parent_issue_id = row.pop("parent_issue_id", None)
+    if row.get("type", IssueType.FULL.value) != IssueType.PATCH.value:
+        if parent_issue_id is not None:
+            raise ValueError("parent_issue_id is only allowed for patch issues")
+        return row
+
+    if (row.get("branch") is None) == (parent_issue_id is None):
+        raise ValueError("Patch issues need exactly one of branch or parent_issue_id")
+    if parent_issue_id is not None:
+        if isinstance(parent_issue_id, bool) or not isinstance(parent_issue_id, int):
+            raise ValueError("parent_issue_id must be an integer")
+        if parent_issue_id not in parent_branches:
+            parent_branches[parent_issue_id] = fetch_issue(parent_issue_id).branch
+        if parent_branches[parent_issue_id] is None:
+            raise ValueError(f"Parent issue {parent_issue_id} has no branch")
+        row["branch"] = parent_branches[parent_issue_id]
+    return row
+
+
+@app.command("import")
+def import_issues(
+    path: Path = typer.Argument(..., help="JSON lines or CSV file with one issue per row"),
+    file_format: Optional[ImportFormat] = typer.Option(
+        None,
+        "--format",
+        help="Input format (default: csv for .csv files, jsonl otherwise)",
+        show_default=False,
+    ),
+    assign_round_robin: Optional[str] = typer.Option(
+        None,
+        "--assign-round-robin",
+        help="Comma-separated worker IDs to spread unassigned issues across",
+        show_default=False,
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_BULK_CHUNK_SIZE,
+        "--chunk-size",
+        help="Issues inserted per database round trip",
+        show_default=True,
+    ),
+) -> None:
+    """Create many issues from a file.
+
+    Each row takes the fields of the create command: description (required),
+    title, type, branch, assigned_to, priority, parent_issue_id (patch issues
+    only), plus adw_id and not_before. Rows are validated with the same rules
+    as `rouge issue create` and inserted in chunks, so a file of hundreds of
+    issues takes a handful of round trips.
+
+    The IDs of created issues are printed one per line, in file order.
+    Invalid rows are reported on stderr with their line number and do not stop
+    the import; the command exits with status 1 if any row failed.
+
+    Examples:
+        rouge issue import sprint.jsonl
+        rouge issue import backlog.csv --assign-round-robin worker-1,worker-2
+        rouge issue import sprint.jsonl --chunk-size 50
+    """
+    if chunk_size < 1:
+        raise typer.BadParameter("Chunk size must be at least 1")
+    workers = None
+    if assign_round_robin is not None:
+        workers = [worker.strip() for worker in assign_round_robin.split(",") if worker.strip()]
+        if not workers:
+            raise typer.BadParameter("--assign-round-robin must name at least one worker")
+    if file_format is None:
+        csv_suffix = path.suffix.lower() == ".csv"
+        file_format = ImportFormat.CSV if csv_suffix else ImportFormat.JSONL
+
+    try:
+        rows, errors = read_import_rows(path, file_format)
+    except UnicodeDecodeError:
+        typer.echo(f"Error: File is not valid UTF-8: {path}", err=True)
+        raise typer.Exit(1)
+    except OSError as e:
+        typer.echo(f"Error: Cannot read file: {path}: {e}", err=True)
+        raise typer.Exit(1)
+
+    try:
+        lines: list[int] = []
+        prepared: list[dict[str, Any]] = []
+        parent_branches: dict[int, Optional[str]] = {}
+        for line_number, row in rows:
+            try:
+                prepared.append(prepare_import_row(row, parent_branches))
+                lines.append(line_number)
+            except ValueError as e:
+                errors.append((line_number, str(e)))
+
+        result = create_issues_bulk(prepared, chunk_size=chunk_size, assign_round_robin=workers)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        logging.exception("Unexpected error in import command")
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(1)
+
+    for _, issue in result.created:
+        typer.echo(f"{issue.id}")
+    errors.extend((lines[index], message) for index, message in result.errors)
+    for line_number, message in sorted(errors):
+        typer.echo(f"Error: line {line_number}: {message}", err=True)
+    typer.echo(
+        f"Imported {len(result.created)} of {len(result.created) + len(errors)} issues", err=True
+    )
+    if errors:
+        raise typer.Exit(1)
+
+
 @app.command()
 def read(
     issue_id: int = typer.Argument(..., help="The issue ID to read"),
@@ -455,6 +677,9 @@ def read(
         typer.echo(f"Title: {issue.title or '(none)'}")
         typer.echo(f"Type: {issue.type}")
         typer.echo(f"Status: {format_status(issue.status)}")
+        typer.echo(f"Priority: {issue.priority}")
+        if issue.not_before:
+            typer.echo(f"Not before: {issue.not_before}")
         typer.echo(f"Assigned to: {issue.assigned_to or '(none)'}")
         if issue.branch:
             typer.echo(f"Branch: {issue.branch}")
@@ -508,6 +733,16 @@ def list_issues(
         help="Filter by status",
         case_sensitive=False,
     ),
+    all_pages: bool = typer.Option(
+        False,
+        "--all",
+        help="Stream every matching issue as JSON lines (ignores --limit)",
+    ),
+    cursor: Optional[str] = typer.Option(
+        None,
+        "--cursor",
+        help="Resume after this cursor; output is JSON lines",
+    ),
 ) -> None:
     """List all issues.
 
@@ -518,6 +753,11 @@ def list_issues(
         - table: Human-readable table with columns: ID, Title, Type, Status, Branch, Assigned To
         - json: Machine-readable JSON array of issue objects
 
+    With --all or --cursor, issues are written as JSON lines instead, one
+    issue object per line with an extra "cursor" key. Passing a line's cursor
+    back with --cursor resumes the listing after that issue, so an
+    interrupted --all stream can be picked up where it stopped.
+
     Filter Options:
         - limit: Maximum number of issues to return (default: 5)
         - issue_type: Filter by issue type ('full', 'patch', 'thin')
@@ -528,6 +768,8 @@ def list_issues(
         rouge issue list --limit 10
         rouge issue list --type full --status pending
         rouge issue list --format json --limit 20
+        rouge issue list --all --status completed
+        rouge issue list --cursor <cursor> --limit 50
     """
     # Trim and validate string options
     if issue_type is not None:
@@ -538,17 +780,37 @@ def list_issues(
         status = status.strip()
         if not status:
             raise typer.BadParameter("Status cannot be empty or whitespace-only")
+    if cursor is not None:
+        cursor = cursor.strip()
+        if not cursor:
+            raise typer.BadParameter("Cursor cannot be empty or whitespace-only")
 
     try:
-        issues = fetch_all_issues(limit=limit, issue_type=issue_type, status=status)
+        if all_pages or cursor is not None:
+            if all_pages:
+                pages = iter_issues(issue_type=issue_type, status=status, cursor=cursor)
+            else:
+                pages = iter(
+                    fetch_all_issues(
+                        limit=limit, issue_type=issue_type, status=status, cursor=cursor
+                    )
+                )
+            echo_json_lines(
+                {**issue.model_dump(mode="json"), "cursor": cursor_for(issue)} for issue in pages
+            )
+            return
 
         if format == OutputFormat.JSON:
             # JSON format: output array of issue objects
+            issues = fetch_all_issues(limit=limit, issue_type=issue_type, status=status)
             issues_data = [issue.model_dump(mode="json") for issue in issues]
             typer.echo(json.dumps(issues_data, indent=2, default=str))
         else:
-            # Table format: human-readable output
-            if not issues:
+            # Table format: fetch only the displayed columns
+            summaries = fetch_all_issues(
+                limit=limit, issue_type=issue_type, status=status, projection=IssueSummary
+            )
+            if not summaries:
                 typer.echo("No issues found.")
                 return
 
@@ -559,7 +821,7 @@ def list_issues(
             typer.echo("-" * 71)
 
             # Print each issue
-            for issue in issues:
+            for issue in summaries:
                 truncated_title = truncate_string(issue.title, 30)
                 assigned_to = issue.assigned_to or "(none)"
                 branch_indicator = "✅" if issue.branch else "❌"
@@ -609,6 +871,13 @@ def update(
         help="Issue status: 'pending', 'started', 'completed', or 'failed'",
         show_default=True,
     ),
+    priority: Optional[int] = typer.Option(
+        None,
+        "--priority",
+        "-p",
+        help="Claim priority from -100 to 100; higher is claimed first",
+        show_default=False,
+    ),
 ) -> None:
     """Update an existing issue.
 
@@ -627,6 +896,7 @@ def update(
         description: New description for the issue
         branch: Branch name (explicit --branch takes precedence over auto-clear)
         status: Issue status ('pending', 'started', 'completed', or 'failed')
+        priority: Claim priority (-100 to 100, higher is claimed first)
 
     Examples:
         rouge issue update 123 --title "New Title"
@@ -637,6 +907,7 @@ def update(
         rouge issue update 123 --type full --branch my-branch  # Keeps branch
         rouge issue update 123 --status started
         rouge issue update 123 --status completed --assigned-to agent-1
+        rouge issue update 123 --priority 50
     """
     validate_issue_id(issue_id)
     try:
@@ -709,6 +980,7 @@ def update(
                 description,
                 branch,
                 normalized_status,
+                priority,
             ]
         ):
             raise ValueError("No fields provided for update. At least one field must be specified.")
@@ -727,6 +999,8 @@ def update(
             kwargs["branch"] = branch
         if normalized_status is not None:
             kwargs["status"] = normalized_status
+        if priority is not None:
+            kwargs["priority"] = priority
         issue = update_issue(issue_id, **kwargs)
 
         # Output issue ID on success (for scripting compatibility)
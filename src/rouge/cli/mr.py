@@ -6,7 +6,8 @@ from typing import Optional
 
 import typer
 
-from rouge.core.database import list_mr_comments
+from rouge.cli.utils import echo_json_lines
+from rouge.core.database import iter_mr_comments, list_mr_comments, mr_cursor_for
 
 app = typer.Typer(
     help=(
@@ -80,10 +81,10 @@ def list_command(
         callback=validate_platform_option,
     ),
     limit: int = typer.Option(
-        10, "--limit", help="Maximum number of comment rows to return", show_default=True
+        10, "--limit", help="Maximum number of merge requests to return", show_default=True
     ),
     offset: int = typer.Option(
-        0, "--offset", help="Number of comment rows to skip", show_default=True
+        0, "--offset", help="Number of merge requests to skip", show_default=True
     ),
     format: OutputFormat = typer.Option(
         OutputFormat.TABLE,
@@ -92,12 +93,22 @@ def list_command(
         help="Output format: 'table' for human-readable, 'json' for machine-readable",
         show_default=True,
     ),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Stream every merge request as JSON lines (ignores --limit)"
+    ),
+    cursor: Optional[str] = typer.Option(
+        None, "--cursor", help="Resume after this cursor; output is JSON lines"
+    ),
 ) -> None:
     """List merge requests created by Rouge workflows.
 
     In Rouge, MR is a generic term covering both GitHub pull requests and
     GitLab merge requests.
     Results are derived from artifact comments in the Rouge database.
+
+    With --all or --cursor, merge requests are written as JSON lines with an
+    extra "cursor" key; pass a line's cursor back with --cursor to continue
+    after that merge request.
     """
     validate_positive_int(issue_id, "--issue-id")
     if limit < 1:
@@ -106,8 +117,27 @@ def list_command(
     if offset < 0:
         typer.echo("Error: --offset must be at least 0", err=True)
         raise typer.Exit(1)
+    if cursor is not None:
+        cursor = cursor.strip()
+        if not cursor:
+            raise typer.BadParameter("Cursor cannot be empty or whitespace-only")
+    if offset and (all_pages or cursor is not None):
+        typer.echo("Error: --offset cannot be combined with --all or --cursor", err=True)
+        raise typer.Exit(1)
 
     try:
+        if all_pages or cursor is not None:
+            if all_pages:
+                entries = iter_mr_comments(issue_id=issue_id, platform=platform, cursor=cursor)
+            else:
+                entries = iter(
+                    list_mr_comments(
+                        issue_id=issue_id, platform=platform, limit=limit, cursor=cursor
+                    )
+                )
+            echo_json_lines({**entry, "cursor": mr_cursor_for(entry)} for entry in entries)
+            return
+
         results = list_mr_comments(
             issue_id=issue_id,
             platform=platform,
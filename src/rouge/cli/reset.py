@@ -5,7 +5,7 @@ import logging
 import typer
 
 from rouge.cli.utils import validate_issue_id
-from rouge.core.database import fetch_issue, update_issue
+from rouge.core.database import fetch_issue, transition_issue_status
 
 
 def reset(
@@ -44,15 +44,23 @@ def reset(
             )
             raise typer.Exit(1)
 
-        # Call update_issue with explicit parameters
+        # Reset with a compare-and-set on the status read above, so an issue a
+        # worker claims in the meantime is left alone.
         # For full/thin type, clear branch; for patch/direct type, preserve existing branch
         if issue.type in ("full", "thin"):
-            updated_issue = update_issue(
-                issue_id, assigned_to=None, status="pending", branch=None, adw_id=None
+            updated_issue = transition_issue_status(
+                issue_id,
+                "pending",
+                expected_status=issue.status,
+                assigned_to=None,
+                branch=None,
+                adw_id=None,
             )
         else:
             # For patch/direct type, preserve existing branch
-            updated_issue = update_issue(issue_id, assigned_to=None, status="pending", adw_id=None)
+            updated_issue = transition_issue_status(
+                issue_id, "pending", expected_status=issue.status, assigned_to=None, adw_id=None
+            )
 
         # Output issue ID on success for scripting compatibility
         typer.echo(f"{updated_issue.id}")
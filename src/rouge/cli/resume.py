@@ -118,7 +118,7 @@ def resume(
         # Execute workflow with resume parameters
         try:
             # Reset issue status from 'failed' to 'started'
-            transition_issue_status(issue_id, "started")
+            transition_issue_status(issue_id, "started", expected_status="failed")
 
             success, workflow_id = execute_adw_workflow(
                 issue.adw_id,
@@ -1,7 +1,8 @@
 """Shared CLI utilities."""
 
+import json
 import re
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 import typer
 
@@ -50,3 +51,16 @@ def prepare_adw_id(adw_id: Optional[str]) -> str:
             raise typer.Exit(1)
         return adw_id
     return make_adw_id()
+
+
+def echo_json_lines(records: Iterable[dict[str, Any]]) -> None:
+    """Print records as JSON lines, one compact object per line.
+
+    Records are written as they are produced, so a lazily paged listing
+    streams instead of being collected in memory first.
+
+    Args:
+        records: Records to print
+    """
+    for record in records:
+        typer.echo(json.dumps(record, default=str))
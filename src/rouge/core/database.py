@@ -2,17 +2,37 @@
 Database configuration and client initialization.
 """
 
+import base64
+import importlib.util
+import json
 import logging
 import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional, Sequence, overload
 
 import httpx
+import psycopg2
 from dotenv import find_dotenv, load_dotenv
 from postgrest.exceptions import APIError
+from pydantic import BaseModel
 from supabase import Client, ClientOptions, create_client
 
-from rouge.core.models import VALID_ISSUE_STATUSES, Comment, Issue
+from rouge.core.models import (
+    MAX_ISSUE_PRIORITY,
+    MIN_ISSUE_PRIORITY,
+    VALID_ISSUE_STATUSES,
+    Comment,
+    CommentSummary,
+    Issue,
+    IssueSummary,
+)
+from rouge.core.storage import PostgresBackend, StorageBackend, SupabaseBackend
 from rouge.core.utils import extract_repo_from_pull_request_url, make_adw_id
 
 logger = logging.getLogger(__name__)
@@ -48,6 +68,26 @@ def init_db_env(dotenv_path: Optional[Path] = None) -> None:
             logger.debug("No .env file found from cwd search; skipping dotenv load")
 
 
+class IssueStatusConflictError(ValueError):
+    """Raised when a guarded status transition finds an unexpected status.
+
+    Attributes:
+        issue_id: ID of the issue that was not updated
+        expected_status: Status the caller required
+        actual_status: Status the issue actually had
+    """
+
+    def __init__(
+        self, issue_id: int, expected_status: Optional[str], actual_status: Optional[str]
+    ) -> None:
+        super().__init__(
+            f"Issue {issue_id} has status '{actual_status}', expected '{expected_status}'"
+        )
+        self.issue_id = issue_id
+        self.expected_status = expected_status
+        self.actual_status = actual_status
+
+
 class SupabaseConfig:
     """Configuration for Supabase client."""
 
@@ -76,21 +116,107 @@ class SupabaseConfig:
         _ = self.key
 
 
-# Global client instance
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """Snapshot of the shared Supabase HTTP connection pool.
+
+    Attributes:
+        max_connections: Configured limit on open connections
+        max_keepalive_connections: Configured limit on idle connections kept open
+        connections: Connections currently open
+        idle_connections: Open connections waiting for a request
+        http2_connections: Open connections that negotiated HTTP/2
+        requests_sent: Requests sent by the current client
+        resets: Clients closed by reset_client() since the process started
+    """
+
+    max_connections: int
+    max_keepalive_connections: int
+    connections: int
+    idle_connections: int
+    http2_connections: int
+    requests_sent: int
+    resets: int
+
+
+# Global client instance and the HTTP client it owns. _client_lock guards both,
+# along with the counters reported by get_http_pool_stats().
 _client: Optional[Client] = None
+_http_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+_requests_sent = 0
+_resets = 0
+
+# Direct Postgres backend shared by all threads, also guarded by _client_lock
+_postgres_backend: Optional[PostgresBackend] = None
+_abandoned_backends: list[PostgresBackend] = []
+
+# Errors raised when the database could not be reached, with either backend.
+# Callers that retry or skip on connectivity problems catch these.
+TRANSIENT_DATABASE_ERRORS: tuple[type[Exception], ...] = (
+    httpx.ReadTimeout,
+    httpx.ConnectTimeout,
+    httpx.ConnectError,
+    psycopg2.OperationalError,
+    psycopg2.InterfaceError,
+)
+
+
+def _count_request(_request: httpx.Request) -> None:
+    global _requests_sent
+    with _client_lock:
+        _requests_sent += 1
+
+
+def _get_http_limits() -> httpx.Limits:
+    """Get connection pool limits based on environment configuration.
+
+    Idle connections are dropped after SUPABASE_HTTP_KEEPALIVE_EXPIRY seconds,
+    before load balancers in front of Supabase close them from their side.
+    """
+    return httpx.Limits(
+        max_connections=int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE", "10")),
+        keepalive_expiry=float(os.getenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY", "15")),
+    )
 
 
-def _build_http_client(timeout: int, verify: bool) -> httpx.Client:
+def _build_http_client(
+    timeout: int,
+    verify: bool,
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    retries: int = 0,
+) -> httpx.Client:
     """Build HTTP client with specific configuration.
 
     Args:
         timeout: Request timeout in seconds
         verify: Whether to verify SSL certificates
+        limits: Connection pool limits (httpx defaults when None)
+        http2: Whether to negotiate HTTP/2; ignored with a warning when the
+            h2 package is not installed
+        retries: Number of times to retry establishing a connection. Only
+            connect errors are retried, never a request that reached the server.
 
     Returns:
         Configured httpx.Client
     """
-    return httpx.Client(timeout=timeout, verify=verify)
+    if limits is None:
+        limits = httpx.Limits()
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("SUPABASE_HTTP2 is enabled but h2 is not installed; using HTTP/1.1")
+        http2 = False
+    transport = httpx.HTTPTransport(verify=verify, http2=http2, limits=limits, retries=retries)
+    return httpx.Client(
+        timeout=timeout,
+        verify=verify,
+        http2=http2,
+        limits=limits,
+        transport=transport,
+        event_hooks={"request": [_count_request]},
+    )
 
 
 def _get_http_client() -> httpx.Client:
@@ -101,39 +227,704 @@ def _get_http_client() -> httpx.Client:
     """
     timeout = int(os.getenv("SUPABASE_HTTP_TIMEOUT", "30"))
     verify = os.getenv("SUPABASE_HTTP_VERIFY", "true").lower() == "true"
-    return _build_http_client(timeout, verify)
+    return _build_http_client(
+        timeout,
+        verify,
+        limits=_get_http_limits(),
+        http2=os.getenv("SUPABASE_HTTP2", "false").lower() == "true",
+        retries=int(os.getenv("SUPABASE_HTTP_RETRIES", "2")),
+    )
 
 
 def get_client() -> Client:
     """Get or create the global Supabase client instance.
 
+    The client and its connection pool are shared by all threads; creation is
+    serialized so concurrent first calls build a single client.
+
     Returns:
         Supabase client instance
 
     Raises:
         ValueError: If required environment variables are missing
     """
-    global _client
-    if _client is None:
-        config = SupabaseConfig()
-        options = ClientOptions(httpx_client=_get_http_client())
-        _client = create_client(config.url, config.key, options=options)
-    return _client
+    global _client, _http_client
+    client = _client
+    if client is not None:
+        return client
+    with _client_lock:
+        if _client is None:
+            config = SupabaseConfig()
+            http_client = _get_http_client()
+            try:
+                options = ClientOptions(httpx_client=http_client)
+                _client = create_client(config.url, config.key, options=options)
+            except Exception:
+                http_client.close()
+                raise
+            _http_client = http_client
+        return _client
 
 
 def reset_client() -> None:
     """Reset the global Supabase client instance.
 
-    This clears any stale HTTP keep-alive connections by setting the module-level
-    _client variable to None, forcing get_client() to recreate it on the next call.
+    Closes the HTTP client behind the current instance, releasing its pooled
+    keep-alive connections, and clears the module-level _client variable so
+    get_client() recreates it on the next call. Requests still in flight on
+    the old client in other threads fail with a connection error, which
+    callers already treat as transient.
+
+    The direct Postgres backend, when in use, is closed and reopened the same
+    way.
 
     Useful for:
     - Recovering from connection issues in long-running processes
     - Clearing stale HTTP connections after network errors
     - Worker daemons that need to reset state periodically
     """
-    global _client
+    global _client, _http_client, _postgres_backend, _requests_sent, _resets
+    with _client_lock:
+        http_client = _http_client
+        postgres_backend = _postgres_backend
+        _client = None
+        _http_client = None
+        _postgres_backend = None
+        if http_client is not None:
+            _requests_sent = 0
+            _resets += 1
+    if http_client is not None:
+        http_client.close()
+    if postgres_backend is not None:
+        postgres_backend.close()
+
+
+def _discard_client_after_fork() -> None:
+    """Forget the parent's client in a forked child without closing it.
+
+    The child shares the parent's sockets; closing them from the child would
+    tear down connections the parent still uses (an HTTP/2 close sends GOAWAY).
+    The lock is replaced because another parent thread may have held it.
+    A Postgres backend is kept referenced rather than dropped: garbage
+    collecting its connections would send the server a terminate message on
+    the parent's sockets.
+    """
+    global _client, _http_client, _postgres_backend, _client_lock, _requests_sent
+    _client_lock = threading.Lock()
     _client = None
+    _http_client = None
+    if _postgres_backend is not None:
+        _abandoned_backends.append(_postgres_backend)
+    _postgres_backend = None
+    _requests_sent = 0
+
+
+os.register_at_fork(after_in_child=_discard_client_after_fork)
+
+
+def get_http_pool_stats() -> HttpPoolStats:
+    """Return a snapshot of the shared Supabase HTTP connection pool.
+
+    Connection counts are zero until get_client() has created a client.
+    """
+    with _client_lock:
+        http_client = _http_client
+        requests_sent = _requests_sent
+        resets = _resets
+    connections: list[Any] = []
+    if http_client is not None:
+        # httpx exposes no public view of its pool; read the httpcore pool behind
+        # the default transport and report nothing if that layout ever changes.
+        pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+    limits = _get_http_limits()
+    return HttpPoolStats(
+        max_connections=limits.max_connections or 0,
+        max_keepalive_connections=limits.max_keepalive_connections or 0,
+        connections=len(connections),
+        idle_connections=sum(1 for conn in connections if conn.is_idle()),
+        http2_connections=sum(1 for conn in connections if "HTTP/2" in conn.info()),
+        requests_sent=requests_sent,
+        resets=resets,
+    )
+
+
+def _get_postgres_backend() -> PostgresBackend:
+    """Get or create the shared direct Postgres backend.
+
+    Raises:
+        ValueError: If ROUGE_DATABASE_URL is not set
+    """
+    global _postgres_backend
+    backend = _postgres_backend
+    if backend is not None:
+        return backend
+    with _client_lock:
+        if _postgres_backend is None:
+            dsn = os.getenv("ROUGE_DATABASE_URL")
+            if not dsn:
+                raise ValueError("ROUGE_DB_BACKEND=postgres requires ROUGE_DATABASE_URL")
+            pool_size = int(os.getenv("ROUGE_DATABASE_POOL_SIZE", "2"))
+            _postgres_backend = PostgresBackend(dsn, pool_size)
+        return _postgres_backend
+
+
+def get_backend(client_factory: Optional[Callable[[], Client]] = None) -> StorageBackend:
+    """Get the storage backend selected by ROUGE_DB_BACKEND.
+
+    "supabase" (the default) goes through PostgREST with the shared client;
+    "postgres" connects directly to ROUGE_DATABASE_URL over a pool of
+    ROUGE_DATABASE_POOL_SIZE connections.
+
+    Args:
+        client_factory: Callable returning the Supabase client for the
+            PostgREST backend (get_client when None)
+
+    Returns:
+        Storage backend for the hot issue, comment, and claim paths
+
+    Raises:
+        ValueError: If ROUGE_DB_BACKEND is unknown or the selected backend
+            is missing its configuration
+    """
+    backend = os.getenv("ROUGE_DB_BACKEND", "supabase").lower()
+    if backend == "postgres":
+        return _get_postgres_backend()
+    if backend != "supabase":
+        raise ValueError(f"ROUGE_DB_BACKEND must be 'supabase' or 'postgres', got {backend!r}")
+    if client_factory is None:
+        # Look get_client up on each call so patched clients are honoured
+        return SupabaseBackend(lambda: get_client())
+    return SupabaseBackend(client_factory)
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_STATES = (CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN)
+
+# Errors that mean the database is unreachable or overloaded, as opposed to a
+# request it answered and rejected. Only these count against the breaker.
+CIRCUIT_FAILURE_ERRORS: tuple[type[Exception], ...] = (
+    httpx.TransportError,
+    psycopg2.OperationalError,
+    psycopg2.InterfaceError,
+)
+
+# PostgREST error codes for gateway failures in front of Supabase
+_GATEWAY_ERROR_CODES = frozenset({"502", "503", "504"})
+
+# Upper bound in seconds for one backoff delay between critical call attempts
+MAX_RETRY_BACKOFF = 8.0
+
+
+class CircuitOpenError(ValueError):
+    """Raised instead of making a best-effort database call while the circuit is open.
+
+    Attributes:
+        operation: Description of the skipped call
+        retry_in: Seconds until the breaker lets a probe call through
+    """
+
+    def __init__(self, operation: str, retry_in: float) -> None:
+        super().__init__(
+            f"Skipped {operation}: database circuit is open (next probe in {retry_in:.0f}s)"
+        )
+        self.operation = operation
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Snapshot of the database circuit breaker.
+
+    Attributes:
+        state: ``"closed"``, ``"open"``, or ``"half_open"``
+        calls: Call outcomes recorded in the current window
+        failures: Failed calls in the current window
+        trips: Times the circuit opened since the process started
+        short_circuited: Best-effort calls skipped while the circuit was open
+    """
+
+    state: str
+    calls: int
+    failures: int
+    trips: int
+    short_circuited: int
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker shared by every database call in a process.
+
+    Closed, calls go through and their outcomes are kept for ``window``
+    seconds. Once at least ``min_calls`` outcomes are recorded and the share
+    of failures reaches ``failure_rate``, the circuit opens: best-effort calls
+    are refused immediately for ``open_seconds``. It then turns half-open and
+    lets one probe call through; a success closes the circuit and a failure
+    opens it again. Critical calls are never refused, and their outcomes
+    move the breaker like any other call.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: float = 60.0,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_rate: Share of failed calls in the window that opens the
+                circuit, between 0 (exclusive) and 1
+            min_calls: Outcomes needed in the window before it can open
+            window: Seconds an outcome counts towards the failure rate
+            open_seconds: Seconds the circuit stays open before a probe
+            clock: Monotonic time source, replaceable in tests
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError(f"failure_rate must be in (0, 1], got {failure_rate}")
+        if min_calls < 1:
+            raise ValueError(f"min_calls must be >= 1, got {min_calls}")
+        if window <= 0 or open_seconds <= 0:
+            raise ValueError("window and open_seconds must be positive")
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        # Start time of the half-open probe in flight, if any
+        self._probe_started: Optional[float] = None
+        self._trips = 0
+        self._short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the wait is over."""
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """Return whether a best-effort call may go ahead.
+
+        In the half-open state only one probe is let through at a time; a
+        probe that never reports back is replaced after ``open_seconds``.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CIRCUIT_CLOSED:
+                return True
+            now = self._clock()
+            if state == CIRCUIT_HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.open_seconds
+            ):
+                self._probe_started = now
+                return True
+            self._short_circuited += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a probe through (0 unless open)."""
+        with self._lock:
+            if self._current_state() != CIRCUIT_OPEN:
+                return 0.0
+            return max(self._opened_at + self.open_seconds - self._clock(), 0.0)
+
+    def record_success(self) -> None:
+        """Record a call the database answered."""
+        with self._lock:
+            if self._current_state() == CIRCUIT_CLOSED:
+                self._record(True)
+            else:
+                self._outcomes.clear()
+                self._transition(CIRCUIT_CLOSED, "a call succeeded")
+
+    def record_failure(self) -> None:
+        """Record a call that failed to reach the database or timed out."""
+        with self._lock:
+            state = self._current_state()
+            if state == CIRCUIT_HALF_OPEN:
+                self._open("the probe call failed")
+            elif state == CIRCUIT_OPEN:
+                # A critical call failed meanwhile; keep best-effort calls off
+                self._opened_at = self._clock()
+            else:
+                self._record(False)
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                calls = len(self._outcomes)
+                if calls >= self.min_calls and failures >= self.failure_rate * calls:
+                    self._open(f"{failures} of the last {calls} calls failed")
+
+    def stats(self) -> CircuitBreakerStats:
+        """Return a snapshot of the breaker."""
+        with self._lock:
+            state = self._current_state()
+            self._prune()
+            return CircuitBreakerStats(
+                state=state,
+                calls=len(self._outcomes),
+                failures=sum(1 for _, ok in self._outcomes if not ok),
+                trips=self._trips,
+                short_circuited=self._short_circuited,
+            )
+
+    def _current_state(self) -> str:
+        if self._state == CIRCUIT_OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._transition(CIRCUIT_HALF_OPEN, "probing with the next call")
+        return self._state
+
+    def _prune(self) -> None:
+        cutoff = self._clock() - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _record(self, ok: bool) -> None:
+        self._outcomes.append((self._clock(), ok))
+        self._prune()
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = self._clock()
+        self._trips += 1
+        self._transition(
+            CIRCUIT_OPEN, f"{reason}; skipping best-effort calls for {self.open_seconds:.0f}s"
+        )
+
+    def _transition(self, state: str, reason: str) -> None:
+        previous = self._state
+        self._state = state
+        self._probe_started = None
+        log = logger.warning if state == CIRCUIT_OPEN else logger.info
+        log("Database circuit %s -> %s: %s", previous, state, reason)
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get or create the process-wide database circuit breaker.
+
+    Configured by ROUGE_DB_CIRCUIT_FAILURE_RATE (default 0.5),
+    ROUGE_DB_CIRCUIT_MIN_CALLS (5), ROUGE_DB_CIRCUIT_WINDOW (60 seconds) and
+    ROUGE_DB_CIRCUIT_OPEN_SECONDS (30 seconds).
+    """
+    global _circuit_breaker
+    breaker = _circuit_breaker
+    if breaker is not None:
+        return breaker
+    with _circuit_breaker_lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker(
+                failure_rate=float(os.getenv("ROUGE_DB_CIRCUIT_FAILURE_RATE", "0.5")),
+                min_calls=int(os.getenv("ROUGE_DB_CIRCUIT_MIN_CALLS", "5")),
+                window=float(os.getenv("ROUGE_DB_CIRCUIT_WINDOW", "60")),
+                open_seconds=float(os.getenv("ROUGE_DB_CIRCUIT_OPEN_SECONDS", "30")),
+            )
+        return _circuit_breaker
+
+
+def reset_circuit_breaker() -> None:
+    """Discard the circuit breaker; the next call starts closed with fresh settings."""
+    global _circuit_breaker
+    with _circuit_breaker_lock:
+        _circuit_breaker = None
+
+
+def get_circuit_breaker_stats() -> CircuitBreakerStats:
+    """Return a snapshot of the process-wide circuit breaker."""
+    return get_circuit_breaker().stats()
+
+
+def _discard_circuit_breaker_after_fork() -> None:
+    """Start a forked child with its own breaker, in case a parent thread held a lock."""
+    global _circuit_breaker, _circuit_breaker_lock
+    _circuit_breaker_lock = threading.Lock()
+    _circuit_breaker = None
+
+
+os.register_at_fork(after_in_child=_discard_circuit_breaker_after_fork)
+
+
+def _is_circuit_failure(exc: Exception) -> bool:
+    """Whether ``exc`` means the database could not serve the call."""
+    if isinstance(exc, CIRCUIT_FAILURE_ERRORS):
+        return True
+    return isinstance(exc, APIError) and str(exc.code) in _GATEWAY_ERROR_CODES
+
+
+def _observe(breaker: CircuitBreaker, call: Callable[[], Any]) -> Any:
+    """Run ``call`` and report its outcome to the breaker."""
+    try:
+        result = call()
+    except Exception as exc:
+        if _is_circuit_failure(exc):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+    breaker.record_success()
+    return result
+
+
+def _best_effort_call(operation: str, call: Callable[[], Any]) -> Any:
+    """Run a call that may be dropped, failing fast while the circuit is open.
+
+    Raises:
+        CircuitOpenError: If the breaker refuses the call
+    """
+    breaker = get_circuit_breaker()
+    if not breaker.allow_request():
+        raise CircuitOpenError(operation, breaker.retry_in())
+    return _observe(breaker, call)
+
+
+def _critical_call(operation: str, call: Callable[[], Any]) -> Any:
+    """Run a call the workflow cannot do without, retrying outages with backoff.
+
+    The call is made whatever the breaker state. Failures that mean the
+    database was unreachable are retried ROUGE_DB_RETRIES times (default 2),
+    waiting ROUGE_DB_RETRY_BACKOFF seconds (default 0.5) with jitter, doubled
+    per attempt up to MAX_RETRY_BACKOFF; the last failure is raised.
+
+    A timed-out attempt may still have been applied, so ``call`` must be safe
+    to repeat, or its caller must recognise the effect of an earlier attempt
+    (see transition_issue_status()).
+    """
+    breaker = get_circuit_breaker()
+    retries = int(os.getenv("ROUGE_DB_RETRIES", "2"))
+    backoff = float(os.getenv("ROUGE_DB_RETRY_BACKOFF", "0.5"))
+    attempt = 0
+    while True:
+        try:
+            return _observe(breaker, call)
+        except Exception as exc:
+            if attempt >= retries or not _is_circuit_failure(exc):
+                raise
+            delay = min(backoff * 2**attempt, MAX_RETRY_BACKOFF) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(
+                "%s failed (%s); retry %d of %d in %.1fs (circuit %s)",
+                operation,
+                type(exc).__name__,
+                attempt,
+                retries,
+                delay,
+                breaker.state,
+            )
+            time.sleep(delay)
+
+
+# ============================================================================
+# Keyset Pagination
+# ============================================================================
+
+
+def _pack_cursor(*values: Any) -> str:
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def _unpack_cursor(cursor: str, size: int) -> tuple[str, list[int]]:
+    """Decode a cursor into its timestamp and positive integer keys.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("wrong number of cursor fields")
+        # Round-trip the timestamp so only a well-formed value reaches the filter
+        created_at = datetime.fromisoformat(values[0]).isoformat()
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    keys = values[1:]
+    if not all(isinstance(key, int) and not isinstance(key, bool) and key > 0 for key in keys):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, keys
+
+
+def encode_cursor(created_at: datetime | str, row_id: int) -> str:
+    """Encode the position of a row in newest-first order as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row seen
+        row_id: ID of the last row seen
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return _pack_cursor(created_at, row_id)
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (ISO created_at timestamp, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, (row_id,) = _unpack_cursor(cursor, 2)
+    return created_at, row_id
+
+
+def cursor_for(row: Issue | IssueSummary | Comment | CommentSummary) -> str:
+    """Return the cursor that resumes a listing after the given row.
+
+    Raises:
+        ValueError: If the row has not been stored yet
+    """
+    if row.id is None or row.created_at is None:
+        raise ValueError("Cannot build a cursor for a row without id and created_at")
+    return encode_cursor(row.created_at, row.id)
+
+
+def _order_newest_first(query: Any, cursor: Optional[str] = None) -> Any:
+    """Order a query by (created_at, id) descending, resuming after cursor.
+
+    The id tiebreak keeps the order total, so rows inserted in one statement
+    (and sharing a timestamp) are neither skipped nor repeated across pages.
+    The redundant created_at upper bound gives the planner an index condition
+    to seek on; the OR alone is only usable as a filter, which degrades deep
+    pages to a scan from the newest row.
+    """
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.lte("created_at", created_at).or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{row_id})'
+        )
+    return query.order("created_at", desc=True).order("id", desc=True)
+
+
+def _select_columns(projection: Optional[type[BaseModel]]) -> str:
+    """Return the select list for a projection model, or every column."""
+    if projection is None:
+        return "*"
+    return ",".join(projection.model_fields)
+
+
+def _validate_page(offset: int, cursor: Optional[str]) -> None:
+    if offset < 0:
+        raise ValueError(f"offset must be >= 0, got {offset}")
+    if cursor is not None:
+        if offset:
+            raise ValueError("offset cannot be combined with cursor")
+        decode_cursor(cursor)
+
+
+# ============================================================================
+# Issue Cache
+# ============================================================================
+
+DEFAULT_ISSUE_CACHE_TTL = 30.0
+
+
+@dataclass(frozen=True)
+class IssueCacheStats:
+    """Issue cache counters since the process started.
+
+    Attributes:
+        hits: Lookups answered from the cache, each a saved round trip
+        misses: Lookups that had to go to the database
+        invalidations: Entries dropped after a delete or a failed write
+    """
+
+    hits: int
+    misses: int
+    invalidations: int
+
+
+# Issue rows by ID with the monotonic time they were read. Writes through this
+# module replace or drop entries; changes made elsewhere show up once the entry
+# is older than ROUGE_ISSUE_CACHE_TTL seconds.
+_issue_cache: dict[int, tuple[float, Issue]] = {}
+_issue_cache_lock = threading.Lock()
+_issue_cache_hits = 0
+_issue_cache_misses = 0
+_issue_cache_invalidations = 0
+
+
+def _issue_cache_ttl() -> float:
+    return float(os.getenv("ROUGE_ISSUE_CACHE_TTL", str(DEFAULT_ISSUE_CACHE_TTL)))
+
+
+def _cached_issue(issue_id: int) -> Optional[Issue]:
+    """Return a copy of the cached issue, counting the lookup as a hit or miss."""
+    global _issue_cache_hits, _issue_cache_misses
+    ttl = _issue_cache_ttl()
+    with _issue_cache_lock:
+        entry = _issue_cache.get(issue_id)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            _issue_cache_hits += 1
+            return entry[1].model_copy(deep=True)
+        _issue_cache.pop(issue_id, None)
+        _issue_cache_misses += 1
+        return None
+
+
+def _cache_issue(issue: Issue) -> None:
+    if issue.id is None or _issue_cache_ttl() <= 0:
+        return
+    with _issue_cache_lock:
+        _issue_cache[issue.id] = (time.monotonic(), issue.model_copy(deep=True))
+
+
+def invalidate_issue(issue_id: int) -> None:
+    """Drop an issue from the cache so the next fetch_issue() reads the database.
+
+    Args:
+        issue_id: ID of the issue to drop
+    """
+    global _issue_cache_invalidations
+    with _issue_cache_lock:
+        if _issue_cache.pop(issue_id, None) is not None:
+            _issue_cache_invalidations += 1
+
+
+def clear_issue_cache() -> None:
+    """Drop every cached issue. Counters are kept."""
+    with _issue_cache_lock:
+        _issue_cache.clear()
+
+
+def get_issue_cache_stats() -> IssueCacheStats:
+    """Return the issue cache counters."""
+    with _issue_cache_lock:
+        return IssueCacheStats(
+            hits=_issue_cache_hits,
+            misses=_issue_cache_misses,
+            invalidations=_issue_cache_invalidations,
+        )
+
+
+def _reinit_issue_cache_lock_after_fork() -> None:
+    """Replace the cache lock in a forked child, in case a parent thread held it."""
+    global _issue_cache_lock
+    _issue_cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reinit_issue_cache_lock_after_fork)
 
 
 # ============================================================================
@@ -141,25 +932,56 @@ def reset_client() -> None:
 # ============================================================================
 
 
-def fetch_issue(issue_id: int) -> Issue:
+@overload
+def fetch_issue(issue_id: int, *, fresh: bool = False) -> Issue: ...
+
+
+@overload
+def fetch_issue(
+    issue_id: int, *, projection: type[IssueSummary], fresh: bool = False
+) -> IssueSummary: ...
+
+
+def fetch_issue(
+    issue_id: int,
+    *,
+    projection: Optional[type[IssueSummary]] = None,
+    fresh: bool = False,
+) -> Issue | IssueSummary:
     """Fetch an issue by ID.
 
+    Full reads are cached for ROUGE_ISSUE_CACHE_TTL seconds (default 30, 0
+    disables caching), and update_issue(), transition_issue_status() and
+    delete_issue() keep the cache in step with their writes. A cached issue
+    also answers projected reads. A read that cannot reach the database is
+    retried with backoff, whatever the circuit breaker state.
+
     Args:
         issue_id: ID of the issue to fetch
+        projection: Optional summary model; only its columns are selected
+            and the issue is returned as that model
+        fresh: Skip the cache and read the database; the result still
+            refreshes the cache
 
     Returns:
-        Issue object
+        Issue object, or the projection model when one is given
 
     Raises:
         ValueError: If issue is not found or fetch fails
     """
+    if not fresh:
+        cached = _cached_issue(issue_id)
+        if cached is not None:
+            if projection is None:
+                return cached
+            return projection.from_supabase(cached.model_dump(include=set(projection.model_fields)))
     try:
-        client = get_client()
-        response = client.table("issues").select("*").eq("id", issue_id).execute()
-
-        # Handle empty response (postgrest returns empty list if not found)
-        # response.data can be None or [] in some versions/cases
-        response_data = response.data[0] if response.data else None
+        backend = get_backend()
+        rows = _critical_call(
+            f"Fetching issue {issue_id}",
+            lambda: backend.fetch_issue_rows(issue_id, _select_columns(projection)),
+        )
+        response_data = rows[0] if rows else None
 
         if response_data is None:
             raise ValueError(f"Issue with id {issue_id} not found")
@@ -169,34 +991,65 @@ def fetch_issue(issue_id: int) -> Issue:
                 f"Expected dict from database for issue {issue_id}, got {type(response_data)}"
             )
 
-        return Issue.from_supabase(response_data)
+        if projection is not None:
+            return projection.from_supabase(response_data)
+        issue = Issue.from_supabase(response_data)
+        _cache_issue(issue)
+        return issue
 
     except APIError as e:
         logger.exception("Database error fetching issue %s", issue_id)
         raise ValueError(f"Failed to fetch issue {issue_id}: {e}") from e
 
 
+@overload
+def fetch_all_issues(
+    limit: int = ...,
+    issue_type: Optional[str] = ...,
+    status: Optional[str] = ...,
+    cursor: Optional[str] = ...,
+) -> list[Issue]: ...
+
+
+@overload
+def fetch_all_issues(
+    limit: int = ...,
+    issue_type: Optional[str] = ...,
+    status: Optional[str] = ...,
+    cursor: Optional[str] = ...,
+    *,
+    projection: type[IssueSummary],
+) -> list[IssueSummary]: ...
+
+
 def fetch_all_issues(
     limit: int = 5,
     issue_type: Optional[str] = None,
     status: Optional[str] = None,
-) -> list[Issue]:
+    cursor: Optional[str] = None,
+    *,
+    projection: Optional[type[IssueSummary]] = None,
+) -> list[Issue] | list[IssueSummary]:
     """Fetch all issues ordered by creation date (newest first).
 
     Args:
         limit: Maximum number of issues to return (default: 5)
         issue_type: Filter by issue type (e.g., 'full', 'patch', 'thin', 'direct')
         status: Filter by status (e.g., 'pending', 'started', 'completed', 'failed')
+        cursor: Return issues after this cursor (see cursor_for())
+        projection: Optional summary model; only its columns are selected,
+            so listings skip heavy fields such as the description
 
     Returns:
-        List of Issue objects
+        List of Issue objects, or of the projection model when one is given
 
     Raises:
-        ValueError: If fetch fails
+        ValueError: If the cursor is invalid or fetch fails
     """
+    _validate_page(0, cursor)
     try:
         client = get_client()
-        query = client.table("issues").select("*")
+        query = client.table("issues").select(_select_columns(projection))
 
         # Apply filters before ordering
         if issue_type is not None:
@@ -205,21 +1058,22 @@ def fetch_all_issues(
             query = query.eq("status", status)
 
         # Apply ordering and limit
-        response = query.order("created_at", desc=True).limit(limit).execute()
+        response = _order_newest_first(query, cursor).limit(limit).execute()
 
         rows = response.data
         if not rows:
             return []
 
         # Validate all rows are dicts before processing
-        issues = []
+        model = projection or Issue
+        issues: list[Any] = []
         for i, row in enumerate(rows):
             if not isinstance(row, dict):
                 raise ValueError(
                     f"Invalid row at index {i}: expected dict, got {type(row).__name__}. "
                     f"Value preview: {str(row)[:100]}"
                 )
-            issues.append(Issue.from_supabase(row))
+            issues.append(model.from_supabase(row))
         return issues
 
     except APIError as e:
@@ -269,9 +1123,127 @@ def fetch_comment(comment_id: int) -> Comment:
         raise ValueError(f"Failed to fetch comment {comment_id}: {e}") from e
 
 
+# Key of the reference objects that replace large strings in comments.raw; the
+# referenced text lives in artifact_blobs under its SHA-256 hash.
+BLOB_REF_KEY = "$blob"
+
+
+def _blob_ref(value: Any) -> Optional[str]:
+    """Return the hash if ``value`` is a blob reference object."""
+    if isinstance(value, dict) and len(value) == 1 and isinstance(value.get(BLOB_REF_KEY), str):
+        return value[BLOB_REF_KEY]
+    return None
+
+
+def _collect_blob_refs(value: Any, hashes: set[str]) -> None:
+    blob_hash = _blob_ref(value)
+    if blob_hash is not None:
+        hashes.add(blob_hash)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_blob_refs(item, hashes)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_blob_refs(item, hashes)
+
+
+def _replace_blob_refs(value: Any, blobs: dict[str, str]) -> Any:
+    blob_hash = _blob_ref(value)
+    if blob_hash is not None:
+        return blobs.get(blob_hash, value)
+    if isinstance(value, dict):
+        return {key: _replace_blob_refs(item, blobs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_replace_blob_refs(item, blobs) for item in value]
+    return value
+
+
+def fetch_blobs(hashes: list[str]) -> dict[str, str]:
+    """Fetch stored comment payload strings by content hash.
+
+    Args:
+        hashes: SHA-256 hex digests to look up
+
+    Returns:
+        Mapping of hash to text for the hashes that exist
+
+    Raises:
+        ValueError: If the fetch fails
+    """
+    if not hashes:
+        return {}
+    try:
+        client = get_client()
+        response = (
+            client.table("artifact_blobs")
+            .select("hash,content")
+            .in_("hash", sorted(set(hashes)))
+            .execute()
+        )
+    except APIError as e:
+        logger.exception("Database error fetching %s blobs", len(hashes))
+        raise ValueError(f"Failed to fetch blobs: {e}") from e
+
+    blobs: dict[str, str] = {}
+    for i, row in enumerate(response.data or []):
+        content = row.get("content") if isinstance(row, dict) else None
+        if not isinstance(row, dict) or not isinstance(content, str):
+            raise ValueError(
+                f"Invalid blob row at index {i}: expected dict with text content. "
+                f"Value preview: {str(row)[:100]}"
+            )
+        blobs[str(row["hash"])] = content
+    return blobs
+
+
+def resolve_blob_refs(value: Any) -> Any:
+    """Replace blob references in a comment payload with the stored text.
+
+    The database moves every string of 2 KB or more in an artifact comment's
+    ``raw`` to artifact_blobs and leaves ``{"$blob": "<hash>"}`` in its place.
+    Listings return payloads with the references; call this when the full
+    payload is needed. All references are fetched in one query. References whose blob
+    is missing are left in place.
+
+    Args:
+        value: A comment's raw payload, or any part of one
+
+    Returns:
+        A copy of ``value`` with references replaced (``value`` itself when
+        it holds none)
+
+    Raises:
+        ValueError: If fetching the blobs fails
+    """
+    hashes: set[str] = set()
+    _collect_blob_refs(value, hashes)
+    if not hashes:
+        return value
+    blobs = fetch_blobs(sorted(hashes))
+    missing = hashes - set(blobs)
+    if missing:
+        logger.warning("Comment payload references %s missing blob(s)", len(missing))
+    return _replace_blob_refs(value, blobs)
+
+
+def resolve_comment_blobs(comment: Comment) -> Comment:
+    """Return ``comment`` with the blob references in its raw payload resolved.
+
+    Raises:
+        ValueError: If fetching the blobs fails
+    """
+    raw = resolve_blob_refs(comment.raw)
+    if raw is comment.raw:
+        return comment
+    return comment.model_copy(update={"raw": raw})
+
+
 def create_comment(comment: Comment) -> Comment:
     """Create a new comment in the database.
 
+    Comments are best effort: while the database circuit breaker is open the
+    insert is not attempted and CircuitOpenError (a ValueError) is raised.
+
     Args:
         comment: Comment object to create (id can be None)
 
@@ -282,15 +1254,14 @@ def create_comment(comment: Comment) -> Comment:
         ValueError: If creation fails
     """
     try:
-        client = get_client()
-        data = comment.to_supabase()
-
-        response = client.table("comments").insert(data).execute()
+        backend = get_backend()
+        row = comment.to_supabase()
+        rows = _best_effort_call("comment insert", lambda: backend.insert_comment(row))
 
-        if not response.data:
+        if not rows:
             raise ValueError("Comment creation returned no data")
 
-        response_data = response.data[0]
+        response_data = rows[0]
         if not isinstance(response_data, dict):
             raise ValueError(f"Expected dict from database, got {type(response_data)}")
 
@@ -301,6 +1272,82 @@ def create_comment(comment: Comment) -> Comment:
         raise ValueError(f"Failed to create comment: {e}") from e
 
 
+def create_comments(
+    comments: list[Comment],
+    *,
+    ignore_duplicates: bool = False,
+) -> list[Comment]:
+    """Create several comments with a single multi-row insert.
+
+    Like create_comment(), fails fast with CircuitOpenError while the
+    database circuit breaker is open.
+
+    Args:
+        comments: Comment objects to create, in the order they should be stored
+        ignore_duplicates: Skip comments whose ``client_key`` already exists
+            instead of failing, which makes replaying a batch idempotent
+
+    Returns:
+        Created Comment objects with IDs and timestamps populated; with
+        ignore_duplicates, only the comments that were new
+
+    Raises:
+        ValueError: If creation fails
+    """
+    if not comments:
+        return []
+
+    rows = [comment.to_supabase() for comment in comments]
+    # Bulk inserts need every row to carry the same columns; a row without an
+    # explicit created_at gets the insert time rather than NULL
+    columns = {key for row in rows for key in row}
+    defaults = {"created_at": datetime.now(timezone.utc).isoformat()}
+    rows = [{column: row.get(column, defaults.get(column)) for column in columns} for row in rows]
+
+    try:
+        backend = get_backend()
+        created = _best_effort_call(
+            f"insert of {len(rows)} comments",
+            lambda: backend.insert_comments(rows, ignore_duplicates=ignore_duplicates),
+        )
+        if ignore_duplicates:
+            return [Comment.from_supabase(row) for row in created]
+
+        if len(created) != len(rows):
+            raise ValueError(f"Comment creation returned {len(created)} of {len(rows)} rows")
+
+        return [Comment.from_supabase(row) for row in created]
+
+    except APIError as e:
+        logger.exception("Database error creating %s comments", len(rows))
+        raise ValueError(f"Failed to create comments: {e}") from e
+
+
+@overload
+def list_comments(
+    *,
+    issue_id: Optional[int] = ...,
+    source: Optional[str] = ...,
+    comment_type: Optional[str] = ...,
+    limit: int = ...,
+    offset: int = ...,
+    cursor: Optional[str] = ...,
+) -> list[Comment]: ...
+
+
+@overload
+def list_comments(
+    *,
+    issue_id: Optional[int] = ...,
+    source: Optional[str] = ...,
+    comment_type: Optional[str] = ...,
+    limit: int = ...,
+    offset: int = ...,
+    cursor: Optional[str] = ...,
+    projection: type[CommentSummary],
+) -> list[CommentSummary]: ...
+
+
 def list_comments(
     *,
     issue_id: Optional[int] = None,
@@ -308,28 +1355,37 @@ def list_comments(
     comment_type: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
-) -> list[Comment]:
+    cursor: Optional[str] = None,
+    projection: Optional[type[CommentSummary]] = None,
+) -> list[Comment] | list[CommentSummary]:
     """List comments with optional filters.
 
+    Prefer ``cursor`` over ``offset`` for deep pages: a cursor seeks
+    directly to the position, while Postgres has to scan every skipped row.
+
     Args:
         issue_id: Optional issue ID to filter by
         source: Optional source to filter by
         comment_type: Optional comment type to filter by
         limit: Maximum number of comments to return (default 10)
         offset: Number of comments to skip (default 0)
+        cursor: Return comments after this cursor (see cursor_for());
+            cannot be combined with offset
+        projection: Optional summary model; only its columns are selected,
+            so listings skip the ``raw`` artifact payload
 
     Returns:
-        List of Comment objects ordered by creation date (newest first)
+        List of Comment objects (or of the projection model when one is
+        given) ordered by creation date (newest first)
 
     Raises:
-        ValueError: If fetch fails
+        ValueError: If validation fails or fetch fails
     """
     if limit < 1:
         raise ValueError(f"limit must be >= 1, got {limit}")
     if limit > MAX_LIMIT:
         limit = MAX_LIMIT
-    if offset < 0:
-        raise ValueError(f"offset must be >= 0, got {offset}")
+    _validate_page(offset, cursor)
     if issue_id is not None and issue_id <= 0:
         raise ValueError(f"issue_id must be > 0, got {issue_id}")
     if source is not None:
@@ -338,27 +1394,28 @@ def list_comments(
         comment_type = comment_type.strip() or None
     try:
         client = get_client()
-        query = client.table("comments").select("*")
+        query = client.table("comments").select(_select_columns(projection))
         if issue_id is not None:
             query = query.eq("issue_id", issue_id)
         if source is not None:
             query = query.eq("source", source)
         if comment_type is not None:
             query = query.eq("type", comment_type)
-        response = query.order("created_at", desc=True).limit(limit).offset(offset).execute()
+        response = _order_newest_first(query, cursor).limit(limit).offset(offset).execute()
 
         if not response.data:
             return []
 
         # Validate all rows are dicts before processing
-        comments = []
+        model = projection or Comment
+        comments: list[Any] = []
         for i, row in enumerate(response.data):
             if not isinstance(row, dict):
                 raise ValueError(
                     f"Invalid row at index {i}: expected dict, got {type(row).__name__}. "
                     f"Value preview: {str(row)[:100]}"
                 )
-            comments.append(Comment.from_supabase(row))
+            comments.append(model.from_supabase(row))
         return comments
 
     except APIError as e:
@@ -366,36 +1423,79 @@ def list_comments(
         raise ValueError(f"Failed to list comments: {e}") from e
 
 
+_MR_COMMENT_TYPES = {
+    "github": ["gh-pull-request"],
+    "gitlab": ["glab-pull-request"],
+    None: ["gh-pull-request", "glab-pull-request"],
+}
+
+# Columns of the mr_comment_entries view returned for each entry
+_MR_ENTRY_COLUMNS = (
+    "comment_id,entry_index,issue_id,adw_id,created_at,platform,repo,number,url,adopted"
+)
+
+
+def mr_cursor_for(entry: dict) -> str:
+    """Return the cursor that resumes a merge request listing after an entry.
+
+    Args:
+        entry: Entry dict returned by list_mr_comments() or iter_mr_comments()
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _pack_cursor(entry["created_at"], entry["comment_id"], entry["entry_index"])
+
+
+def _order_mr_entries(query: Any, cursor: Optional[str]) -> Any:
+    """Order entries newest comment first, then by position within the comment.
+
+    As in _order_newest_first, the created_at upper bound lets the planner
+    seek instead of filtering.
+    """
+    if cursor is not None:
+        created_at, (comment_id, entry_index) = _unpack_cursor(cursor, 3)
+        query = query.lte("created_at", created_at).or_(
+            f'created_at.lt."{created_at}",'
+            f'and(created_at.eq."{created_at}",comment_id.lt.{comment_id}),'
+            f'and(created_at.eq."{created_at}",comment_id.eq.{comment_id},'
+            f"entry_index.gt.{entry_index})"
+        )
+    return query.order("created_at", desc=True).order("comment_id", desc=True).order("entry_index")
+
+
 def list_mr_comments(
     *,
     issue_id: Optional[int] = None,
     platform: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[dict]:
-    """List merge/pull-request comments with optional filters.
-
-    Queries artifact comments whose type is ``gh-pull-request`` or
-    ``glab-pull-request`` and flattens each comment's pull-request
-    entries into individual result dicts.
+    """List merge/pull-request entries with optional filters.
 
-    Note:
-        Pagination (``limit`` and ``offset``) applies to the underlying
-        comment rows, **not** to the flattened pull-request entries.  A
-        single comment may contain multiple pull-request entries, so the
-        number of returned dicts can exceed ``limit``.
+    Reads the ``mr_comment_entries`` view, which flattens the pull-request
+    entries of ``gh-pull-request`` and ``glab-pull-request`` artifact
+    comments in the database and returns only the listed columns; the
+    artifact payload itself never leaves the server. Text fields that were
+    moved to artifact_blobs are resolved by the view for the returned page
+    only. Pagination applies to entries, newest comment first.
 
     Args:
         issue_id: Optional issue ID to filter by.
         platform: Optional platform filter — ``"github"``, ``"gitlab"``,
             or ``None`` for all platforms.
-        limit: Maximum number of comment rows to return (default 10).
-        offset: Number of comment rows to skip (default 0).
+        limit: Maximum number of entries to return (default 10).
+        offset: Number of entries to skip (default 0).
+        cursor: Return entries after this cursor (see mr_cursor_for());
+            cannot be combined with offset.
 
     Returns:
         List of dicts, each representing a single pull-request entry with
         keys: ``issue_id``, ``adw_id``, ``platform``, ``repo``,
-        ``number``, ``url``, ``adopted``.
+        ``number``, ``url``, ``adopted``, plus ``comment_id``,
+        ``entry_index`` and ``created_at`` locating the entry in its
+        artifact comment.
 
     Raises:
         ValueError: If validation fails or the database query fails.
@@ -407,85 +1507,337 @@ def list_mr_comments(
         limit = MAX_LIMIT
     if offset < 0:
         raise ValueError(f"offset must be >= 0, got {offset}")
+    if cursor is not None:
+        if offset:
+            raise ValueError("offset cannot be combined with cursor")
+        _unpack_cursor(cursor, 3)
     if issue_id is not None and issue_id <= 0:
         raise ValueError(f"issue_id must be > 0, got {issue_id}")
-    if platform not in {"github", "gitlab", None}:
+    if platform not in _MR_COMMENT_TYPES:
         raise ValueError(f"platform must be 'github', 'gitlab', or None, got {platform!r}")
 
-    # -- determine type filter --
-    _PLATFORM_TYPE_MAP = {
-        "github": ["gh-pull-request"],
-        "gitlab": ["glab-pull-request"],
-        None: ["gh-pull-request", "glab-pull-request"],
-    }
-    type_values = _PLATFORM_TYPE_MAP[platform]
-
     try:
         client = get_client()
-        query = client.table("comments").select("*").eq("source", "artifact")
-        query = query.in_("type", type_values)
+        query = client.table("mr_comment_entries").select(_MR_ENTRY_COLUMNS)
+        query = query.in_("type", _MR_COMMENT_TYPES[platform])
         if issue_id is not None:
             query = query.eq("issue_id", issue_id)
-        response = query.order("created_at", desc=True).limit(limit).offset(offset).execute()
-
-        if not response.data:
-            return []
+        response = _order_mr_entries(query, cursor).limit(limit).offset(offset).execute()
 
         results: list[dict] = []
-        for row in response.data:
+        for row in response.data or []:
             if not isinstance(row, dict):
-                logger.warning("Skipping non-dict comment row: %s", type(row).__name__)
+                logger.warning("Skipping non-dict MR entry row: %s", type(row).__name__)
                 continue
+            repo = row.get("repo")
+            if not isinstance(repo, str) or "/" not in repo:
+                repo = extract_repo_from_pull_request_url(row.get("url")) or repo
+            results.append(
+                {
+                    "issue_id": row.get("issue_id"),
+                    "adw_id": row.get("adw_id"),
+                    "platform": row.get("platform"),
+                    "repo": repo,
+                    "number": row.get("number"),
+                    "url": row.get("url"),
+                    "adopted": row.get("adopted", False),
+                    "comment_id": row.get("comment_id"),
+                    "entry_index": row.get("entry_index"),
+                    "created_at": row.get("created_at"),
+                }
+            )
+        return results
 
-            raw = row.get("raw")
-            if not isinstance(raw, dict):
-                logger.warning("Skipping comment %s: 'raw' is not a dict", row.get("id"))
-                continue
+    except APIError as e:
+        logger.exception("Database error listing MR comments")
+        raise ValueError(f"Failed to list MR comments: {e}") from e
 
-            artifact = raw.get("artifact")
-            if not isinstance(artifact, dict):
-                logger.warning(
-                    "Skipping comment %s: 'raw.artifact' is not a dict",
-                    row.get("id"),
-                )
-                continue
 
-            pull_requests = artifact.get("pull_requests")
-            if not isinstance(pull_requests, list) or not pull_requests:
-                logger.warning(
-                    "Skipping comment %s: 'pull_requests' missing or empty",
-                    row.get("id"),
-                )
-                continue
+# ============================================================================
+# Streaming Iterators
+# ============================================================================
 
-            artifact_platform = artifact.get("platform")
-            for pr_entry in pull_requests:
-                if not isinstance(pr_entry, dict):
-                    logger.warning(
-                        "Skipping malformed PR entry in comment %s",
-                        row.get("id"),
-                    )
-                    continue
-                repo = pr_entry.get("repo")
-                if not isinstance(repo, str) or "/" not in repo:
-                    repo = extract_repo_from_pull_request_url(pr_entry.get("url")) or repo
-                results.append(
-                    {
-                        "issue_id": row.get("issue_id"),
-                        "adw_id": row.get("adw_id"),
-                        "platform": artifact_platform,
-                        "repo": repo,
-                        "number": pr_entry.get("number"),
-                        "url": pr_entry.get("url"),
-                        "adopted": pr_entry.get("adopted", False),
-                    }
+
+def _check_page_size(page_size: int) -> int:
+    if page_size < 1:
+        raise ValueError(f"page_size must be >= 1, got {page_size}")
+    return min(page_size, MAX_LIMIT)
+
+
+def iter_issues(
+    *,
+    issue_type: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = MAX_LIMIT,
+) -> Iterator[Issue]:
+    """Stream every matching issue, newest first, one page at a time.
+
+    Pages are fetched lazily with keyset pagination, so the cost of each
+    request stays constant however deep the walk goes.
+
+    Args:
+        issue_type: Filter by issue type
+        status: Filter by status
+        cursor: Start after this cursor instead of at the newest issue
+        page_size: Issues fetched per request (capped at MAX_LIMIT)
+
+    Yields:
+        Issue objects
+
+    Raises:
+        ValueError: If validation fails or a page cannot be fetched
+    """
+    page_size = _check_page_size(page_size)
+    while True:
+        issues = fetch_all_issues(
+            limit=page_size, issue_type=issue_type, status=status, cursor=cursor
+        )
+        yield from issues
+        if len(issues) < page_size:
+            return
+        cursor = cursor_for(issues[-1])
+
+
+def iter_comments(
+    *,
+    issue_id: Optional[int] = None,
+    source: Optional[str] = None,
+    comment_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = MAX_LIMIT,
+) -> Iterator[Comment]:
+    """Stream every matching comment, newest first, one page at a time.
+
+    Args:
+        issue_id: Optional issue ID to filter by
+        source: Optional source to filter by
+        comment_type: Optional comment type to filter by
+        cursor: Start after this cursor instead of at the newest comment
+        page_size: Comments fetched per request (capped at MAX_LIMIT)
+
+    Yields:
+        Comment objects
+
+    Raises:
+        ValueError: If validation fails or a page cannot be fetched
+    """
+    page_size = _check_page_size(page_size)
+    while True:
+        comments = list_comments(
+            issue_id=issue_id,
+            source=source,
+            comment_type=comment_type,
+            limit=page_size,
+            cursor=cursor,
+        )
+        yield from comments
+        if len(comments) < page_size:
+            return
+        cursor = cursor_for(comments[-1])
+
+
+def iter_mr_comments(
+    *,
+    issue_id: Optional[int] = None,
+    platform: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = MAX_LIMIT,
+) -> Iterator[dict]:
+    """Stream every pull-request entry, newest comment first.
+
+    Args:
+        issue_id: Optional issue ID to filter by
+        platform: ``"github"``, ``"gitlab"``, or ``None`` for all platforms
+        cursor: Start after this cursor (see mr_cursor_for())
+        page_size: Entries fetched per request (capped at MAX_LIMIT)
+
+    Yields:
+        Pull-request entry dicts, as returned by list_mr_comments()
+
+    Raises:
+        ValueError: If validation fails or a page cannot be fetched
+    """
+    page_size = _check_page_size(page_size)
+    while True:
+        entries = list_mr_comments(
+            issue_id=issue_id, platform=platform, limit=page_size, cursor=cursor
+        )
+        yield from entries
+        if len(entries) < page_size:
+            return
+        cursor = mr_cursor_for(entries[-1])
+
+
+# ============================================================================
+# Comment Retention
+# ============================================================================
+
+DEFAULT_COMPACT_AFTER_DAYS = 30
+DEFAULT_COMPACT_BATCH_SIZE = 50
+DEFAULT_BLOB_BACKFILL_BATCH_SIZE = 200
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """Totals from compact_workflow_comments()."""
+
+    issues: int
+    comments_removed: int
+    bytes_reclaimed: int
+    batches: int
+
+
+def compact_workflow_comments(
+    older_than_days: int = DEFAULT_COMPACT_AFTER_DAYS,
+    *,
+    batch_size: int = DEFAULT_COMPACT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+) -> CompactionResult:
+    """Collapse workflow progress comments of long-finished issues.
+
+    Calls the ``compact_workflow_comments`` RPC until a batch comes back
+    empty. Each call is its own short transaction over at most ``batch_size``
+    issues that completed or failed more than ``older_than_days`` ago, and
+    replaces each run's ``workflow`` comments with one ``workflow-summary``
+    comment holding per-step timings. Artifact and other comments are kept.
+
+    Args:
+        older_than_days: Only compact issues last updated this many days ago
+        batch_size: Issues compacted per RPC call
+        max_batches: Stop after this many calls; ``None`` runs until done
+
+    Returns:
+        Totals across all batches; bytes are estimated stored sizes
+
+    Raises:
+        ValueError: If an argument is out of range or an RPC call fails
+    """
+    if older_than_days < 0:
+        raise ValueError(f"older_than_days must be >= 0, got {older_than_days}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if max_batches is not None and max_batches < 1:
+        raise ValueError(f"max_batches must be >= 1, got {max_batches}")
+
+    client = get_client()
+    issues = removed = reclaimed = batches = 0
+    while max_batches is None or batches < max_batches:
+        try:
+            response = client.rpc(
+                "compact_workflow_comments",
+                {"p_older_than_days": older_than_days, "p_batch_size": batch_size},
+            ).execute()
+        except APIError as e:
+            logger.exception("Database error compacting workflow comments")
+            raise ValueError(f"Failed to compact workflow comments: {e}") from e
+
+        rows = response.data if isinstance(response.data, list) else []
+        if not rows:
+            break
+        batches += 1
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                raise ValueError(
+                    f"Invalid compaction row at index {i}: expected dict, "
+                    f"got {type(row).__name__}. Value preview: {str(row)[:100]}"
                 )
+            issues += 1
+            removed += int(row.get("comments_removed") or 0)
+            reclaimed += int(row.get("bytes_reclaimed") or 0)
+        logger.debug("Compacted workflow comments of %s issues", len(rows))
 
-        return results
+    logger.info(
+        "Compacted %s workflow comments on %s issues, reclaiming about %s bytes",
+        removed,
+        issues,
+        reclaimed,
+    )
+    return CompactionResult(
+        issues=issues, comments_removed=removed, bytes_reclaimed=reclaimed, batches=batches
+    )
 
-    except APIError as e:
-        logger.exception("Database error listing MR comments")
-        raise ValueError(f"Failed to list MR comments: {e}") from e
+
+@dataclass(frozen=True)
+class BlobBackfillResult:
+    """Totals from externalize_artifact_comment_blobs()."""
+
+    comments_scanned: int
+    comments_rewritten: int
+    bytes_reclaimed: int
+    batches: int
+
+
+def externalize_artifact_comment_blobs(
+    *,
+    batch_size: int = DEFAULT_BLOB_BACKFILL_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+) -> BlobBackfillResult:
+    """Move large strings of existing artifact comments to artifact_blobs.
+
+    New artifact comments are externalized on insert; this rewrites the ones
+    stored before that. Calls the ``externalize_artifact_comment_blobs`` RPC,
+    walking comments in id order, until a batch comes back empty. Each call
+    is its own short transaction over at most ``batch_size`` comments, and
+    running it again only revisits rows with nothing left to move.
+
+    Args:
+        batch_size: Comments rewritten per RPC call
+        max_batches: Stop after this many calls; ``None`` runs until done
+
+    Returns:
+        Totals across all batches; bytes are estimated stored sizes
+
+    Raises:
+        ValueError: If an argument is out of range or an RPC call fails
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if max_batches is not None and max_batches < 1:
+        raise ValueError(f"max_batches must be >= 1, got {max_batches}")
+
+    client = get_client()
+    after_id = scanned = rewritten = reclaimed = batches = 0
+    while max_batches is None or batches < max_batches:
+        try:
+            response = client.rpc(
+                "externalize_artifact_comment_blobs",
+                {"p_after_id": after_id, "p_batch_size": batch_size},
+            ).execute()
+        except APIError as e:
+            logger.exception("Database error externalizing artifact comment blobs")
+            raise ValueError(f"Failed to externalize artifact comment blobs: {e}") from e
+
+        rows = response.data if isinstance(response.data, list) else []
+        if not rows:
+            break
+        batches += 1
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict) or not isinstance(row.get("comment_id"), int):
+                raise ValueError(
+                    f"Invalid blob backfill row at index {i}: expected dict with an "
+                    f"integer comment_id. Value preview: {str(row)[:100]}"
+                )
+            scanned += 1
+            after_id = max(after_id, row["comment_id"])
+            freed = int(row.get("bytes_reclaimed") or 0)
+            if freed:
+                rewritten += 1
+                reclaimed += freed
+        logger.debug("Externalized blobs of %s artifact comments up to %s", len(rows), after_id)
+
+    logger.info(
+        "Externalized blobs of %s of %s artifact comments, reclaiming about %s bytes",
+        rewritten,
+        scanned,
+        reclaimed,
+    )
+    return BlobBackfillResult(
+        comments_scanned=scanned,
+        comments_rewritten=rewritten,
+        bytes_reclaimed=reclaimed,
+        batches=batches,
+    )
 
 
 # ============================================================================
@@ -493,6 +1845,96 @@ def list_mr_comments(
 # ============================================================================
 
 
+def _validate_priority(priority: int) -> int:
+    """Validate an issue priority against the database bounds.
+
+    Args:
+        priority: Priority value to validate
+
+    Returns:
+        The priority unchanged
+
+    Raises:
+        ValueError: If priority is not an integer within the allowed range
+    """
+    if isinstance(priority, bool) or not isinstance(priority, int):
+        raise ValueError("Priority must be an integer")
+    if not MIN_ISSUE_PRIORITY <= priority <= MAX_ISSUE_PRIORITY:
+        raise ValueError(
+            f"Priority must be between {MIN_ISSUE_PRIORITY} and {MAX_ISSUE_PRIORITY}, "
+            f"got {priority}"
+        )
+    return priority
+
+
+def _build_issue_row(
+    description: str,
+    *,
+    title: Optional[str] = None,
+    issue_type: str = "full",
+    adw_id: Optional[str] = None,
+    branch: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    priority: Optional[int] = None,
+    not_before: Optional[datetime] = None,
+) -> dict[str, Any]:
+    """Validate new-issue fields and build the row to insert.
+
+    Arguments are as for create_issue(). An ``adw_id`` is generated when none
+    is given, so the row is complete before it reaches the database.
+
+    Returns:
+        Row dictionary for the issues table
+
+    Raises:
+        ValueError: If validation fails
+    """
+    # Validate inputs
+    if not description or not description.strip():
+        raise ValueError("Description cannot be empty")
+
+    if len(description.strip()) < 10:
+        raise ValueError("Description must be at least 10 characters")
+
+    if title and not title.strip():
+        raise ValueError("Title cannot be empty/whitespace if provided")
+
+    # Validate issue_type
+    valid_types = ("full", "patch", "thin", "direct")
+    if issue_type not in valid_types:
+        raise ValueError(
+            f"Invalid issue_type '{issue_type}'. Must be one of: {', '.join(valid_types)}"
+        )
+
+    # Generate adw_id if not provided or if it's whitespace-only
+    normalized = adw_id.strip() if adw_id is not None else ""
+    issue_adw_id = normalized or make_adw_id()
+
+    data: dict[str, Any] = {
+        "description": description,
+        "status": "pending",
+        "type": issue_type,
+        "adw_id": issue_adw_id,
+    }
+    if title:
+        data["title"] = title
+    if branch is not None:
+        branch = branch.strip()
+        if not branch:
+            raise ValueError("Branch cannot be empty")
+        data["branch"] = branch
+    if assigned_to is not None:
+        assigned_to = assigned_to.strip()
+        if not assigned_to:
+            raise ValueError("Assigned to cannot be empty")
+        data["assigned_to"] = assigned_to
+    if priority is not None:
+        data["priority"] = _validate_priority(priority)
+    if not_before is not None:
+        data["not_before"] = not_before.isoformat()
+    return data
+
+
 def create_issue(
     description: str,
     title: Optional[str] = None,
@@ -500,6 +1942,8 @@ def create_issue(
     adw_id: Optional[str] = None,
     branch: Optional[str] = None,
     assigned_to: Optional[str] = None,
+    priority: Optional[int] = None,
+    not_before: Optional[datetime] = None,
 ) -> Issue:
     """Create a new issue.
 
@@ -513,6 +1957,9 @@ def create_issue(
             a new 8-character UUID will be generated by the workflow.
         branch: Optional branch name to pre-set on the issue.
         assigned_to: Optional assignee identifier (email, agent name, or custom ID).
+        priority: Optional claim priority; higher values are claimed first.
+            Defaults to the database default of 0.
+        not_before: Optional earliest time a worker may claim the issue.
 
     Returns:
         Created Issue object
@@ -520,49 +1967,19 @@ def create_issue(
     Raises:
         ValueError: If creation fails or validation fails
     """
+    data = _build_issue_row(
+        description,
+        title=title,
+        issue_type=issue_type,
+        adw_id=adw_id,
+        branch=branch,
+        assigned_to=assigned_to,
+        priority=priority,
+        not_before=not_before,
+    )
+
     try:
         client = get_client()
-
-        # Validate inputs
-        if not description or not description.strip():
-            raise ValueError("Description cannot be empty")
-
-        if len(description.strip()) < 10:
-            raise ValueError("Description must be at least 10 characters")
-
-        if title and not title.strip():
-            raise ValueError("Title cannot be empty/whitespace if provided")
-
-        # Validate issue_type
-        valid_types = ("full", "patch", "thin", "direct")
-        if issue_type not in valid_types:
-            raise ValueError(
-                f"Invalid issue_type '{issue_type}'. Must be one of: {', '.join(valid_types)}"
-            )
-
-        # Generate adw_id if not provided or if it's whitespace-only
-        normalized = adw_id.strip() if adw_id is not None else ""
-        issue_adw_id = normalized or make_adw_id()
-
-        data = {
-            "description": description,
-            "status": "pending",
-            "type": issue_type,
-            "adw_id": issue_adw_id,
-        }
-        if title:
-            data["title"] = title
-        if branch is not None:
-            branch = branch.strip()
-            if not branch:
-                raise ValueError("Branch cannot be empty")
-            data["branch"] = branch
-        if assigned_to is not None:
-            assigned_to = assigned_to.strip()
-            if not assigned_to:
-                raise ValueError("Assigned to cannot be empty")
-            data["assigned_to"] = assigned_to
-
         response = client.table("issues").insert(data).execute()
 
         if not response.data:
@@ -579,6 +1996,169 @@ def create_issue(
         raise ValueError(f"Failed to create issue: {e}") from e
 
 
+DEFAULT_BULK_CHUNK_SIZE = 100
+
+# Row keys accepted by create_issues_bulk(), mapped to create_issue() arguments
+_BULK_ISSUE_FIELDS = {
+    "description": "description",
+    "title": "title",
+    "type": "issue_type",
+    "adw_id": "adw_id",
+    "branch": "branch",
+    "assigned_to": "assigned_to",
+    "priority": "priority",
+    "not_before": "not_before",
+}
+
+
+@dataclass(frozen=True)
+class BulkIssueResult:
+    """Outcome of create_issues_bulk().
+
+    Both lists refer to input rows by their position in the input.
+    """
+
+    created: list[tuple[int, Issue]]
+    errors: list[tuple[int, str]]
+
+
+def _bulk_issue_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Validate one bulk input row and build the row to insert.
+
+    Raises:
+        ValueError: If the row has unknown keys or fails create_issue() validation
+    """
+    unknown = sorted(set(row) - set(_BULK_ISSUE_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    for key in ("description", "title", "type", "adw_id", "branch", "assigned_to"):
+        if row.get(key) is not None and not isinstance(row[key], str):
+            raise ValueError(f"Field '{key}' must be a string")
+    kwargs = {_BULK_ISSUE_FIELDS[key]: value for key, value in row.items() if value is not None}
+    if "description" not in kwargs:
+        raise ValueError("Description cannot be empty")
+    not_before = kwargs.get("not_before")
+    if isinstance(not_before, str):
+        try:
+            kwargs["not_before"] = datetime.fromisoformat(not_before)
+        except ValueError:
+            raise ValueError(f"Invalid not_before timestamp '{not_before}'") from None
+    return _build_issue_row(**kwargs)
+
+
+def _collect_inserted_issues(
+    chunk: list[tuple[int, dict[str, Any]]],
+    returned: Any,
+    created: list[tuple[int, Issue]],
+    errors: list[tuple[int, str]],
+) -> None:
+    """Match the rows an insert returned to its input rows, in order.
+
+    Input rows without a returned row are reported as errors rather than
+    silently dropped.
+    """
+    rows = returned if isinstance(returned, list) else []
+    for position, (index, _) in enumerate(chunk):
+        row = rows[position] if position < len(rows) else None
+        if isinstance(row, dict):
+            created.append((index, Issue.from_supabase(row)))
+        else:
+            errors.append((index, "Failed to create issue: insert returned no row"))
+
+
+def create_issues_bulk(
+    rows: Sequence[dict[str, Any]],
+    *,
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    assign_round_robin: Optional[Sequence[str]] = None,
+) -> BulkIssueResult:
+    """Create many issues with one multi-row insert per chunk.
+
+    Each row is validated like create_issue() and gets its ``adw_id`` locally,
+    so invalid rows are reported without a round trip and never block the
+    rest of the batch. If the database rejects a chunk, its rows are retried
+    one at a time so only the offending rows fail. If the database cannot be
+    reached for a chunk, its rows are reported as errors with an unknown
+    outcome (a timed-out insert may still have committed) and the remaining
+    chunks are still attempted, so issues already created are always returned.
+
+    Args:
+        rows: Issues as dicts with the keys description (required), title,
+            type, adw_id, branch, assigned_to, priority, and not_before (a
+            datetime or ISO 8601 string)
+        chunk_size: Maximum rows per insert
+        assign_round_robin: Worker IDs to spread unassigned rows across, in
+            turn; rows that name an assignee keep it
+
+    Returns:
+        Created issues and per-row error messages, by input position
+
+    Raises:
+        ValueError: If chunk_size is less than 1 or assign_round_robin is empty
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    workers = None
+    if assign_round_robin is not None:
+        workers = [worker.strip() for worker in assign_round_robin if worker.strip()]
+        if not workers:
+            raise ValueError("assign_round_robin must name at least one worker")
+
+    errors: list[tuple[int, str]] = []
+    pending: list[tuple[int, dict[str, Any]]] = []
+    assigned = 0
+    for index, row in enumerate(rows):
+        try:
+            data = _bulk_issue_row(row)
+        except ValueError as e:
+            errors.append((index, str(e)))
+            continue
+        if workers and "assigned_to" not in data:
+            data["assigned_to"] = workers[assigned % len(workers)]
+            assigned += 1
+        pending.append((index, data))
+
+    created: list[tuple[int, Issue]] = []
+    client = get_client()
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+        try:
+            # Columns a row leaves out take their database defaults
+            response = (
+                client.table("issues")
+                .insert([data for _, data in chunk], default_to_null=False)
+                .execute()
+            )
+        except TRANSIENT_DATABASE_ERRORS as e:
+            logger.warning(
+                "Bulk insert of %s issues could not reach the database: %s", len(chunk), e
+            )
+            errors.extend(
+                (index, f"Failed to create issue (outcome unknown): {e}") for index, _ in chunk
+            )
+            continue
+        except APIError:
+            logger.warning(
+                "Bulk insert of %s issues failed; retrying rows one at a time", len(chunk)
+            )
+            for index, data in chunk:
+                try:
+                    response = client.table("issues").insert(data).execute()
+                except TRANSIENT_DATABASE_ERRORS as e:
+                    errors.append((index, f"Failed to create issue (outcome unknown): {e}"))
+                    continue
+                except APIError as e:
+                    errors.append((index, f"Failed to create issue: {e}"))
+                    continue
+                _collect_inserted_issues([(index, data)], response.data, created, errors)
+            continue
+        _collect_inserted_issues(chunk, response.data, created, errors)
+
+    errors.sort()
+    logger.info("Created %s of %s issues in bulk", len(created), len(rows))
+    return BulkIssueResult(created=created, errors=errors)
+
+
 def delete_issue(issue_id: int) -> bool:
     """Delete an issue.
 
@@ -591,6 +2171,7 @@ def delete_issue(issue_id: int) -> bool:
     Raises:
         ValueError: If deletion fails or issue not found
     """
+    invalidate_issue(issue_id)
     try:
         client = get_client()
         response = client.table("issues").delete().eq("id", issue_id).execute()
@@ -604,8 +2185,7 @@ def delete_issue(issue_id: int) -> bool:
         raise ValueError(f"Failed to delete issue {issue_id}: {e}") from e
 
 
-def update_issue(
-    issue_id: int,
+def _build_issue_updates(
     *,
     assigned_to: Optional[str] | _Unset = UNSET,
     issue_type: str | _Unset = UNSET,
@@ -614,24 +2194,19 @@ def update_issue(
     status: str | _Unset = UNSET,
     branch: Optional[str] | _Unset = UNSET,
     adw_id: Optional[str] | _Unset = UNSET,
-) -> Issue:
-    """Update multiple fields on an issue in a single operation.
+    priority: int | _Unset = UNSET,
+    not_before: Optional[datetime] | _Unset = UNSET,
+) -> dict[str, Any]:
+    """Validate issue fields and map them to column values.
 
-    Args:
-        issue_id: Issue ID to update
-        assigned_to: Worker ID string or None to unassign, or UNSET to skip
-        issue_type: Issue type ('full', 'patch', 'thin', or 'direct'), or UNSET to skip
-        title: Issue title or None to clear, or UNSET to skip
-        description: Issue description, or UNSET to skip
-        status: Issue status ('pending', 'started', 'completed', 'failed'), or UNSET to skip
-        branch: Branch name or None to clear, or UNSET to skip
-        adw_id: ADW identifier or None to clear, or UNSET to skip
+    Shared by update_issue() and transition_issue_status(); see update_issue()
+    for the meaning of each argument. UNSET fields are omitted.
 
     Returns:
-        Updated Issue object
+        Dict of column name to new value
 
     Raises:
-        ValueError: If validation fails, no fields provided, or update fails
+        ValueError: If a field fails validation
         TypeError: If assigned_to is not a string when provided (and not None)
     """
     updates: dict[str, Any] = {}
@@ -697,29 +2272,96 @@ def update_issue(
                 raise ValueError("adw_id cannot be empty/whitespace if provided")
         updates["adw_id"] = adw_id
 
+    # Validate and add priority to updates
+    if not isinstance(priority, _Unset):
+        updates["priority"] = _validate_priority(priority)
+
+    # Add not_before to updates
+    if not isinstance(not_before, _Unset):
+        updates["not_before"] = not_before.isoformat() if not_before is not None else None
+
+    return updates
+
+
+def update_issue(
+    issue_id: int,
+    *,
+    assigned_to: Optional[str] | _Unset = UNSET,
+    issue_type: str | _Unset = UNSET,
+    title: Optional[str] | _Unset = UNSET,
+    description: str | _Unset = UNSET,
+    status: str | _Unset = UNSET,
+    branch: Optional[str] | _Unset = UNSET,
+    adw_id: Optional[str] | _Unset = UNSET,
+    priority: int | _Unset = UNSET,
+    not_before: Optional[datetime] | _Unset = UNSET,
+) -> Issue:
+    """Update multiple fields on an issue in a single operation.
+
+    Calls that cannot reach the database are retried with backoff.
+
+    Args:
+        issue_id: Issue ID to update
+        assigned_to: Worker ID string or None to unassign, or UNSET to skip
+        issue_type: Issue type ('full', 'patch', 'thin', or 'direct'), or UNSET to skip
+        title: Issue title or None to clear, or UNSET to skip
+        description: Issue description, or UNSET to skip
+        status: Issue status ('pending', 'started', 'completed', 'failed'), or UNSET to skip
+        branch: Branch name or None to clear, or UNSET to skip
+        adw_id: ADW identifier or None to clear, or UNSET to skip
+        priority: Claim priority, or UNSET to skip
+        not_before: Earliest claim time or None to clear, or UNSET to skip
+
+    Returns:
+        Updated Issue object
+
+    Raises:
+        ValueError: If validation fails, no fields provided, or update fails
+        TypeError: If assigned_to is not a string when provided (and not None)
+    """
+    updates = _build_issue_updates(
+        assigned_to=assigned_to,
+        issue_type=issue_type,
+        title=title,
+        description=description,
+        status=status,
+        branch=branch,
+        adw_id=adw_id,
+        priority=priority,
+        not_before=not_before,
+    )
+
     # Ensure at least one field is being updated
     if not updates:
         raise ValueError("No fields provided for update")
 
     try:
-        client = get_client()
+        backend = get_backend()
 
-        # Verify issue exists first
-        issue_check = client.table("issues").select("id").eq("id", issue_id).execute()
-        if not issue_check.data:
+        # Verify issue exists first, unless it was read recently
+        if _cached_issue(issue_id) is None and not _critical_call(
+            f"Checking issue {issue_id}", lambda: backend.issue_exists(issue_id)
+        ):
             raise ValueError(f"Issue with id {issue_id} not found")
 
-        response = client.table("issues").update(updates).eq("id", issue_id).execute()
-        if not response.data:
+        rows = _critical_call(
+            f"Updating issue {issue_id}", lambda: backend.update_issue_rows(issue_id, updates)
+        )
+        if not rows:
+            invalidate_issue(issue_id)
             raise ValueError(f"Update failed: issue {issue_id} not returned")
 
-        row = response.data[0]
+        row = rows[0]
         if not isinstance(row, dict):
+            invalidate_issue(issue_id)
             raise ValueError(f"Invalid response data type for issue {issue_id}")
 
-        return Issue.from_supabase(row)
+        issue = Issue.from_supabase(row)
+        _cache_issue(issue)
+        return issue
 
     except APIError as e:
+        invalidate_issue(issue_id)
         logger.exception("Database error updating issue %s", issue_id)
         raise ValueError(f"Failed to update issue {issue_id}: {e}") from e
 
@@ -727,27 +2369,92 @@ def update_issue(
 def transition_issue_status(
     issue_id: int,
     status: str,
+    *,
+    expected_status: Optional[str] = None,
     **kwargs: Any,
 ) -> Issue:
     """Update issue status with standardized transition logging.
 
-    Reads the current issue to capture the from-state, delegates to
-    update_issue() for the actual update, and logs the transition at INFO.
+    Calls the ``transition_issue_status`` RPC, which locks the issue, applies
+    the new status and any extra fields, and returns the row before and after
+    the update in a single round trip. The from-state for the INFO log comes
+    from that previous row. When ``expected_status`` is given the update only
+    happens if the issue is still in that status (compare-and-set). Calls that
+    cannot reach the database are retried with backoff; if a retry finds the
+    issue already in ``status``, an earlier attempt committed before its
+    response was lost and the transition counts as done.
 
     Args:
         issue_id: Issue ID to update
         status: New status value
-        **kwargs: Additional fields to pass to update_issue()
+        expected_status: Optional status the issue must currently have
+        **kwargs: Additional fields, validated as in update_issue()
 
     Returns:
-        Updated Issue object (propagates ValueError/TypeError from update_issue)
+        Updated Issue object
+
+    Raises:
+        IssueStatusConflictError: If the issue is not in ``expected_status``
+        ValueError: If validation fails, the issue is not found, or the RPC fails
+        TypeError: If assigned_to is not a string when provided (and not None)
     """
-    current = fetch_issue(issue_id)
-    updated = update_issue(issue_id, status=status, **kwargs)
+    fields = _build_issue_updates(status=status, **kwargs)
+    params: dict[str, Any] = {"p_issue_id": issue_id, "p_status": fields.pop("status")}
+    if expected_status is not None:
+        if expected_status not in VALID_ISSUE_STATUSES:
+            raise ValueError(
+                f"Invalid expected status '{expected_status}'. "
+                f"Must be one of: {', '.join(sorted(VALID_ISSUE_STATUSES))}"
+            )
+        params["p_expected_status"] = expected_status
+    if fields:
+        params["p_fields"] = fields
+
+    attempts = 0
+
+    def call() -> list[dict[str, Any]]:
+        nonlocal attempts
+        attempts += 1
+        return backend.rpc("transition_issue_status", params)
+
+    try:
+        backend = get_backend()
+        rows = _critical_call(f"Transitioning issue {issue_id}", call)
+    except APIError as e:
+        invalidate_issue(issue_id)
+        logger.exception("Database error transitioning issue %s", issue_id)
+        raise ValueError(f"Failed to update issue {issue_id}: {e}") from e
+
+    if not rows:
+        invalidate_issue(issue_id)
+        raise ValueError(f"Issue with id {issue_id} not found")
+
+    row = rows[0]
+    if not isinstance(row, dict) or not isinstance(row.get("previous_issue"), dict):
+        invalidate_issue(issue_id)
+        raise ValueError(f"Invalid response data type for issue {issue_id}")
+
+    previous_status = row["previous_issue"].get("status")
+    if row.get("issue") is None:
+        if attempts > 1 and previous_status == params["p_status"]:
+            # A timed-out earlier attempt had already applied the transition
+            updated = Issue.from_supabase(row["previous_issue"])
+            _cache_issue(updated)
+            logger.info(
+                "Issue %s status transition to '%s' was applied by an earlier attempt",
+                issue_id,
+                updated.status,
+            )
+            return updated
+        invalidate_issue(issue_id)
+        raise IssueStatusConflictError(issue_id, expected_status, previous_status)
+
+    updated = Issue.from_supabase(row["issue"])
+    _cache_issue(updated)
     logger.info(
         "Issue %s status transitioned from '%s' to '%s'",
         issue_id,
-        current.status,
-        status,
+        previous_status,
+        updated.status,
     )
     return updated
@@ -14,6 +14,10 @@ IssueStatusLiteral = Literal["pending", "claimed", "started", "completed", "fail
 VALID_ISSUE_STATUSES: frozenset[str] = frozenset(get_args(IssueStatusLiteral))
 """Derived set of valid status strings for runtime validation."""
 
+MIN_ISSUE_PRIORITY = -100
+MAX_ISSUE_PRIORITY = 100
+"""Inclusive bounds of Issue.priority, matching the database check constraint."""
+
 
 class Issue(BaseModel):
     """Issue model matching Supabase schema.
@@ -29,6 +33,16 @@ class Issue(BaseModel):
             auto-generated by create_issue if not supplied.
         branch: Optional branch name for issue work.
         assigned_to: Assignee identifier (free-text, e.g., email, agent name, or custom ID).
+        lease_owner: Worker holding the claim lease while the issue is claimed or started.
+        lease_expires_at: When the claim lease lapses unless the worker renews it.
+        attempts: Number of times the issue has been claimed by a worker.
+        priority: Claim priority; higher values are claimed first, with older
+            issues gradually boosted so low priorities are not starved.
+        not_before: Earliest time the issue may be claimed (if any).
+        claimed_from: Original assignee (a work pool, a peer worker, or None)
+            of an issue claimed through a pool, as unassigned, or by stealing.
+        claimed_via: How the current claim was obtained ('pool', 'unassigned',
+            or 'steal'); None when the issue was claimed by its own assignee.
         created_at: Timestamp when the issue was created.
         updated_at: Timestamp when the issue was last updated.
     """
@@ -41,6 +55,13 @@ class Issue(BaseModel):
     adw_id: Optional[str] = None
     branch: Optional[str] = None
     assigned_to: Optional[str] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    attempts: int = 0
+    priority: int = Field(default=0, ge=MIN_ISSUE_PRIORITY, le=MAX_ISSUE_PRIORITY)
+    not_before: Optional[datetime] = None
+    claimed_from: Optional[str] = None
+    claimed_via: Optional[Literal["pool", "unassigned", "steal"]] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -101,8 +122,52 @@ class Issue(BaseModel):
         return cls(**row)
 
 
+class IssueSummary(BaseModel):
+    """Lightweight issue row for listings.
+
+    Carries only the columns listing views display, leaving out the
+    description (which can hold a full spec) and lease bookkeeping. Pass it
+    as ``projection`` to the database read functions to select just these
+    columns.
+    """
+
+    id: int
+    title: Optional[str] = None
+    status: IssueStatusLiteral = "pending"
+    type: Literal["full", "patch", "thin", "direct"] = "full"
+    branch: Optional[str] = None
+    assigned_to: Optional[str] = None
+    priority: int = 0
+    created_at: Optional[datetime] = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def default_status(cls, v):
+        """Default missing status to pending."""
+        return v if v else "pending"
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def default_type(cls, v: Optional[str]) -> str:
+        """Default missing type to full."""
+        if not v:
+            return "full"
+        return v
+
+    @classmethod
+    def from_supabase(cls, row: dict) -> "IssueSummary":
+        """Create IssueSummary from a projected Supabase row."""
+        return cls(**row)
+
+
 class Comment(BaseModel):
-    """Comment model matching Supabase schema."""
+    """Comment model matching Supabase schema.
+
+    ``client_key`` is a client-generated idempotency key; replaying a spooled
+    comment with a key that already exists is a no-op. ``created_at`` is
+    inserted explicitly when set, so replayed comments keep the time they
+    were emitted; otherwise the database default applies.
+    """
 
     id: Optional[int] = None
     issue_id: int
@@ -111,6 +176,7 @@ class Comment(BaseModel):
     source: Optional[str] = None
     type: Optional[str] = None
     adw_id: Optional[str] = None
+    client_key: Optional[str] = None
     created_at: Optional[datetime] = None
 
     @field_validator("comment")
@@ -131,6 +197,10 @@ class Comment(BaseModel):
             data["source"] = self.source
         if self.type is not None:
             data["type"] = self.type
+        if self.client_key is not None:
+            data["client_key"] = self.client_key
+        if self.created_at is not None:
+            data["created_at"] = self.created_at.isoformat()
         return data
 
     @classmethod
@@ -139,6 +209,28 @@ class Comment(BaseModel):
         return cls(**row)
 
 
+class CommentSummary(BaseModel):
+    """Lightweight comment row for listings.
+
+    Leaves out ``raw``, which can embed entire plan and implement artifacts,
+    so listing comments transfers only their text and metadata. Pass it as
+    ``projection`` to list_comments() to select just these columns.
+    """
+
+    id: int
+    issue_id: int
+    comment: str
+    source: Optional[str] = None
+    type: Optional[str] = None
+    adw_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_supabase(cls, row: dict) -> "CommentSummary":
+        """Create CommentSummary from a projected Supabase row."""
+        return cls(**row)
+
+
 # Source types for comment payloads
 CommentSource = Literal["system", "agent", "artifact"]
 
@@ -1,7 +1,8 @@
 """Notification helpers for workflows including progress comments.
 
 This package provides utilities for inserting progress comments during
-workflow execution.
+workflow execution. While a ``comment_sink()`` is active (as it is for every
+pipeline run) comments are queued and written in batches in the background.
 
 Example:
     from rouge.core.models import CommentPayload
@@ -19,10 +19,13 @@ Example:
 """
 
 import logging
+import uuid
 from typing import TYPE_CHECKING, Optional
 
 from rouge.core.database import create_comment
 from rouge.core.models import Comment, CommentPayload
+from rouge.core.notifications.sink import get_active_sink
+from rouge.core.notifications.spool import spool_comments
 
 if TYPE_CHECKING:
     from rouge.core.workflow.artifacts import Artifact
@@ -53,6 +56,12 @@ def emit_comment_from_payload(payload: CommentPayload) -> tuple[str, str]:
     decide how to handle logging. Never raises, ensuring workflow execution
     continues even if Supabase is unavailable.
 
+    While a comment sink is active (see ``rouge.core.notifications.sink``),
+    the comment is queued for a batched background insert instead of being
+    inserted synchronously. Comments whose insert fails are appended to the
+    local comment spool and replayed later (see
+    ``rouge.core.notifications.spool``).
+
     Args:
         payload: A CommentPayload object containing the comment details.
 
@@ -78,7 +87,12 @@ def emit_comment_from_payload(payload: CommentPayload) -> tuple[str, str]:
         type=payload.kind,
         adw_id=payload.adw_id,
         issue_id=payload.issue_id,
+        client_key=str(uuid.uuid4()),
     )
+    sink = get_active_sink()
+    if sink is not None and sink.submit(comment):
+        return ("success", f"Comment queued: Text='{comment.comment}'")
+
     try:
         created_comment = create_comment(comment)
         return (
@@ -86,7 +100,10 @@ def emit_comment_from_payload(payload: CommentPayload) -> tuple[str, str]:
             f"Comment inserted: ID={created_comment.id}, Text='{comment.comment}'",
         )
     except Exception as exc:  # pragma: no cover - logging path only
-        return ("error", f"Failed to insert comment on issue {comment.issue_id}: {exc}")
+        message = f"Failed to insert comment on issue {comment.issue_id}: {exc}"
+        if spool_comments([comment]):
+            message += " (spooled for replay)"
+        return ("error", message)
 
 
 def emit_artifact_comment(
@@ -96,7 +113,9 @@ def emit_artifact_comment(
 
     Best-effort helper that creates a comment when an artifact is saved during
     workflow execution. The comment includes the full artifact JSON in the raw
-    field for detailed tracking and debugging.
+    field for detailed tracking and debugging. The database stores long strings
+    in it (plans, implementation output) once in artifact_blobs and keeps a
+    reference in the comment; see ``rouge.core.database.resolve_blob_refs``.
 
     Args:
         issue_id: Optional Rouge issue ID. If None, the comment will be logged
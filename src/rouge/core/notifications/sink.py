@@ -0,0 +1,259 @@
+"""Background comment sink for workflow progress comments.
+
+Workflow steps emit several progress comments each (step start and end,
+artifact saves, agent output). Inserting them one at a time keeps a
+PostgREST round trip on the workflow's critical path for every comment, so
+a slow Supabase adds seconds to each step.
+
+``CommentSink`` moves those inserts to a background thread: comments are
+queued in order and written as multi-row inserts once ``batch_size``
+comments are waiting, once the oldest has waited ``flush_interval``
+seconds, or when the sink is flushed or closed. A single writer thread
+keeps comments in submission order.
+
+``comment_sink()`` installs a sink for the duration of a pipeline run;
+``emit_comment_from_payload`` queues comments on it while it is active and
+falls back to synchronous inserts otherwise.
+
+Batches that fail to insert are appended to the local comment spool and
+replayed later.
+
+Example:
+    from rouge.core.notifications.sink import comment_sink
+
+    with comment_sink():
+        runner.run(issue_id, adw_id)  # comments are written in batches
+    # all queued comments have been written (or reported) here
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from rouge.core.database import create_comments
+from rouge.core.models import Comment
+from rouge.core.notifications.spool import spool_comments
+
+# Comments written per multi-row insert
+DEFAULT_BATCH_SIZE = 25
+
+# Seconds the oldest queued comment may wait before a partial batch is written
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+# Seconds to wait for queued comments to be written when closing a sink
+SINK_CLOSE_TIMEOUT = 30.0
+
+
+class CommentSink:
+    """Queues comments and writes them in batches from a background thread."""
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize the sink without starting its thread.
+
+        Args:
+            batch_size: Maximum comments per insert; a full batch is written
+                immediately
+            flush_interval: Seconds the oldest queued comment may wait before
+                a partial batch is written
+            logger: Optional logger; defaults to this module's logger
+
+        Raises:
+            ValueError: If batch_size or flush_interval is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self._queue: deque[tuple[float, Comment]] = deque()
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._finished = 0
+        self._flush_target = 0
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted comments not yet written or dropped."""
+        with self._cond:
+            return self._submitted - self._finished
+
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            self._closing = False
+        self._thread = threading.Thread(target=self._run, name="rouge-comment-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, comment: Comment) -> bool:
+        """Queue a comment for insertion.
+
+        A comment without ``created_at`` is stamped with the submission time,
+        so it keeps that time if its batch is spooled and replayed later.
+
+        Args:
+            comment: Comment to insert
+
+        Returns:
+            True if the comment was queued, False if the sink is not running
+            (the caller should insert it directly)
+        """
+        with self._cond:
+            if self._closing or self._thread is None:
+                return False
+            if comment.created_at is None:
+                comment.created_at = datetime.now(timezone.utc)
+            self._queue.append((time.monotonic(), comment))
+            self._submitted += 1
+            self._cond.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write every comment submitted so far and wait for the inserts.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if all comments submitted before the call were written or
+            reported as failed, False if the timeout expired first
+        """
+        with self._cond:
+            target = self._submitted
+            self._flush_target = max(self._flush_target, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._finished >= target, timeout)
+
+    def close(self, timeout: float = SINK_CLOSE_TIMEOUT) -> bool:
+        """Stop accepting comments, write the queue, and stop the thread.
+
+        Args:
+            timeout: Maximum seconds to wait for queued comments
+
+        Returns:
+            True if the queue was drained, False if comments were still
+            pending when the timeout expired
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self.logger.warning(
+                    "Comment sink did not drain within %ss; %s comment(s) not written",
+                    timeout,
+                    self.pending,
+                )
+                return False
+            self._thread = None
+        return True
+
+    def _next_batch(self) -> Optional[list[Comment]]:
+        """Block until a batch is due and take it off the queue.
+
+        Returns:
+            The next batch, or None once the sink is closed and drained
+        """
+        with self._cond:
+            while True:
+                if self._queue:
+                    due = (
+                        len(self._queue) >= self.batch_size
+                        or self._closing
+                        or self._finished < self._flush_target
+                    )
+                    wait = self._queue[0][0] + self.flush_interval - time.monotonic()
+                    if due or wait <= 0:
+                        count = min(self.batch_size, len(self._queue))
+                        return [self._queue.popleft()[1] for _ in range(count)]
+                    self._cond.wait(wait)
+                elif self._closing:
+                    return None
+                else:
+                    self._cond.wait()
+
+    def _write(self, batch: list[Comment]) -> None:
+        try:
+            create_comments(batch)
+            self.logger.debug("Inserted %s queued comment(s)", len(batch))
+        except Exception as exc:
+            issue_ids = sorted({comment.issue_id for comment in batch})
+            spooled = spool_comments(batch)
+            self.logger.error(
+                "Failed to insert %s comment(s) on issue(s) %s: %s%s",
+                len(batch),
+                issue_ids,
+                exc,
+                " (spooled for replay)" if spooled else "",
+            )
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._write(batch)
+            with self._cond:
+                self._finished += len(batch)
+                self._cond.notify_all()
+
+
+_active_sink: Optional[CommentSink] = None
+_active_lock = threading.Lock()
+
+
+def get_active_sink() -> Optional[CommentSink]:
+    """Return the sink installed by ``comment_sink()``, if any."""
+    return _active_sink
+
+
+@contextmanager
+def comment_sink(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> Iterator[CommentSink]:
+    """Queue progress comments on a background sink for the enclosed block.
+
+    Nested uses share the outermost sink. On exit the sink is closed, so
+    every queued comment has been written (or its failure logged) once the
+    block returns.
+
+    Args:
+        batch_size: Maximum comments per insert
+        flush_interval: Seconds the oldest queued comment may wait
+
+    Yields:
+        The active CommentSink
+    """
+    global _active_sink
+    with _active_lock:
+        existing = _active_sink
+        if existing is None:
+            sink = CommentSink(batch_size, flush_interval)
+            sink.start()
+            _active_sink = sink
+    if existing is not None:
+        yield existing
+        return
+
+    try:
+        yield sink
+    finally:
+        with _active_lock:
+            _active_sink = None
+        sink.close()
@@ -0,0 +1,286 @@
+"""Durable local spool for comments that could not be inserted.
+
+When Supabase is unreachable, progress and artifact comments would otherwise
+be lost, and ``list_mr_comments`` could no longer find pull requests that
+were actually created. Failed inserts are appended to a local spool instead
+and replayed once the database is back.
+
+The spool lives under ``.rouge/spool/comments`` in the working directory, or
+in ``ROUGE_COMMENT_SPOOL_DIR`` when set. It is a set of append-only JSONL
+segments, one compact JSON object per comment. Each process appends to its
+own segment and starts a new one once a segment reaches
+``MAX_SEGMENT_BYTES``, so concurrent workflows never interleave writes.
+
+Every comment carries a client-generated ``client_key`` and the time it was
+emitted (``created_at``, stamped at spool time if the caller left it unset),
+which replay inserts explicitly so late comments keep their place in the
+issue's history. Replay inserts the
+backlog in bulk and ignores keys that already exist, so replaying a segment
+twice (for example after a crash mid-replay, or when the original insert
+did reach the database before timing out) never duplicates comments.
+Replay runs from the worker between polls and from ``rouge comment flush``.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from rouge.core.database import create_comments
+from rouge.core.models import Comment
+
+logger = logging.getLogger(__name__)
+
+SPOOL_DIR_ENV = "ROUGE_COMMENT_SPOOL_DIR"
+
+# Size at which a process starts a new spool segment
+MAX_SEGMENT_BYTES = 1024 * 1024
+
+# Comments inserted per replay request
+REPLAY_BATCH_SIZE = 100
+
+_SEGMENT_SUFFIX = ".jsonl"
+_REPLAYING_SUFFIX = ".jsonl.replaying"
+_LOCK_NAME = "replay.lock"
+
+
+def get_spool_dir() -> Path:
+    """Return the comment spool directory.
+
+    Returns:
+        ``ROUGE_COMMENT_SPOOL_DIR`` if set, otherwise ``.rouge/spool/comments``
+        under the working directory
+    """
+    # rouge.core.paths imports rouge.core.workflow, which imports this module
+    from rouge.core.paths import RougePaths
+
+    override = os.getenv(SPOOL_DIR_ENV, "").strip()
+    if override:
+        return Path(override)
+    return RougePaths.get_comment_spool_dir()
+
+
+class CommentSpool:
+    """Append-only JSONL spool of comments awaiting insertion."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_segment_bytes: int = MAX_SEGMENT_BYTES,
+    ) -> None:
+        """Initialize the spool; the directory is created on first append.
+
+        Args:
+            directory: Spool directory; defaults to ``get_spool_dir()``
+            max_segment_bytes: Segment size that triggers rotation
+        """
+        self.directory = directory if directory is not None else get_spool_dir()
+        self.max_segment_bytes = max_segment_bytes
+        self._segment: Optional[Path] = None
+        self._segment_pid = 0
+
+    def segments(self) -> list[Path]:
+        """Return spooled segments, oldest first, including interrupted replays."""
+        if not self.directory.is_dir():
+            return []
+        paths = [
+            path
+            for path in self.directory.iterdir()
+            if path.name.endswith(_SEGMENT_SUFFIX) or path.name.endswith(_REPLAYING_SUFFIX)
+        ]
+        return sorted(paths, key=lambda path: path.name)
+
+    def pending(self) -> int:
+        """Return the number of spooled comments."""
+        count = 0
+        for path in self.segments():
+            try:
+                with path.open("rb") as fh:
+                    count += sum(1 for line in fh if line.strip())
+            except FileNotFoundError:
+                continue
+        return count
+
+    def append(self, comments: list[Comment]) -> bool:
+        """Durably append comments to this process's current segment.
+
+        Never raises; a spool that cannot be written is logged.
+
+        Args:
+            comments: Comments to spool; each should carry a ``client_key``
+
+        Returns:
+            True if the comments were written and fsynced
+        """
+        if not comments:
+            return True
+        spooled_at = datetime.now(timezone.utc)
+        data = "".join(
+            json.dumps(
+                comment.model_dump(mode="json", exclude={"id"})
+                | {"created_at": (comment.created_at or spooled_at).isoformat()},
+                separators=(",", ":"),
+            )
+            + "\n"
+            for comment in comments
+        ).encode("utf-8")
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+            # Retry if a replayer takes the segment between open and lock
+            for _ in range(3):
+                segment = self._current_segment()
+                with segment.open("ab") as fh:
+                    fcntl.flock(fh, fcntl.LOCK_EX)
+                    if not self._still_linked(fh.fileno(), segment):
+                        self._segment = None
+                        continue
+                    fh.write(data)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                return True
+            raise OSError(f"spool segment kept moving under {self.directory}")
+        except OSError:
+            logger.exception("Failed to spool %s comment(s) to %s", len(comments), self.directory)
+            return False
+
+    def replay(self, batch_size: int = REPLAY_BATCH_SIZE) -> tuple[int, int]:
+        """Insert spooled comments and remove the segments that were written.
+
+        Segments are replayed oldest first and stop at the first failed
+        insert, so comments stay in order. Only one replayer runs at a time;
+        a concurrent call returns immediately.
+
+        Args:
+            batch_size: Comments per insert request
+
+        Returns:
+            Tuple of (comments replayed, comments still spooled)
+        """
+        if not self.directory.is_dir():
+            return (0, 0)
+
+        replayed = 0
+        lock_path = self.directory / _LOCK_NAME
+        with lock_path.open("a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.debug("Comment spool replay already running in %s", self.directory)
+                return (0, self.pending())
+
+            for segment in self.segments():
+                written = self._replay_segment(segment, batch_size)
+                if written is None:
+                    break
+                replayed += written
+
+        remaining = self.pending()
+        if replayed:
+            logger.info("Replayed %s spooled comment(s); %s remaining", replayed, remaining)
+        return (replayed, remaining)
+
+    def _current_segment(self) -> Path:
+        segment = self._segment
+        # A forked child starts its own segment rather than sharing the parent's
+        if segment is not None and self._segment_pid == os.getpid():
+            try:
+                if segment.stat().st_size < self.max_segment_bytes:
+                    return segment
+            except FileNotFoundError:
+                pass
+        self._segment_pid = os.getpid()
+        name = f"comments-{time.time_ns():020d}-{self._segment_pid}{_SEGMENT_SUFFIX}"
+        self._segment = self.directory / name
+        return self._segment
+
+    @staticmethod
+    def _still_linked(fd: int, path: Path) -> bool:
+        try:
+            return os.fstat(fd).st_ino == path.stat().st_ino
+        except FileNotFoundError:
+            return False
+
+    def _replay_segment(self, segment: Path, batch_size: int) -> Optional[int]:
+        """Replay one segment.
+
+        Returns:
+            Number of comments replayed, or None if an insert failed and the
+            segment was kept for the next replay
+        """
+        if segment.name.endswith(_REPLAYING_SUFFIX):
+            claimed = segment
+        else:
+            # New appends go to a fresh segment once this one is renamed
+            claimed = segment.with_name(segment.name[: -len(_SEGMENT_SUFFIX)] + _REPLAYING_SUFFIX)
+            try:
+                segment.rename(claimed)
+            except FileNotFoundError:
+                return 0
+
+        with claimed.open("rb") as fh:
+            # Wait for an append that opened the segment before the rename
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            comments = self._read_segment(fh.read(), claimed)
+
+            for start in range(0, len(comments), batch_size):
+                try:
+                    create_comments(comments[start : start + batch_size], ignore_duplicates=True)
+                except Exception as exc:
+                    logger.warning("Comment spool replay stopped at %s: %s", claimed.name, exc)
+                    return None
+
+            claimed.unlink()
+        return len(comments)
+
+    @staticmethod
+    def _read_segment(content: bytes, path: Path) -> list[Comment]:
+        comments = []
+        for number, line in enumerate(content.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                comments.append(Comment.model_validate(json.loads(line)))
+            except ValueError:
+                logger.warning("Skipping malformed spooled comment %s:%s", path.name, number)
+        return comments
+
+
+_spools: dict[Path, CommentSpool] = {}
+
+
+def get_comment_spool() -> CommentSpool:
+    """Return the spool for the current spool directory.
+
+    The instance is reused so a process keeps appending to one segment.
+    """
+    directory = get_spool_dir()
+    spool = _spools.get(directory)
+    if spool is None:
+        spool = _spools[directory] = CommentSpool(directory)
+    return spool
+
+
+def spool_comments(comments: list[Comment]) -> bool:
+    """Append comments to the default spool.
+
+    Args:
+        comments: Comments whose insert failed
+
+    Returns:
+        True if the comments were spooled
+    """
+    return get_comment_spool().append(comments)
+
+
+def replay_comment_spool() -> tuple[int, int]:
+    """Replay the default spool.
+
+    Returns:
+        Tuple of (comments replayed, comments still spooled)
+    """
+    return get_comment_spool().replay()
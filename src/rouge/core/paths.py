@@ -40,6 +40,11 @@ class RougePaths:
         """
         return RougePaths.get_workflows_dir() / workflow_id
 
+    @staticmethod
+    def get_comment_spool_dir() -> Path:
+        """Get spool directory for comments awaiting insertion."""
+        return RougePaths.get_base_dir() / "spool" / "comments"
+
     @staticmethod
     def ensure_directories() -> None:
         """
@@ -0,0 +1,281 @@
+"""Storage backends for the hot database paths.
+
+The functions in ``rouge.core.database`` and ``rouge.worker.database`` that
+run on every workflow step or poll (issue reads and updates, comment inserts,
+and the claim, lease, and status RPCs) go through a ``StorageBackend``:
+
+* ``SupabaseBackend`` (the default) calls PostgREST through supabase-py.
+* ``PostgresBackend`` talks to Postgres directly over a psycopg2 connection
+  pool and runs every statement as a server-side prepared statement, which
+  saves the HTTPS hop and the PostgREST request parsing when workers run next
+  to the database.
+
+``rouge.core.database.get_backend`` selects one from ``ROUGE_DB_BACKEND``.
+Both backends return rows as plain dicts and report statement errors as
+PostgREST ``APIError``, so callers handle them the same way. Connection
+failures on the Postgres backend surface as ``psycopg2.OperationalError`` or
+``psycopg2.InterfaceError``, which callers treat as transient like httpx
+timeouts.
+"""
+
+import hashlib
+import re
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Sequence
+
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+from postgrest.exceptions import APIError
+
+Row = dict[str, Any]
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Prepared statements kept per connection. insert_comments() produces one
+# statement shape per batch size, so the least recently used statement is
+# deallocated once a connection holds this many.
+MAX_PREPARED_STATEMENTS = 64
+
+
+class StorageBackend(ABC):
+    """Row-level operations behind the hot database functions."""
+
+    name: str
+
+    @abstractmethod
+    def rpc(self, function: str, params: dict[str, Any]) -> list[Row]:
+        """Call a database function with named parameters.
+
+        Args:
+            function: Name of a function in the public schema
+            params: Arguments by parameter name; omitted parameters take
+                their defaults
+
+        Returns:
+            Rows returned by the function
+        """
+
+    @abstractmethod
+    def fetch_issue_rows(self, issue_id: int, columns: str) -> list[Row]:
+        """Select ``columns`` ("*" or a comma-separated list) of one issue."""
+
+    @abstractmethod
+    def issue_exists(self, issue_id: int) -> bool:
+        """Return whether an issue with this ID exists."""
+
+    @abstractmethod
+    def update_issue_rows(self, issue_id: int, updates: dict[str, Any]) -> list[Row]:
+        """Apply column updates to one issue and return the updated rows."""
+
+    @abstractmethod
+    def insert_comment(self, row: Row) -> list[Row]:
+        """Insert one comment and return the stored rows."""
+
+    @abstractmethod
+    def insert_comments(self, rows: list[Row], *, ignore_duplicates: bool = False) -> list[Row]:
+        """Insert comments in one statement and return the stored rows.
+
+        Args:
+            rows: Comment rows, all with the same columns
+            ignore_duplicates: Skip rows whose ``client_key`` already exists;
+                only the inserted rows are returned
+        """
+
+    def close(self) -> None:
+        """Release the backend's connections."""
+
+
+class SupabaseBackend(StorageBackend):
+    """PostgREST backend using a supabase-py client."""
+
+    name = "supabase"
+
+    def __init__(self, client_factory: Callable[[], Any]) -> None:
+        """Initialize the backend.
+
+        Args:
+            client_factory: Returns the Supabase client to use; called for
+                every operation so client resets take effect immediately
+        """
+        self._client_factory = client_factory
+
+    def rpc(self, function: str, params: dict[str, Any]) -> list[Row]:
+        return self._client_factory().rpc(function, params).execute().data or []
+
+    def fetch_issue_rows(self, issue_id: int, columns: str) -> list[Row]:
+        client = self._client_factory()
+        return client.table("issues").select(columns).eq("id", issue_id).execute().data or []
+
+    def issue_exists(self, issue_id: int) -> bool:
+        client = self._client_factory()
+        return bool(client.table("issues").select("id").eq("id", issue_id).execute().data)
+
+    def update_issue_rows(self, issue_id: int, updates: dict[str, Any]) -> list[Row]:
+        client = self._client_factory()
+        return client.table("issues").update(updates).eq("id", issue_id).execute().data or []
+
+    def insert_comment(self, row: Row) -> list[Row]:
+        return self._client_factory().table("comments").insert(row).execute().data or []
+
+    def insert_comments(self, rows: list[Row], *, ignore_duplicates: bool = False) -> list[Row]:
+        table = self._client_factory().table("comments")
+        if ignore_duplicates:
+            query = table.upsert(rows, on_conflict="client_key", ignore_duplicates=True)
+        else:
+            query = table.insert(rows)
+        return query.execute().data or []
+
+
+def _identifier(name: str) -> str:
+    """Return ``name`` if it is a plain lowercase SQL identifier.
+
+    Raises:
+        ValueError: If the name could change the meaning of a statement
+    """
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def _adapt(value: Any) -> Any:
+    """Wrap dicts for jsonb parameters; other values adapt natively."""
+    if isinstance(value, dict):
+        return psycopg2.extras.Json(value)
+    return value
+
+
+class PostgresBackend(StorageBackend):
+    """Direct Postgres backend over a psycopg2 connection pool.
+
+    Connections run in autocommit mode, so each statement is its own
+    transaction as with PostgREST. Statements are prepared once per
+    connection (``PREPARE``) and then run with ``EXECUTE``, so Postgres
+    parses and plans each statement shape only once per connection. Each
+    connection keeps at most ``MAX_PREPARED_STATEMENTS``; the least recently
+    used one is deallocated to make room.
+    """
+
+    name = "postgres"
+
+    def __init__(self, dsn: str, pool_size: int = 2) -> None:
+        """Open the connection pool.
+
+        Args:
+            dsn: Postgres connection string
+            pool_size: Number of connections kept open; callers beyond that
+                wait for a free connection
+
+        Raises:
+            ValueError: If pool_size is less than 1
+            psycopg2.OperationalError: If connecting fails
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        self._pool = psycopg2.pool.ThreadedConnectionPool(pool_size, pool_size, dsn)
+        self._slots = threading.BoundedSemaphore(pool_size)
+        # Prepared statement names by connection, least recently used first.
+        # Weak keys drop a connection's entry once the pool lets go of it.
+        self._prepared: weakref.WeakKeyDictionary[Any, OrderedDict[str, None]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _execute(self, sql: str, args: Sequence[Any] = ()) -> list[Row]:
+        """Run ``sql`` (with $n placeholders) as a prepared statement."""
+        name = "rouge_" + hashlib.sha1(sql.encode("utf-8")).hexdigest()[:16]
+        with self._slots:
+            conn = self._pool.getconn()
+            broken = False
+            try:
+                prepared = self._prepared.get(conn)
+                if prepared is None:
+                    conn.autocommit = True
+                    prepared = self._prepared[conn] = OrderedDict()
+                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                    if name in prepared:
+                        prepared.move_to_end(name)
+                    else:
+                        while len(prepared) >= MAX_PREPARED_STATEMENTS:
+                            evicted, _ = prepared.popitem(last=False)
+                            cursor.execute(f"deallocate {evicted}")
+                        cursor.execute(f"prepare {name} as {sql}")
+                        prepared[name] = None
+                    if args:
+                        placeholders = ", ".join(["%s"] * len(args))
+                        cursor.execute(
+                            f"execute {name}({placeholders})", [_adapt(arg) for arg in args]
+                        )
+                    else:
+                        cursor.execute(f"execute {name}")
+                    if cursor.description is None:
+                        return []
+                    return [dict(row) for row in cursor.fetchall()]
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                broken = True
+                raise
+            except psycopg2.Error as e:
+                raise APIError(
+                    {
+                        "message": (e.pgerror or str(e)).strip(),
+                        "code": e.pgcode or "",
+                        "hint": getattr(e.diag, "message_hint", None) or "",
+                        "details": getattr(e.diag, "message_detail", None) or "",
+                    }
+                ) from e
+            finally:
+                if broken or conn.closed:
+                    self._prepared.pop(conn, None)
+                    self._pool.putconn(conn, close=True)
+                else:
+                    self._pool.putconn(conn)
+
+    def rpc(self, function: str, params: dict[str, Any]) -> list[Row]:
+        arguments = ", ".join(
+            f"{_identifier(key)} => ${index}" for index, key in enumerate(params, start=1)
+        )
+        sql = f"select * from public.{_identifier(function)}({arguments})"
+        return self._execute(sql, list(params.values()))
+
+    def fetch_issue_rows(self, issue_id: int, columns: str) -> list[Row]:
+        if columns != "*":
+            columns = ", ".join(_identifier(column) for column in columns.split(","))
+        return self._execute(f"select {columns} from public.issues where id = $1", [issue_id])
+
+    def issue_exists(self, issue_id: int) -> bool:
+        return bool(self._execute("select 1 from public.issues where id = $1", [issue_id]))
+
+    def update_issue_rows(self, issue_id: int, updates: dict[str, Any]) -> list[Row]:
+        assignments = ", ".join(
+            f"{_identifier(column)} = ${index}" for index, column in enumerate(updates, start=1)
+        )
+        sql = f"update public.issues set {assignments} where id = ${len(updates) + 1} returning *"
+        return self._execute(sql, [*updates.values(), issue_id])
+
+    def insert_comment(self, row: Row) -> list[Row]:
+        return self.insert_comments([row])
+
+    def insert_comments(self, rows: list[Row], *, ignore_duplicates: bool = False) -> list[Row]:
+        if not rows:
+            return []
+        columns = list(rows[0])
+        width = len(columns)
+        values = ", ".join(
+            "(" + ", ".join(f"${n * width + i}" for i in range(1, width + 1)) + ")"
+            for n in range(len(rows))
+        )
+        sql = (
+            f"insert into public.comments ({', '.join(_identifier(c) for c in columns)}) "
+            f"values {values}"
+        )
+        if ignore_duplicates:
+            sql += " on conflict (client_key) do nothing"
+        sql += " returning *"
+        return self._execute(sql, [row.get(column) for row in rows for column in columns])
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._prepared.clear()
+        self._pool.closeall()
@@ -1,8 +1,14 @@
 """Pipeline orchestrator for workflow execution."""
 
+import logging
 import os
 from typing import Dict, List, Optional
 
+from rouge.core.database import (
+    get_circuit_breaker_stats,
+    get_issue_cache_stats,
+    invalidate_issue,
+)
 from rouge.core.utils import get_logger
 from rouge.core.workflow.artifacts import ArtifactStore
 from rouge.core.workflow.step_base import WorkflowContext, WorkflowStep
@@ -49,6 +55,42 @@ class WorkflowRunner:
         """
         logger = get_logger(adw_id)
 
+        # The run starts from a database read; repeat reads are then cached
+        invalidate_issue(issue_id)
+        cache_before = get_issue_cache_stats()
+        circuit_before = get_circuit_breaker_stats()
+        try:
+            return self._run_steps(logger, issue_id, adw_id, resume_from, pipeline_type)
+        finally:
+            cache_after = get_issue_cache_stats()
+            logger.info(
+                "Issue cache for %s pipeline: %d hits (round trips saved), %d misses",
+                pipeline_type,
+                cache_after.hits - cache_before.hits,
+                cache_after.misses - cache_before.misses,
+            )
+            circuit_after = get_circuit_breaker_stats()
+            skipped = circuit_after.short_circuited - circuit_before.short_circuited
+            trips = circuit_after.trips - circuit_before.trips
+            if skipped or trips:
+                logger.warning(
+                    "Database circuit opened %d time(s) during %s pipeline; "
+                    "%d best-effort call(s) skipped, circuit now %s",
+                    trips,
+                    pipeline_type,
+                    skipped,
+                    circuit_after.state,
+                )
+
+    def _run_steps(
+        self,
+        logger: logging.Logger,
+        issue_id: int,
+        adw_id: str,
+        resume_from: Optional[str],
+        pipeline_type: str,
+    ) -> bool:
+        """Execute the steps of one run; see run()."""
         # Create artifact store unconditionally
         artifact_store = ArtifactStore(adw_id)
         logger.debug("Artifact persistence enabled at %s", artifact_store.workflow_dir)
@@ -6,6 +6,7 @@ pluggable step pipeline architecture.
 
 from typing import TYPE_CHECKING, Optional
 
+from rouge.core.notifications.sink import comment_sink
 from rouge.core.workflow.pipeline import WorkflowRunner, get_full_pipeline
 
 if TYPE_CHECKING:
@@ -31,6 +32,8 @@ def execute_workflow(
     7. PR/MR creation (conditional, best-effort)
 
     Progress comments are inserted at key points (best-effort, non-blocking).
+    They are queued on a background comment sink and written in batches; the
+    sink is drained before this function returns.
 
     Resume behavior:
     - When ``resume_from`` is provided, the workflow will skip all steps before
@@ -50,4 +53,5 @@ def execute_workflow(
     """
     steps = pipeline if pipeline is not None else get_full_pipeline()
     runner = WorkflowRunner(steps)
-    return runner.run(issue_id, adw_id, resume_from=resume_from, pipeline_type=pipeline_type)
+    with comment_sink():
+        return runner.run(issue_id, adw_id, resume_from=resume_from, pipeline_type=pipeline_type)
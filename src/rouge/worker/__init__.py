@@ -5,13 +5,25 @@ This package provides the issue worker functionality for the Rouge system.
 
 from .cli import main_entry
 from .config import WorkerConfig
-from .database import get_client, get_next_issue, update_issue_status
+from .database import (
+    get_client,
+    get_next_issue,
+    get_next_issues,
+    reap_expired_leases,
+    release_issues,
+    renew_leases,
+    update_issue_status,
+)
 from .worker import IssueWorker
 
 __all__ = [
     "IssueWorker",
     "get_client",
     "get_next_issue",
+    "get_next_issues",
+    "reap_expired_leases",
+    "release_issues",
+    "renew_leases",
     "update_issue_status",
     "WorkerConfig",
     "main_entry",
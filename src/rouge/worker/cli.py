@@ -3,13 +3,20 @@
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Optional, cast
 
 import typer
 
-from .config import WorkerConfig
+from .config import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, WorkerConfig
+from .database import reap_expired_leases
+from .notify import get_database_url
+from .poll_scheduler import PollStrategy
 from .worker import IssueWorker
-from .worker_artifact import read_worker_artifact, transition_worker_artifact
+from .worker_artifact import (
+    ArtifactFsyncPolicy,
+    read_worker_artifact,
+    transition_worker_artifact,
+)
 
 
 # Compute defaults from environment
@@ -106,6 +113,21 @@ def main(
         help="Number of seconds to wait between polls (default: 10)",
         show_default=True,
     ),
+    poll_strategy: str = typer.Option(
+        "adaptive",
+        "--poll-strategy",
+        help=(
+            "Poll scheduling strategy: 'adaptive' re-polls immediately after work and "
+            "backs off with jitter when idle; 'fixed' always waits --poll-interval"
+        ),
+        show_default=True,
+    ),
+    max_poll_interval: Optional[int] = typer.Option(
+        None,
+        "--max-poll-interval",
+        help="Backoff ceiling in seconds for the adaptive strategy (default: 60)",
+        show_default=False,
+    ),
     log_level: Optional[str] = typer.Option(
         None,
         "--log-level",
@@ -118,6 +140,122 @@ def main(
         help="Timeout in seconds for workflow execution (default: 3600)",
         show_default=False,
     ),
+    slots: int = typer.Option(
+        1,
+        "--slots",
+        help="Maximum number of workflows to run concurrently (default: 1)",
+        show_default=True,
+    ),
+    claim_batch: int = typer.Option(
+        1,
+        "--claim-batch",
+        help="Maximum number of issues to claim per poll round trip (default: 1)",
+        show_default=True,
+    ),
+    listen: bool = typer.Option(
+        False,
+        "--listen",
+        help=(
+            "Wake on Postgres issue notifications (requires ROUGE_DATABASE_URL); "
+            "polling is kept as a safety net"
+        ),
+        show_default=True,
+    ),
+    in_process: bool = typer.Option(
+        False,
+        "--in-process",
+        help=(
+            "Run workflows in forked children of the worker, reusing its warm imports, "
+            "instead of launching rouge-adw per issue"
+        ),
+        show_default=True,
+    ),
+    warm_pool: int = typer.Option(
+        0,
+        "--warm-pool",
+        help=(
+            "Number of pre-started, warmed-up runner processes to keep idle for claimed "
+            "workflows (0 disables)"
+        ),
+        show_default=True,
+    ),
+    warm_pool_max_jobs: int = typer.Option(
+        1,
+        "--warm-pool-max-jobs",
+        help="Number of workflows a warm runner executes before it is replaced",
+        show_default=True,
+    ),
+    lease_seconds: int = typer.Option(
+        DEFAULT_LEASE_SECONDS,
+        "--lease-seconds",
+        help="Lease duration in seconds for claimed issues; renewed while work runs",
+        show_default=True,
+    ),
+    heartbeat_interval: Optional[int] = typer.Option(
+        None,
+        "--heartbeat-interval",
+        help="Seconds between lease renewals (default: a third of --lease-seconds)",
+    ),
+    reap_interval: int = typer.Option(
+        0,
+        "--reap-interval",
+        help=(
+            "Seconds between runs of the expired-lease reaper from this worker "
+            "(0 disables; see 'rouge-worker reap-leases')"
+        ),
+        show_default=True,
+    ),
+    max_attempts: int = typer.Option(
+        DEFAULT_MAX_ATTEMPTS,
+        "--max-attempts",
+        help="Claims after which an issue with an expired lease is failed instead of retried",
+        show_default=True,
+    ),
+    artifact_fsync: str = typer.Option(
+        "transitions",
+        "--artifact-fsync",
+        help=(
+            "When worker state writes are fsynced: always, transitions (state changes "
+            "only), or never"
+        ),
+        show_default=True,
+    ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve Prometheus metrics on this port at /metrics (default: disabled)",
+    ),
+    metrics_host: str = typer.Option(
+        "127.0.0.1",
+        "--metrics-host",
+        help="Interface for the metrics endpoint (use 0.0.0.0 for remote scrapes)",
+        show_default=True,
+    ),
+    pool: Optional[str] = typer.Option(
+        None,
+        "--pool",
+        help=(
+            "Work pool to join: also claim issues assigned to this pool name and "
+            "unassigned issues"
+        ),
+    ),
+    steal_threshold: Optional[int] = typer.Option(
+        None,
+        "--steal-threshold",
+        help=(
+            "When idle, steal pending issues from a pool peer whose backlog exceeds "
+            "this size (requires --pool; default: no stealing)"
+        ),
+    ),
+    comment_replay_interval: int = typer.Option(
+        60,
+        "--comment-replay-interval",
+        help=(
+            "Seconds between replays of spooled comments (inserts that failed while "
+            "Supabase was unreachable) when idle; 0 disables"
+        ),
+        show_default=True,
+    ),
 ) -> None:
     """Rouge Issue Worker Daemon."""
     if ctx.invoked_subcommand is not None:
@@ -145,6 +283,25 @@ def main(
             workflow_timeout=resolved_timeout,
             db_retries=_get_default_db_retries(),
             db_backoff_ms=_get_default_db_backoff_ms(),
+            slots=slots,
+            claim_batch_size=claim_batch,
+            listen=listen,
+            database_url=get_database_url(),
+            poll_strategy=cast(PollStrategy, poll_strategy.strip().lower()),
+            max_poll_interval=max_poll_interval,
+            in_process=in_process,
+            warm_pool=warm_pool,
+            warm_pool_max_jobs=warm_pool_max_jobs,
+            lease_seconds=lease_seconds,
+            heartbeat_interval=heartbeat_interval,
+            reap_interval=reap_interval,
+            max_attempts=max_attempts,
+            artifact_fsync=cast(ArtifactFsyncPolicy, artifact_fsync.strip().lower()),
+            metrics_port=metrics_port,
+            metrics_host=metrics_host,
+            pool=pool.strip() if pool is not None else None,
+            steal_threshold=steal_threshold,
+            comment_replay_interval=comment_replay_interval,
         )
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -175,6 +332,34 @@ def reset_worker(
     transition_worker_artifact(artifact, "ready", clear_issue=True)
 
 
+@app.command("reap-leases")
+def reap_leases(
+    max_attempts: int = typer.Option(
+        DEFAULT_MAX_ATTEMPTS,
+        "--max-attempts",
+        help="Claims after which an expired issue is failed instead of returned to pending",
+        show_default=True,
+    ),
+) -> None:
+    """Return issues whose worker stopped renewing its lease to pending."""
+    if max_attempts < 1:
+        typer.echo("Error: --max-attempts must be positive", err=True)
+        raise typer.Exit(1)
+    try:
+        reaped = reap_expired_leases(max_attempts)
+    except Exception as e:
+        typer.echo(f"Error: Failed to reap expired leases: {e}", err=True)
+        raise typer.Exit(1)
+    if not reaped:
+        typer.echo("No expired leases")
+        return
+    for issue_id, status, attempts, previous_owner in reaped:
+        typer.echo(
+            f"Issue {issue_id}: {status} (attempt {attempts}, "
+            f"lease held by {previous_owner or 'unknown'})"
+        )
+
+
 def main_entry() -> None:
     """Entry point for the rouge-worker CLI."""
     from rouge.core.utils import _get_log_level
@@ -5,6 +5,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .in_process import fork_supported
+from .poll_scheduler import VALID_POLL_STRATEGIES, PollStrategy
+from .worker_artifact import VALID_ARTIFACT_FSYNC_POLICIES, ArtifactFsyncPolicy
+
+# Default backoff ceiling in seconds for the adaptive poll strategy
+DEFAULT_MAX_POLL_INTERVAL = 60
+
+# Default claim lease in seconds; renewed by the heartbeat while work runs
+DEFAULT_LEASE_SECONDS = 600
+
+# Default number of claims before the lease reaper fails an issue
+DEFAULT_MAX_ATTEMPTS = 3
+
 
 @dataclass
 class WorkerConfig:
@@ -12,12 +25,45 @@ class WorkerConfig:
 
     Attributes:
         worker_id: Unique identifier for this worker instance
-        poll_interval: Number of seconds to wait between polls
+        poll_interval: Number of seconds to wait between polls; the starting
+            backoff interval for the adaptive poll strategy
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         workflow_timeout: Timeout in seconds for workflow execution
         working_dir: Optional directory to run worker from
         db_retries: Number of retry attempts for database operations
         db_backoff_ms: Backoff delay in milliseconds between retry attempts
+        slots: Maximum number of workflows to run concurrently
+        claim_batch_size: Maximum number of issues to claim per poll round trip
+        listen: Whether to wake on Postgres issue notifications between polls
+        database_url: Direct Postgres connection string used for LISTEN
+        poll_strategy: Poll scheduling strategy ("adaptive" or "fixed")
+        max_poll_interval: Backoff ceiling in seconds for the adaptive strategy;
+            defaults to the larger of 60 and poll_interval
+        in_process: Run workflows in forked children of the worker instead of
+            launching a fresh rouge-adw interpreter per issue
+        warm_pool: Number of pre-started, warmed-up runner processes to keep
+            idle for claimed workflows; 0 disables the pool
+        warm_pool_max_jobs: Number of workflows a warm runner executes before
+            it is replaced
+        lease_seconds: Lease duration in seconds recorded on each claim and
+            each heartbeat renewal
+        heartbeat_interval: Seconds between lease renewals; defaults to a
+            third of lease_seconds
+        reap_interval: Seconds between runs of the expired-lease reaper from
+            this worker; 0 leaves reaping to ``rouge-worker reap-leases``
+        max_attempts: Claims after which the reaper fails an expired issue
+            instead of returning it to pending
+        artifact_fsync: When worker artifact writes are fsynced: "always",
+            "transitions" (state changes only), or "never"
+        metrics_port: Port for the Prometheus metrics endpoint; None disables
+            it and 0 binds any free port
+        metrics_host: Interface the metrics endpoint binds to
+        pool: Work pool to claim from in addition to issues assigned to this
+            worker; unassigned issues are claimable by any pool worker
+        steal_threshold: Pending backlog size above which an idle pool worker
+            steals issues from a peer in the same pool; None disables stealing
+        comment_replay_interval: Seconds between replays of the local comment
+            spool while idle; 0 disables replay from this worker
     """
 
     worker_id: str
@@ -27,6 +73,25 @@ class WorkerConfig:
     working_dir: Optional[str] = None
     db_retries: int = 3
     db_backoff_ms: int = 500
+    slots: int = 1
+    claim_batch_size: int = 1
+    listen: bool = False
+    database_url: Optional[str] = None
+    poll_strategy: PollStrategy = "adaptive"
+    max_poll_interval: Optional[int] = None
+    in_process: bool = False
+    warm_pool: int = 0
+    warm_pool_max_jobs: int = 1
+    lease_seconds: int = DEFAULT_LEASE_SECONDS
+    heartbeat_interval: Optional[int] = None
+    reap_interval: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    artifact_fsync: ArtifactFsyncPolicy = "transitions"
+    metrics_port: Optional[int] = None
+    metrics_host: str = "127.0.0.1"
+    pool: Optional[str] = None
+    steal_threshold: Optional[int] = None
+    comment_replay_interval: int = 60
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -58,6 +123,14 @@ class WorkerConfig:
         if self.poll_interval <= 0:
             raise ValueError("poll_interval must be positive")
 
+        if self.poll_strategy not in VALID_POLL_STRATEGIES:
+            raise ValueError(f"poll_strategy must be one of {list(VALID_POLL_STRATEGIES)}")
+
+        if self.max_poll_interval is None:
+            self.max_poll_interval = max(DEFAULT_MAX_POLL_INTERVAL, self.poll_interval)
+        elif self.max_poll_interval < self.poll_interval:
+            raise ValueError("max_poll_interval must be >= poll_interval")
+
         if self.workflow_timeout <= 0:
             raise ValueError("workflow_timeout must be positive")
 
@@ -67,6 +140,64 @@ class WorkerConfig:
         if self.db_backoff_ms <= 0:
             raise ValueError("db_backoff_ms must be positive")
 
+        if self.slots <= 0:
+            raise ValueError("slots must be positive")
+
+        if self.claim_batch_size <= 0:
+            raise ValueError("claim_batch_size must be positive")
+
+        if self.listen and not self.database_url:
+            raise ValueError("database_url is required when listen is enabled")
+
+        if self.in_process and not fork_supported():
+            raise ValueError("in_process execution requires a platform that supports fork")
+
+        if self.warm_pool < 0:
+            raise ValueError("warm_pool must be non-negative")
+
+        if self.warm_pool_max_jobs <= 0:
+            raise ValueError("warm_pool_max_jobs must be positive")
+
+        if self.in_process and self.warm_pool:
+            raise ValueError("in_process and warm_pool are mutually exclusive")
+
+        if self.lease_seconds <= 1:
+            raise ValueError("lease_seconds must be greater than 1")
+
+        if self.heartbeat_interval is None:
+            self.heartbeat_interval = max(1, self.lease_seconds // 3)
+        elif self.heartbeat_interval <= 0:
+            raise ValueError("heartbeat_interval must be positive")
+        elif self.heartbeat_interval >= self.lease_seconds:
+            raise ValueError("heartbeat_interval must be less than lease_seconds")
+
+        if self.reap_interval < 0:
+            raise ValueError("reap_interval must be non-negative")
+
+        if self.comment_replay_interval < 0:
+            raise ValueError("comment_replay_interval must be non-negative")
+
+        if self.max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+
+        if self.artifact_fsync not in VALID_ARTIFACT_FSYNC_POLICIES:
+            raise ValueError(f"artifact_fsync must be one of {list(VALID_ARTIFACT_FSYNC_POLICIES)}")
+
+        if self.metrics_port is not None and not 0 <= self.metrics_port <= 65535:
+            raise ValueError("metrics_port must be between 0 and 65535")
+
+        if self.pool is not None:
+            if not self.pool or any(c.isspace() for c in self.pool):
+                raise ValueError("pool cannot be empty or contain whitespace")
+            if self.pool == self.worker_id:
+                raise ValueError("pool must differ from worker_id")
+
+        if self.steal_threshold is not None:
+            if self.pool is None:
+                raise ValueError("steal_threshold requires a pool")
+            if self.steal_threshold < 0:
+                raise ValueError("steal_threshold must be non-negative")
+
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
             raise ValueError(f"log_level must be one of {valid_log_levels}")
@@ -1,12 +1,19 @@
 """Database operations for the Rouge Worker."""
 
 import logging
-from typing import Optional, Tuple
-
-import httpx
+from typing import Any, Optional, Tuple
 
+from rouge.core.database import (
+    TRANSIENT_DATABASE_ERRORS,
+    CircuitOpenError,
+    IssueStatusConflictError,
+    _best_effort_call,
+    _observe,
+    get_circuit_breaker,
+    reset_client,
+)
+from rouge.core.database import get_backend as _get_backend
 from rouge.core.database import get_client as _get_client
-from rouge.core.database import reset_client
 from rouge.core.database import transition_issue_status as _transition_issue_status
 from rouge.core.models import VALID_ISSUE_STATUSES
 from rouge.worker.exceptions import TransientDatabaseError
@@ -21,9 +28,62 @@ def get_client():
     return _get_client()
 
 
+def get_backend():
+    """Get the storage backend for the worker's RPC calls.
+
+    Returns:
+        Backend selected by ROUGE_DB_BACKEND, using this module's client
+    """
+    return _get_backend(get_client)
+
+
+ClaimedIssue = Tuple[int, str, str, str, Optional[str]]
+
+
+def _parse_claimed_issue(row: dict[str, Any]) -> ClaimedIssue:
+    """Convert a claim RPC row into the worker's issue tuple.
+
+    Args:
+        row: Row returned by ``get_and_lock_next_issue(s)``
+
+    Returns:
+        Tuple of (issue_id, description, status, type, adw_id)
+    """
+    return (
+        row["issue_id"],
+        row["issue_description"],
+        row["issue_status"],
+        row["issue_type"],
+        row.get("issue_adw_id"),
+    )
+
+
+def _claim_params(
+    worker_id: str,
+    lease_seconds: Optional[int],
+    pool: Optional[str],
+    steal_threshold: Optional[int],
+) -> dict[str, Any]:
+    """Build the RPC parameters shared by the claim functions.
+
+    Optional settings are only sent when given so the database defaults apply.
+    """
+    params: dict[str, Any] = {"p_worker_id": worker_id}
+    if lease_seconds is not None:
+        params["p_lease_seconds"] = lease_seconds
+    if pool is not None:
+        params["p_pool"] = pool
+    if steal_threshold is not None:
+        params["p_steal_threshold"] = steal_threshold
+    return params
+
+
 def get_next_issue(
     worker_id: str,
     logger: Optional[logging.Logger] = None,
+    lease_seconds: Optional[int] = None,
+    pool: Optional[str] = None,
+    steal_threshold: Optional[int] = None,
 ) -> Optional[Tuple[int, str, str, str, Optional[str]]]:
     """
     Atomically retrieve and lock the next pending issue via RPC.
@@ -31,12 +91,21 @@ def get_next_issue(
     Calls the ``get_and_lock_next_issue`` Postgres RPC function which uses
     ``FOR UPDATE SKIP LOCKED`` to atomically select and lock an issue,
     preventing race conditions when multiple workers poll simultaneously.
+    The call counts towards the database circuit breaker and is skipped
+    (returning None) while the circuit is open.
 
     Args:
         worker_id: Unique identifier for the worker requesting the issue.
             Passed as ``p_worker_id`` to the RPC so only issues assigned
-            to this worker are returned.
+            to this worker are returned, unless a pool is given.
         logger: Optional logger for logging operations
+        lease_seconds: Optional lease duration for the claim; the database
+            default is used when omitted
+        pool: Optional work pool name. Issues assigned to the pool and
+            unassigned issues can then be claimed as well; the claimed issue
+            is reassigned to ``worker_id``.
+        steal_threshold: Optional backlog size above which an idle pool
+            worker steals pending issues from a peer in the same pool
 
     Returns:
         Tuple of (issue_id, description, status, type, adw_id) if an issue is
@@ -49,20 +118,19 @@ def get_next_issue(
             the RPC call. The database client is automatically reset on these errors.
     """
     try:
-        client = get_client()
+        backend = get_backend()
 
         if logger:
             logger.debug("Fetching next issue for worker %s", worker_id)
 
-        response = client.rpc("get_and_lock_next_issue", {"p_worker_id": worker_id}).execute()
+        params = _claim_params(worker_id, lease_seconds, pool, steal_threshold)
+        rows = _best_effort_call(
+            "issue claim", lambda: backend.rpc("get_and_lock_next_issue", params)
+        )
 
-        if response.data and len(response.data) > 0:
-            issue = response.data[0]
-            issue_id = issue["issue_id"]
-            description = issue["issue_description"]
-            status = issue["issue_status"]
-            issue_type = issue["issue_type"]
-            adw_id: Optional[str] = issue.get("issue_adw_id")
+        if rows:
+            claimed = _parse_claimed_issue(rows[0])
+            issue_id, _description, status, issue_type, adw_id = claimed
             if logger:
                 logger.info(
                     "Locked issue %s (status: %s, type: %s, adw_id: %s) for processing",
@@ -71,11 +139,11 @@ def get_next_issue(
                     issue_type,
                     adw_id,
                 )
-            return (issue_id, description, status, issue_type, adw_id)
+            return claimed
 
         return None
 
-    except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
+    except TRANSIENT_DATABASE_ERRORS as e:
         if logger:
             logger.warning(
                 "Transient database error during get_next_issue: %s. Resetting client.",
@@ -87,28 +155,272 @@ def get_next_issue(
             original_error=e,
         ) from e
 
+    except CircuitOpenError as e:
+        if logger:
+            logger.debug("%s", e)
+        return None
+
     except Exception:
         if logger:
             logger.exception("Error retrieving next issue")
         return None
 
 
+def get_next_issues(
+    worker_id: str,
+    limit: int,
+    logger: Optional[logging.Logger] = None,
+    lease_seconds: Optional[int] = None,
+    pool: Optional[str] = None,
+    steal_threshold: Optional[int] = None,
+) -> list[ClaimedIssue]:
+    """
+    Atomically retrieve and lock up to ``limit`` pending issues via RPC.
+
+    Calls the ``get_and_lock_next_issues`` Postgres RPC function, which claims
+    several issues in one round trip with ``FOR UPDATE SKIP LOCKED``. Issues
+    are returned in claim order (highest effective priority first).
+
+    Args:
+        worker_id: Unique identifier for the worker requesting issues.
+            Passed as ``p_worker_id`` so only issues assigned to this worker
+            are returned, unless a pool is given.
+        limit: Maximum number of issues to claim. Must be >= 1.
+        logger: Optional logger for logging operations
+        lease_seconds: Optional lease duration for the claims; the database
+            default is used when omitted
+        pool: Optional work pool name; see ``get_next_issue``
+        steal_threshold: Optional peer backlog size above which an idle pool
+            worker steals; see ``get_next_issue``
+
+    Returns:
+        List of (issue_id, description, status, type, adw_id) tuples; empty
+        if no issues are available, the RPC fails, or the database circuit
+        is open.
+
+    Raises:
+        ValueError: If limit is less than 1.
+        TransientDatabaseError: If a transient network/timeout error occurs during
+            the RPC call. The database client is automatically reset on these errors.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+
+    try:
+        backend = get_backend()
+
+        if logger:
+            logger.debug("Fetching up to %s issues for worker %s", limit, worker_id)
+
+        params = _claim_params(worker_id, lease_seconds, pool, steal_threshold)
+        params["p_limit"] = limit
+        rows = _best_effort_call(
+            "issue claim", lambda: backend.rpc("get_and_lock_next_issues", params)
+        )
+
+        claimed = [_parse_claimed_issue(row) for row in rows]
+        if claimed and logger:
+            logger.info(
+                "Locked %s issue(s) %s for processing",
+                len(claimed),
+                [issue[0] for issue in claimed],
+            )
+        return claimed
+
+    except TRANSIENT_DATABASE_ERRORS as e:
+        if logger:
+            logger.warning(
+                "Transient database error during get_next_issues: %s. Resetting client.",
+                type(e).__name__,
+            )
+        reset_client()
+        raise TransientDatabaseError(
+            f"Database connection error while fetching next issues for worker {worker_id}",
+            original_error=e,
+        ) from e
+
+    except CircuitOpenError as e:
+        if logger:
+            logger.debug("%s", e)
+        return []
+
+    except Exception:
+        if logger:
+            logger.exception("Error retrieving next issues")
+        return []
+
+
+def release_issues(
+    worker_id: str,
+    issue_ids: list[int],
+    logger: Optional[logging.Logger] = None,
+) -> list[int]:
+    """
+    Return claimed-but-unstarted issues to ``pending`` via RPC.
+
+    Calls the ``release_claimed_issues`` Postgres RPC function. Only issues
+    that are still ``claimed`` and assigned to ``worker_id`` are released, so
+    issues that have already started are never touched. Issues claimed from a
+    work pool, the unassigned queue, or a peer are handed back there.
+
+    Args:
+        worker_id: Unique identifier for the worker that holds the claims.
+        issue_ids: IDs of the claimed issues to release.
+        logger: Optional logger for logging operations
+
+    Returns:
+        IDs of the issues that were released; empty if none were released,
+        the RPC fails, or the database circuit is open (the claims then go
+        back to pending once their leases expire).
+    """
+    if not issue_ids:
+        return []
+
+    try:
+        backend = get_backend()
+        rows = _best_effort_call(
+            "claim release",
+            lambda: backend.rpc(
+                "release_claimed_issues", {"p_worker_id": worker_id, "p_issue_ids": issue_ids}
+            ),
+        )
+        released = [row["issue_id"] for row in rows]
+        if logger:
+            logger.info("Released %s unprocessed claim(s): %s", len(released), released)
+        return released
+
+    except Exception:
+        if logger:
+            logger.exception("Error releasing claimed issues %s", issue_ids)
+        else:
+            logging.getLogger(__name__).exception("Error releasing claimed issues %s", issue_ids)
+        return []
+
+
+def renew_leases(
+    worker_id: str,
+    issue_ids: list[int],
+    lease_seconds: int,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[list[int]]:
+    """
+    Extend the leases this worker holds on claimed or started issues via RPC.
+
+    Calls the ``renew_issue_leases`` Postgres RPC function. Only leases still
+    owned by ``worker_id`` on issues that are ``claimed`` or ``started`` are
+    renewed; an issue missing from the result has lost its lease (for
+    example, it was reaped after the worker stalled).
+
+    Args:
+        worker_id: Unique identifier for the worker that holds the leases.
+        issue_ids: IDs of the issues whose leases to renew.
+        lease_seconds: New lease duration, counted from now.
+        logger: Optional logger for logging operations
+
+    Renewals are made even while the database circuit is open, so running
+    work keeps its leases, and their outcomes count towards the breaker.
+
+    Returns:
+        IDs of the issues whose leases were renewed, or None if the RPC
+        failed and the outcome is unknown.
+    """
+    if not issue_ids:
+        return []
+
+    try:
+        backend = get_backend()
+        rows = _observe(
+            get_circuit_breaker(),
+            lambda: backend.rpc(
+                "renew_issue_leases",
+                {
+                    "p_worker_id": worker_id,
+                    "p_issue_ids": issue_ids,
+                    "p_lease_seconds": lease_seconds,
+                },
+            ),
+        )
+        return [row["issue_id"] for row in rows]
+
+    except Exception:
+        if logger:
+            logger.exception("Error renewing leases for issues %s", issue_ids)
+        else:
+            logging.getLogger(__name__).exception("Error renewing leases for issues %s", issue_ids)
+        return None
+
+
+ReapedLease = Tuple[int, str, int, Optional[str]]
+
+
+def reap_expired_leases(
+    max_attempts: int,
+    logger: Optional[logging.Logger] = None,
+) -> list[ReapedLease]:
+    """
+    Return issues whose lease has expired to ``pending`` via RPC.
+
+    Calls the ``reap_expired_leases`` Postgres RPC function. Issues that are
+    ``claimed`` or ``started`` with an expired lease go back to ``pending``,
+    or to ``failed`` once they have been claimed ``max_attempts`` times.
+    Unlike the polling helpers, RPC errors propagate so callers can report
+    them. The call is made whatever the circuit breaker state, and its
+    outcome counts towards the breaker.
+
+    Args:
+        max_attempts: Number of claims after which an expired issue is failed
+            instead of retried. Must be >= 1.
+        logger: Optional logger for logging operations
+
+    Returns:
+        List of (issue_id, new_status, attempts, previous_owner) tuples for
+        the reaped issues.
+
+    Raises:
+        ValueError: If max_attempts is less than 1.
+    """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+
+    backend = get_backend()
+    rows = _observe(
+        get_circuit_breaker(),
+        lambda: backend.rpc("reap_expired_leases", {"p_max_attempts": max_attempts}),
+    )
+    reaped = [
+        (row["issue_id"], row["issue_status"], row["issue_attempts"], row.get("previous_owner"))
+        for row in rows
+    ]
+    if reaped and logger:
+        logger.info("Reaped %s expired lease(s): %s", len(reaped), [lease[0] for lease in reaped])
+    return reaped
+
+
 def update_issue_status(
     issue_id: int,
     status: str,
     logger: Optional[logging.Logger] = None,
+    expected_status: Optional[str] = None,
 ) -> bool:
     """
     Update the status of an issue in the database.
 
+    The update is a single compare-and-set RPC; see
+    ``rouge.core.database.transition_issue_status``.
+
     Args:
         issue_id: The ID of the issue to update
         status: The new status reflecting the issue lifecycle:
             pending → claimed → started → completed|failed
         logger: Optional logger for logging operations
+        expected_status: Optional status the issue must currently have
 
     Returns:
         True if the status was updated successfully, False otherwise.
+
+    Raises:
+        IssueStatusConflictError: If the issue is no longer in ``expected_status``,
+            so the caller can stop working on an issue it no longer owns
     """
     if status not in VALID_ISSUE_STATUSES:
         error_message = (
@@ -122,9 +434,15 @@ def update_issue_status(
         return False
 
     try:
-        _transition_issue_status(issue_id, status)
+        if expected_status is None:
+            _transition_issue_status(issue_id, status)
+        else:
+            _transition_issue_status(issue_id, status, expected_status=expected_status)
         return True
 
+    except IssueStatusConflictError:
+        raise
+
     except Exception:
         if logger:
             logger.exception("Error updating issue %s status", issue_id)
@@ -0,0 +1,132 @@
+"""In-process workflow execution for the Rouge Worker.
+
+Instead of launching ``rouge-adw`` as a fresh interpreter for every issue, the
+worker can fork itself and call ``execute_adw_workflow`` directly in the
+child. The child inherits the worker's already-imported modules (supabase,
+pydantic, typer, and every workflow step), so short workflows no longer pay
+interpreter startup, import, and uv environment resolution on each claim.
+Running in a child process rather than a thread keeps the worker isolated
+from workflow crashes and lets timeouts kill the workflow outright.
+
+The child re-creates its own Supabase client so it never shares the parent's
+HTTP connections.
+"""
+
+import logging
+import multiprocessing
+import signal
+import subprocess
+import sys
+from typing import Final, Optional
+
+from rouge.adw.adw import execute_adw_workflow
+from rouge.core.database import reset_client
+from rouge.core.utils import get_logger, setup_logger
+
+FORK_START_METHOD: Final = "fork"
+
+
+def fork_supported() -> bool:
+    """Return True if the platform supports forking worker children."""
+    return FORK_START_METHOD in multiprocessing.get_all_start_methods()
+
+
+def run_workflow_job(issue_id: int, adw_id: str, workflow_type: str) -> bool:
+    """Run an ADW workflow in the current process the way ``rouge-adw`` does.
+
+    Args:
+        issue_id: The ID of the issue to process
+        adw_id: The ADW ID for the workflow execution
+        workflow_type: The workflow type (e.g. "full", "patch")
+
+    Returns:
+        True if the workflow succeeded, False if it failed or raised
+    """
+    setup_logger(adw_id)
+    try:
+        success, _ = execute_adw_workflow(adw_id, issue_id, workflow_type=workflow_type)
+    except Exception:
+        get_logger(adw_id).exception("ADW workflow failed with unexpected error")
+        return False
+    return success
+
+
+def _run_workflow_child(issue_id: int, adw_id: str, workflow_type: str) -> None:
+    """Entry point of a forked workflow child.
+
+    Mirrors the ``rouge-adw`` CLI: runs the workflow and exits 0 on success
+    or 1 on failure.
+
+    Args:
+        issue_id: The ID of the issue to process
+        adw_id: The ADW ID for the workflow execution
+        workflow_type: The workflow type (e.g. "full", "patch")
+    """
+    # The worker's shutdown handlers only flip a flag; children must die on signals
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # Never reuse the parent's pooled HTTP connections across the fork
+    reset_client()
+
+    success = run_workflow_job(issue_id, adw_id, workflow_type)
+    logging.shutdown()
+    sys.exit(0 if success else 1)
+
+
+class ForkedWorkflow:
+    """A workflow running in a forked child of the worker process.
+
+    Exposes the subset of the ``subprocess.Popen`` interface the worker uses
+    (``pid``, ``poll``, ``wait``, ``kill``) so it can stand in for a
+    ``rouge-adw`` child wherever one is supervised.
+    """
+
+    def __init__(self, issue_id: int, adw_id: str, workflow_type: str) -> None:
+        """Fork a child that runs the workflow.
+
+        Args:
+            issue_id: The ID of the issue to process
+            adw_id: The ADW ID for the workflow execution
+            workflow_type: The workflow type (e.g. "full", "patch")
+
+        Raises:
+            OSError: If the child process cannot be forked
+        """
+        context = multiprocessing.get_context(FORK_START_METHOD)
+        self._process = context.Process(
+            target=_run_workflow_child,
+            args=(issue_id, adw_id, workflow_type),
+            name=f"rouge-adw-{adw_id}",
+        )
+        self._process.start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process ID of the forked child."""
+        return self._process.pid
+
+    def poll(self) -> Optional[int]:
+        """Return the child's exit code, or None if it is still running."""
+        return self._process.exitcode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Wait for the child to exit.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            The child's exit code (negative if it was killed by a signal)
+
+        Raises:
+            subprocess.TimeoutExpired: If the child is still running after timeout
+        """
+        self._process.join(timeout)
+        exitcode = self._process.exitcode
+        if exitcode is None:
+            raise subprocess.TimeoutExpired(self._process.name, timeout or 0)
+        return exitcode
+
+    def kill(self) -> None:
+        """Kill the child with SIGKILL."""
+        self._process.kill()
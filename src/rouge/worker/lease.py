@@ -0,0 +1,150 @@
+"""Lease heartbeat for the Rouge Worker.
+
+Every claim records a lease on the issue (``lease_owner`` and
+``lease_expires_at``) that lapses unless it is renewed. ``LeaseHeartbeat``
+renews the leases of every issue the worker holds, both queued claims and
+running workflows, from a background thread. A live worker therefore keeps
+its work for as long as a workflow runs, while the issues of a worker whose
+host died stop being renewed and are returned to ``pending`` by
+``reap_expired_leases``.
+
+The heartbeat can also run the reaper itself every ``reap_interval``
+seconds, so a fleet recovers stranded work without an operator running
+``rouge-worker reap-leases``.
+
+A renewal that finds a lease gone means the issue was reaped or reassigned
+while this worker still ran it. Such issues are remembered as lost until they
+are untracked, so the worker can check ``lease_lost`` and stop the workflow
+or skip its final status write instead of overwriting another run's status.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from .database import reap_expired_leases, renew_leases
+
+# Seconds to wait for the heartbeat thread to finish when stopping
+HEARTBEAT_STOP_TIMEOUT = 5.0
+
+
+class LeaseHeartbeat:
+    """Renews the leases held by one worker on a background thread."""
+
+    def __init__(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        interval: float,
+        logger: Optional[logging.Logger] = None,
+        reap_interval: float = 0,
+        max_attempts: int = 3,
+    ) -> None:
+        """Initialize the heartbeat without starting its thread.
+
+        Args:
+            worker_id: Worker that owns the leases
+            lease_seconds: Lease duration applied on each renewal
+            interval: Seconds between renewals; must be below lease_seconds
+            logger: Optional logger; defaults to this module's logger
+            reap_interval: Seconds between runs of the expired-lease reaper,
+                or 0 to leave reaping to another process
+            max_attempts: Claims after which the reaper fails an issue
+                instead of returning it to pending
+
+        Raises:
+            ValueError: If interval is not positive or not below lease_seconds
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if interval >= lease_seconds:
+            raise ValueError("interval must be less than lease_seconds")
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.interval = interval
+        self.reap_interval = reap_interval
+        self.max_attempts = max_attempts
+        self.logger = logger or logging.getLogger(__name__)
+        self._held: set[int] = set()
+        self._lost: set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_reap_at = 0.0
+
+    def track(self, *issue_ids: int) -> None:
+        """Start renewing the leases of newly claimed issues."""
+        with self._lock:
+            self._held.update(issue_ids)
+            self._lost.difference_update(issue_ids)
+
+    def untrack(self, *issue_ids: int) -> None:
+        """Stop renewing the leases of issues that finished or were released."""
+        with self._lock:
+            self._held.difference_update(issue_ids)
+            self._lost.difference_update(issue_ids)
+
+    def held(self) -> list[int]:
+        """Return the IDs of the issues whose leases are being renewed."""
+        with self._lock:
+            return sorted(self._held)
+
+    def lease_lost(self, issue_id: int) -> bool:
+        """Return True if a renewal found the issue's lease taken from this worker."""
+        with self._lock:
+            return issue_id in self._lost
+
+    def beat(self) -> None:
+        """Renew all held leases once, and run the reaper if it is due.
+
+        Issues whose lease could not be renewed were reaped or reassigned
+        while this worker held them; they are moved from the held set to the
+        lost set and reported, since another run may now pick them up.
+        """
+        issue_ids = self.held()
+        if issue_ids:
+            renewed = renew_leases(self.worker_id, issue_ids, self.lease_seconds, self.logger)
+            if renewed is not None:
+                lost = set(issue_ids) - set(renewed)
+                with self._lock:
+                    # Ignore issues that finished while the renewal was in flight
+                    lost &= self._held
+                    self._held -= lost
+                    self._lost |= lost
+                if lost:
+                    self.logger.warning(
+                        "Lost lease on issue(s) %s; they may be picked up by another run",
+                        sorted(lost),
+                    )
+
+        if self.reap_interval and time.monotonic() >= self._next_reap_at:
+            self._next_reap_at = time.monotonic() + self.reap_interval
+            try:
+                reap_expired_leases(self.max_attempts, self.logger)
+            except Exception:
+                self.logger.exception("Error reaping expired leases")
+
+    def start(self) -> None:
+        """Start the heartbeat thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"rouge-lease-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat thread and wait for it to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(HEARTBEAT_STOP_TIMEOUT)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.beat()
+            except Exception:
+                self.logger.exception("Lease heartbeat failed")
@@ -0,0 +1,401 @@
+"""Prometheus-style metrics for the Rouge Worker.
+
+``WorkerMetrics`` keeps in-process counters, histograms, and gauges for one
+worker: poll latency and outcomes, transient database errors, workflow
+durations and exit codes by issue type, timeouts, the current
+``WorkerArtifact.state``, the Supabase HTTP connection pool, and the
+database circuit breaker.
+``MetricsServer`` exposes them in the Prometheus text exposition format on
+``/metrics`` using only the standard library HTTP server, so scraping works
+without extra dependencies or network access.
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from rouge.core.database import (
+    CIRCUIT_STATES,
+    CircuitBreakerStats,
+    HttpPoolStats,
+    get_circuit_breaker_stats,
+    get_http_pool_stats,
+)
+
+# Histogram bucket upper bounds in seconds for database poll round trips
+POLL_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Histogram bucket upper bounds in seconds for workflow executions
+WORKFLOW_DURATION_BUCKETS = (10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0, 7200.0)
+
+# States reported by the rouge_worker_state gauge
+WORKER_STATES = ("ready", "working", "failed")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    """Render a Prometheus label set such as ``{issue_type="full"}``."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, dropping the fraction for whole numbers."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class for a named metric family with optional labels."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {list(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        """Return the exposition lines for this metric family."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, one series per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {} if labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given labels."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, one series per label combination."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: tuple[float, ...],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: (non-cumulative bucket counts incl. +Inf, sum)
+        self._series: dict[LabelValues, tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given labels."""
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), -1)
+        with self._lock:
+            counts, total = self._series.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return sum(series[0]) if series else 0
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.labelnames, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class WorkerMetrics:
+    """The metric families recorded by one IssueWorker."""
+
+    def __init__(self) -> None:
+        self.poll_duration = Histogram(
+            "rouge_worker_poll_duration_seconds",
+            "Duration of claim RPC round trips",
+            POLL_DURATION_BUCKETS,
+        )
+        self.polls = Counter(
+            "rouge_worker_polls_total",
+            "Database polls by outcome (hit, miss, or error)",
+            ("result",),
+        )
+        self.transient_db_errors = Counter(
+            "rouge_worker_transient_db_errors_total",
+            "TransientDatabaseError occurrences while claiming issues",
+        )
+        self.workflow_duration = Histogram(
+            "rouge_worker_workflow_duration_seconds",
+            "Wall-clock duration of workflow executions",
+            WORKFLOW_DURATION_BUCKETS,
+            ("issue_type",),
+        )
+        self.workflow_exits = Counter(
+            "rouge_worker_workflow_exits_total",
+            "Finished workflows by issue type and exit code",
+            ("issue_type", "exit_code"),
+        )
+        self.workflow_timeouts = Counter(
+            "rouge_worker_workflow_timeouts_total",
+            "Workflows killed after exceeding the workflow timeout",
+            ("issue_type",),
+        )
+        self.state = Gauge(
+            "rouge_worker_state",
+            "Current worker artifact state (1 for the active state)",
+            ("state",),
+        )
+        self.http_connections = Gauge(
+            "rouge_worker_http_connections",
+            "Open Supabase HTTP connections by state (idle or active)",
+            ("state",),
+        )
+        self.http_client_resets = Gauge(
+            "rouge_worker_http_client_resets",
+            "Supabase HTTP clients closed and rebuilt since the worker started",
+        )
+        self.db_circuit_state = Gauge(
+            "rouge_worker_db_circuit_state",
+            "Database circuit breaker state (1 for the current state)",
+            ("state",),
+        )
+        self.db_circuit_trips = Gauge(
+            "rouge_worker_db_circuit_trips",
+            "Times the database circuit opened since the worker started",
+        )
+        self.db_circuit_short_circuited = Gauge(
+            "rouge_worker_db_circuit_short_circuited",
+            "Best-effort database calls skipped while the circuit was open",
+        )
+
+    def record_poll(self, result: str) -> None:
+        """Count a poll outcome: "hit", "miss", or "error"."""
+        self.polls.inc(result=result)
+
+    def record_workflow(
+        self,
+        issue_type: str,
+        duration: float,
+        returncode: Optional[int] = None,
+        timed_out: bool = False,
+    ) -> None:
+        """Record a finished workflow.
+
+        Args:
+            issue_type: Workflow type the issue ran with
+            duration: Seconds from launch to completion
+            returncode: Child exit code, or None if it never produced one
+            timed_out: Whether the workflow was killed for exceeding its timeout
+        """
+        self.workflow_duration.observe(duration, issue_type=issue_type)
+        if timed_out:
+            self.workflow_timeouts.inc(issue_type=issue_type)
+        elif returncode is not None:
+            self.workflow_exits.inc(issue_type=issue_type, exit_code=str(returncode))
+
+    def set_state(self, state: str) -> None:
+        """Mark ``state`` as the worker's current artifact state."""
+        for candidate in WORKER_STATES:
+            self.state.set(1 if candidate == state else 0, state=candidate)
+
+    def record_http_pool(self, stats: HttpPoolStats) -> None:
+        """Copy a connection pool snapshot into the HTTP gauges."""
+        self.http_connections.set(stats.idle_connections, state="idle")
+        self.http_connections.set(stats.connections - stats.idle_connections, state="active")
+        self.http_client_resets.set(stats.resets)
+
+    def record_circuit_breaker(self, stats: CircuitBreakerStats) -> None:
+        """Copy a circuit breaker snapshot into the circuit gauges."""
+        for candidate in CIRCUIT_STATES:
+            self.db_circuit_state.set(1 if candidate == stats.state else 0, state=candidate)
+        self.db_circuit_trips.set(stats.trips)
+        self.db_circuit_short_circuited.set(stats.short_circuited)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format.
+
+        The HTTP pool and circuit breaker gauges are refreshed from their live
+        state on every render.
+        """
+        self.record_http_pool(get_http_pool_stats())
+        self.record_circuit_breaker(get_circuit_breaker_stats())
+        families = (
+            self.poll_duration,
+            self.polls,
+            self.transient_db_errors,
+            self.workflow_duration,
+            self.workflow_exits,
+            self.workflow_timeouts,
+            self.state,
+            self.http_connections,
+            self.http_client_resets,
+            self.db_circuit_state,
+            self.db_circuit_trips,
+            self.db_circuit_short_circuited,
+        )
+        lines: list[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves ``WorkerMetrics`` on ``/metrics`` from a background thread."""
+
+    def __init__(
+        self,
+        metrics: WorkerMetrics,
+        port: int,
+        host: str = "127.0.0.1",
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize the server without binding its socket.
+
+        Args:
+            metrics: Metrics to expose
+            port: TCP port to listen on; 0 picks a free port
+            host: Interface to bind; defaults to loopback only
+            logger: Optional logger; defaults to this module's logger
+        """
+        self.metrics = metrics
+        self.host = host
+        self.requested_port = port
+        self.logger = logger or logging.getLogger(__name__)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to, once started."""
+        if self._server is None:
+            return self.requested_port
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """Bind the socket and start serving if not already running.
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        if self._server is not None:
+            return
+        metrics = self.metrics
+        logger = self.logger
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug("Metrics request: " + format, *args)
+
+        self._server = ThreadingHTTPServer((self.host, self.requested_port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="rouge-metrics", daemon=True
+        )
+        self._thread.start()
+        self.logger.info("Serving metrics on http://%s:%s/metrics", self.host, self.port)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
@@ -0,0 +1,160 @@
+"""Postgres LISTEN/NOTIFY support for push-based issue dispatch.
+
+The ``notify_issue_pending`` trigger sends a notification on
+``ISSUE_NOTIFY_CHANNEL`` whenever an issue becomes pending for a worker. The
+listener in this module holds a dedicated psycopg2 connection that LISTENs on
+that channel so an idle worker can block until work arrives instead of
+sleeping for a fixed poll interval. Polling remains as a safety net: every
+wait is bounded by a timeout, and connection failures degrade to a plain
+sleep until the connection can be re-established.
+"""
+
+import json
+import logging
+import os
+import select
+import time
+from typing import Optional
+
+import psycopg2
+import psycopg2.extensions
+
+ISSUE_NOTIFY_CHANNEL = "rouge_issue_pending"
+
+
+def get_database_url() -> Optional[str]:
+    """Get the direct Postgres connection string from the environment.
+
+    Returns:
+        The value of ``ROUGE_DATABASE_URL`` with surrounding whitespace
+        removed, or None if it is unset or empty.
+    """
+    url = os.getenv("ROUGE_DATABASE_URL", "").strip()
+    return url or None
+
+
+class IssueNotificationListener:
+    """Blocks on Postgres notifications for issues assigned to one worker."""
+
+    def __init__(
+        self,
+        dsn: str,
+        worker_id: str,
+        channel: str = ISSUE_NOTIFY_CHANNEL,
+        logger: Optional[logging.Logger] = None,
+        pool: Optional[str] = None,
+    ) -> None:
+        """Initialize the listener.
+
+        The connection is opened lazily on the first call to ``wait``.
+
+        Args:
+            dsn: Postgres connection string
+            worker_id: Only notifications assigned to this worker wake the caller
+            channel: Notification channel to LISTEN on
+            logger: Optional logger; defaults to this module's logger
+            pool: Optional work pool; notifications for the pool and for
+                unassigned issues then wake the caller as well
+        """
+        self.dsn = dsn
+        self.worker_id = worker_id
+        self.channel = channel
+        self.pool = pool
+        self.logger = logger or logging.getLogger(__name__)
+        self._conn: Optional[psycopg2.extensions.connection] = None
+
+    def connect(self) -> None:
+        """Open the connection and start listening on the channel.
+
+        Raises:
+            psycopg2.Error: If the connection or LISTEN fails
+        """
+        conn = psycopg2.connect(self.dsn)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+        except psycopg2.Error:
+            conn.close()
+            raise
+        self._conn = conn
+        self.logger.info("Listening for issue notifications on channel %s", self.channel)
+
+    def close(self) -> None:
+        """Close the connection if it is open."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                self.logger.debug("Error closing notification connection", exc_info=True)
+            self._conn = None
+
+    def _is_for_worker(self, payload: str) -> bool:
+        """Check whether a notification payload targets this worker.
+
+        Args:
+            payload: JSON payload sent by ``notify_issue_pending``
+
+        Returns:
+            True if the payload's ``assigned_to`` matches this worker, or its
+            pool or no one when the worker belongs to a pool
+        """
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            self.logger.warning("Ignoring malformed issue notification payload: %r", payload)
+            return False
+        if not isinstance(data, dict):
+            return False
+        assigned_to = data.get("assigned_to")
+        if assigned_to == self.worker_id:
+            return True
+        return self.pool is not None and assigned_to in (self.pool, None)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until an issue is assigned to this worker or the timeout elapses.
+
+        Reconnects if the connection is missing. When the connection cannot be
+        established or breaks while waiting, falls back to sleeping for the
+        remaining timeout so callers keep their regular poll cadence.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if a notification for this worker arrived, False on timeout
+            or connection failure
+        """
+        deadline = time.monotonic() + timeout
+        if self._conn is None:
+            try:
+                self.connect()
+            except psycopg2.Error as e:
+                self.logger.warning("Could not listen for issue notifications: %s", e)
+                time.sleep(timeout)
+                return False
+
+        conn = self._conn
+        if conn is None:
+            raise RuntimeError("notification connection must not be None after connect")
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                readable, _, _ = select.select([conn], [], [], remaining)
+                if not readable:
+                    return False
+                conn.poll()
+                notified = False
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    if self._is_for_worker(notify.payload):
+                        notified = True
+                if notified:
+                    return True
+        except (psycopg2.Error, OSError) as e:
+            self.logger.warning("Issue notification connection lost: %s", e)
+            self.close()
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return False
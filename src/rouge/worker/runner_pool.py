@@ -0,0 +1,390 @@
+"""Pre-started warm runner pool for the Rouge Worker.
+
+A warm runner is a separate Python process that has already imported the
+workflow stack, built the prompt registry, and opened a Supabase client
+before any issue is claimed. The worker hands each claimed
+``(issue_id, adw_id, workflow_type)`` to an idle runner over a pipe, so a
+claim starts executing immediately instead of waiting for interpreter
+startup, imports, and uv environment resolution.
+
+Each workflow still runs in its own process, isolated from the worker. A
+runner is retired after ``max_jobs`` workflows (one by default, so no state
+leaks between workflows), and a replacement is started as soon as a runner
+is handed its last job, so its warm-up overlaps the running workflow.
+
+Runners are started with the ``spawn`` method by default: they are fresh
+interpreters that inherit nothing from the worker beyond its environment and
+working directory.
+"""
+
+import logging
+import multiprocessing
+import multiprocessing.connection
+import signal
+import subprocess
+import time
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Callable, Final, Optional
+
+from rouge.core.database import get_client, reset_client
+from rouge.core.prompts import get_registry
+
+from .in_process import run_workflow_job
+
+RUNNER_START_METHOD: Final = "spawn"
+
+# Seconds to wait for a retired runner to exit before killing it
+RUNNER_EXIT_TIMEOUT = 5.0
+
+WorkflowJob = Callable[[int, str, str], bool]
+
+
+def _warm_up(logger: logging.Logger) -> None:
+    """Load the expensive per-process state a workflow needs.
+
+    Importing this module has already imported the workflow stack; this
+    builds the prompt registry and opens the Supabase client.
+
+    Args:
+        logger: Logger for warm-up failures
+    """
+    get_registry()
+    try:
+        get_client()
+    except Exception as e:
+        # Leave it to the workflow to surface configuration errors
+        logger.warning("Warm runner could not open a Supabase client: %s", e)
+
+
+def _runner_main(
+    conn: multiprocessing.connection.Connection, max_jobs: int, job: WorkflowJob
+) -> None:
+    """Entry point of a warm runner process.
+
+    Warms up, reports ``("ready", None)``, then runs up to ``max_jobs``
+    requests from the pipe, answering each with ``("done", success)``. A
+    ``None`` request or a closed pipe stops the runner early.
+
+    Args:
+        conn: Runner end of the pipe to the worker
+        max_jobs: Number of workflows to run before exiting
+        job: Callable that runs one workflow and returns its success
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # A forked runner must not share the worker's HTTP connections
+    reset_client()
+    _warm_up(logging.getLogger(__name__))
+    try:
+        conn.send(("ready", None))
+        for _ in range(max_jobs):
+            request = conn.recv()
+            if request is None:
+                break
+            issue_id, adw_id, workflow_type = request
+            success = job(issue_id, adw_id, workflow_type)
+            conn.send(("done", success))
+    except (EOFError, OSError):
+        # The worker closed its end of the pipe; nothing left to do
+        pass
+    finally:
+        conn.close()
+        logging.shutdown()
+
+
+class _Runner:
+    """Worker-side handle for one runner process."""
+
+    def __init__(
+        self,
+        context: BaseContext,
+        max_jobs: int,
+        job: WorkflowJob,
+    ) -> None:
+        parent_conn, child_conn = context.Pipe()
+        process_class = context.Process  # type: ignore[attr-defined]
+        self.process: BaseProcess = process_class(
+            target=_runner_main,
+            args=(child_conn, max_jobs, job),
+            name="rouge-runner",
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.jobs = 0
+        self.ready = False
+
+    def refresh_ready(self) -> bool:
+        """Consume a pending ready message without blocking.
+
+        Returns:
+            True if the runner has finished warming up
+        """
+        if not self.ready:
+            try:
+                if self.conn.poll():
+                    message = self.conn.recv()
+                    self.ready = message[0] == "ready"
+            except (EOFError, OSError):
+                return False
+        return self.ready
+
+    def retire(self) -> None:
+        """Ask the runner to exit without waiting for it."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.conn.close()
+
+    def reap(self, wait: bool = False) -> bool:
+        """Collect a retired runner's exit status.
+
+        Args:
+            wait: If True, wait up to RUNNER_EXIT_TIMEOUT for the runner to
+                exit and kill it if it does not; otherwise only check
+
+        Returns:
+            True if the runner has exited
+        """
+        self.process.join(RUNNER_EXIT_TIMEOUT if wait else 0)
+        if wait and self.process.exitcode is None:
+            self.process.kill()
+            self.process.join()
+        return self.process.exitcode is not None
+
+
+class RunnerJob:
+    """A workflow handed to a warm runner.
+
+    Exposes the subset of the ``subprocess.Popen`` interface the worker uses
+    (``pid``, ``poll``, ``wait``, ``kill``). The return code is 0 if the
+    workflow succeeded, 1 if it failed, or the runner's exit code if it died
+    without reporting a result.
+    """
+
+    def __init__(self, pool: "WarmRunnerPool", runner: _Runner) -> None:
+        self._pool = pool
+        self._runner = runner
+        self.returncode: Optional[int] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process ID of the runner executing the workflow."""
+        return self._runner.process.pid
+
+    def poll(self) -> Optional[int]:
+        """Return the workflow's return code, or None if it is still running."""
+        if self.returncode is None:
+            self._check(0)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Wait for the workflow to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            The workflow's return code
+
+        Raises:
+            subprocess.TimeoutExpired: If the workflow is still running after timeout
+        """
+        if self.returncode is None and not self._check(timeout):
+            raise subprocess.TimeoutExpired(self._runner.process.name, timeout or 0)
+        if self.returncode is None:
+            raise RuntimeError("runner job must have a return code after finishing")
+        return self.returncode
+
+    def kill(self) -> None:
+        """Kill the runner executing the workflow."""
+        if self.returncode is not None:
+            return
+        self._runner.process.kill()
+        self._runner.process.join()
+        self._finish(self._runner.process.exitcode or -signal.SIGKILL)
+
+    def _check(self, timeout: Optional[float]) -> bool:
+        """Wait up to ``timeout`` for the runner's result.
+
+        Args:
+            timeout: Seconds to wait, 0 to check without blocking, or None to
+                wait forever
+
+        Returns:
+            True once the workflow has finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        conn = self._runner.conn
+        try:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not conn.poll(remaining):
+                    return False
+                status, success = conn.recv()
+                if status == "ready":
+                    self._runner.ready = True
+                    continue
+                self._finish(0 if success else 1)
+                return True
+        except (EOFError, OSError):
+            # The runner died without reporting a result
+            self._runner.process.join()
+            self._finish(self._runner.process.exitcode or 1)
+            return True
+
+    def _finish(self, returncode: int) -> None:
+        self.returncode = returncode
+        self._pool._release(self._runner)
+
+
+class WarmRunnerPool:
+    """Keeps a number of idle, warmed-up runner processes ready for work."""
+
+    def __init__(
+        self,
+        size: int,
+        max_jobs: int = 1,
+        start_method: str = RUNNER_START_METHOD,
+        job: WorkflowJob = run_workflow_job,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize the pool without starting any runners.
+
+        Args:
+            size: Number of idle runners to keep warm
+            max_jobs: Number of workflows a runner executes before it is replaced
+            start_method: multiprocessing start method for runners
+            job: Module-level callable that runs one workflow in a runner
+            logger: Optional logger; defaults to this module's logger
+
+        Raises:
+            ValueError: If size or max_jobs is not positive
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be positive")
+        self.size = size
+        self.max_jobs = max_jobs
+        self.job = job
+        self.logger = logger or logging.getLogger(__name__)
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: list[_Runner] = []
+        self._retired: list[_Runner] = []
+        self._closed = False
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle runners, warm or still warming up."""
+        return len(self._idle)
+
+    def start(self) -> None:
+        """Start runners until ``size`` are idle."""
+        self._prune()
+        while not self._closed and len(self._idle) < self.size:
+            self._idle.append(_Runner(self._context, self.max_jobs, self.job))
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until every idle runner has finished warming up.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            True if all idle runners are warm, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for runner in self._idle:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                if not runner.ready and runner.conn.poll(remaining):
+                    runner.refresh_ready()
+            except (EOFError, OSError):
+                return False
+            if not runner.ready:
+                return False
+        return True
+
+    def submit(self, issue_id: int, adw_id: str, workflow_type: str) -> RunnerJob:
+        """Hand a workflow to an idle runner and top the pool back up.
+
+        A warm runner is preferred. If none is warm yet, the request is queued
+        on a warming runner's pipe and starts as soon as it is ready.
+
+        Args:
+            issue_id: The ID of the issue to process
+            adw_id: The ADW ID for the workflow execution
+            workflow_type: The workflow type (e.g. "full", "patch")
+
+        Returns:
+            A handle for the running workflow
+
+        Raises:
+            RuntimeError: If the pool has been closed
+            OSError: If no runner can be started or reached
+        """
+        if self._closed:
+            raise RuntimeError("runner pool is closed")
+        self.start()
+        candidates = sorted(self._idle, key=lambda runner: not runner.refresh_ready())
+        for runner in candidates:
+            self._idle.remove(runner)
+            try:
+                runner.conn.send((issue_id, adw_id, workflow_type))
+            except (OSError, ValueError):
+                self.logger.warning("Discarding unreachable runner pid %s", runner.process.pid)
+                self._retire(runner)
+                continue
+            runner.jobs += 1
+            if runner.jobs >= self.max_jobs:
+                # Warm the replacement while the runner's last workflow runs
+                self.start()
+            return RunnerJob(self, runner)
+        raise OSError("no warm runner could accept the workflow")
+
+    def close(self) -> None:
+        """Stop all idle runners. Runners executing workflows are left to their handles."""
+        self._closed = True
+        while self._idle:
+            self._retire(self._idle.pop())
+        for runner in self._retired:
+            runner.reap(wait=True)
+        self._retired.clear()
+
+    def _retire(self, runner: _Runner) -> None:
+        """Ask a runner to exit; it is reaped later so callers never block on it."""
+        runner.retire()
+        self._retired.append(runner)
+
+    def _prune(self) -> None:
+        """Reap retired runners and drop idle runners that exited unexpectedly."""
+        self._retired = [runner for runner in self._retired if not runner.reap()]
+        for runner in list(self._idle):
+            if not runner.process.is_alive():
+                self.logger.warning(
+                    "Warm runner pid %s exited with code %s; replacing it",
+                    runner.process.pid,
+                    runner.process.exitcode,
+                )
+                self._idle.remove(runner)
+                self._retire(runner)
+
+    def _release(self, runner: _Runner) -> None:
+        """Return a runner to the pool after a workflow, or retire it.
+
+        Args:
+            runner: Runner whose workflow just finished
+        """
+        reusable = (
+            not self._closed
+            and runner.jobs < self.max_jobs
+            and runner.process.is_alive()
+            and len(self._idle) < self.size
+        )
+        if reusable:
+            self._idle.append(runner)
+        else:
+            self._retire(runner)
@@ -7,11 +7,16 @@ issues and executes the appropriate workflows using the rouge-adw command. The w
 operates independently of the CLI, providing automated background processing of issues
 with proper locking mechanisms to prevent race conditions between multiple worker instances.
 
+With ``--slots N`` a single worker supervises up to N concurrent rouge-adw
+children, claiming new issues while slots are free and reaping finished
+children without blocking the loop.
+
 Usage:
     python -m rouge-worker --worker-id <worker_id> [--poll-interval <seconds>] [--log-level <level>]
 
 Example:
     python -m rouge-worker --worker-id alleycat-1 --poll-interval 10 --log-level INFO
+    python -m rouge-worker --worker-id alleycat-1 --slots 4
 """
 
 import logging
@@ -21,37 +26,97 @@ import shutil
 import signal
 import subprocess
 import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from types import FrameType
-from typing import Literal
-
-from rouge.core.database import init_db_env, reset_client
+from typing import Any, Literal
+
+from rouge.core.database import (
+    CIRCUIT_OPEN,
+    IssueStatusConflictError,
+    get_circuit_breaker,
+    init_db_env,
+    reset_client,
+)
+from rouge.core.notifications.spool import replay_comment_spool
 from rouge.core.utils import _get_log_level, make_adw_id
 
 from .config import WorkerConfig
-from .database import get_next_issue, update_issue_status
+from .database import (
+    ClaimedIssue,
+    get_next_issue,
+    get_next_issues,
+    release_issues,
+    update_issue_status,
+)
 from .exceptions import TransientDatabaseError
+from .in_process import ForkedWorkflow
+from .lease import LeaseHeartbeat
+from .metrics import MetricsServer, WorkerMetrics
+from .notify import IssueNotificationListener
+from .poll_scheduler import PollScheduler, build_poll_scheduler
+from .runner_pool import RunnerJob, WarmRunnerPool
 from .worker_artifact import (
+    ArtifactSignature,
     WorkerArtifact,
+    WorkerSlot,
     read_worker_artifact,
     transition_worker_artifact,
+    worker_artifact_signature,
     write_worker_artifact,
 )
 
+# Seconds between reaping passes while slot children are running
+SLOT_REAP_INTERVAL = 1.0
+
+# Seconds an idle worker keeps poll counters in memory before writing them;
+# state transitions write the current counters anyway
+POLL_STATS_PERSIST_INTERVAL = 60.0
+
+
+@dataclass
+class _SlotProcess:
+    """A workflow child process owned by a worker slot."""
+
+    process: subprocess.Popen | ForkedWorkflow | RunnerJob
+    issue_id: int
+    adw_id: str
+    workflow_type: str
+    deadline: float
+    started_at: float
+
 
 class IssueWorker:
     """Worker daemon that processes pending issues from the database."""
 
-    def __init__(self, config: WorkerConfig):
+    def __init__(self, config: WorkerConfig, scheduler: PollScheduler | None = None):
         """
         Initialize the issue worker.
 
         Args:
             config: WorkerConfig instance with worker settings
+            scheduler: Optional poll scheduler; defaults to the one selected by
+                ``config.poll_strategy``
         """
         self.config = config
+        self.scheduler = scheduler or build_poll_scheduler(
+            config.poll_strategy,
+            config.poll_interval,
+            config.max_poll_interval or config.poll_interval,
+        )
         self.running = True
         self.worker_artifact: WorkerArtifact | None = None
+        self._slot_processes: dict[int, _SlotProcess] = {}
+        self._next_slot_poll_at = 0.0
+        self._next_comment_replay_at = 0.0
+        self._claim_queue: deque[ClaimedIssue] = deque()
+        self._transient_error_count = 0
+        self._listener: IssueNotificationListener | None = None
+        self._artifact_signature: ArtifactSignature | None = None
+        self._artifact_written_at = time.monotonic()
+        self.metrics = WorkerMetrics()
+        self._metrics_server: MetricsServer | None = None
         self._working_dir_note = None
         if self.config.working_dir is not None:
             os.chdir(self.config.working_dir)
@@ -83,7 +148,56 @@ class IssueWorker:
         signal.signal(signal.SIGINT, self._handle_shutdown)
 
         self.logger.info("Worker %s initialized", self.config.worker_id)
-        self.logger.info("Poll interval: %s seconds", self.config.poll_interval)
+        self.logger.info(
+            "Poll interval: %s seconds (%s strategy)",
+            self.config.poll_interval,
+            self.scheduler.strategy,
+        )
+        if self.config.slots > 1:
+            self.logger.info("Concurrent slots: %s", self.config.slots)
+        if self.config.claim_batch_size > 1:
+            self.logger.info("Claim batch size: %s", self.config.claim_batch_size)
+        if self.config.in_process:
+            self.logger.info("Running workflows in forked in-process children")
+        if self.config.pool is not None:
+            self.logger.info(
+                "Work pool: %s (steal threshold: %s)",
+                self.config.pool,
+                self.config.steal_threshold,
+            )
+        self._heartbeat = LeaseHeartbeat(
+            self.config.worker_id,
+            self.config.lease_seconds,
+            self.config.heartbeat_interval or self.config.lease_seconds // 3,
+            logger=self.logger,
+            reap_interval=self.config.reap_interval,
+            max_attempts=self.config.max_attempts,
+        )
+        self._runner_pool: WarmRunnerPool | None = None
+        if self.config.warm_pool:
+            self._runner_pool = WarmRunnerPool(
+                self.config.warm_pool, self.config.warm_pool_max_jobs, logger=self.logger
+            )
+            self.logger.info(
+                "Warm runner pool: %s idle runner(s), %s job(s) per runner",
+                self.config.warm_pool,
+                self.config.warm_pool_max_jobs,
+            )
+        if self.config.listen and self.config.database_url:
+            self._listener = IssueNotificationListener(
+                self.config.database_url,
+                self.config.worker_id,
+                logger=self.logger,
+                pool=self.config.pool,
+            )
+            self.logger.info("Listening for issue notifications; polling is a safety net")
+        if self.config.metrics_port is not None:
+            self._metrics_server = MetricsServer(
+                self.metrics,
+                self.config.metrics_port,
+                host=self.config.metrics_host,
+                logger=self.logger,
+            )
 
     def setup_logging(self) -> logging.Logger:
         """
@@ -129,7 +243,7 @@ class IssueWorker:
         Returns:
             WorkerArtifact instance
         """
-        artifact = read_worker_artifact(self.config.worker_id)
+        artifact = self._read_artifact()
         if artifact is None:
             # Create new artifact in ready state
             artifact = WorkerArtifact(
@@ -137,9 +251,15 @@ class IssueWorker:
                 state="ready",
                 current_issue_id=None,
                 current_adw_id=None,
+                slots=(
+                    [WorkerSlot(index=i) for i in range(self.config.slots)]
+                    if self.config.slots > 1
+                    else []
+                ),
             )
             # No need to refresh_timestamp here since it's a new artifact
-            write_worker_artifact(artifact)
+            write_worker_artifact(artifact, fsync=self.config.artifact_fsync != "never")
+            self._remember_artifact_write()
             self.logger.info("Created new worker artifact in state: ready")
         else:
             self.logger.info(
@@ -148,6 +268,7 @@ class IssueWorker:
                 artifact.current_issue_id,
                 artifact.current_adw_id,
             )
+        self.metrics.set_state(artifact.state)
         return artifact
 
     def _handle_shutdown(self, signum: int, _frame: FrameType | None) -> None:
@@ -167,6 +288,25 @@ class IssueWorker:
         # Fallback to uv run (development mode)
         return ["uv", "run", "rouge-adw"]
 
+    def _build_workflow_cmd(self, issue_id: int, workflow_type: str, adw_id: str) -> list[str]:
+        """Build the rouge-adw command line for a workflow execution.
+
+        Args:
+            issue_id: The ID of the issue to process
+            workflow_type: The workflow type passed via --workflow-type
+            adw_id: The ADW ID passed via --adw-id
+
+        Returns:
+            List of command components to execute
+        """
+        return self._get_base_cmd() + [
+            "--adw-id",
+            adw_id,
+            "--workflow-type",
+            workflow_type,
+            str(issue_id),
+        ]
+
     def _handle_workflow_failure(self, issue_id: int, workflow_type: str, reason: str) -> None:
         """Handle workflow failure by logging with exception context.
 
@@ -190,7 +330,43 @@ class IssueWorker:
         """
         if self.worker_artifact is None:
             raise RuntimeError("worker_artifact must not be None in _transition_artifact")
-        transition_worker_artifact(self.worker_artifact, state, clear_issue)
+        transition_worker_artifact(
+            self.worker_artifact,
+            state,
+            clear_issue,
+            fsync=self.config.artifact_fsync != "never",
+        )
+        self._remember_artifact_write()
+        self.metrics.set_state(state)
+
+    def _read_artifact(self) -> WorkerArtifact | None:
+        """Return the worker artifact, reading the file only if it changed.
+
+        The in-memory artifact is authoritative while the file on disk is the
+        one this worker last wrote or read. The file is re-read and validated
+        only when its inode, modification time, or size differs, for example
+        after ``rouge-worker reset`` rewrote it.
+
+        Returns:
+            The current WorkerArtifact, or None if it is missing or unreadable
+        """
+        signature = worker_artifact_signature(self.config.worker_id)
+        if (
+            signature is not None
+            and signature == self._artifact_signature
+            and self.worker_artifact is not None
+        ):
+            return self.worker_artifact
+        artifact = read_worker_artifact(self.config.worker_id)
+        self._artifact_signature = signature if artifact is not None else None
+        if artifact is not None:
+            self.metrics.set_state(artifact.state)
+        return artifact
+
+    def _remember_artifact_write(self) -> None:
+        """Record the artifact file this worker just wrote as already loaded."""
+        self._artifact_signature = worker_artifact_signature(self.config.worker_id)
+        self._artifact_written_at = time.monotonic()
 
     def _execute_workflow(
         self,
@@ -206,7 +382,8 @@ class IssueWorker:
 
         This method owns the full issue-status lifecycle:
 
-        * ``claimed -> started`` — set before the subprocess is launched.
+        * ``claimed -> started`` — set before the subprocess is launched; if
+          the issue is no longer ``claimed`` the workflow is not run.
         * ``started -> completed`` — set when the subprocess exits 0.
         * ``started -> failed`` — set on non-zero exit, timeout, or
           unexpected exception.
@@ -221,6 +398,7 @@ class IssueWorker:
             Tuple of (adw_id, success) where success is True if workflow completed.
 
         """
+        started_at = time.monotonic()
         try:
             # Use provided adw_id or generate a new one
             adw_id = adw_id or make_adw_id()
@@ -236,36 +414,47 @@ class IssueWorker:
             self.worker_artifact.current_adw_id = adw_id
             self._transition_artifact("working")
 
-            if not update_issue_status(issue_id, "started", self.logger):
+            try:
+                started = update_issue_status(
+                    issue_id, "started", self.logger, expected_status="claimed"
+                )
+            except IssueStatusConflictError as e:
+                self.logger.error(
+                    "STATUS_CONFLICT: not running %s workflow %s — %s", workflow_type, adw_id, e
+                )
+                self._transition_artifact("ready", clear_issue=True)
+                return adw_id, False
+            if not started:
                 self.logger.warning(
                     "STATUS_TRANSITION_FAILED: issue %s remains in 'claimed' — "
                     "proceeding with workflow execution despite stale status",
                     issue_id,
                 )
 
-            cmd = self._get_base_cmd() + [
-                "--adw-id",
-                adw_id,
-                "--workflow-type",
-                workflow_type,
-                str(issue_id),
-            ]
-
-            # Execute the workflow with a timeout
-            # Note: Not capturing output allows real-time logging from rouge-adw
-            result = subprocess.run(
-                cmd,
-                timeout=self.config.workflow_timeout,
-            )
+            if self.config.in_process or self._runner_pool is not None:
+                returncode = self._run_supervised_workflow(issue_id, workflow_type, adw_id)
+            else:
+                cmd = self._build_workflow_cmd(issue_id, workflow_type, adw_id)
 
-            if result.returncode == 0:
+                # Execute the workflow with a timeout
+                # Note: Not capturing output allows real-time logging from rouge-adw
+                result = subprocess.run(
+                    cmd,
+                    timeout=self.config.workflow_timeout,
+                )
+                returncode = result.returncode
+
+            self.metrics.record_workflow(
+                workflow_type, time.monotonic() - started_at, returncode=returncode
+            )
+            if returncode == 0:
                 self.logger.info(
                     "Successfully completed %s workflow %s for issue %s",
                     workflow_type,
                     adw_id,
                     issue_id,
                 )
-                update_issue_status(issue_id, "completed", self.logger)
+                self._set_final_status(issue_id, "completed")
 
                 # Transition to ready state after successful execution
                 self._transition_artifact("ready", clear_issue=True)
@@ -277,9 +466,9 @@ class IssueWorker:
                     workflow_type.capitalize(),
                     adw_id,
                     issue_id,
-                    result.returncode,
+                    returncode,
                 )
-                update_issue_status(issue_id, "failed", self.logger)
+                self._set_final_status(issue_id, "failed")
 
                 # Transition to failed state after workflow failure
                 self._transition_artifact("failed")
@@ -287,8 +476,11 @@ class IssueWorker:
                 return adw_id, False
 
         except subprocess.TimeoutExpired:
+            self.metrics.record_workflow(
+                workflow_type, time.monotonic() - started_at, timed_out=True
+            )
             self._handle_workflow_failure(issue_id, workflow_type, "Workflow timed out")
-            update_issue_status(issue_id, "failed", self.logger)
+            self._set_final_status(issue_id, "failed")
 
             # Transition to failed state on timeout
             try:
@@ -303,7 +495,7 @@ class IssueWorker:
             return adw_id, False
         except Exception:
             self._handle_workflow_failure(issue_id, workflow_type, "Unexpected error in workflow")
-            update_issue_status(issue_id, "failed", self.logger)
+            self._set_final_status(issue_id, "failed")
 
             # Transition to failed state on exception
             try:
@@ -317,6 +509,79 @@ class IssueWorker:
 
             return adw_id, False
 
+    def _set_final_status(self, issue_id: int, status: Literal["completed", "failed"]) -> None:
+        """Record a workflow's outcome on its issue unless the lease was lost.
+
+        An issue whose lease was reaped or reassigned while the workflow ran
+        may already belong to another run, so its status is left alone. The
+        write is also guarded on the issue still being ``started``.
+
+        Args:
+            issue_id: The ID of the issue whose workflow finished
+            status: The final issue status to set
+        """
+        if self._heartbeat.lease_lost(issue_id):
+            self.logger.error(
+                "LEASE_LOST: not marking issue %s %s — its lease was reaped or reassigned "
+                "while the workflow ran",
+                issue_id,
+                status,
+            )
+            return
+        try:
+            update_issue_status(issue_id, status, self.logger, expected_status="started")
+        except IssueStatusConflictError as e:
+            self.logger.error("STATUS_CONFLICT: not marking issue %s %s — %s", issue_id, status, e)
+
+    def _run_supervised_workflow(self, issue_id: int, workflow_type: str, adw_id: str) -> int:
+        """Run a workflow in a forked child or warm runner and wait for it to finish.
+
+        Matches ``subprocess.run`` timeout semantics: a child still running
+        after ``workflow_timeout`` is killed and TimeoutExpired is raised.
+
+        Args:
+            issue_id: The ID of the issue to process
+            workflow_type: The workflow type (e.g. "full", "patch")
+            adw_id: The ADW ID for the workflow execution
+
+        Returns:
+            The child's exit code
+
+        Raises:
+            subprocess.TimeoutExpired: If the workflow exceeds the timeout
+        """
+        workflow = self._launch_workflow(issue_id, workflow_type, adw_id)
+        try:
+            return workflow.wait(timeout=self.config.workflow_timeout)
+        except subprocess.TimeoutExpired:
+            workflow.kill()
+            workflow.wait()
+            raise
+
+    def _launch_workflow(
+        self, issue_id: int, workflow_type: str, adw_id: str
+    ) -> subprocess.Popen | ForkedWorkflow | RunnerJob:
+        """Start a workflow child without waiting for it.
+
+        Args:
+            issue_id: The ID of the issue to process
+            workflow_type: The workflow type (e.g. "full", "patch")
+            adw_id: The ADW ID for the workflow execution
+
+        Returns:
+            A job on a warm runner when the pool is enabled, a forked
+            in-process child when ``in_process`` is enabled, otherwise a
+            rouge-adw subprocess
+
+        Raises:
+            OSError: If the child cannot be started
+        """
+        if self._runner_pool is not None:
+            return self._runner_pool.submit(issue_id, adw_id, workflow_type)
+        if self.config.in_process:
+            return ForkedWorkflow(issue_id, adw_id, workflow_type)
+        return subprocess.Popen(self._build_workflow_cmd(issue_id, workflow_type, adw_id))
+
     def execute_workflow(
         self,
         issue_id: int,
@@ -342,9 +607,237 @@ class IssueWorker:
         Returns:
             True if workflow executed successfully, False otherwise
         """
-        _, success = self._execute_workflow(issue_id, issue_type, description, adw_id=adw_id)
+        try:
+            _, success = self._execute_workflow(issue_id, issue_type, description, adw_id=adw_id)
+        finally:
+            self._heartbeat.untrack(issue_id)
         return success
 
+    def _poll_next_issue(self) -> ClaimedIssue | None:
+        """Claim the next pending issue, retrying transient database errors.
+
+        Issues already claimed by an earlier batch are served from the local
+        claim queue first. Otherwise claims one issue, or up to
+        ``claim_batch_size`` issues when batching is enabled, applying
+        jittered backoff between attempts and resetting the database client
+        before each retry. Gives up for this poll cycle once ``db_retries``
+        attempts have been exhausted, or as soon as the process-wide database
+        circuit breaker is open, so the worker waits a whole poll cycle
+        instead of retrying claims against a database the breaker already
+        reports as down.
+
+        The outcome of each database poll is recorded on the poll scheduler;
+        ``self.scheduler.current_interval`` then holds the delay to wait
+        before the next poll.
+
+        Returns:
+            The next claimed issue tuple, or None if no issue was available or
+            all retry attempts failed.
+        """
+        if self._claim_queue:
+            return self._claim_queue.popleft()
+
+        issue = None
+        exhausted = False
+        breaker = get_circuit_breaker()
+        for attempt in range(self.config.db_retries):
+            if breaker.state == CIRCUIT_OPEN:
+                self.logger.warning(
+                    "Database circuit open, skipping poll cycle (retry in %.1fs)",
+                    breaker.retry_in(),
+                )
+                exhausted = True
+                break
+            poll_started = time.monotonic()
+            try:
+                if self.config.claim_batch_size > 1:
+                    claimed = get_next_issues(
+                        self.config.worker_id,
+                        self.config.claim_batch_size,
+                        self.logger,
+                        **self._claim_options(),
+                    )
+                    self._heartbeat.track(*(claim[0] for claim in claimed))
+                    self._claim_queue.extend(claimed)
+                    issue = self._claim_queue.popleft() if self._claim_queue else None
+                else:
+                    issue = get_next_issue(
+                        self.config.worker_id,
+                        self.logger,
+                        **self._claim_options(),
+                    )
+                    if issue is not None:
+                        self._heartbeat.track(issue[0])
+                self.metrics.poll_duration.observe(time.monotonic() - poll_started)
+                # Success - reset global transient error counter
+                self._transient_error_count = 0
+                break
+            except TransientDatabaseError as e:
+                self.metrics.poll_duration.observe(time.monotonic() - poll_started)
+                self.metrics.transient_db_errors.inc()
+                self._transient_error_count += 1
+                if self._transient_error_count == 1:
+                    # First occurrence - log with full traceback
+                    self.logger.warning(
+                        "Transient database error during get_next_issue: %s",
+                        e,
+                        exc_info=True,
+                    )
+                else:
+                    # Subsequent occurrences - log one-line warning with counter
+                    self.logger.warning(
+                        "Transient DB error (attempt %d of %d)",
+                        attempt + 1,
+                        self.config.db_retries,
+                    )
+
+                # If this was the last attempt, skip the poll cycle
+                if attempt + 1 >= self.config.db_retries:
+                    self.logger.warning(
+                        "All %d retry attempts exhausted, skipping poll cycle",
+                        self.config.db_retries,
+                    )
+                    exhausted = True
+                    break
+
+                # Apply backoff with ±20% jitter before retry
+                jitter = random.uniform(-0.2, 0.2)
+                backoff_ms = self.config.db_backoff_ms * (1 + jitter)
+                time.sleep(backoff_ms / 1000.0)
+
+                # Reset client before retry
+                reset_client()
+
+        if exhausted:
+            self.scheduler.record_error()
+            self.metrics.record_poll("error")
+        elif issue is None:
+            self.scheduler.record_miss()
+            self.metrics.record_poll("miss")
+        else:
+            self.scheduler.record_hit()
+            self.metrics.record_poll("hit")
+        self._publish_poll_stats()
+        return issue
+
+    def _claim_options(self) -> dict[str, Any]:
+        """Keyword arguments for the claim helpers.
+
+        Pool options are only passed when a pool is configured, so workers
+        outside a pool issue the same claim calls as before pools existed.
+        """
+        options: dict[str, Any] = {"lease_seconds": self.config.lease_seconds}
+        if self.config.pool is not None:
+            options["pool"] = self.config.pool
+        if self.config.steal_threshold is not None:
+            options["steal_threshold"] = self.config.steal_threshold
+        return options
+
+    def _publish_poll_stats(self) -> None:
+        """Copy the poll scheduler counters into the in-memory worker artifact.
+
+        The counters reach disk with the next state transition, or once
+        POLL_STATS_PERSIST_INTERVAL seconds have passed since the artifact was
+        last written, so an idle worker does not write on every poll.
+        """
+        if self.worker_artifact is None:
+            return
+        self.worker_artifact.poll = self.scheduler.stats()
+        if time.monotonic() - self._artifact_written_at >= POLL_STATS_PERSIST_INTERVAL:
+            write_worker_artifact(
+                self.worker_artifact, fsync=self.config.artifact_fsync == "always"
+            )
+            self._remember_artifact_write()
+
+    def _replay_comment_spool(self) -> None:
+        """Replay spooled comments if the replay interval has elapsed.
+
+        Comments whose insert failed while Supabase was unreachable are
+        spooled under the working directory by the workflows this worker
+        runs. Replaying them while idle keeps the backlog short without
+        delaying claims.
+        """
+        interval = self.config.comment_replay_interval
+        if not interval or time.monotonic() < self._next_comment_replay_at:
+            return
+        self._next_comment_replay_at = time.monotonic() + interval
+        try:
+            replayed, remaining = replay_comment_spool()
+        except Exception:
+            self.logger.exception("Error replaying spooled comments")
+            return
+        if remaining:
+            self.logger.warning(
+                "%s spooled comment(s) still awaiting insert (%s replayed)", remaining, replayed
+            )
+
+    def _wait_for_work(self, timeout: float) -> bool:
+        """Sleep for up to ``timeout`` seconds, waking early when work arrives.
+
+        Without a notification listener this is a plain sleep. With one, the
+        wait ends as soon as an issue is assigned to this worker, and any
+        deferred slot poll is made due immediately.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if woken by an issue notification, False otherwise
+        """
+        if self._listener is None:
+            time.sleep(timeout)
+            return False
+        notified = self._listener.wait(timeout)
+        if notified:
+            self.logger.debug("Woken by issue notification")
+            self._next_slot_poll_at = 0.0
+        return notified
+
+    def _release_claim_queue(self) -> None:
+        """Return locally queued, never-started claims to ``pending``.
+
+        Called on shutdown and when the worker stops claiming because it
+        entered the failed state, so queued issues are not stranded in
+        ``claimed``.
+        """
+        if not self._claim_queue:
+            return
+        issue_ids = [issue[0] for issue in self._claim_queue]
+        self._claim_queue.clear()
+        self._heartbeat.untrack(*issue_ids)
+        released = release_issues(self.config.worker_id, issue_ids, self.logger)
+        unreleased = sorted(set(issue_ids) - set(released))
+        if unreleased:
+            self.logger.warning(
+                "Could not release claimed issue(s) %s; they remain in 'claimed'",
+                unreleased,
+            )
+
+    def _start_metrics_server(self) -> None:
+        """Start the metrics endpoint, continuing without it if the port is taken."""
+        if self._metrics_server is None:
+            return
+        try:
+            self._metrics_server.start()
+        except OSError:
+            self.logger.exception(
+                "Could not serve metrics on %s:%s; continuing without metrics",
+                self.config.metrics_host,
+                self.config.metrics_port,
+            )
+            self._metrics_server = None
+
+    def _close_resources(self) -> None:
+        """Release queued claims and stop the worker's helpers on shutdown."""
+        self._release_claim_queue()
+        if self._listener is not None:
+            self._listener.close()
+        if self._runner_pool is not None:
+            self._runner_pool.close()
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+        self._heartbeat.stop()
+
     def run(self) -> None:
         """
         Main worker loop.
@@ -352,22 +845,31 @@ class IssueWorker:
         Continuously polls for pending issues and executes workflows.
         Sleeps for the configured poll interval when no issues are available.
         Checks worker artifact state before polling to handle failed or working states.
+        Delegates to the multi-slot loop when more than one slot is configured.
         """
+        self._heartbeat.start()
+        if self._runner_pool is not None:
+            self._runner_pool.start()
+        self._start_metrics_server()
+        if self.config.slots > 1:
+            self._run_slots()
+            return
+
         self.logger.info("Worker %s starting main loop", self.config.worker_id)
-        transient_error_count = 0
 
         while self.running:
             try:
-                self.worker_artifact = read_worker_artifact(self.config.worker_id)
+                self.worker_artifact = self._read_artifact()
                 if self.worker_artifact is None:
                     self.logger.error(
                         "Worker artifact not found or unreadable for %s, skipping poll",
                         self.config.worker_id,
                     )
-                    time.sleep(self.config.poll_interval)
+                    time.sleep(self.scheduler.record_error())
                     continue
                 # Check worker state before polling
                 if self.worker_artifact.state == "failed":
+                    self._release_claim_queue()
                     self.logger.info(
                         "Worker in failed state (issue_id=%s, adw_id=%s), "
                         "sleeping without polling. Operator intervention required.",
@@ -387,55 +889,343 @@ class IssueWorker:
                     continue
 
                 # Get next issue with retry logic for transient database errors
-                issue = None
-                for attempt in range(self.config.db_retries):
-                    try:
-                        issue = get_next_issue(self.config.worker_id, self.logger)
-                        # Success - reset global transient error counter
-                        transient_error_count = 0
-                        break
-                    except TransientDatabaseError as e:
-                        transient_error_count += 1
-                        if transient_error_count == 1:
-                            # First occurrence - log with full traceback
-                            self.logger.warning(
-                                "Transient database error during get_next_issue: %s",
-                                e,
-                                exc_info=True,
-                            )
-                        else:
-                            # Subsequent occurrences - log one-line warning with counter
-                            self.logger.warning(
-                                "Transient DB error (attempt %d of %d)",
-                                attempt + 1,
-                                self.config.db_retries,
-                            )
-
-                        # If this was the last attempt, skip the poll cycle
-                        if attempt + 1 >= self.config.db_retries:
-                            self.logger.warning(
-                                "All %d retry attempts exhausted, skipping poll cycle",
-                                self.config.db_retries,
-                            )
-                            break
-
-                        # Apply backoff with ±20% jitter before retry
-                        jitter = random.uniform(-0.2, 0.2)
-                        backoff_ms = self.config.db_backoff_ms * (1 + jitter)
-                        time.sleep(backoff_ms / 1000.0)
-
-                        # Reset client before retry
-                        reset_client()
+                issue = self._poll_next_issue()
 
                 if issue:
                     issue_id, description, status, issue_type, adw_id = issue
                     self.execute_workflow(issue_id, description, status, issue_type, adw_id=adw_id)
                 else:
-                    # No issues available, sleep for poll interval
+                    # No issues available, wait as long as the scheduler says
+                    self._replay_comment_spool()
+                    delay = self.scheduler.current_interval
+                    self.logger.debug("No pending issues, sleeping for %.1f seconds", delay)
+                    self._wait_for_work(delay)
+
+            except KeyboardInterrupt:
+                self.logger.info("Received keyboard interrupt, shutting down...")
+                self.running = False
+
+            except Exception as e:
+                self.logger.exception("Unexpected error in main loop: %s", e)
+                time.sleep(self.scheduler.record_error())
+
+        self._close_resources()
+        self.logger.info("Worker %s stopped", self.config.worker_id)
+
+    # ------------------------------------------------------------------
+    # Multi-slot execution
+    # ------------------------------------------------------------------
+
+    def _ensure_slots(self) -> None:
+        """Make the artifact's slot list match the configured slot count.
+
+        Existing slot entries are preserved by index so that failed or stale
+        working slots from a previous run remain visible to the operator.
+        """
+        if self.worker_artifact is None:
+            raise RuntimeError("worker_artifact must not be None in _ensure_slots")
+        existing = {slot.index: slot for slot in self.worker_artifact.slots}
+        self.worker_artifact.slots = [
+            existing.get(index) or WorkerSlot(index=index) for index in range(self.config.slots)
+        ]
+
+    def _sync_slot_state(self) -> None:
+        """Derive the worker state from its slots and persist the artifact.
+
+        The worker is ``failed`` if any slot failed, ``working`` if any slot
+        is running a workflow, and ``ready`` otherwise.
+        """
+        if self.worker_artifact is None:
+            raise RuntimeError("worker_artifact must not be None in _sync_slot_state")
+        slot_states = {slot.state for slot in self.worker_artifact.slots}
+        state: Literal["ready", "working", "failed"]
+        if "failed" in slot_states:
+            state = "failed"
+        elif "working" in slot_states:
+            state = "working"
+        else:
+            state = "ready"
+        self._transition_artifact(state)
+
+    def _start_slot(
+        self,
+        slot: WorkerSlot,
+        issue_id: int,
+        workflow_type: str,
+        description: str = "",
+        adw_id: str | None = None,
+    ) -> None:
+        """Launch a workflow child for the given issue in a free slot.
+
+        Sets the issue from ``claimed`` to ``started`` before launching and
+        returns as soon as the child is running; completion is handled by
+        ``_reap_slots``. If the issue is no longer ``claimed`` the slot is
+        freed without launching anything.
+
+        Args:
+            slot: The idle slot to run the workflow in
+            issue_id: The ID of the issue to process
+            workflow_type: The workflow type (e.g. "full", "patch")
+            description: The issue description (used for logging)
+            adw_id: Optional pre-assigned ADW ID; if None, a new one is generated
+        """
+        adw_id = adw_id or make_adw_id()
+        self.logger.info(
+            "Executing %s workflow %s for issue %s in slot %s",
+            workflow_type,
+            adw_id,
+            issue_id,
+            slot.index,
+        )
+        self.logger.debug("Issue description: %s", description)
+        slot.assign(issue_id, adw_id)
+
+        try:
+            started = update_issue_status(
+                issue_id, "started", self.logger, expected_status="claimed"
+            )
+        except IssueStatusConflictError as e:
+            self.logger.error(
+                "STATUS_CONFLICT: not running %s workflow %s in slot %s — %s",
+                workflow_type,
+                adw_id,
+                slot.index,
+                e,
+            )
+            self._heartbeat.untrack(issue_id)
+            slot.clear()
+            self._sync_slot_state()
+            return
+        if not started:
+            self.logger.warning(
+                "STATUS_TRANSITION_FAILED: issue %s remains in 'claimed' — "
+                "proceeding with workflow execution despite stale status",
+                issue_id,
+            )
+
+        try:
+            process = self._launch_workflow(issue_id, workflow_type, adw_id)
+        except OSError:
+            self._handle_workflow_failure(issue_id, workflow_type, "Failed to launch workflow")
+            self._set_final_status(issue_id, "failed")
+            self._finish_slot(slot, success=False)
+            return
+
+        slot.pid = process.pid
+        self._slot_processes[slot.index] = _SlotProcess(
+            process=process,
+            issue_id=issue_id,
+            adw_id=adw_id,
+            workflow_type=workflow_type,
+            deadline=time.monotonic() + self.config.workflow_timeout,
+            started_at=time.monotonic(),
+        )
+        self._sync_slot_state()
+
+    def _finish_slot(self, slot: WorkerSlot, success: bool) -> None:
+        """Record the outcome of a slot's workflow and persist the artifact.
+
+        Successful slots return to idle. Failed slots keep their issue and ADW
+        IDs for debugging, which also become the worker's current issue so the
+        failure is visible in the same place as for single-slot workers.
+
+        Args:
+            slot: The slot whose workflow finished
+            success: Whether the workflow completed successfully
+        """
+        if self.worker_artifact is None:
+            raise RuntimeError("worker_artifact must not be None in _finish_slot")
+        if slot.issue_id is not None:
+            self._heartbeat.untrack(slot.issue_id)
+        if success:
+            slot.clear()
+        else:
+            slot.state = "failed"
+            slot.pid = None
+            self.worker_artifact.current_issue_id = slot.issue_id
+            self.worker_artifact.current_adw_id = slot.adw_id
+        self._sync_slot_state()
+
+    def _reap_slots(self) -> None:
+        """Collect finished or timed-out slot children without blocking.
+
+        Each finished child drives the ``started -> completed|failed`` issue
+        transition. Children that exceed the workflow timeout are killed and
+        treated as failures; children whose lease was lost are killed without
+        touching the issue's status.
+        """
+        if not self._slot_processes:
+            return
+        if self.worker_artifact is None:
+            raise RuntimeError("worker_artifact must not be None in _reap_slots")
+
+        for index, child in list(self._slot_processes.items()):
+            returncode = child.process.poll()
+            if returncode is None and self._heartbeat.lease_lost(child.issue_id):
+                child.process.kill()
+                child.process.wait()
+                self.logger.error(
+                    "LEASE_LOST: killed %s workflow %s for issue %s in slot %s after its "
+                    "lease was reaped or reassigned",
+                    child.workflow_type,
+                    child.adw_id,
+                    child.issue_id,
+                    index,
+                )
+                success = False
+            elif returncode is None:
+                if time.monotonic() < child.deadline:
+                    continue
+                child.process.kill()
+                child.process.wait()
+                self.metrics.record_workflow(
+                    child.workflow_type, time.monotonic() - child.started_at, timed_out=True
+                )
+                self.logger.error(
+                    "%s workflow %s for issue %s timed out in slot %s",
+                    child.workflow_type.capitalize(),
+                    child.adw_id,
+                    child.issue_id,
+                    index,
+                )
+                success = False
+            elif returncode == 0:
+                self.metrics.record_workflow(
+                    child.workflow_type, time.monotonic() - child.started_at, returncode=0
+                )
+                self.logger.info(
+                    "Successfully completed %s workflow %s for issue %s in slot %s",
+                    child.workflow_type,
+                    child.adw_id,
+                    child.issue_id,
+                    index,
+                )
+                success = True
+            else:
+                self.metrics.record_workflow(
+                    child.workflow_type, time.monotonic() - child.started_at, returncode=returncode
+                )
+                self.logger.error(
+                    "%s workflow %s failed for issue %s with exit code %s in slot %s",
+                    child.workflow_type.capitalize(),
+                    child.adw_id,
+                    child.issue_id,
+                    returncode,
+                    index,
+                )
+                success = False
+
+            del self._slot_processes[index]
+            self._set_final_status(child.issue_id, "completed" if success else "failed")
+            self._finish_slot(self.worker_artifact.slots[index], success)
+
+    def _fill_slots(self) -> bool:
+        """Claim issues into idle slots until the queue or the slots run out.
+
+        After a poll comes back empty or fails, further polls are deferred by
+        the poll scheduler's interval so that frequent reaping does not hammer
+        the claim RPC.
+
+        Returns:
+            True if at least one issue was claimed and started
+        """
+        if self.worker_artifact is None:
+            raise RuntimeError("worker_artifact must not be None in _fill_slots")
+        if time.monotonic() < self._next_slot_poll_at:
+            return False
+
+        claimed = False
+        for slot in self.worker_artifact.slots:
+            if not self.running:
+                break
+            if slot.state != "idle":
+                continue
+            issue = self._poll_next_issue()
+            if issue is None:
+                self._next_slot_poll_at = time.monotonic() + self.scheduler.current_interval
+                break
+            issue_id, description, _status, issue_type, adw_id = issue
+            self._start_slot(slot, issue_id, issue_type, description, adw_id=adw_id)
+            claimed = True
+        return claimed
+
+    def _run_slots(self) -> None:
+        """Main loop for workers configured with more than one slot.
+
+        Reaps finished children, then claims new issues into idle slots. While
+        children are running the loop wakes every ``SLOT_REAP_INTERVAL``
+        seconds; when idle it sleeps for the poll interval. The artifact is
+        re-read from disk only when no children are running, so that operator
+        resets are picked up without clobbering live slot state. A failed slot
+        stops further claims until the worker is reset. On shutdown, running
+        children are drained before the loop exits.
+        """
+        self.logger.info(
+            "Worker %s starting main loop with %s slots",
+            self.config.worker_id,
+            self.config.slots,
+        )
+
+        while self.running or self._slot_processes:
+            try:
+                self._reap_slots()
+
+                if not self.running:
+                    self._release_claim_queue()
                     self.logger.debug(
-                        "No pending issues, sleeping for %s seconds", self.config.poll_interval
+                        "Draining %s running workflow(s) before shutdown",
+                        len(self._slot_processes),
                     )
-                    time.sleep(self.config.poll_interval)
+                    time.sleep(SLOT_REAP_INTERVAL)
+                    continue
+
+                if not self._slot_processes:
+                    artifact = self._read_artifact()
+                    if artifact is None:
+                        self.logger.error(
+                            "Worker artifact not found or unreadable for %s, skipping poll",
+                            self.config.worker_id,
+                        )
+                        time.sleep(self.scheduler.record_error())
+                        continue
+                    self.worker_artifact = artifact
+                    self._ensure_slots()
+                    if artifact.state == "failed":
+                        self._release_claim_queue()
+                        self.logger.info(
+                            "Worker in failed state (issue_id=%s, adw_id=%s), "
+                            "sleeping without polling. Operator intervention required.",
+                            artifact.current_issue_id,
+                            artifact.current_adw_id,
+                        )
+                        time.sleep(self.config.poll_interval)
+                        continue
+                    elif artifact.state == "working":
+                        self.logger.warning(
+                            "Worker in working state without active execution "
+                            "(slots=%s), skipping poll",
+                            [
+                                (slot.index, slot.issue_id, slot.adw_id)
+                                for slot in artifact.slots
+                                if slot.state == "working"
+                            ],
+                        )
+                        time.sleep(self.config.poll_interval)
+                        continue
+                elif self.worker_artifact is not None and self.worker_artifact.state == "failed":
+                    # A slot failed: let the remaining children finish, claim nothing new
+                    self._release_claim_queue()
+                    time.sleep(SLOT_REAP_INTERVAL)
+                    continue
+
+                claimed = self._fill_slots()
+                if self._slot_processes:
+                    self._wait_for_work(SLOT_REAP_INTERVAL)
+                elif not claimed:
+                    self._replay_comment_spool()
+                    delay = max(0.0, self._next_slot_poll_at - time.monotonic())
+                    self.logger.debug("No pending issues, sleeping for %.1f seconds", delay)
+                    self._wait_for_work(delay)
 
             except KeyboardInterrupt:
                 self.logger.info("Received keyboard interrupt, shutting down...")
@@ -443,6 +1233,7 @@ class IssueWorker:
 
             except Exception as e:
                 self.logger.exception("Unexpected error in main loop: %s", e)
-                time.sleep(self.config.poll_interval)
+                time.sleep(self.scheduler.record_error())
 
+        self._close_resources()
         self.logger.info("Worker %s stopped", self.config.worker_id)
@@ -18,12 +18,102 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# When write_worker_artifact fsyncs: on every write, only on state
+# transitions (periodic poll statistics writes are not fsynced), or never
+ArtifactFsyncPolicy = Literal["always", "transitions", "never"]
+
+VALID_ARTIFACT_FSYNC_POLICIES: tuple[ArtifactFsyncPolicy, ...] = ("always", "transitions", "never")
+
+# Identity of an artifact file on disk: (inode, mtime in ns, size)
+ArtifactSignature = tuple[int, int, int]
+
 
 def _utc_now() -> datetime:
     """Return current UTC time in a timezone-aware manner."""
     return datetime.now(timezone.utc)
 
 
+class WorkerSlot(BaseModel):
+    """State of a single execution slot in a multi-slot worker.
+
+    Attributes:
+        index: Zero-based slot position within the worker
+        state: Current slot state (idle, working, or failed)
+        issue_id: The issue being processed in this slot (if any)
+        adw_id: The ADW ID for the workflow running in this slot (if any)
+        pid: Process ID of the rouge-adw child running in this slot (if any)
+        started_at: Timestamp when the current workflow was started (if any)
+    """
+
+    index: int = Field(
+        description="Zero-based slot position within the worker",
+        ge=0,
+    )
+    state: Literal["idle", "working", "failed"] = Field(
+        default="idle",
+        description="Current slot state",
+    )
+    issue_id: Optional[int] = Field(
+        default=None,
+        description="The issue ID being processed in this slot",
+    )
+    adw_id: Optional[str] = Field(
+        default=None,
+        description="The ADW ID for the workflow running in this slot",
+    )
+    pid: Optional[int] = Field(
+        default=None,
+        description="Process ID of the rouge-adw child running in this slot",
+    )
+    started_at: Optional[datetime] = Field(
+        default=None,
+        description="Timestamp when the current workflow was started",
+    )
+
+    def assign(self, issue_id: int, adw_id: str) -> None:
+        """Mark the slot as working on the given issue.
+
+        Args:
+            issue_id: The issue ID being processed
+            adw_id: The ADW ID for the workflow execution
+        """
+        self.state = "working"
+        self.issue_id = issue_id
+        self.adw_id = adw_id
+        self.pid = None
+        self.started_at = _utc_now()
+
+    def clear(self) -> None:
+        """Return the slot to the idle state and drop all workflow details."""
+        self.state = "idle"
+        self.issue_id = None
+        self.adw_id = None
+        self.pid = None
+        self.started_at = None
+
+
+class PollStats(BaseModel):
+    """Poll scheduler counters published in the worker artifact.
+
+    Attributes:
+        strategy: Name of the poll scheduling strategy in use
+        current_interval: Seconds the worker waits before its next poll
+        hits: Number of polls that claimed an issue
+        misses: Number of polls that found no pending issue
+        errors: Number of failed polls or loop iterations
+    """
+
+    strategy: str = Field(description="Name of the poll scheduling strategy in use")
+    current_interval: float = Field(
+        default=0.0,
+        description="Seconds the worker waits before its next poll",
+        ge=0,
+    )
+    hits: int = Field(default=0, description="Number of polls that claimed an issue", ge=0)
+    misses: int = Field(default=0, description="Number of polls that found no pending issue", ge=0)
+    errors: int = Field(default=0, description="Number of failed polls or loop iterations", ge=0)
+
+
 class WorkerArtifact(BaseModel):
     """Artifact containing worker daemon state.
 
@@ -32,6 +122,8 @@ class WorkerArtifact(BaseModel):
         state: Current worker state (ready, working, or failed)
         current_issue_id: The issue currently being processed (if any)
         current_adw_id: The ADW ID for the current workflow (if any)
+        slots: Per-slot execution state (empty for single-slot workers)
+        poll: Poll scheduler counters (if the worker has polled)
         updated_at: Timestamp of last state update
     """
 
@@ -50,6 +142,14 @@ class WorkerArtifact(BaseModel):
         default=None,
         description="The ADW ID for the current workflow execution",
     )
+    slots: list[WorkerSlot] = Field(
+        default_factory=list,
+        description="Per-slot execution state (empty for single-slot workers)",
+    )
+    poll: Optional[PollStats] = Field(
+        default=None,
+        description="Poll scheduler counters (if the worker has polled)",
+    )
     updated_at: datetime = Field(
         default_factory=_utc_now,
         description="Timestamp of last state update",
@@ -119,6 +219,27 @@ def _get_worker_artifact_path(worker_id: str) -> Path:
     return candidate_worker_dir / "state.json"
 
 
+def worker_artifact_signature(worker_id: str) -> Optional[ArtifactSignature]:
+    """Return the on-disk identity of a worker artifact without reading it.
+
+    Every write replaces the file atomically, so any change to the artifact,
+    whether by the worker or by ``rouge-worker reset``, changes its inode or
+    modification time.
+
+    Args:
+        worker_id: The worker identifier
+
+    Returns:
+        (inode, mtime_ns, size) of the artifact file, or None if it does not
+        exist or the worker_id is invalid
+    """
+    try:
+        stat = _get_worker_artifact_path(worker_id).stat()
+    except (OSError, ValueError):
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
 def read_worker_artifact(worker_id: str) -> Optional[WorkerArtifact]:
     """Read a worker artifact from disk.
 
@@ -155,21 +276,26 @@ def transition_worker_artifact(
     artifact: WorkerArtifact,
     state: Literal["ready", "working", "failed"],
     clear_issue: bool = False,
+    fsync: bool = True,
 ) -> None:
     """Apply a state transition to a WorkerArtifact and persist it to disk.
 
     Args:
         artifact: The WorkerArtifact to transition
         state: New state to set
-        clear_issue: If True, clears current_issue_id and current_adw_id
+        clear_issue: If True, clears current_issue_id and current_adw_id and
+            returns every slot to idle
+        fsync: If True, fsync the artifact before it replaces the old file
     """
     from_state = artifact.state
     artifact.state = state
     if clear_issue:
         artifact.current_issue_id = None
         artifact.current_adw_id = None
+        for slot in artifact.slots:
+            slot.clear()
     artifact.refresh_timestamp()
-    wrote = write_worker_artifact(artifact)
+    wrote = write_worker_artifact(artifact, fsync=fsync)
     if wrote:
         logger.info(
             "Worker %s transitioned from '%s' to '%s'%s",
@@ -187,14 +313,17 @@ def transition_worker_artifact(
         )
 
 
-def write_worker_artifact(artifact: WorkerArtifact) -> bool:
+def write_worker_artifact(artifact: WorkerArtifact, fsync: bool = True) -> bool:
     """Write a worker artifact to disk.
 
     This is a best-effort operation that will not raise exceptions.
-    Failures are logged but do not halt execution.
+    Failures are logged but do not halt execution. The file is always
+    replaced atomically; ``fsync`` only controls whether its contents are
+    forced to stable storage first.
 
     Args:
         artifact: The WorkerArtifact to persist
+        fsync: If True, fsync the temp file before the atomic replace
 
     Returns:
         True if the artifact was successfully written, False otherwise.
@@ -219,7 +348,8 @@ def write_worker_artifact(artifact: WorkerArtifact) -> bool:
         try:
             # Write JSON to temp file, flush and fsync file descriptor
             os.write(fd, json_data.encode("utf-8"))
-            os.fsync(fd)
+            if fsync:
+                os.fsync(fd)
         finally:
             os.close(fd)
 
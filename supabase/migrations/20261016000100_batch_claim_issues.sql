@@ -0,0 +1,64 @@
+-- Batch claiming for workers draining large backlogs.
+--
+-- get_and_lock_next_issues claims up to p_limit pending issues assigned to the
+-- caller in a single statement, using the same FOR UPDATE SKIP LOCKED pattern
+-- as get_and_lock_next_issue. release_claimed_issues returns claims that a
+-- worker queued locally but never started back to 'pending'.
+
+create or replace function public.get_and_lock_next_issues(
+    p_worker_id text,
+    p_limit integer
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    if p_limit is null or p_limit < 1 then
+        raise exception 'p_limit must be >= 1, got %', p_limit;
+    end if;
+
+    return query
+    with next_issues as (
+        select i.id
+        from public.issues i
+        where i.type in ('direct', 'full', 'patch', 'thin')
+          and i.status = 'pending'
+          and i.assigned_to = p_worker_id
+        order by i.id
+        for update skip locked
+        limit p_limit
+    ),
+    claimed as (
+        update public.issues i
+        set status = 'claimed',
+            updated_at = now()
+        from next_issues
+        where i.id = next_issues.id
+        returning i.id, i.description, i.status, i.type, i.adw_id
+    )
+    select c.id, c.description, c.status, c.type, c.adw_id
+    from claimed c
+    order by c.id;
+end;
+$$ language plpgsql;
+
+create or replace function public.release_claimed_issues(
+    p_worker_id text,
+    p_issue_ids integer[]
+)
+returns table (issue_id integer) as $$
+begin
+    return query
+    update public.issues i
+    set status = 'pending',
+        updated_at = now()
+    where i.id = any(p_issue_ids)
+      and i.status = 'claimed'
+      and i.assigned_to = p_worker_id
+    returning i.id;
+end;
+$$ language plpgsql;
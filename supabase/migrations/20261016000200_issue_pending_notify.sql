@@ -0,0 +1,34 @@
+-- Push notifications for newly available work.
+--
+-- Sends a pg_notify on the 'rouge_issue_pending' channel whenever an issue
+-- becomes pending for a worker: on insert, or on an update that changes its
+-- status or assignee. The payload is a JSON object with 'issue_id' and
+-- 'assigned_to' so listening workers can ignore work assigned to others.
+-- Workers started with --listen block on LISTEN and keep polling only as a
+-- safety net for missed notifications.
+
+create or replace function public.notify_issue_pending()
+returns trigger as $$
+begin
+    if new.status = 'pending' and new.assigned_to is not null then
+        perform pg_notify(
+            'rouge_issue_pending',
+            json_build_object('issue_id', new.id, 'assigned_to', new.assigned_to)::text
+        );
+    end if;
+    return new;
+end;
+$$ language plpgsql;
+
+create trigger notify_issues_pending_insert
+after insert on public.issues
+for each row execute function public.notify_issue_pending();
+
+create trigger notify_issues_pending_update
+after update of status, assigned_to on public.issues
+for each row
+when (
+    old.status is distinct from new.status
+    or old.assigned_to is distinct from new.assigned_to
+)
+execute function public.notify_issue_pending();
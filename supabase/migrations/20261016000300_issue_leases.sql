@@ -0,0 +1,154 @@
+-- Lease-based claims so work held by a dead worker is recovered automatically.
+--
+-- Claiming an issue now also records a lease: lease_owner is the claiming
+-- worker and lease_expires_at is when the claim lapses unless renewed.
+-- Running workers renew their leases on a heartbeat with renew_issue_leases.
+-- reap_expired_leases returns 'claimed'/'started' issues whose lease has
+-- expired to 'pending', or to 'failed' once they have used up their attempts.
+-- attempts counts how many times an issue has been claimed.
+
+alter table public.issues
+    add column lease_owner text,
+    add column lease_expires_at timestamptz,
+    add column attempts integer not null default 0;
+
+create index idx_issues_lease_expires_at on public.issues(lease_expires_at)
+where status in ('claimed', 'started');
+
+-- Leases only mean something while an issue is claimed or started.
+create or replace function public.clear_issue_lease()
+returns trigger as $$
+begin
+    if new.status not in ('claimed', 'started') then
+        new.lease_owner := null;
+        new.lease_expires_at := null;
+    end if;
+    return new;
+end;
+$$ language plpgsql;
+
+create trigger clear_issues_lease
+before update of status on public.issues
+for each row
+when (old.status is distinct from new.status)
+execute function public.clear_issue_lease();
+
+-- The claim functions gain a lease duration; drop the old signatures so RPC
+-- calls without p_lease_seconds resolve to the new functions.
+drop function if exists public.get_and_lock_next_issue(text);
+drop function if exists public.get_and_lock_next_issues(text, integer);
+
+create or replace function public.get_and_lock_next_issue(
+    p_worker_id text,
+    p_lease_seconds integer default 600
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    return query
+    select * from public.get_and_lock_next_issues(p_worker_id, 1, p_lease_seconds);
+end;
+$$ language plpgsql;
+
+create or replace function public.get_and_lock_next_issues(
+    p_worker_id text,
+    p_limit integer,
+    p_lease_seconds integer default 600
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    if p_limit is null or p_limit < 1 then
+        raise exception 'p_limit must be >= 1, got %', p_limit;
+    end if;
+    if p_lease_seconds is null or p_lease_seconds < 1 then
+        raise exception 'p_lease_seconds must be >= 1, got %', p_lease_seconds;
+    end if;
+
+    return query
+    with next_issues as (
+        select i.id
+        from public.issues i
+        where i.type in ('direct', 'full', 'patch', 'thin')
+          and i.status = 'pending'
+          and i.assigned_to = p_worker_id
+        order by i.id
+        for update skip locked
+        limit p_limit
+    ),
+    claimed as (
+        update public.issues i
+        set status = 'claimed',
+            lease_owner = p_worker_id,
+            lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+            attempts = i.attempts + 1,
+            updated_at = now()
+        from next_issues
+        where i.id = next_issues.id
+        returning i.id, i.description, i.status, i.type, i.adw_id
+    )
+    select c.id, c.description, c.status, c.type, c.adw_id
+    from claimed c
+    order by c.id;
+end;
+$$ language plpgsql;
+
+create or replace function public.renew_issue_leases(
+    p_worker_id text,
+    p_issue_ids integer[],
+    p_lease_seconds integer
+)
+returns table (issue_id integer) as $$
+begin
+    if p_lease_seconds is null or p_lease_seconds < 1 then
+        raise exception 'p_lease_seconds must be >= 1, got %', p_lease_seconds;
+    end if;
+
+    return query
+    update public.issues i
+    set lease_expires_at = now() + make_interval(secs => p_lease_seconds)
+    where i.id = any(p_issue_ids)
+      and i.lease_owner = p_worker_id
+      and i.status in ('claimed', 'started')
+    returning i.id;
+end;
+$$ language plpgsql;
+
+create or replace function public.reap_expired_leases(p_max_attempts integer default 3)
+returns table (
+    issue_id integer,
+    issue_status text,
+    issue_attempts integer,
+    previous_owner text
+) as $$
+begin
+    if p_max_attempts is null or p_max_attempts < 1 then
+        raise exception 'p_max_attempts must be >= 1, got %', p_max_attempts;
+    end if;
+
+    return query
+    with expired as (
+        select i.id, i.lease_owner
+        from public.issues i
+        where i.status in ('claimed', 'started')
+          and i.lease_expires_at < now()
+        for update skip locked
+    )
+    update public.issues i
+    set status = case when i.attempts >= p_max_attempts then 'failed' else 'pending' end,
+        updated_at = now()
+    from expired
+    where i.id = expired.id
+    returning i.id, i.status, i.attempts, expired.lease_owner;
+end;
+$$ language plpgsql;
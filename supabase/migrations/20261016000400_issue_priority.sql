@@ -0,0 +1,140 @@
+-- Priority-aware claiming with aging.
+--
+-- priority orders pending work for a worker: higher values are claimed
+-- first. not_before defers an issue until the given time. Claims pick by
+-- effective priority, which adds one point for every p_aging_seconds an issue
+-- has been eligible, so a backlog of low-priority issues is not starved
+-- forever by a steady stream of urgent ones. Ties go to the oldest issue.
+--
+-- The partial index covers the claim path: the distinct priorities among a
+-- worker's pending issues are found with a loose index scan, and only the
+-- oldest eligible issues at each priority (which carry the largest age boost
+-- for that priority) are ranked. Claim cost therefore depends on the number
+-- of distinct priorities, not on the size of the backlog.
+
+alter table public.issues
+    add column priority integer not null default 0 check (priority between -100 and 100),
+    add column not_before timestamptz;
+
+create index idx_issues_pending_priority
+on public.issues(assigned_to, priority desc, id)
+include (type, not_before, created_at)
+where status = 'pending';
+
+drop function if exists public.get_and_lock_next_issue(text, integer);
+drop function if exists public.get_and_lock_next_issues(text, integer, integer);
+
+create or replace function public.get_and_lock_next_issue(
+    p_worker_id text,
+    p_lease_seconds integer default 600,
+    p_aging_seconds integer default 3600
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    return query
+    select * from public.get_and_lock_next_issues(
+        p_worker_id, 1, p_lease_seconds, p_aging_seconds
+    );
+end;
+$$ language plpgsql;
+
+-- p_aging_seconds <= 0 disables aging and claims strictly by priority.
+create or replace function public.get_and_lock_next_issues(
+    p_worker_id text,
+    p_limit integer,
+    p_lease_seconds integer default 600,
+    p_aging_seconds integer default 3600
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    if p_limit is null or p_limit < 1 then
+        raise exception 'p_limit must be >= 1, got %', p_limit;
+    end if;
+    if p_lease_seconds is null or p_lease_seconds < 1 then
+        raise exception 'p_lease_seconds must be >= 1, got %', p_lease_seconds;
+    end if;
+
+    return query
+    with recursive levels as (
+        (
+            select i.priority
+            from public.issues i
+            where i.status = 'pending'
+              and i.assigned_to = p_worker_id
+            order by i.priority desc
+            limit 1
+        )
+        union all
+        select (
+            select i.priority
+            from public.issues i
+            where i.status = 'pending'
+              and i.assigned_to = p_worker_id
+              and i.priority < levels.priority
+            order by i.priority desc
+            limit 1
+        )
+        from levels
+        where levels.priority is not null
+    ),
+    candidates as (
+        select c.id,
+               c.priority + case
+                   when p_aging_seconds is null or p_aging_seconds <= 0 then 0
+                   else floor(
+                       extract(epoch from now() - coalesce(c.not_before, c.created_at, now()))
+                       / p_aging_seconds
+                   )::integer
+               end as effective_priority
+        from levels l
+        cross join lateral (
+            select i.id, i.priority, i.not_before, i.created_at
+            from public.issues i
+            where i.status = 'pending'
+              and i.assigned_to = p_worker_id
+              and i.priority = l.priority
+              and i.type in ('direct', 'full', 'patch', 'thin')
+              and (i.not_before is null or i.not_before <= now())
+            order by i.id
+            limit p_limit
+        ) c
+        where l.priority is not null
+    ),
+    next_issues as (
+        select i.id, c.effective_priority
+        from public.issues i
+        join candidates c on c.id = i.id
+        where i.status = 'pending'
+          and i.assigned_to = p_worker_id
+        order by c.effective_priority desc, i.priority desc, i.id
+        for update of i skip locked
+        limit p_limit
+    ),
+    claimed as (
+        update public.issues i
+        set status = 'claimed',
+            lease_owner = p_worker_id,
+            lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+            attempts = i.attempts + 1,
+            updated_at = now()
+        from next_issues
+        where i.id = next_issues.id
+        returning i.id, i.description, i.status, i.type, i.adw_id, next_issues.effective_priority
+    )
+    select c.id, c.description, c.status, c.type, c.adw_id
+    from claimed c
+    order by c.effective_priority desc, c.id;
+end;
+$$ language plpgsql;
@@ -0,0 +1,301 @@
+-- Shared work pools and work stealing.
+--
+-- A worker started with a pool name claims, besides the issues assigned to
+-- it, issues assigned to the pool name and unassigned issues (assigned_to is
+-- null), ranked together by effective priority. Pool names share the
+-- assigned_to namespace with worker IDs, so they must not collide.
+--
+-- Workers record their pool in worker_pool_members whenever they claim. An
+-- idle pool worker that finds nothing to claim may steal pending issues
+-- assigned to a peer in the same pool whose backlog exceeds
+-- p_steal_threshold, taking at most the excess so the peer keeps its
+-- threshold of work.
+--
+-- Claimed issues are reassigned to the claiming worker so status updates and
+-- lease renewals work unchanged. claimed_via and claimed_from remember how
+-- the issue was obtained; releasing a queued claim or reaping an expired
+-- lease hands the issue back to the pool, to the unassigned queue, or to the
+-- peer it was stolen from.
+
+create table public.worker_pool_members (
+    worker_id text primary key,
+    pool text not null,
+    last_seen_at timestamptz not null default now()
+);
+
+create index idx_worker_pool_members_pool on public.worker_pool_members(pool);
+
+alter table public.issues
+    add column claimed_from text,
+    add column claimed_via text check (claimed_via in ('pool', 'unassigned', 'steal'));
+
+-- Unassigned pending issues can now be claimed, so announce them too.
+create or replace function public.notify_issue_pending()
+returns trigger as $$
+begin
+    if new.status = 'pending' then
+        perform pg_notify(
+            'rouge_issue_pending',
+            json_build_object('issue_id', new.id, 'assigned_to', new.assigned_to)::text
+        );
+    end if;
+    return new;
+end;
+$$ language plpgsql;
+
+-- Best claim candidates among the pending issues of one assignee (null for
+-- unassigned issues), using the priority index introduced with aging.
+create or replace function public.pending_issue_candidates(
+    p_assignee text,
+    p_limit integer,
+    p_aging_seconds integer default 3600
+)
+returns table (candidate_id integer, effective_priority integer) as $$
+declare
+    v_match text := case
+        when p_assignee is null then 'i.assigned_to is null'
+        else 'i.assigned_to = $1'
+    end;
+begin
+    return query execute format($query$
+        with recursive levels as (
+            (
+                select i.priority
+                from public.issues i
+                where i.status = 'pending' and %1$s
+                order by i.priority desc
+                limit 1
+            )
+            union all
+            select (
+                select i.priority
+                from public.issues i
+                where i.status = 'pending' and %1$s and i.priority < levels.priority
+                order by i.priority desc
+                limit 1
+            )
+            from levels
+            where levels.priority is not null
+        )
+        select c.id,
+               c.priority + case
+                   when $3 is null or $3 <= 0 then 0
+                   else floor(
+                       extract(epoch from now() - coalesce(c.not_before, c.created_at, now()))
+                       / $3
+                   )::integer
+               end
+        from levels l
+        cross join lateral (
+            select i.id, i.priority, i.not_before, i.created_at
+            from public.issues i
+            where i.status = 'pending'
+              and %1$s
+              and i.priority = l.priority
+              and i.type in ('direct', 'full', 'patch', 'thin')
+              and (i.not_before is null or i.not_before <= now())
+            order by i.id
+            limit $2
+        ) c
+        where l.priority is not null
+    $query$, v_match)
+    using p_assignee, p_limit, p_aging_seconds;
+end;
+$$ language plpgsql stable;
+
+drop function if exists public.get_and_lock_next_issue(text, integer, integer);
+drop function if exists public.get_and_lock_next_issues(text, integer, integer, integer);
+
+create or replace function public.get_and_lock_next_issue(
+    p_worker_id text,
+    p_lease_seconds integer default 600,
+    p_aging_seconds integer default 3600,
+    p_pool text default null,
+    p_steal_threshold integer default null
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+begin
+    return query
+    select * from public.get_and_lock_next_issues(
+        p_worker_id, 1, p_lease_seconds, p_aging_seconds, p_pool, p_steal_threshold
+    );
+end;
+$$ language plpgsql;
+
+create or replace function public.get_and_lock_next_issues(
+    p_worker_id text,
+    p_limit integer,
+    p_lease_seconds integer default 600,
+    p_aging_seconds integer default 3600,
+    p_pool text default null,
+    p_steal_threshold integer default null
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+declare
+    v_ids integer[];
+    v_take integer := p_limit;
+    v_victim text;
+    v_backlog bigint;
+begin
+    if p_limit is null or p_limit < 1 then
+        raise exception 'p_limit must be >= 1, got %', p_limit;
+    end if;
+    if p_lease_seconds is null or p_lease_seconds < 1 then
+        raise exception 'p_lease_seconds must be >= 1, got %', p_lease_seconds;
+    end if;
+    if p_steal_threshold is not null and p_steal_threshold < 0 then
+        raise exception 'p_steal_threshold must be >= 0, got %', p_steal_threshold;
+    end if;
+
+    if p_pool is not null then
+        insert into public.worker_pool_members (worker_id, pool, last_seen_at)
+        values (p_worker_id, p_pool, now())
+        on conflict (worker_id) do update
+        set pool = excluded.pool,
+            last_seen_at = excluded.last_seen_at;
+    end if;
+
+    select array_agg(c.candidate_id order by c.effective_priority desc, c.candidate_id)
+    into v_ids
+    from (
+        select * from public.pending_issue_candidates(p_worker_id, p_limit, p_aging_seconds)
+        union all
+        select * from public.pending_issue_candidates(p_pool, p_limit, p_aging_seconds)
+        where p_pool is not null
+        union all
+        select * from public.pending_issue_candidates(null, p_limit, p_aging_seconds)
+        where p_pool is not null
+    ) c;
+
+    if v_ids is null and p_pool is not null and p_steal_threshold is not null then
+        select m.worker_id, count(*)
+        into v_victim, v_backlog
+        from public.worker_pool_members m
+        join public.issues i
+          on i.assigned_to = m.worker_id
+         and i.status = 'pending'
+        where m.pool = p_pool
+          and m.worker_id <> p_worker_id
+        group by m.worker_id
+        having count(*) > p_steal_threshold
+        order by count(*) desc, m.worker_id
+        limit 1;
+
+        if v_victim is not null then
+            v_take := least(p_limit, (v_backlog - p_steal_threshold)::integer);
+            select array_agg(c.candidate_id order by c.effective_priority desc, c.candidate_id)
+            into v_ids
+            from public.pending_issue_candidates(v_victim, v_take, p_aging_seconds) c;
+        end if;
+    end if;
+
+    if v_ids is null then
+        return;
+    end if;
+
+    return query
+    with next_issues as (
+        select i.id, array_position(v_ids, i.id) as claim_rank
+        from public.issues i
+        where i.id = any(v_ids)
+          and i.status = 'pending'
+        order by array_position(v_ids, i.id)
+        for update of i skip locked
+        limit v_take
+    ),
+    claimed as (
+        update public.issues i
+        set status = 'claimed',
+            claimed_via = case
+                when i.assigned_to = p_worker_id then null
+                when i.assigned_to is null then 'unassigned'
+                when i.assigned_to = p_pool then 'pool'
+                else 'steal'
+            end,
+            claimed_from = case
+                when i.assigned_to = p_worker_id then null
+                else i.assigned_to
+            end,
+            assigned_to = p_worker_id,
+            lease_owner = p_worker_id,
+            lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+            attempts = i.attempts + 1,
+            updated_at = now()
+        from next_issues
+        where i.id = next_issues.id
+        returning i.id, i.description, i.status, i.type, i.adw_id, next_issues.claim_rank
+    )
+    select c.id, c.description, c.status, c.type, c.adw_id
+    from claimed c
+    order by c.claim_rank;
+end;
+$$ language plpgsql;
+
+-- Queued claims go back to wherever they were claimed from.
+create or replace function public.release_claimed_issues(
+    p_worker_id text,
+    p_issue_ids integer[]
+)
+returns table (issue_id integer) as $$
+begin
+    return query
+    update public.issues i
+    set status = 'pending',
+        assigned_to = case when i.claimed_via is null then i.assigned_to else i.claimed_from end,
+        claimed_via = null,
+        claimed_from = null,
+        updated_at = now()
+    where i.id = any(p_issue_ids)
+      and i.status = 'claimed'
+      and i.assigned_to = p_worker_id
+    returning i.id;
+end;
+$$ language plpgsql;
+
+-- Expired pool, unassigned, and stolen claims are handed back the same way.
+create or replace function public.reap_expired_leases(p_max_attempts integer default 3)
+returns table (
+    issue_id integer,
+    issue_status text,
+    issue_attempts integer,
+    previous_owner text
+) as $$
+begin
+    if p_max_attempts is null or p_max_attempts < 1 then
+        raise exception 'p_max_attempts must be >= 1, got %', p_max_attempts;
+    end if;
+
+    return query
+    with expired as (
+        select i.id, i.lease_owner
+        from public.issues i
+        where i.status in ('claimed', 'started')
+          and i.lease_expires_at < now()
+        for update skip locked
+    )
+    update public.issues i
+    set status = case when i.attempts >= p_max_attempts then 'failed' else 'pending' end,
+        assigned_to = case
+            when i.attempts < p_max_attempts and i.claimed_via is not null then i.claimed_from
+            else i.assigned_to
+        end,
+        claimed_via = case when i.attempts >= p_max_attempts then i.claimed_via end,
+        claimed_from = case when i.attempts >= p_max_attempts then i.claimed_from end,
+        updated_at = now()
+    from expired
+    where i.id = expired.id
+    returning i.id, i.status, i.attempts, expired.lease_owner;
+end;
+$$ language plpgsql;
@@ -0,0 +1,68 @@
+-- Compare-and-set issue status transitions.
+--
+-- transition_issue_status locks the issue, optionally checks that it is still
+-- in p_expected_status, and applies the new status together with any extra
+-- fields in one round trip. It returns the row as it was before and after
+-- the update, so callers can log the transition without a separate read.
+--
+-- No row is returned when the issue does not exist. When the expected status
+-- does not match, nothing is updated and the current row is returned as
+-- previous_issue with a null issue.
+--
+-- p_fields may set assigned_to, type, title, description, branch, adw_id,
+-- priority, and not_before; a key that is present with a null value clears
+-- the column, and absent keys are left unchanged.
+
+create or replace function public.transition_issue_status(
+    p_issue_id integer,
+    p_status text,
+    p_expected_status text default null,
+    p_fields jsonb default '{}'::jsonb
+)
+returns table (previous_issue jsonb, issue jsonb) as $$
+declare
+    v_previous public.issues;
+    v_fields jsonb := coalesce(p_fields, '{}'::jsonb);
+begin
+    select * into v_previous
+    from public.issues i
+    where i.id = p_issue_id
+    for update;
+
+    if not found then
+        return;
+    end if;
+
+    if p_expected_status is not null and v_previous.status <> p_expected_status then
+        return query select to_jsonb(v_previous), null::jsonb;
+        return;
+    end if;
+
+    return query
+    update public.issues i
+    set status = p_status,
+        assigned_to = case
+            when v_fields ? 'assigned_to' then v_fields->>'assigned_to'
+            else i.assigned_to
+        end,
+        type = case when v_fields ? 'type' then v_fields->>'type' else i.type end,
+        title = case when v_fields ? 'title' then v_fields->>'title' else i.title end,
+        description = case
+            when v_fields ? 'description' then v_fields->>'description'
+            else i.description
+        end,
+        branch = case when v_fields ? 'branch' then v_fields->>'branch' else i.branch end,
+        adw_id = case when v_fields ? 'adw_id' then v_fields->>'adw_id' else i.adw_id end,
+        priority = case
+            when v_fields ? 'priority' then (v_fields->>'priority')::integer
+            else i.priority
+        end,
+        not_before = case
+            when v_fields ? 'not_before' then (v_fields->>'not_before')::timestamptz
+            else i.not_before
+        end,
+        updated_at = now()
+    where i.id = p_issue_id
+    returning to_jsonb(v_previous), to_jsonb(i);
+end;
+$$ language plpgsql;
@@ -0,0 +1,12 @@
+-- Idempotent comment inserts.
+--
+-- Comments carry a client-generated client_key. Comments that could not be
+-- inserted are spooled locally and replayed later with
+-- "on conflict (client_key) do nothing", so a comment whose original insert
+-- did reach the database (or a segment replayed twice) is never duplicated.
+-- Older rows and clients without a key keep client_key null, which the
+-- unique constraint allows any number of times.
+
+alter table public.comments
+    add column client_key uuid,
+    add constraint comments_client_key_key unique (client_key);
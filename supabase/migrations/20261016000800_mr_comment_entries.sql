@@ -0,0 +1,51 @@
+-- Server-side extraction of pull/merge request entries.
+--
+-- Pull-request artifact comments keep their entries in
+-- raw->'artifact'->'pull_requests', next to the rest of the artifact. Listing
+-- merge requests used to fetch whole comment rows (raw included) and flatten
+-- them client-side. mr_comment_entries flattens them in the database instead,
+-- one row per entry with only the projected columns, so `rouge mr list`
+-- transfers a few hundred bytes per merge request whatever else the artifact
+-- holds, and pagination applies to entries rather than comments.
+--
+-- Entries are keyed by (created_at, comment_id, entry_index); entry_index is
+-- the 1-based position within the comment. Malformed artifacts (no
+-- pull_requests array, non-object entries) contribute no rows.
+--
+-- The index serves the view's filter and its newest-first order, optionally
+-- narrowed to one issue.
+
+create index idx_comments_source_type_issue_created
+on public.comments(source, type, issue_id, created_at desc, id desc);
+
+create or replace view public.mr_comment_entries
+with (security_invoker = on) as
+select
+    c.id as comment_id,
+    pr.entry_index::integer as entry_index,
+    c.issue_id,
+    c.adw_id,
+    c.type,
+    c.created_at,
+    c.raw->'artifact'->>'platform' as platform,
+    pr.entry->>'repo' as repo,
+    case
+        when jsonb_typeof(pr.entry->'number') = 'number'
+            then (pr.entry->>'number')::numeric::bigint
+    end as number,
+    pr.entry->>'url' as url,
+    case
+        when jsonb_typeof(pr.entry->'adopted') = 'boolean' then (pr.entry->>'adopted')::boolean
+        else false
+    end as adopted
+from public.comments c
+cross join lateral jsonb_array_elements(
+    case
+        when jsonb_typeof(c.raw->'artifact'->'pull_requests') = 'array'
+            then c.raw->'artifact'->'pull_requests'
+        else '[]'::jsonb
+    end
+) with ordinality as pr(entry, entry_index)
+where c.source = 'artifact'
+  and c.type in ('gh-pull-request', 'glab-pull-request')
+  and jsonb_typeof(pr.entry) = 'object';
@@ -0,0 +1,59 @@
+-- Composite and partial indexes for the hot listing paths.
+--
+-- Listings page newest first on (created_at desc, id desc), either by offset
+-- or by keyset cursor. The baseline single-column indexes find the matching
+-- rows but not in that order, so every page sorted all of an issue's
+-- comments, or all issues of a status, before applying the limit. Each index
+-- below leads with the equality filters of one access path and ends in the
+-- listing order, so a page is a bounded index range scan:
+--
+--   fetch_all_issues()                      idx_issues_created
+--   fetch_all_issues(status=...)            idx_issues_status_created
+--   fetch_all_issues(type=..., status=...)  idx_issues_type_status_created
+--   list_comments()                         idx_comments_created
+--   list_comments(issue_id=...)             idx_comments_issue_created
+--   list_comments(issue_id=..., type=...)   idx_comments_issue_type_created
+--   list_mr_comments()                      idx_comments_mr_created
+--   list_mr_comments(issue_id=...)          idx_comments_source_type_issue_created
+--
+-- Filtering issues by type alone walks idx_issues_created and skips other
+-- types; with four issue types a page reads about four pages of index.
+--
+-- idx_comments_mr_created is partial: pull-request artifacts are a small
+-- fraction of all comments, and the predicate matches the filter of the
+-- mr_comment_entries view. The claim RPC is already served by
+-- idx_issues_pending_priority and is unchanged.
+--
+-- The replaced single-column indexes are prefixes of the new composites and
+-- are dropped so writes do not maintain both. scripts/benchmark_query_plans.py
+-- reports EXPLAIN ANALYZE timings for these queries with and without this
+-- migration's indexes.
+
+drop index if exists public.idx_issues_status;
+drop index if exists public.idx_issues_type;
+drop index if exists public.idx_comments_issue_id;
+
+create index idx_issues_created
+on public.issues(created_at desc, id desc);
+
+create index idx_issues_status_created
+on public.issues(status, created_at desc, id desc);
+
+create index idx_issues_type_status_created
+on public.issues(type, status, created_at desc, id desc);
+
+create index idx_comments_created
+on public.comments(created_at desc, id desc);
+
+create index idx_comments_issue_created
+on public.comments(issue_id, created_at desc, id desc);
+
+create index idx_comments_issue_type_created
+on public.comments(issue_id, type, created_at desc, id desc);
+
+create index idx_comments_mr_created
+on public.comments(created_at desc, id desc)
+where source = 'artifact' and type in ('gh-pull-request', 'glab-pull-request');
+
+analyze public.issues;
+analyze public.comments;
@@ -0,0 +1,129 @@
+-- Content-addressed storage for large comment payloads.
+--
+-- Artifact comments embed the whole artifact in raw, and a step usually
+-- posts the same agent output more than once: the parsed template result,
+-- the artifact, and the progress comment all carry the same plan or
+-- implementation text. Every copy was stored inline in comments.raw.
+--
+-- artifact_blobs holds each distinct large string once, keyed by the SHA-256
+-- of its UTF-8 bytes. A before-insert trigger on comments replaces every
+-- string of at least 2048 bytes anywhere in raw with a reference object
+-- {"$blob": "<sha256 hex>"}, so identical text is stored a single time
+-- whichever comment posts it. Clients are unchanged on the write path
+-- (including batched and spooled inserts) and resolve references only when
+-- a comment's full payload is shown, e.g. by `rouge comment read`.
+--
+-- Short fields stay inline, so jsonb filters on small values work as before.
+-- The mr_comment_entries view reads its text columns through blob_text(),
+-- which resolves a reference in the database for the rows a page returns, so
+-- `rouge mr list` never sees references. Existing comments are left as they
+-- are here and rewritten in batches later (20261016001400), so this migration
+-- never rewrites the whole table in one transaction.
+
+create table public.artifact_blobs (
+    hash text primary key check (hash ~ '^[0-9a-f]{64}$'),
+    content text not null,
+    created_at timestamptz not null default now()
+);
+
+create or replace function public.externalize_blobs(
+    p_value jsonb,
+    p_min_bytes integer default 2048
+)
+returns jsonb as $$
+declare
+    v_text text;
+    v_hash text;
+begin
+    case jsonb_typeof(p_value)
+        when 'string' then
+            v_text := p_value #>> '{}';
+            if octet_length(v_text) < p_min_bytes then
+                return p_value;
+            end if;
+            v_hash := encode(sha256(convert_to(v_text, 'UTF8')), 'hex');
+            insert into public.artifact_blobs (hash, content)
+            values (v_hash, v_text)
+            on conflict (hash) do nothing;
+            return jsonb_build_object('$blob', v_hash);
+        when 'object' then
+            -- Small subtrees cannot hold a string over the threshold
+            if octet_length(p_value::text) < p_min_bytes then
+                return p_value;
+            end if;
+            return (
+                select coalesce(
+                    jsonb_object_agg(key, public.externalize_blobs(value, p_min_bytes)),
+                    '{}'::jsonb
+                )
+                from jsonb_each(p_value)
+            );
+        when 'array' then
+            if octet_length(p_value::text) < p_min_bytes then
+                return p_value;
+            end if;
+            return (
+                select coalesce(
+                    jsonb_agg(public.externalize_blobs(element, p_min_bytes) order by position),
+                    '[]'::jsonb
+                )
+                from jsonb_array_elements(p_value) with ordinality as e(element, position)
+            );
+        else
+            return p_value;
+    end case;
+end;
+$$ language plpgsql;
+
+create or replace function public.externalize_comment_blobs()
+returns trigger as $$
+begin
+    new.raw := public.externalize_blobs(new.raw);
+    return new;
+end;
+$$ language plpgsql;
+
+create trigger externalize_comments_blobs
+before insert on public.comments
+for each row execute function public.externalize_comment_blobs();
+
+create or replace function public.blob_text(p_value jsonb)
+returns text as $$
+    select case
+        when jsonb_typeof(p_value) = 'object' and p_value ? '$blob'
+            then (select b.content from public.artifact_blobs b where b.hash = p_value->>'$blob')
+        else p_value #>> '{}'
+    end
+$$ language sql stable;
+
+create or replace view public.mr_comment_entries
+with (security_invoker = on) as
+select
+    c.id as comment_id,
+    pr.entry_index::integer as entry_index,
+    c.issue_id,
+    c.adw_id,
+    c.type,
+    c.created_at,
+    public.blob_text(c.raw->'artifact'->'platform') as platform,
+    public.blob_text(pr.entry->'repo') as repo,
+    case
+        when jsonb_typeof(pr.entry->'number') = 'number'
+            then (pr.entry->>'number')::numeric::bigint
+    end as number,
+    public.blob_text(pr.entry->'url') as url,
+    case
+        when jsonb_typeof(pr.entry->'adopted') = 'boolean' then (pr.entry->>'adopted')::boolean
+        else false
+    end as adopted
+from public.comments c
+cross join lateral jsonb_array_elements(
+    case
+        when jsonb_typeof(c.raw->'artifact'->'pull_requests') = 'array'
+            then c.raw->'artifact'->'pull_requests'
+        else '[]'::jsonb
+    end
+) with ordinality as pr(entry, entry_index)
+where c.source = 'artifact'
+  and c.type in ('gh-pull-request', 'glab-pull-request')
+  and jsonb_typeof(pr.entry) = 'object';
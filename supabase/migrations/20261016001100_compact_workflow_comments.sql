@@ -0,0 +1,152 @@
+-- Retention for workflow progress chatter.
+--
+-- Every workflow run posts dozens of system comments of type 'workflow'
+-- ("Step X started", "Step X completed", template results), so comments
+-- grows without bound even though nobody reads them once the issue is done.
+--
+-- compact_workflow_comments() handles one batch of finished issues (status
+-- 'completed' or 'failed', last updated more than p_older_than_days ago).
+-- For each workflow run (issue and adw_id) it replaces the progress comments
+-- with a single 'workflow-summary' comment whose raw keeps the per-step
+-- timings, and returns how many rows it removed and roughly how many stored
+-- bytes that freed. Artifact comments, pull request entries and every other
+-- comment type are left alone, and summaries are never compacted again.
+--
+-- Each call is one short transaction over at most p_batch_size issues, which
+-- it locks with skip locked so a concurrent status change is never blocked
+-- for long; `rouge comment compact` calls it until a batch comes back empty.
+-- Deleted rows are reused by the table after vacuum rather than returned to
+-- the operating system.
+
+create or replace function public.compact_workflow_comments(
+    p_older_than_days integer default 30,
+    p_batch_size integer default 50
+)
+returns table (
+    issue_id integer,
+    comments_removed integer,
+    bytes_reclaimed bigint
+) as $$
+begin
+    if p_older_than_days is null or p_older_than_days < 0 then
+        raise exception 'p_older_than_days must be >= 0, got %', p_older_than_days;
+    end if;
+    if p_batch_size is null or p_batch_size < 1 then
+        raise exception 'p_batch_size must be >= 1, got %', p_batch_size;
+    end if;
+
+    return query
+    with candidates as (
+        select i.id
+        from public.issues i
+        where i.status in ('completed', 'failed')
+          and i.updated_at < now() - make_interval(days => p_older_than_days)
+          and exists (
+              select 1
+              from public.comments c
+              where c.issue_id = i.id
+                and c.source = 'system'
+                and c.type = 'workflow'
+          )
+        order by i.id
+        limit p_batch_size
+        for update of i skip locked
+    ),
+    removed as (
+        delete from public.comments c
+        using candidates
+        where c.issue_id = candidates.id
+          and c.source = 'system'
+          and c.type = 'workflow'
+        returning
+            c.issue_id,
+            c.adw_id,
+            c.raw,
+            c.created_at,
+            pg_column_size(c.comment) + pg_column_size(c.raw) as stored_bytes
+    ),
+    step_events as (
+        select
+            r.issue_id,
+            r.adw_id,
+            r.raw->>'step' as step,
+            min(r.created_at) filter (where r.raw->>'status' = 'started') as first_started_at,
+            max(r.created_at) filter (where r.raw->>'status' = 'started') as started_at,
+            max(r.created_at) filter (where r.raw->>'status' = 'completed') as completed_at,
+            (array_agg(r.raw->'success' order by r.created_at desc)
+                filter (where r.raw->>'status' = 'completed'))[1] as success,
+            count(*) filter (where r.raw->>'status' = 'started') as runs
+        from removed r
+        where jsonb_typeof(r.raw->'step') = 'string'
+        group by r.issue_id, r.adw_id, r.raw->>'step'
+    ),
+    steps as (
+        select
+            s.issue_id,
+            s.adw_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'step', s.step,
+                    'started_at', s.started_at,
+                    'completed_at', s.completed_at,
+                    'duration_seconds', case
+                        when s.completed_at >= s.started_at
+                            then round(extract(epoch from s.completed_at - s.started_at), 3)
+                    end,
+                    'success', s.success,
+                    'runs', s.runs
+                )
+                order by s.first_started_at nulls last, s.step
+            ) as steps
+        from step_events s
+        group by s.issue_id, s.adw_id
+    ),
+    runs as (
+        select
+            r.issue_id,
+            r.adw_id,
+            count(*)::integer as removed_count,
+            sum(r.stored_bytes)::bigint as removed_bytes,
+            min(r.created_at) as first_at,
+            max(r.created_at) as last_at
+        from removed r
+        group by r.issue_id, r.adw_id
+    ),
+    summaries as (
+        insert into public.comments (issue_id, adw_id, comment, raw, source, type, created_at)
+        select
+            runs.issue_id,
+            runs.adw_id,
+            format('Compacted %s workflow progress comments', runs.removed_count),
+            jsonb_build_object(
+                'compacted', runs.removed_count,
+                'first_at', runs.first_at,
+                'last_at', runs.last_at,
+                'steps', coalesce(steps.steps, '[]'::jsonb)
+            ),
+            'system',
+            'workflow-summary',
+            runs.last_at
+        from runs
+        left join steps
+            on steps.issue_id = runs.issue_id
+           and steps.adw_id is not distinct from runs.adw_id
+        returning
+            comments.issue_id,
+            pg_column_size(comments.comment) + pg_column_size(comments.raw) as stored_bytes
+    ),
+    added as (
+        select s.issue_id, sum(s.stored_bytes)::bigint as added_bytes
+        from summaries s
+        group by s.issue_id
+    )
+    select
+        runs.issue_id,
+        sum(runs.removed_count)::integer,
+        greatest(sum(runs.removed_bytes) - coalesce(max(added.added_bytes), 0), 0)::bigint
+    from runs
+    left join added on added.issue_id = runs.issue_id
+    group by runs.issue_id
+    order by runs.issue_id;
+end;
+$$ language plpgsql;
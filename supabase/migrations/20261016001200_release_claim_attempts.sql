@@ -0,0 +1,29 @@
+-- Give back the attempt when a worker releases a claim it never started.
+--
+-- get_and_lock_next_issues() bumps attempts on every claim so the reaper can
+-- fail issues whose workers keep dying mid-run. release_claimed_issues() only
+-- ever hands back rows that are still 'claimed' (queued in the worker's
+-- batch, or abandoned before the 'started' transition), so none of their
+-- work ran; counting those claims made an issue that was merely queued on a
+-- shutting-down worker a few times look like a crash loop and get failed by
+-- reap_expired_leases(). Releasing now takes the attempt back off.
+create or replace function public.release_claimed_issues(
+    p_worker_id text,
+    p_issue_ids integer[]
+)
+returns table (issue_id integer) as $$
+begin
+    return query
+    update public.issues i
+    set status = 'pending',
+        assigned_to = case when i.claimed_via is null then i.assigned_to else i.claimed_from end,
+        claimed_via = null,
+        claimed_from = null,
+        attempts = greatest(i.attempts - 1, 0),
+        updated_at = now()
+    where i.id = any(p_issue_ids)
+      and i.status = 'claimed'
+      and i.assigned_to = p_worker_id
+    returning i.id;
+end;
+$$ language plpgsql;
@@ -0,0 +1,129 @@
+-- Re-check who a candidate belongs to once its row is locked.
+--
+-- get_and_lock_next_issues() picks candidate IDs first and locks them
+-- afterwards, and the locked select only re-checked status = 'pending'. A
+-- candidate reassigned in between (released back to a peer, handed to a
+-- different pool, or taken by the operator) was still claimed, and a steal
+-- could take an issue that no longer belonged to the victim. The locked
+-- select now repeats the assignee predicate the candidates were chosen by,
+-- which Postgres re-evaluates against the latest row version, so such rows
+-- are skipped instead of claimed.
+create or replace function public.get_and_lock_next_issues(
+    p_worker_id text,
+    p_limit integer,
+    p_lease_seconds integer default 600,
+    p_aging_seconds integer default 3600,
+    p_pool text default null,
+    p_steal_threshold integer default null
+)
+returns table (
+    issue_id integer,
+    issue_description text,
+    issue_status text,
+    issue_type text,
+    issue_adw_id text
+) as $$
+declare
+    v_ids integer[];
+    v_take integer := p_limit;
+    v_victim text;
+    v_backlog bigint;
+begin
+    if p_limit is null or p_limit < 1 then
+        raise exception 'p_limit must be >= 1, got %', p_limit;
+    end if;
+    if p_lease_seconds is null or p_lease_seconds < 1 then
+        raise exception 'p_lease_seconds must be >= 1, got %', p_lease_seconds;
+    end if;
+    if p_steal_threshold is not null and p_steal_threshold < 0 then
+        raise exception 'p_steal_threshold must be >= 0, got %', p_steal_threshold;
+    end if;
+
+    if p_pool is not null then
+        insert into public.worker_pool_members (worker_id, pool, last_seen_at)
+        values (p_worker_id, p_pool, now())
+        on conflict (worker_id) do update
+        set pool = excluded.pool,
+            last_seen_at = excluded.last_seen_at;
+    end if;
+
+    select array_agg(c.candidate_id order by c.effective_priority desc, c.candidate_id)
+    into v_ids
+    from (
+        select * from public.pending_issue_candidates(p_worker_id, p_limit, p_aging_seconds)
+        union all
+        select * from public.pending_issue_candidates(p_pool, p_limit, p_aging_seconds)
+        where p_pool is not null
+        union all
+        select * from public.pending_issue_candidates(null, p_limit, p_aging_seconds)
+        where p_pool is not null
+    ) c;
+
+    if v_ids is null and p_pool is not null and p_steal_threshold is not null then
+        select m.worker_id, count(*)
+        into v_victim, v_backlog
+        from public.worker_pool_members m
+        join public.issues i
+          on i.assigned_to = m.worker_id
+         and i.status = 'pending'
+        where m.pool = p_pool
+          and m.worker_id <> p_worker_id
+        group by m.worker_id
+        having count(*) > p_steal_threshold
+        order by count(*) desc, m.worker_id
+        limit 1;
+
+        if v_victim is not null then
+            v_take := least(p_limit, (v_backlog - p_steal_threshold)::integer);
+            select array_agg(c.candidate_id order by c.effective_priority desc, c.candidate_id)
+            into v_ids
+            from public.pending_issue_candidates(v_victim, v_take, p_aging_seconds) c;
+        end if;
+    end if;
+
+    if v_ids is null then
+        return;
+    end if;
+
+    return query
+    with next_issues as (
+        select i.id, array_position(v_ids, i.id) as claim_rank
+        from public.issues i
+        where i.id = any(v_ids)
+          and i.status = 'pending'
+          and (
+              i.assigned_to = p_worker_id
+              or (p_pool is not null and (i.assigned_to = p_pool or i.assigned_to is null))
+              or (v_victim is not null and i.assigned_to = v_victim)
+          )
+        order by array_position(v_ids, i.id)
+        for update of i skip locked
+        limit v_take
+    ),
+    claimed as (
+        update public.issues i
+        set status = 'claimed',
+            claimed_via = case
+                when i.assigned_to = p_worker_id then null
+                when i.assigned_to is null then 'unassigned'
+                when i.assigned_to = p_pool then 'pool'
+                else 'steal'
+            end,
+            claimed_from = case
+                when i.assigned_to = p_worker_id then null
+                else i.assigned_to
+            end,
+            assigned_to = p_worker_id,
+            lease_owner = p_worker_id,
+            lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+            attempts = i.attempts + 1,
+            updated_at = now()
+        from next_issues
+        where i.id = next_issues.id
+        returning i.id, i.description, i.status, i.type, i.adw_id, next_issues.claim_rank
+    )
+    select c.id, c.description, c.status, c.type, c.adw_id
+    from claimed c
+    order by c.claim_rank;
+end;
+$$ language plpgsql;
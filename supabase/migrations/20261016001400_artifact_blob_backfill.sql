@@ -0,0 +1,70 @@
+-- Externalize artifact comments only, and backfill them in batches.
+--
+-- The externalize_comments_blobs trigger moved large strings out of every
+-- comment, although only artifact comments carry whole plans and
+-- implementation output; progress and other comments keep their payload
+-- inline again. References already stored in those rows stay valid, as
+-- readers resolve a {"$blob": ...} reference whichever comment holds it.
+--
+-- Comments written before artifact_blobs existed are not rewritten by a
+-- migration, which would hold one transaction over every large row.
+-- externalize_artifact_comment_blobs() rewrites one batch of artifact
+-- comments with a raw payload of at least 2048 bytes and an id above
+-- p_after_id, and returns one row per comment it looked at with roughly how
+-- many stored bytes it freed (0 for rows that had nothing left to move).
+-- `rouge comment externalize-blobs` calls it, passing the last returned id,
+-- until a batch comes back empty.
+
+drop trigger externalize_comments_blobs on public.comments;
+
+create trigger externalize_comments_blobs
+before insert on public.comments
+for each row
+when (new.source = 'artifact')
+execute function public.externalize_comment_blobs();
+
+create or replace function public.externalize_artifact_comment_blobs(
+    p_after_id integer default 0,
+    p_batch_size integer default 200
+)
+returns table (
+    comment_id integer,
+    bytes_reclaimed bigint
+) as $$
+begin
+    if p_batch_size is null or p_batch_size < 1 then
+        raise exception 'p_batch_size must be >= 1, got %', p_batch_size;
+    end if;
+
+    return query
+    with batch as (
+        select
+            c.id,
+            pg_column_size(c.raw) as old_bytes,
+            public.externalize_blobs(c.raw) as new_raw
+        from public.comments c
+        where c.id > coalesce(p_after_id, 0)
+          and c.source = 'artifact'
+          and octet_length(c.raw::text) >= 2048
+        order by c.id
+        limit p_batch_size
+    ),
+    rewritten as (
+        update public.comments c
+        set raw = batch.new_raw
+        from batch
+        where c.id = batch.id
+          and c.raw is distinct from batch.new_raw
+        returning c.id
+    )
+    select
+        batch.id,
+        case
+            when rewritten.id is null then 0::bigint
+            else greatest(batch.old_bytes - pg_column_size(batch.new_raw), 0)::bigint
+        end
+    from batch
+    left join rewritten on rewritten.id = batch.id
+    order by batch.id;
+end;
+$$ language plpgsql;
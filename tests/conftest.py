@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from rouge.core.database import clear_issue_cache, reset_circuit_breaker
 from rouge.core.workflow.artifacts import ArtifactStore
 
 
@@ -30,3 +31,41 @@ def tmp_artifact_store(tmp_path: Path) -> ArtifactStore:
             )
     """
     return ArtifactStore(workflow_id="test-workflow", base_path=tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def isolated_comment_spool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the comment spool at a per-test directory.
+
+    Failed comment inserts are spooled to disk; this keeps tests from
+    writing into the working directory's ``.rouge`` folder.
+    """
+    spool_dir = tmp_path / "comment-spool"
+    monkeypatch.setenv("ROUGE_COMMENT_SPOOL_DIR", str(spool_dir))
+    return spool_dir
+
+
+@pytest.fixture(autouse=True)
+def empty_issue_cache() -> None:
+    """Start every test with an empty issue cache.
+
+    Issue reads and writes are cached per process; without this, rows mocked
+    in one test would answer fetch_issue() calls in the next.
+    """
+    clear_issue_cache()
+
+
+@pytest.fixture(autouse=True)
+def supabase_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route database calls through the PostgREST backend tests mock."""
+    monkeypatch.delenv("ROUGE_DB_BACKEND", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def closed_circuit_breaker() -> None:
+    """Start every test with a closed database circuit breaker.
+
+    The breaker is process-wide; failures mocked in one test would otherwise
+    short-circuit comment inserts in the next.
+    """
+    reset_circuit_breaker()
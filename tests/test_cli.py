@@ -16,6 +16,7 @@ from typer.testing import CliRunner
 
 from rouge.cli.cli import app
 from rouge.cli.issue import app as issue_app
+from rouge.core.database import IssueStatusConflictError
 from rouge.core.models import Issue
 
 runner = CliRunner()
@@ -144,7 +145,7 @@ def test_reset_command_exists() -> None:
     assert result.exit_code != 0
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_failed_issue_succeeds(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with failed issue succeeds."""
@@ -178,14 +179,15 @@ def test_reset_command_with_failed_issue_succeeds(mock_fetch_issue, mock_update_
     mock_fetch_issue.assert_called_once_with(123)
     mock_update_issue.assert_called_once_with(
         123,
+        "pending",
+        expected_status="failed",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_pending_issue_succeeds(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with pending issue succeeds (clears assignment/branch)."""
@@ -219,14 +221,15 @@ def test_reset_command_with_pending_issue_succeeds(mock_fetch_issue, mock_update
     mock_fetch_issue.assert_called_once_with(456)
     mock_update_issue.assert_called_once_with(
         456,
+        "pending",
+        expected_status="pending",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_claimed_issue_fails(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with claimed issue fails with clear error."""
@@ -245,7 +248,7 @@ def test_reset_command_with_claimed_issue_fails(mock_fetch_issue, mock_update_is
     mock_update_issue.assert_not_called()
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_started_issue_succeeds(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with started issue succeeds."""
@@ -277,14 +280,15 @@ def test_reset_command_with_started_issue_succeeds(mock_fetch_issue, mock_update
     mock_fetch_issue.assert_called_once_with(789)
     mock_update_issue.assert_called_once_with(
         789,
+        "pending",
+        expected_status="started",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_completed_issue_succeeds(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with completed issue succeeds."""
@@ -318,14 +322,31 @@ def test_reset_command_with_completed_issue_succeeds(mock_fetch_issue, mock_upda
     mock_fetch_issue.assert_called_once_with(321)
     mock_update_issue.assert_called_once_with(
         321,
+        "pending",
+        expected_status="completed",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
+@patch("rouge.cli.reset.fetch_issue")
+def test_reset_command_fails_when_issue_claimed_concurrently(
+    mock_fetch_issue, mock_update_issue
+) -> None:
+    """Test 'rouge issue reset' reports a status change between read and reset."""
+    mock_fetch_issue.return_value = Issue(
+        id=654, description="Test issue", status="pending", type="full"
+    )
+    mock_update_issue.side_effect = IssueStatusConflictError(654, "pending", "claimed")
+
+    result = runner.invoke(issue_app, ["reset", "654"])
+    assert result.exit_code == 1
+    assert "Error: Issue 654 has status 'claimed', expected 'pending'" in result.output
+
+
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_non_existent_issue_fails(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with non-existent issue fails."""
@@ -339,7 +360,7 @@ def test_reset_command_with_non_existent_issue_fails(mock_fetch_issue, mock_upda
     mock_update_issue.assert_not_called()
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_failed_main_issue_clears_branch(
     mock_fetch_issue, mock_update_issue
@@ -376,14 +397,15 @@ def test_reset_command_with_failed_main_issue_clears_branch(
     # Verify branch is set to None for main issues
     mock_update_issue.assert_called_once_with(
         111,
+        "pending",
+        expected_status="failed",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_failed_patch_issue_preserves_branch(
     mock_fetch_issue, mock_update_issue
@@ -420,13 +442,14 @@ def test_reset_command_with_failed_patch_issue_preserves_branch(
     # Verify branch is NOT in kwargs (preserves existing value)
     mock_update_issue.assert_called_once_with(
         333,
+        "pending",
+        expected_status="failed",
         assigned_to=None,
-        status="pending",
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_failed_thin_issue_clears_branch(
     mock_fetch_issue, mock_update_issue
@@ -460,14 +483,15 @@ def test_reset_command_with_failed_thin_issue_clears_branch(
     mock_fetch_issue.assert_called_once_with(444)
     mock_update_issue.assert_called_once_with(
         444,
+        "pending",
+        expected_status="failed",
         assigned_to=None,
-        status="pending",
         branch=None,
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_with_failed_direct_issue_preserves_branch(
     mock_fetch_issue, mock_update_issue
@@ -504,13 +528,14 @@ def test_reset_command_with_failed_direct_issue_preserves_branch(
     # Verify branch is NOT in kwargs (preserves existing value)
     mock_update_issue.assert_called_once_with(
         555,
+        "pending",
+        expected_status="failed",
         assigned_to=None,
-        status="pending",
         adw_id=None,
     )
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_invalid_issue_id_zero(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' with issue_id of 0 fails."""
@@ -521,7 +546,7 @@ def test_reset_command_invalid_issue_id_zero(mock_fetch_issue, mock_update_issue
     mock_update_issue.assert_not_called()
 
 
-@patch("rouge.cli.reset.update_issue")
+@patch("rouge.cli.reset.transition_issue_status")
 @patch("rouge.cli.reset.fetch_issue")
 def test_reset_command_unexpected_error(mock_fetch_issue, mock_update_issue) -> None:
     """Test 'rouge issue reset' handles unexpected errors."""
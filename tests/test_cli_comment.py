@@ -7,7 +7,8 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 
 from rouge.cli.comment import app
-from rouge.core.models import Comment
+from rouge.core.database import BlobBackfillResult, CompactionResult, decode_cursor
+from rouge.core.models import Comment, CommentSummary
 
 runner = CliRunner()
 
@@ -33,7 +34,12 @@ class TestCommentListCommand:
         assert result.exit_code == 0
         assert "Test comment" in result.output
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source=None, comment_type=None, limit=10, offset=0
+            issue_id=None,
+            source=None,
+            comment_type=None,
+            limit=10,
+            offset=0,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -54,7 +60,12 @@ class TestCommentListCommand:
         assert result.exit_code == 0
         assert "Issue 5 comment" in result.output
         mock_list_comments.assert_called_once_with(
-            issue_id=5, source=None, comment_type=None, limit=10, offset=0
+            issue_id=5,
+            source=None,
+            comment_type=None,
+            limit=10,
+            offset=0,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -75,7 +86,12 @@ class TestCommentListCommand:
         assert result.exit_code == 0
         assert "agent" in result.output
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source="agent", comment_type=None, limit=10, offset=0
+            issue_id=None,
+            source="agent",
+            comment_type=None,
+            limit=10,
+            offset=0,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -96,7 +112,12 @@ class TestCommentListCommand:
         assert result.exit_code == 0
         assert "plan" in result.output
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source=None, comment_type="plan", limit=10, offset=0
+            issue_id=None,
+            source=None,
+            comment_type="plan",
+            limit=10,
+            offset=0,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -107,7 +128,12 @@ class TestCommentListCommand:
         result = runner.invoke(app, ["list", "--limit", "5"])
         assert result.exit_code == 0
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source=None, comment_type=None, limit=5, offset=0
+            issue_id=None,
+            source=None,
+            comment_type=None,
+            limit=5,
+            offset=0,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -118,7 +144,12 @@ class TestCommentListCommand:
         result = runner.invoke(app, ["list", "--offset", "10"])
         assert result.exit_code == 0
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source=None, comment_type=None, limit=10, offset=10
+            issue_id=None,
+            source=None,
+            comment_type=None,
+            limit=10,
+            offset=10,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -138,7 +169,12 @@ class TestCommentListCommand:
         result = runner.invoke(app, ["list", "--limit", "5", "--offset", "10"])
         assert result.exit_code == 0
         mock_list_comments.assert_called_once_with(
-            issue_id=None, source=None, comment_type=None, limit=5, offset=10
+            issue_id=None,
+            source=None,
+            comment_type=None,
+            limit=5,
+            offset=10,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -164,7 +200,12 @@ class TestCommentListCommand:
         )
         assert result.exit_code == 0
         mock_list_comments.assert_called_once_with(
-            issue_id=5, source="agent", comment_type="plan", limit=20, offset=5
+            issue_id=5,
+            source="agent",
+            comment_type="plan",
+            limit=20,
+            offset=5,
+            projection=CommentSummary,
         )
 
     @patch("rouge.cli.comment.list_comments")
@@ -358,6 +399,29 @@ class TestCommentReadCommand:
         assert output_data["adw_id"] == "adw-test-123"
         mock_fetch_comment.assert_called_once_with(123)
 
+    @patch("rouge.core.database.fetch_blobs")
+    @patch("rouge.cli.comment.fetch_comment")
+    def test_read_resolves_blob_references(self, mock_fetch_comment, mock_fetch_blobs) -> None:
+        """Test comment read replaces stored blob references with their text."""
+        mock_fetch_comment.return_value = Comment(
+            id=123,
+            issue_id=1,
+            comment="Artifact saved: plan",
+            source="artifact",
+            type="plan",
+            raw={
+                "artifact_type": "plan",
+                "artifact": {"artifact_type": "plan", "plan_data": {"plan": {"$blob": "ab12"}}},
+            },
+        )
+        mock_fetch_blobs.return_value = {"ab12": "# Step 1\nRefactor the parser"}
+
+        result = runner.invoke(app, ["read", "123"])
+
+        assert result.exit_code == 0
+        assert "# Step 1\nRefactor the parser" in result.output
+        mock_fetch_blobs.assert_called_once_with(["ab12"])
+
     @patch("rouge.cli.comment.fetch_comment")
     def test_read_with_json_format_short_flag(self, mock_fetch_comment) -> None:
         """Test comment read command with -f json short flag."""
@@ -757,3 +821,152 @@ class TestRenderCommentTextHelper:
         assert "Raw Data (JSON):" in result
         assert '"key"' in result
         assert '"value"' in result
+
+
+class TestCommentFlushCommand:
+    """Tests for 'rouge comment flush' command."""
+
+    @patch("rouge.cli.comment.CommentSpool.replay", return_value=(3, 0))
+    def test_flush_reports_replayed(self, mock_replay) -> None:
+        """Test flush replays the spool and reports the count."""
+        result = runner.invoke(app, ["flush"])
+
+        assert result.exit_code == 0
+        assert "Replayed 3 comment(s)" in result.output
+        mock_replay.assert_called_once_with()
+
+    @patch("rouge.cli.comment.CommentSpool.replay", return_value=(1, 4))
+    def test_flush_fails_when_backlog_remains(self, _mock_replay) -> None:
+        """Test flush exits 1 while comments are still spooled."""
+        result = runner.invoke(app, ["flush"])
+
+        assert result.exit_code == 1
+        assert "4 still spooled" in result.output
+
+
+class TestCommentCompactCommand:
+    """Tests for 'rouge comment compact' command."""
+
+    @patch("rouge.cli.comment.compact_workflow_comments")
+    def test_compact_reports_totals(self, mock_compact) -> None:
+        """Test compact passes its options through and reports bytes reclaimed."""
+        mock_compact.return_value = CompactionResult(
+            issues=2, comments_removed=15, bytes_reclaimed=4500, batches=1
+        )
+
+        result = runner.invoke(app, ["compact", "--older-than-days", "90", "--batch-size", "20"])
+
+        assert result.exit_code == 0
+        mock_compact.assert_called_once_with(90, batch_size=20, max_batches=None)
+        assert "Compacted 15 comment(s) on 2 issue(s)" in result.output
+        assert "reclaiming about 4500 bytes" in result.output
+
+    @patch("rouge.cli.comment.compact_workflow_comments")
+    def test_compact_rejects_zero_batch_size(self, mock_compact) -> None:
+        """Test compact validates --batch-size before calling the database."""
+        result = runner.invoke(app, ["compact", "--batch-size", "0"])
+
+        assert result.exit_code != 0
+        mock_compact.assert_not_called()
+
+    @patch("rouge.cli.comment.compact_workflow_comments")
+    def test_compact_reports_errors(self, mock_compact) -> None:
+        """Test compact exits 1 when the RPC fails."""
+        mock_compact.side_effect = ValueError("Failed to compact workflow comments: timeout")
+
+        result = runner.invoke(app, ["compact"])
+
+        assert result.exit_code == 1
+        assert "Error: Failed to compact workflow comments" in result.output
+
+
+class TestCommentExternalizeBlobsCommand:
+    """Tests for 'rouge comment externalize-blobs' command."""
+
+    @patch("rouge.cli.comment.externalize_artifact_comment_blobs")
+    def test_externalize_blobs_reports_totals(self, mock_backfill) -> None:
+        """Test externalize-blobs passes its options through and reports totals."""
+        mock_backfill.return_value = BlobBackfillResult(
+            comments_scanned=40, comments_rewritten=25, bytes_reclaimed=90000, batches=2
+        )
+
+        result = runner.invoke(
+            app, ["externalize-blobs", "--batch-size", "20", "--max-batches", "2"]
+        )
+
+        assert result.exit_code == 0
+        mock_backfill.assert_called_once_with(batch_size=20, max_batches=2)
+        assert "Rewrote 25 of 40 artifact comment(s) in 2 batch(es)" in result.output
+        assert "reclaiming about 90000 bytes" in result.output
+
+    @patch("rouge.cli.comment.externalize_artifact_comment_blobs")
+    def test_externalize_blobs_reports_errors(self, mock_backfill) -> None:
+        """Test externalize-blobs exits 1 when the RPC fails."""
+        mock_backfill.side_effect = ValueError(
+            "Failed to externalize artifact comment blobs: timeout"
+        )
+
+        result = runner.invoke(app, ["externalize-blobs"])
+
+        assert result.exit_code == 1
+        assert "Error: Failed to externalize artifact comment blobs" in result.output
+
+
+class TestCommentListPaging:
+    """Tests for 'rouge comment list --all' and '--cursor'."""
+
+    @staticmethod
+    def _comment(comment_id: int) -> Comment:
+        return Comment(
+            id=comment_id,
+            issue_id=5,
+            comment=f"Comment {comment_id}",
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+        )
+
+    @patch("rouge.cli.comment.iter_comments")
+    def test_all_streams_json_lines(self, mock_iter_comments) -> None:
+        """Test --all writes one JSON object per comment, each with its cursor."""
+        mock_iter_comments.return_value = iter([self._comment(2), self._comment(1)])
+
+        result = runner.invoke(app, ["list", "--issue-id", "5", "--all"])
+
+        assert result.exit_code == 0, result.output
+        mock_iter_comments.assert_called_once_with(
+            issue_id=5, source=None, comment_type=None, cursor=None
+        )
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert [line["id"] for line in lines] == [2, 1]
+        assert decode_cursor(lines[-1]["cursor"]) == ("2024-01-01T12:00:00", 1)
+
+    @patch("rouge.cli.comment.list_comments")
+    def test_cursor_fetches_one_page(self, mock_list_comments) -> None:
+        """Test --cursor without --all returns a single page after the cursor."""
+        mock_list_comments.return_value = [self._comment(3)]
+
+        result = runner.invoke(app, ["list", "--cursor", "abc", "--limit", "1"])
+
+        assert result.exit_code == 0, result.output
+        mock_list_comments.assert_called_once_with(
+            issue_id=None, source=None, comment_type=None, limit=1, cursor="abc"
+        )
+        assert json.loads(result.output)["id"] == 3
+
+    @patch("rouge.cli.comment.list_comments")
+    def test_invalid_cursor_reported(self, mock_list_comments) -> None:
+        """Test a malformed cursor is reported as an error."""
+        mock_list_comments.side_effect = ValueError("Invalid cursor: 'abc'")
+
+        result = runner.invoke(app, ["list", "--cursor", "abc"])
+
+        assert result.exit_code == 1
+        assert "Invalid cursor" in result.output
+
+    @patch("rouge.cli.comment.iter_comments")
+    def test_offset_rejected_with_all(self, mock_iter_comments) -> None:
+        """Test --offset cannot be combined with keyset paging."""
+        result = runner.invoke(app, ["list", "--all", "--offset", "10"])
+
+        assert result.exit_code == 1
+        assert "--offset cannot be combined" in result.output
+        mock_iter_comments.assert_not_called()
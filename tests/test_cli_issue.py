@@ -1,12 +1,15 @@
 """Tests for issue CLI commands."""
 
+import json
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
 from rouge.cli.issue import app, generate_title
-from rouge.core.models import Issue
+from rouge.core.database import decode_cursor
+from rouge.core.models import Issue, IssueSummary
 
 runner = CliRunner()
 
@@ -76,6 +79,7 @@ def test_create_command_description_only(mock_create_issue) -> None:
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -96,6 +100,7 @@ def test_create_command_description_with_explicit_title(mock_create_issue) -> No
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -119,6 +124,7 @@ def test_create_command_direct_type(mock_create_issue) -> None:
         issue_type="direct",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -140,6 +146,7 @@ def test_create_command_spec_file_with_title(mock_create_issue, tmp_path) -> Non
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -254,6 +261,7 @@ def test_create_command_long_description_auto_title(mock_create_issue) -> None:
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -282,6 +290,7 @@ def test_create_command_short_title_flag(mock_create_issue) -> None:
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -303,6 +312,7 @@ def test_create_command_short_spec_file_flag(mock_create_issue, tmp_path) -> Non
         issue_type="full",
         branch=None,
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -321,6 +331,7 @@ def test_create_command_branch_long_flag(mock_create_issue) -> None:
         issue_type="full",
         branch="feature/new-flag",
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -339,6 +350,7 @@ def test_create_command_branch_short_flag(mock_create_issue) -> None:
         issue_type="full",
         branch="feature/short-flag",
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -359,6 +371,7 @@ def test_create_command_with_assigned_to(mock_create_issue) -> None:
         issue_type="full",
         branch=None,
         assigned_to="agent-1",
+        priority=None,
     )
 
 
@@ -396,6 +409,7 @@ def test_create_patch_with_branch_succeeds(mock_create_issue: MagicMock) -> None
         issue_type="patch",
         branch="feature/test",
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -434,6 +448,7 @@ def test_create_patch_with_parent_issue_id_succeeds(
         issue_type="patch",
         branch="feature/parent",
         assigned_to=None,
+        priority=None,
     )
 
 
@@ -644,7 +659,9 @@ def test_list_command_no_issues(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
     assert "No issues found." in result.output
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -673,7 +690,9 @@ def test_list_command_single_issue(mock_fetch_all_issues) -> None:
     assert "full" in result.output
     assert "❌" in result.output  # No branch
     assert "(none)" in result.output  # No assignment
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -727,7 +746,9 @@ def test_list_command_multiple_issues(mock_fetch_all_issues) -> None:
     assert "✅" in result.output  # completed status or branch indicator
     assert "❌" in result.output  # First/Third issues have no branch
     assert "(none)" in result.output  # Third issue has no assignment
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -851,7 +872,9 @@ def test_list_command_table_format_explicit(mock_fetch_all_issues) -> None:
     assert result.exit_code == 0
     assert "ID" in result.output
     assert "Table Test" in result.output
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -895,7 +918,9 @@ def test_list_command_truncates_long_title(mock_fetch_all_issues) -> None:
     assert "..." in result.output
     # Full title should not appear in table output
     assert long_title not in result.output
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -906,7 +931,9 @@ def test_list_command_database_error(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 1
     assert "Error: Database error" in result.output
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -917,7 +944,9 @@ def test_list_command_unexpected_error(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 1
     assert "Unexpected error: Unexpected failure" in result.output
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -940,7 +969,9 @@ def test_list_command_default_limit_five(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
     # Verify default limit of 5 is used
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status=None, projection=IssueSummary
+    )
     # Verify only 5 issues are in output
     for i in range(1, 6):
         assert f"Issue {i}" in result.output
@@ -969,7 +1000,9 @@ def test_list_command_limit_override(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list", "--limit", "20"])
     assert result.exit_code == 0
     # Verify limit of 20 is used
-    mock_fetch_all_issues.assert_called_once_with(limit=20, issue_type=None, status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=20, issue_type=None, status=None, projection=IssueSummary
+    )
     # Verify first 20 issues are in output
     for i in range(1, 21):
         assert f"Issue {i}" in result.output
@@ -1002,7 +1035,9 @@ def test_list_command_filter_by_type_patch(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list", "--type", "patch"])
     assert result.exit_code == 0
     # Verify type filter is passed correctly
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type="patch", status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type="patch", status=None, projection=IssueSummary
+    )
     # Verify patch issues are in output
     assert "Patch Issue 1" in result.output
     assert "Patch Issue 2" in result.output
@@ -1016,7 +1051,9 @@ def test_list_command_filter_by_type_passes_value(mock_fetch_all_issues) -> None
 
     result = runner.invoke(app, ["list", "--type", "full"])
     assert result.exit_code == 0
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type="full", status=None)
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type="full", status=None, projection=IssueSummary
+    )
 
 
 @patch("rouge.cli.issue.fetch_all_issues")
@@ -1043,7 +1080,9 @@ def test_list_command_filter_by_status_failed(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list", "--status", "failed"])
     assert result.exit_code == 0
     # Verify status filter is passed correctly
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status="failed")
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status="failed", projection=IssueSummary
+    )
     # Verify failed issues are in output
     assert "Failed Issue 1" in result.output
     assert "Failed Issue 2" in result.output
@@ -1066,7 +1105,9 @@ def test_list_command_filter_by_status_claimed(mock_fetch_all_issues) -> None:
 
     result = runner.invoke(app, ["list", "--status", "claimed"])
     assert result.exit_code == 0
-    mock_fetch_all_issues.assert_called_once_with(limit=5, issue_type=None, status="claimed")
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=5, issue_type=None, status="claimed", projection=IssueSummary
+    )
     assert "Claimed Issue 1" in result.output
 
 
@@ -1094,7 +1135,9 @@ def test_list_command_combined_filters(mock_fetch_all_issues) -> None:
     result = runner.invoke(app, ["list", "--limit", "10", "--type", "patch", "--status", "started"])
     assert result.exit_code == 0
     # Verify all filters are passed correctly
-    mock_fetch_all_issues.assert_called_once_with(limit=10, issue_type="patch", status="started")
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=10, issue_type="patch", status="started", projection=IssueSummary
+    )
     # Verify filtered issues are in output
     assert "Started Patch 1" in result.output
     assert "Started Patch 2" in result.output
@@ -1145,6 +1188,35 @@ def test_list_command_json_format_with_filters(mock_fetch_all_issues) -> None:
     assert issues_data[2]["title"] == "Main Issue 3"
 
 
+@patch("rouge.cli.issue.create_issue")
+def test_create_command_with_priority(mock_create_issue) -> None:
+    """Test create command forwards --priority."""
+    mock_create_issue.return_value = Issue(id=321, description="Fix prod outage", priority=50)
+
+    result = runner.invoke(
+        app, ["create", "Fix prod outage", "--type", "patch", "--branch", "hotfix", "-p", "50"]
+    )
+    assert result.exit_code == 0
+    mock_create_issue.assert_called_once_with(
+        description="Fix prod outage",
+        title="Fix prod outage",
+        issue_type="patch",
+        branch="hotfix",
+        assigned_to=None,
+        priority=50,
+    )
+
+
+@patch("rouge.cli.issue.create_issue")
+def test_create_command_priority_out_of_range(mock_create_issue) -> None:
+    """Test create command reports invalid priorities from the database layer."""
+    mock_create_issue.side_effect = ValueError("Priority must be between -100 and 100, got 500")
+
+    result = runner.invoke(app, ["create", "Fix the login bug", "--priority", "500"])
+    assert result.exit_code == 1
+    assert "Priority must be between -100 and 100" in result.output
+
+
 # Tests for update command
 
 
@@ -1617,3 +1689,157 @@ def test_delete_command_unexpected_error(mock_delete_issue) -> None:
     assert result.exit_code == 1
     assert "Unexpected error: Unexpected failure" in result.output
     mock_delete_issue.assert_called_once_with(123)
+
+
+@patch("rouge.cli.issue.update_issue")
+def test_update_command_priority(mock_update_issue) -> None:
+    """Test update command with only --priority."""
+    mock_update_issue.return_value = Issue(id=123, description="Test description", priority=10)
+
+    result = runner.invoke(app, ["update", "123", "--priority", "10"])
+    assert result.exit_code == 0
+    mock_update_issue.assert_called_once_with(123, priority=10)
+
+
+@patch("rouge.cli.issue.iter_issues")
+def test_list_command_all_streams_json_lines(mock_iter_issues) -> None:
+    """Test list --all writes one issue per line with a resumable cursor."""
+    created_at = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+    mock_iter_issues.return_value = iter(
+        [
+            Issue(id=2, description="Second", status="completed", created_at=created_at),
+            Issue(id=1, description="First", status="completed", created_at=created_at),
+        ]
+    )
+
+    result = runner.invoke(app, ["list", "--all", "--status", "completed"])
+
+    assert result.exit_code == 0, result.output
+    mock_iter_issues.assert_called_once_with(issue_type=None, status="completed", cursor=None)
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["id"] for line in lines] == [2, 1]
+    assert decode_cursor(lines[0]["cursor"]) == ("2026-10-16T12:00:00+00:00", 2)
+
+
+@patch("rouge.cli.issue.fetch_all_issues")
+def test_list_command_cursor_fetches_one_page(mock_fetch_all_issues) -> None:
+    """Test list --cursor fetches one page of --limit issues after the cursor."""
+    mock_fetch_all_issues.return_value = []
+
+    result = runner.invoke(app, ["list", "--cursor", "abc", "--limit", "20"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    mock_fetch_all_issues.assert_called_once_with(
+        limit=20, issue_type=None, status=None, cursor="abc"
+    )
+
+
+@patch("rouge.cli.issue.create_issues_bulk")
+def test_import_command_jsonl(mock_create_issues_bulk, tmp_path) -> None:
+    """Test import reads JSON lines, reports bad lines, and prints created IDs."""
+    from rouge.core.database import BulkIssueResult
+
+    path = tmp_path / "sprint.jsonl"
+    path.write_text(
+        '{"description": "  Fix the login bug on mobile  "}\n'
+        "\n"
+        "{not json}\n"
+        '{"description": "Add dark mode", "title": "Dark mode", "priority": 5}\n',
+        encoding="utf-8",
+    )
+    mock_create_issues_bulk.return_value = BulkIssueResult(
+        created=[(0, Issue(id=7, description="Fix the login bug on mobile"))],
+        errors=[(1, "Description must be at least 10 characters")],
+    )
+
+    result = runner.invoke(
+        app,
+        ["import", str(path), "--assign-round-robin", "worker-1, worker-2", "--chunk-size", "50"],
+    )
+
+    assert result.exit_code == 1
+    mock_create_issues_bulk.assert_called_once_with(
+        [
+            {"description": "Fix the login bug on mobile", "title": "Fix the login bug on mobile"},
+            {"description": "Add dark mode", "title": "Dark mode", "priority": 5},
+        ],
+        chunk_size=50,
+        assign_round_robin=["worker-1", "worker-2"],
+    )
+    assert "7\n" in result.output
+    assert "Error: line 3: Invalid JSON" in result.output
+    assert "Error: line 4: Description must be at least 10 characters" in result.output
+    assert "Imported 1 of 3 issues" in result.output
+
+
+@patch("rouge.core.database.get_client")
+def test_import_command_prints_created_ids_when_database_drops(mock_get_client, tmp_path) -> None:
+    """Test import still prints created IDs when a later chunk times out."""
+    import httpx
+
+    path = tmp_path / "sprint.jsonl"
+    path.write_text(
+        '{"description": "Fix the login bug on mobile"}\n'
+        '{"description": "Add dark mode to settings"}\n',
+        encoding="utf-8",
+    )
+    insert = mock_get_client.return_value.table.return_value.insert
+    insert.return_value.execute.side_effect = [
+        MagicMock(data=[{"id": 7, "description": "Fix the login bug on mobile"}]),
+        httpx.ReadTimeout("timed out"),
+    ]
+
+    result = runner.invoke(app, ["import", str(path), "--chunk-size", "1"])
+
+    assert result.exit_code == 1
+    assert "7\n" in result.output
+    assert "Error: line 2: Failed to create issue (outcome unknown): timed out" in result.output
+    assert "Unexpected error" not in result.output
+    assert "Imported 1 of 2 issues" in result.output
+
+
+@patch("rouge.cli.issue.fetch_issue")
+@patch("rouge.cli.issue.create_issues_bulk")
+def test_import_command_csv_resolves_parent_branch(
+    mock_create_issues_bulk, mock_fetch_issue, tmp_path
+) -> None:
+    """Test CSV import converts integers and inherits patch branches from parents."""
+    from rouge.core.database import BulkIssueResult
+
+    path = tmp_path / "patches.csv"
+    path.write_text(
+        "description,type,parent_issue_id,priority\n"
+        "Apply the review fixes,patch,12,10\n"
+        "Apply more review fixes,patch,12,\n"
+        "Patch without a branch,patch,,\n"
+        "Bad priority here,full,,high\n",
+        encoding="utf-8",
+    )
+    mock_fetch_issue.return_value = Issue(id=12, description="Parent issue", branch="feature/x")
+    mock_create_issues_bulk.return_value = BulkIssueResult(
+        created=[
+            (0, Issue(id=20, description="Apply the review fixes")),
+            (1, Issue(id=21, description="Apply more review fixes")),
+        ],
+        errors=[],
+    )
+
+    result = runner.invoke(app, ["import", str(path)])
+
+    assert result.exit_code == 1
+    mock_fetch_issue.assert_called_once_with(12)
+    rows = mock_create_issues_bulk.call_args.args[0]
+    assert rows[0] == {
+        "description": "Apply the review fixes",
+        "title": "Apply the review fixes",
+        "type": "patch",
+        "branch": "feature/x",
+        "priority": 10,
+    }
+    assert rows[1]["branch"] == "feature/x"
+    assert "20\n21\n" in result.output
+    assert "Error: line 4: Patch issues need exactly one of branch or parent_issue_id" in (
+        result.output
+    )
+    assert "Error: line 5: Field 'priority' must be an integer" in result.output
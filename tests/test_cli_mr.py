@@ -6,6 +6,7 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 
 from rouge.cli.mr import app
+from rouge.core.database import mr_cursor_for
 
 runner = CliRunner()
 
@@ -137,3 +138,35 @@ class TestMrListCommand:
         mock_list_mr_comments.assert_called_once_with(
             issue_id=None, platform=None, limit=5, offset=10
         )
+
+    @patch("rouge.cli.mr.iter_mr_comments")
+    def test_list_all_streams_json_lines(self, mock_iter_mr_comments) -> None:
+        """Test --all writes each merge request as a JSON line with a cursor."""
+        entry = {
+            **SAMPLE_MR_ROWS[0],
+            "comment_id": 9,
+            "entry_index": 1,
+            "created_at": "2024-01-01T12:00:00+00:00",
+        }
+        mock_iter_mr_comments.return_value = iter([entry])
+
+        result = runner.invoke(app, ["--all", "--platform", "github"])
+
+        assert result.exit_code == 0, result.output
+        mock_iter_mr_comments.assert_called_once_with(issue_id=None, platform="github", cursor=None)
+        line = json.loads(result.output)
+        assert line["url"] == "https://github.com/org/repo/pull/123"
+        assert line["cursor"] == mr_cursor_for(entry)
+
+    @patch("rouge.cli.mr.list_mr_comments")
+    def test_list_cursor_fetches_one_page(self, mock_list_mr_comments) -> None:
+        """Test --cursor without --all fetches a single page of merge requests."""
+        mock_list_mr_comments.return_value = []
+
+        result = runner.invoke(app, ["--cursor", "abc", "--limit", "3"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == ""
+        mock_list_mr_comments.assert_called_once_with(
+            issue_id=None, platform=None, limit=3, cursor="abc"
+        )
@@ -0,0 +1,159 @@
+"""Unit tests for the background comment sink."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from rouge.core.models import Comment, CommentPayload
+from rouge.core.notifications.comments import emit_comment_from_payload
+from rouge.core.notifications.sink import CommentSink, comment_sink, get_active_sink
+
+
+def _comment(n: int, issue_id: int = 1) -> Comment:
+    return Comment(issue_id=issue_id, comment=f"comment {n}", raw={"n": n}, adw_id="adw-1")
+
+
+def _payload(text: str) -> CommentPayload:
+    return CommentPayload(issue_id=1, adw_id="adw-1", text=text, source="system", kind="workflow")
+
+
+class TestCommentSink:
+    """Tests for CommentSink batching and ordering."""
+
+    def test_full_batches_are_written_in_order(self) -> None:
+        """Test comments are inserted in submission order, batch_size at a time."""
+        batches: list[list[str]] = []
+        sink = CommentSink(batch_size=3, flush_interval=60)
+
+        with patch(
+            "rouge.core.notifications.sink.create_comments",
+            side_effect=lambda batch: batches.append([c.comment for c in batch]),
+        ):
+            sink.start()
+            for n in range(7):
+                assert sink.submit(_comment(n))
+            assert sink.close()
+
+        assert batches == [
+            ["comment 0", "comment 1", "comment 2"],
+            ["comment 3", "comment 4", "comment 5"],
+            ["comment 6"],
+        ]
+
+    def test_partial_batch_written_after_flush_interval(self) -> None:
+        """Test a lone comment is written once it has waited flush_interval."""
+        written = threading.Event()
+        sink = CommentSink(batch_size=10, flush_interval=0.05)
+
+        with patch(
+            "rouge.core.notifications.sink.create_comments",
+            side_effect=lambda batch: written.set(),
+        ):
+            sink.start()
+            sink.submit(_comment(0))
+            assert written.wait(2)
+            sink.close()
+
+    def test_flush_waits_for_queued_comments(self) -> None:
+        """Test flush() writes a partial batch immediately and waits for it."""
+        sink = CommentSink(batch_size=10, flush_interval=60)
+
+        with patch("rouge.core.notifications.sink.create_comments") as mock_create:
+            sink.start()
+            sink.submit(_comment(0))
+            sink.submit(_comment(1))
+            assert sink.flush(timeout=2)
+            assert sink.pending == 0
+            mock_create.assert_called_once()
+            sink.close()
+
+    def test_failed_insert_is_logged_not_raised(self, caplog) -> None:
+        """Test a failing insert drops the batch with an error and the sink keeps running."""
+        sink = CommentSink(batch_size=1, flush_interval=60)
+
+        with patch(
+            "rouge.core.notifications.sink.create_comments",
+            side_effect=[ValueError("Supabase down"), None],
+        ) as mock_create:
+            sink.start()
+            sink.submit(_comment(0, issue_id=5))
+            sink.submit(_comment(1, issue_id=5))
+            assert sink.close()
+
+        assert mock_create.call_count == 2
+        assert "Failed to insert 1 comment(s) on issue(s) [5]: Supabase down" in caplog.text
+
+    def test_submit_stamps_created_at(self) -> None:
+        """Test queued comments carry their submission time into the insert."""
+        sink = CommentSink(batch_size=10, flush_interval=60)
+        comment = _comment(0)
+
+        with patch("rouge.core.notifications.sink.create_comments") as mock_create:
+            sink.start()
+            before = datetime.now(timezone.utc)
+            sink.submit(comment)
+            assert sink.close()
+
+        [written] = mock_create.call_args.args[0]
+        assert written.created_at is not None and written.created_at >= before
+
+    def test_submit_rejected_when_not_running(self) -> None:
+        """Test a sink that is not started or already closed refuses comments."""
+        sink = CommentSink()
+        assert sink.submit(_comment(0)) is False
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test batch_size and flush_interval must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            CommentSink(batch_size=0)
+        with pytest.raises(ValueError, match="flush_interval"):
+            CommentSink(flush_interval=0)
+
+
+class TestCommentSinkContext:
+    """Tests for comment_sink() and emit_comment_from_payload integration."""
+
+    def test_emit_queues_while_sink_active(self) -> None:
+        """Test emit_comment_from_payload queues instead of inserting synchronously."""
+        with (
+            patch("rouge.core.notifications.comments.create_comment") as mock_create_one,
+            patch("rouge.core.notifications.sink.create_comments") as mock_create_many,
+        ):
+            with comment_sink() as sink:
+                status, msg = emit_comment_from_payload(_payload("Step A started"))
+                assert status == "success"
+                assert "queued" in msg
+                assert get_active_sink() is sink
+
+            assert get_active_sink() is None
+            mock_create_one.assert_not_called()
+            mock_create_many.assert_called_once()
+            assert mock_create_many.call_args[0][0][0].comment == "Step A started"
+
+    def test_slow_insert_does_not_block_emit(self) -> None:
+        """Test a slow database only delays the sink, not the caller."""
+        release = threading.Event()
+
+        with patch(
+            "rouge.core.notifications.sink.create_comments",
+            side_effect=lambda batch: release.wait(2),
+        ):
+            with comment_sink(batch_size=1):
+                start = time.monotonic()
+                for n in range(5):
+                    emit_comment_from_payload(_payload(f"Step {n} started"))
+                elapsed = time.monotonic() - start
+                release.set()
+
+        assert elapsed < 1
+
+    def test_nested_sinks_share_outer_sink(self) -> None:
+        """Test nested comment_sink() blocks reuse the active sink."""
+        with patch("rouge.core.notifications.sink.create_comments"):
+            with comment_sink() as outer:
+                with comment_sink() as inner:
+                    assert inner is outer
+                assert get_active_sink() is outer
@@ -0,0 +1,152 @@
+"""Unit tests for the durable local comment spool."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rouge.core.models import Comment, CommentPayload
+from rouge.core.notifications.comments import emit_comment_from_payload
+from rouge.core.notifications.sink import CommentSink
+from rouge.core.notifications.spool import CommentSpool, get_spool_dir
+
+
+def _comment(n: int) -> Comment:
+    return Comment(issue_id=1, comment=f"comment {n}", raw={"n": n}, client_key=f"key-{n}")
+
+
+@pytest.fixture
+def spool(tmp_path: Path) -> CommentSpool:
+    """Create a spool in a temporary directory."""
+    return CommentSpool(tmp_path / "spool")
+
+
+class TestCommentSpool:
+    """Tests for appending to and replaying the spool."""
+
+    def test_append_writes_compact_jsonl(self, spool: CommentSpool) -> None:
+        """Test each comment becomes one compact JSON line with its client key."""
+        assert spool.append([_comment(0), _comment(1)])
+
+        [segment] = spool.segments()
+        lines = segment.read_text().splitlines()
+        assert len(lines) == 2
+        assert ": " not in lines[0]
+        assert json.loads(lines[1])["client_key"] == "key-1"
+        assert spool.pending() == 2
+
+    def test_segments_rotate_at_size_limit(self, tmp_path: Path) -> None:
+        """Test a new segment is started once the current one is full."""
+        spool = CommentSpool(tmp_path / "spool", max_segment_bytes=1)
+        spool.append([_comment(0)])
+        spool.append([_comment(1)])
+
+        assert len(spool.segments()) == 2
+        assert spool.pending() == 2
+
+    def test_replay_inserts_in_order_and_removes_segments(self, tmp_path: Path) -> None:
+        """Test replay inserts oldest segments first, idempotently, then deletes them."""
+        spool = CommentSpool(tmp_path / "spool", max_segment_bytes=1)
+        for n in range(3):
+            spool.append([_comment(n)])
+
+        with patch("rouge.core.notifications.spool.create_comments") as mock_create:
+            assert spool.replay() == (3, 0)
+
+        replayed = [call.args[0][0].comment for call in mock_create.call_args_list]
+        assert replayed == ["comment 0", "comment 1", "comment 2"]
+        for call in mock_create.call_args_list:
+            assert call.kwargs == {"ignore_duplicates": True}
+        assert spool.segments() == []
+
+    def test_replay_keeps_original_created_at(self, spool: CommentSpool) -> None:
+        """Test replayed comments are inserted with the time they were emitted."""
+        emitted_at = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+        comment = _comment(0)
+        comment.created_at = emitted_at
+        spool.append([comment, _comment(1)])
+
+        with patch("rouge.core.notifications.spool.create_comments") as mock_create:
+            assert spool.replay() == (2, 0)
+
+        first, second = mock_create.call_args.args[0]
+        assert first.created_at == emitted_at
+        assert first.to_supabase()["created_at"] == emitted_at.isoformat()
+        # Comments spooled without a timestamp are stamped when spooled
+        assert second.created_at is not None
+
+    def test_failed_replay_keeps_backlog(self, spool: CommentSpool) -> None:
+        """Test an insert failure leaves the segment for the next replay."""
+        spool.append([_comment(0), _comment(1)])
+
+        with patch(
+            "rouge.core.notifications.spool.create_comments",
+            side_effect=ValueError("still down"),
+        ):
+            assert spool.replay() == (0, 2)
+
+        # The interrupted segment is picked up again, and appends go elsewhere
+        spool.append([_comment(2)])
+        with patch("rouge.core.notifications.spool.create_comments") as mock_create:
+            assert spool.replay() == (3, 0)
+        assert [c.comment for c in mock_create.call_args.args[0]] == ["comment 2"]
+
+    def test_replay_skips_malformed_lines(self, spool: CommentSpool) -> None:
+        """Test a corrupt line does not block the rest of the segment."""
+        spool.append([_comment(0)])
+        [segment] = spool.segments()
+        with segment.open("a") as fh:
+            fh.write("{not json\n")
+
+        with patch("rouge.core.notifications.spool.create_comments") as mock_create:
+            assert spool.replay() == (1, 0)
+        assert len(mock_create.call_args.args[0]) == 1
+
+    def test_replay_of_missing_directory_is_noop(self, spool: CommentSpool) -> None:
+        """Test replay does nothing before anything was spooled."""
+        with patch("rouge.core.notifications.spool.create_comments") as mock_create:
+            assert spool.replay() == (0, 0)
+        mock_create.assert_not_called()
+
+    def test_spool_dir_from_env(self, isolated_comment_spool: Path) -> None:
+        """Test ROUGE_COMMENT_SPOOL_DIR overrides the default location."""
+        assert get_spool_dir() == isolated_comment_spool
+
+
+class TestFailedInsertsAreSpooled:
+    """Tests that failed comment inserts end up in the spool."""
+
+    def test_sync_insert_failure_is_spooled(self, isolated_comment_spool: Path) -> None:
+        """Test emit_comment_from_payload spools a comment it could not insert."""
+        payload = CommentPayload(issue_id=1, text="Step started", source="system", kind="workflow")
+
+        with patch(
+            "rouge.core.notifications.comments.create_comment",
+            side_effect=ValueError("connection refused"),
+        ):
+            status, msg = emit_comment_from_payload(payload)
+
+        assert status == "error"
+        assert "spooled for replay" in msg
+        spooled = CommentSpool(isolated_comment_spool)
+        assert spooled.pending() == 1
+
+    def test_sink_batch_failure_is_spooled(self, isolated_comment_spool: Path) -> None:
+        """Test a batch the sink could not insert is spooled in order."""
+        sink = CommentSink(batch_size=2, flush_interval=60)
+
+        with patch(
+            "rouge.core.notifications.sink.create_comments",
+            side_effect=ValueError("connection refused"),
+        ):
+            sink.start()
+            sink.submit(_comment(0))
+            sink.submit(_comment(1))
+            assert sink.close()
+
+        [segment] = CommentSpool(isolated_comment_spool).segments()
+        rows = [json.loads(line) for line in segment.read_text().splitlines()]
+        assert [row["client_key"] for row in rows] == ["key-0", "key-1"]
+        assert all(row["created_at"] for row in rows)
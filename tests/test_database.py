@@ -1,24 +1,39 @@
 """Tests for database operations."""
 
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
 
 from rouge.core.database import (
     UNSET,
+    BlobBackfillResult,
+    IssueStatusConflictError,
     SupabaseConfig,
+    compact_workflow_comments,
     create_comment,
+    create_comments,
     create_issue,
+    create_issues_bulk,
+    cursor_for,
+    decode_cursor,
     delete_issue,
+    encode_cursor,
+    externalize_artifact_comment_blobs,
     fetch_all_issues,
+    fetch_blobs,
     fetch_comment,
     fetch_issue,
     get_client,
+    get_issue_cache_stats,
+    iter_comments,
+    iter_issues,
     list_comments,
+    resolve_blob_refs,
     transition_issue_status,
     update_issue,
 )
-from rouge.core.models import Comment
+from rouge.core.models import Comment, CommentSummary, IssueSummary
 
 
 @pytest.fixture
@@ -160,6 +175,7 @@ def test_fetch_all_issues_success(mock_get_client) -> None:
     mock_client.table.return_value = mock_table
     mock_table.select.return_value = mock_select
     mock_select.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_execute.data = [
         {"id": 1, "description": "Issue 1", "status": "pending"},
@@ -334,6 +350,61 @@ def test_create_comment_success(mock_get_client) -> None:
     assert insert_call_args["adw_id"] is None
 
 
+@patch("rouge.core.database.get_client")
+def test_create_comments_single_multi_row_insert(mock_get_client) -> None:
+    """Test create_comments inserts all rows at once with uniform columns."""
+    mock_table = Mock()
+    mock_table.insert.return_value.execute.return_value.data = [
+        {"id": 1, "issue_id": 1, "comment": "First", "raw": {}, "source": "system"},
+        {"id": 2, "issue_id": 1, "comment": "Second", "raw": {}, "source": None},
+    ]
+    mock_get_client.return_value.table.return_value = mock_table
+
+    created = create_comments(
+        [
+            Comment(issue_id=1, comment="First", raw={}, source="system"),
+            Comment(issue_id=1, comment="Second", raw={}),
+        ]
+    )
+
+    assert [c.id for c in created] == [1, 2]
+    mock_table.insert.assert_called_once()
+    rows = mock_table.insert.call_args[0][0]
+    assert [row["comment"] for row in rows] == ["First", "Second"]
+    assert rows[0].keys() == rows[1].keys()
+    assert rows[1]["source"] is None
+
+
+@patch("rouge.core.database.get_client")
+def test_create_comments_keeps_explicit_created_at(mock_get_client) -> None:
+    """Test replayed timestamps are inserted and rows without one never get NULL."""
+    mock_table = Mock()
+    mock_table.insert.return_value.execute.return_value.data = [
+        {"id": 1, "issue_id": 1, "comment": "Old", "raw": {}},
+        {"id": 2, "issue_id": 1, "comment": "New", "raw": {}},
+    ]
+    mock_get_client.return_value.table.return_value = mock_table
+    emitted_at = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+
+    create_comments(
+        [
+            Comment(issue_id=1, comment="Old", raw={}, created_at=emitted_at),
+            Comment(issue_id=1, comment="New", raw={}),
+        ]
+    )
+
+    rows = mock_table.insert.call_args[0][0]
+    assert rows[0]["created_at"] == emitted_at.isoformat()
+    assert rows[1]["created_at"] is not None
+
+
+@patch("rouge.core.database.get_client")
+def test_create_comments_empty_skips_insert(mock_get_client) -> None:
+    """Test an empty batch makes no database call."""
+    assert create_comments([]) == []
+    mock_get_client.assert_not_called()
+
+
 @patch("rouge.core.database.get_client")
 def test_create_comment_with_adw_id(mock_get_client) -> None:
     """Test successful comment creation with adw_id."""
@@ -395,6 +466,7 @@ def test_list_comments_default(mock_get_client) -> None:
     mock_client.table.return_value = mock_table
     mock_table.select.return_value = mock_select
     mock_select.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_execute.data = [
@@ -431,6 +503,7 @@ def test_list_comments_with_issue_id(mock_get_client) -> None:
     mock_table.select.return_value = mock_select
     mock_select.eq.return_value = mock_eq
     mock_eq.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_execute.data = [{"id": 1, "issue_id": 5, "comment": "Issue 5 comment"}]
@@ -458,6 +531,7 @@ def test_list_comments_with_source(mock_get_client) -> None:
     mock_table.select.return_value = mock_select
     mock_select.eq.return_value = mock_eq
     mock_eq.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_execute.data = [{"id": 1, "issue_id": 1, "comment": "Agent comment", "source": "agent"}]
@@ -485,6 +559,7 @@ def test_list_comments_with_type(mock_get_client) -> None:
     mock_table.select.return_value = mock_select
     mock_select.eq.return_value = mock_eq
     mock_eq.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_execute.data = [{"id": 1, "issue_id": 1, "comment": "Plan comment", "type": "plan"}]
@@ -510,6 +585,7 @@ def test_list_comments_empty(mock_get_client) -> None:
     mock_client.table.return_value = mock_table
     mock_table.select.return_value = mock_select
     mock_select.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_execute.data = []
@@ -535,6 +611,7 @@ def test_list_comments_api_error(mock_get_client) -> None:
     mock_client.table.return_value = mock_table
     mock_table.select.return_value = mock_select
     mock_select.order.return_value = mock_order
+    mock_order.order.return_value = mock_order
     mock_order.limit.return_value = mock_limit
     mock_limit.offset.return_value = mock_offset
     mock_offset.execute.side_effect = APIError({"message": "DB error", "code": "500"})
@@ -879,6 +956,63 @@ def test_create_issue_with_assigned_to(mock_get_client) -> None:
     assert insert_call_args["assigned_to"] == "tydirium-1"
 
 
+@patch("rouge.core.database.get_client")
+def test_create_issue_with_priority_and_not_before(mock_get_client) -> None:
+    """Test creating an issue with a priority and a not_before time."""
+    mock_client = Mock()
+    mock_table = Mock()
+    mock_insert = Mock()
+    mock_execute = Mock()
+
+    mock_client.table.return_value = mock_table
+    mock_table.insert.return_value = mock_insert
+    mock_execute.data = [
+        {
+            "id": 8,
+            "description": "Urgent production fix",
+            "status": "pending",
+            "type": "patch",
+            "adw_id": "test1234",
+            "priority": 50,
+            "not_before": "2026-10-17T09:00:00+00:00",
+        }
+    ]
+    mock_insert.execute.return_value = mock_execute
+    mock_get_client.return_value = mock_client
+
+    not_before = datetime(2026, 10, 17, 9, tzinfo=timezone.utc)
+    issue = create_issue("Urgent production fix", priority=50, not_before=not_before)
+    assert issue.priority == 50
+    assert issue.not_before == not_before
+
+    insert_call_args = mock_table.insert.call_args[0][0]
+    assert insert_call_args["priority"] == 50
+    assert insert_call_args["not_before"] == "2026-10-17T09:00:00+00:00"
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issue_omits_priority_by_default(mock_get_client) -> None:
+    """Test the database default priority is used when none is given."""
+    mock_client = Mock()
+    mock_client.table.return_value.insert.return_value.execute.return_value.data = [
+        {"id": 9, "description": "Default priority issue", "status": "pending"}
+    ]
+    mock_get_client.return_value = mock_client
+
+    issue = create_issue("Default priority issue")
+    assert issue.priority == 0
+    insert_call_args = mock_client.table.return_value.insert.call_args[0][0]
+    assert "priority" not in insert_call_args
+    assert "not_before" not in insert_call_args
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issue_priority_out_of_range(_mock_get_client) -> None:
+    """Test priorities outside the database bounds are rejected."""
+    with pytest.raises(ValueError, match="Priority must be between -100 and 100"):
+        create_issue("Out of range priority", priority=101)
+
+
 # ============================================================================
 # update_issue_branch tests
 # ============================================================================
@@ -2071,55 +2205,685 @@ def test_transition_issue_status_logs_info(mock_get_client, caplog) -> None:
     import logging
 
     mock_client = Mock()
-    mock_table = Mock()
+    mock_client.rpc.return_value.execute.return_value.data = [
+        {
+            "previous_issue": {"id": 123, "description": "Test issue", "status": "failed"},
+            "issue": {"id": 123, "description": "Test issue", "status": "pending"},
+        }
+    ]
+    mock_get_client.return_value = mock_client
+
+    with caplog.at_level(logging.INFO):
+        result = transition_issue_status(123, "pending", assigned_to=None)
+
+    assert result.id == 123
+    assert result.status == "pending"
+    assert "Issue 123 status transitioned from 'failed' to 'pending'" in caplog.text
+    # One round trip: no separate fetch or existence check
+    mock_client.table.assert_not_called()
+    mock_client.rpc.assert_called_once_with(
+        "transition_issue_status",
+        {"p_issue_id": 123, "p_status": "pending", "p_fields": {"assigned_to": None}},
+    )
+
 
-    # Mock for fetch_issue (called by transition_issue_status)
-    mock_select_fetch = Mock()
-    mock_eq_fetch = Mock()
-    mock_execute_fetch = Mock()
-    mock_execute_fetch.data = [
+@patch("rouge.core.database.get_client")
+def test_transition_issue_status_passes_expected_status(mock_get_client) -> None:
+    """Test the compare-and-set guard is sent to the RPC."""
+    mock_client = Mock()
+    mock_client.rpc.return_value.execute.return_value.data = [
         {
-            "id": 123,
-            "description": "Test issue",
-            "status": "failed",
+            "previous_issue": {"id": 7, "description": "Test issue", "status": "failed"},
+            "issue": {"id": 7, "description": "Test issue", "status": "started"},
         }
     ]
-    mock_eq_fetch.execute.return_value = mock_execute_fetch
-    mock_select_fetch.eq.return_value = mock_eq_fetch
+    mock_get_client.return_value = mock_client
 
-    # Mock for update_issue select check
-    mock_select_check = Mock()
-    mock_eq_check = Mock()
-    mock_execute_check = Mock()
-    mock_execute_check.data = [{"id": 123}]
-    mock_eq_check.execute.return_value = mock_execute_check
-    mock_select_check.eq.return_value = mock_eq_check
+    transition_issue_status(7, "started", expected_status="failed")
 
-    # Mock for update_issue update call
-    mock_update = Mock()
-    mock_eq_update = Mock()
-    mock_execute_update = Mock()
-    mock_execute_update.data = [
+    mock_client.rpc.assert_called_once_with(
+        "transition_issue_status",
+        {"p_issue_id": 7, "p_status": "started", "p_expected_status": "failed"},
+    )
+
+
+@patch("rouge.core.database.get_client")
+def test_transition_issue_status_conflict(mock_get_client) -> None:
+    """Test a status mismatch raises IssueStatusConflictError with the actual status."""
+    mock_client = Mock()
+    mock_client.rpc.return_value.execute.return_value.data = [
         {
-            "id": 123,
-            "description": "Test issue",
-            "status": "pending",
+            "previous_issue": {"id": 7, "description": "Test issue", "status": "claimed"},
+            "issue": None,
         }
     ]
-    mock_eq_update.execute.return_value = mock_execute_update
-    mock_update.eq.return_value = mock_eq_update
+    mock_get_client.return_value = mock_client
 
-    # Chain the table mock to return the right sub-mocks in order:
-    # 1st call: fetch_issue -> select("*").eq("id", 123)
-    # 2nd call: update_issue -> select("id").eq("id", 123)  (existence check)
-    # 3rd call: update_issue -> update({...}).eq("id", 123)
-    mock_table.select.side_effect = [mock_select_fetch, mock_select_check]
-    mock_table.update.return_value = mock_update
+    with pytest.raises(IssueStatusConflictError) as exc_info:
+        transition_issue_status(7, "pending", expected_status="failed")
+
+    assert exc_info.value.actual_status == "claimed"
+    assert "expected 'failed'" in str(exc_info.value)
+
+
+@patch("rouge.core.database.get_client")
+def test_transition_issue_status_not_found(mock_get_client) -> None:
+    """Test an empty RPC result means the issue does not exist."""
+    mock_client = Mock()
+    mock_client.rpc.return_value.execute.return_value.data = []
+    mock_get_client.return_value = mock_client
+
+    with pytest.raises(ValueError, match="Issue with id 404 not found"):
+        transition_issue_status(404, "failed")
+
+
+def test_transition_issue_status_validates_before_rpc() -> None:
+    """Test invalid statuses and fields are rejected without a database call."""
+    with patch("rouge.core.database.get_client") as mock_get_client:
+        with pytest.raises(ValueError, match="Invalid status"):
+            transition_issue_status(1, "done")
+        with pytest.raises(ValueError, match="Invalid expected status"):
+            transition_issue_status(1, "pending", expected_status="done")
+        with pytest.raises(ValueError, match="adw_id cannot be empty"):
+            transition_issue_status(1, "pending", adw_id="  ")
+    mock_get_client.assert_not_called()
+
+
+@patch("rouge.core.database.get_client")
+def test_update_issue_priority_and_clear_not_before(mock_get_client) -> None:
+    """Test updating priority and clearing not_before in one update."""
+    mock_client = Mock()
+    mock_table = Mock()
+    mock_table.select.return_value.eq.return_value.execute.return_value.data = [{"id": 1}]
+    mock_table.update.return_value.eq.return_value.execute.return_value.data = [
+        {"id": 1, "description": "Test issue", "status": "pending", "priority": -5}
+    ]
     mock_client.table.return_value = mock_table
     mock_get_client.return_value = mock_client
 
-    with caplog.at_level(logging.INFO):
-        result = transition_issue_status(123, "pending", assigned_to=None)
+    issue = update_issue(1, priority=-5, not_before=None)
+    assert issue.priority == -5
+    mock_table.update.assert_called_once_with({"priority": -5, "not_before": None})
 
-    assert result.id == 123
-    assert "Issue 123 status transitioned from 'failed' to 'pending'" in caplog.text
+
+def test_update_issue_invalid_priority() -> None:
+    """Test non-integer and out-of-range priorities are rejected before any query."""
+    with pytest.raises(ValueError, match="Priority must be an integer"):
+        update_issue(1, priority=True)
+    with pytest.raises(ValueError, match="between -100 and 100"):
+        update_issue(1, priority=-101)
+
+
+# Tests for keyset pagination
+
+
+def _keyset_chain(mock_get_client, pages: list[list[dict]]) -> Mock:
+    """Wire a comments/issues query whose execute() returns successive pages."""
+    query = Mock()
+    for method in ("select", "eq", "lte", "or_", "order", "limit", "offset"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [Mock(data=page) for page in pages]
+    mock_client = Mock()
+    mock_client.table.return_value = query
+    mock_get_client.return_value = mock_client
+    return query
+
+
+def _comment_rows(ids: range) -> list[dict]:
+    return [
+        {
+            "id": n,
+            "issue_id": 1,
+            "comment": f"Comment {n}",
+            "created_at": "2026-10-16T12:00:00+00:00",
+        }
+        for n in ids
+    ]
+
+
+def test_cursor_round_trip() -> None:
+    """Test encode_cursor and decode_cursor are inverses."""
+    created_at = datetime(2026, 10, 16, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2026-10-16T12:30:00+00:00", 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not-a-cursor", encode_cursor('2026-10-16",id.gt.0', 1), encode_cursor("2026", 0)],
+)
+def test_decode_cursor_rejects_malformed(cursor: str) -> None:
+    """Test malformed cursors, including filter injection attempts, are rejected."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursor_for_requires_stored_row() -> None:
+    """Test a cursor needs the row's id and created_at."""
+    with pytest.raises(ValueError, match="without id and created_at"):
+        cursor_for(Comment(issue_id=1, comment="unsaved"))
+
+
+@patch("rouge.core.database.get_client")
+def test_list_comments_with_cursor_seeks_past_row(mock_get_client) -> None:
+    """Test a cursor becomes a (created_at, id) keyset filter with an id tiebreak."""
+    query = _keyset_chain(mock_get_client, [_comment_rows(range(9, 7, -1))])
+    cursor = encode_cursor("2026-10-16T12:00:00+00:00", 10)
+
+    comments = list_comments(issue_id=1, limit=2, cursor=cursor)
+
+    assert [c.id for c in comments] == [9, 8]
+    query.lte.assert_called_once_with("created_at", "2026-10-16T12:00:00+00:00")
+    query.or_.assert_called_once_with(
+        'created_at.lt."2026-10-16T12:00:00+00:00",'
+        'and(created_at.eq."2026-10-16T12:00:00+00:00",id.lt.10)'
+    )
+    assert [c.args for c in query.order.call_args_list] == [("created_at",), ("id",)]
+
+
+def test_list_comments_rejects_cursor_with_offset() -> None:
+    """Test offset and cursor pagination cannot be mixed."""
+    cursor = encode_cursor("2026-10-16T12:00:00+00:00", 10)
+    with pytest.raises(ValueError, match="offset cannot be combined with cursor"):
+        list_comments(offset=5, cursor=cursor)
+
+
+@patch("rouge.core.database.get_client")
+def test_iter_comments_follows_cursor_until_short_page(mock_get_client) -> None:
+    """Test iter_comments fetches pages lazily, resuming after the last row."""
+    query = _keyset_chain(
+        mock_get_client, [_comment_rows(range(5, 3, -1)), _comment_rows(range(3, 2, -1))]
+    )
+
+    comments = iter_comments(issue_id=1, page_size=2)
+    assert next(comments).id == 5
+    assert query.execute.call_count == 1
+
+    assert [c.id for c in comments] == [4, 3]
+    assert query.execute.call_count == 2
+    query.or_.assert_called_once()
+    assert "id.lt.4" in query.or_.call_args.args[0]
+
+
+@patch("rouge.core.database.get_client")
+def test_iter_issues_stops_on_empty_page(mock_get_client) -> None:
+    """Test iter_issues stops when a full page is followed by an empty one."""
+    rows = [
+        {"id": n, "description": f"Issue {n}", "created_at": "2026-10-16T12:00:00+00:00"}
+        for n in (2, 1)
+    ]
+    query = _keyset_chain(mock_get_client, [rows, []])
+
+    assert [issue.id for issue in iter_issues(status="pending", page_size=2)] == [2, 1]
+    assert query.execute.call_count == 2
+    query.eq.assert_any_call("status", "pending")
+
+
+def test_iter_comments_rejects_invalid_page_size() -> None:
+    """Test page_size must be positive."""
+    with pytest.raises(ValueError, match="page_size"):
+        next(iter_comments(page_size=0))
+
+
+# Tests for column projection
+
+
+@patch("rouge.core.database.get_client")
+def test_list_comments_projection_skips_raw(mock_get_client) -> None:
+    """Test a CommentSummary projection selects only summary columns."""
+    query = _keyset_chain(mock_get_client, [_comment_rows(range(2, 0, -1))])
+
+    comments = list_comments(projection=CommentSummary)
+
+    columns = query.select.call_args.args[0].split(",")
+    assert "raw" not in columns
+    assert {"id", "issue_id", "comment", "created_at"} <= set(columns)
+    assert all(isinstance(comment, CommentSummary) for comment in comments)
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_all_issues_projection_skips_description(mock_get_client) -> None:
+    """Test an IssueSummary projection parses rows without a description."""
+    query = _keyset_chain(
+        mock_get_client, [[{"id": 1, "title": "Fix login", "status": None, "type": None}]]
+    )
+
+    issues = fetch_all_issues(projection=IssueSummary)
+
+    assert "description" not in query.select.call_args.args[0].split(",")
+    assert issues == [IssueSummary(id=1, title="Fix login", status="pending", type="full")]
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_issue_projection(mock_get_client) -> None:
+    """Test fetch_issue returns the projection model when one is given."""
+    query = _keyset_chain(mock_get_client, [[{"id": 7, "status": "started", "branch": "b"}]])
+
+    issue = fetch_issue(7, projection=IssueSummary)
+
+    assert isinstance(issue, IssueSummary)
+    assert issue.branch == "b"
+    assert query.select.call_args.args[0] == ",".join(IssueSummary.model_fields)
+
+
+# Tests for the issue cache
+
+
+def _issue_row(issue_id: int = 7, status: str = "pending") -> dict:
+    return {"id": issue_id, "description": "Test issue", "status": status}
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_issue_served_from_cache(mock_get_client) -> None:
+    """Test a repeated fetch_issue is answered without a round trip."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()]])
+    before = get_issue_cache_stats()
+
+    first = fetch_issue(7)
+    first.description = "mutated by caller"
+    second = fetch_issue(7)
+    summary = fetch_issue(7, projection=IssueSummary)
+
+    assert query.execute.call_count == 1
+    assert second.description == "Test issue"
+    assert summary == IssueSummary(id=7, status="pending", type="full")
+    after = get_issue_cache_stats()
+    assert (after.hits - before.hits, after.misses - before.misses) == (2, 1)
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_issue_fresh_bypasses_cache(mock_get_client) -> None:
+    """Test fresh=True always reads the database and refreshes the cache."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()], [_issue_row(status="started")]])
+
+    fetch_issue(7)
+    issue = fetch_issue(7, fresh=True)
+
+    assert query.execute.call_count == 2
+    assert issue.status == "started"
+    assert fetch_issue(7).status == "started"
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_issue_cache_disabled_with_zero_ttl(mock_get_client, monkeypatch) -> None:
+    """Test ROUGE_ISSUE_CACHE_TTL=0 turns the cache off."""
+    monkeypatch.setenv("ROUGE_ISSUE_CACHE_TTL", "0")
+    query = _keyset_chain(mock_get_client, [[_issue_row()], [_issue_row()]])
+
+    fetch_issue(7)
+    fetch_issue(7)
+
+    assert query.execute.call_count == 2
+
+
+@patch("rouge.core.database.time")
+@patch("rouge.core.database.get_client")
+def test_fetch_issue_cache_expires(mock_get_client, mock_time) -> None:
+    """Test entries older than the TTL are read again."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()], [_issue_row()]])
+    mock_time.monotonic.side_effect = [100.0, 100.0 + 29, 100.0 + 31, 100.0 + 31]
+
+    fetch_issue(7)
+    fetch_issue(7)
+    assert query.execute.call_count == 1
+
+    fetch_issue(7)
+    assert query.execute.call_count == 2
+
+
+@patch("rouge.core.database.get_client")
+def test_update_issue_skips_existence_check_and_refreshes_cache(mock_get_client) -> None:
+    """Test update_issue trusts a cached row and caches the updated one."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()]])
+    query.update.return_value = query
+    fetch_issue(7)
+    query.execute.side_effect = [Mock(data=[{**_issue_row(), "branch": "feature/x"}])]
+
+    update_issue(7, branch="feature/x")
+
+    query.update.assert_called_once_with({"branch": "feature/x"})
+    assert query.execute.call_count == 2
+    assert fetch_issue(7).branch == "feature/x"
+    assert query.execute.call_count == 2
+
+
+@patch("rouge.core.database.get_client")
+def test_delete_issue_invalidates_cache(mock_get_client) -> None:
+    """Test a deleted issue is no longer served from the cache."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()]])
+    query.delete.return_value = query
+    fetch_issue(7)
+    query.execute.side_effect = [Mock(data=[_issue_row()]), Mock(data=[])]
+
+    delete_issue(7)
+
+    with pytest.raises(ValueError, match="not found"):
+        fetch_issue(7)
+
+
+@patch("rouge.core.database.get_client")
+def test_transition_conflict_invalidates_cache(mock_get_client) -> None:
+    """Test a status conflict drops the stale cached row."""
+    query = _keyset_chain(mock_get_client, [[_issue_row()], [_issue_row(status="claimed")]])
+    mock_get_client.return_value.rpc.return_value.execute.return_value.data = [
+        {"previous_issue": _issue_row(status="claimed"), "issue": None}
+    ]
+    fetch_issue(7)
+
+    with pytest.raises(IssueStatusConflictError):
+        transition_issue_status(7, "started", expected_status="pending")
+
+    assert fetch_issue(7).status == "claimed"
+    assert query.execute.call_count == 2
+
+
+def _bulk_insert_table(mock_get_client, fail_rows: set[str] = frozenset()) -> Mock:
+    """Wire an issues table whose inserts echo rows back with sequential IDs.
+
+    Single-row inserts whose description is in ``fail_rows`` and every
+    multi-row insert containing one of them raise APIError.
+    """
+    from postgrest.exceptions import APIError
+
+    mock_table = Mock()
+    mock_get_client.return_value.table.return_value = mock_table
+    next_id = iter(range(1, 100))
+
+    def insert(data, **_kwargs):
+        rows = data if isinstance(data, list) else [data]
+        query = Mock()
+        if any(row["description"] in fail_rows for row in rows):
+            query.execute.side_effect = APIError({"message": "check violation", "code": "23514"})
+        else:
+            query.execute.return_value = Mock(data=[{**row, "id": next(next_id)} for row in rows])
+        return query
+
+    mock_table.insert.side_effect = insert
+    return mock_table
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issues_bulk_inserts_in_chunks(mock_get_client) -> None:
+    """Valid rows are inserted in chunks and assigned round robin."""
+    mock_table = _bulk_insert_table(mock_get_client)
+    rows = [{"description": f"Seeded sprint issue {n}"} for n in range(5)]
+    rows[1]["assigned_to"] = "lead"
+    rows.insert(2, {"description": "short"})
+
+    result = create_issues_bulk(rows, chunk_size=2, assign_round_robin=["w1", "w2"])
+
+    assert mock_table.insert.call_count == 3
+    for insert_call in mock_table.insert.call_args_list:
+        assert insert_call.kwargs == {"default_to_null": False}
+    assert [index for index, _ in result.created] == [0, 1, 3, 4, 5]
+    assert [issue.assigned_to for _, issue in result.created] == ["w1", "lead", "w2", "w1", "w2"]
+    assert all(len(issue.adw_id) == 8 for _, issue in result.created)
+    assert result.errors == [(2, "Description must be at least 10 characters")]
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issues_bulk_retries_failed_chunk_row_by_row(mock_get_client) -> None:
+    """A rejected chunk is retried one row at a time so only bad rows fail."""
+    mock_table = _bulk_insert_table(mock_get_client, fail_rows={"Rejected by the database"})
+    rows = [
+        {"description": "Accepted by the database"},
+        {"description": "Rejected by the database"},
+        {"description": "Also accepted by the database", "type": "thin"},
+    ]
+
+    result = create_issues_bulk(rows)
+
+    assert mock_table.insert.call_count == 4
+    assert [index for index, _ in result.created] == [0, 2]
+    assert [index for index, _ in result.errors] == [1]
+    assert "check violation" in result.errors[0][1]
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issues_bulk_reports_rows_not_returned(mock_get_client) -> None:
+    """Rows an insert does not return are errors, in bulk and row by row."""
+    from postgrest.exceptions import APIError
+
+    mock_table = Mock()
+    mock_get_client.return_value.table.return_value = mock_table
+    rows = [{"description": f"Seeded sprint issue {n}"} for n in range(4)]
+    returned = {**rows[0], "id": 1, "adw_id": "abcd1234"}
+    mock_table.insert.return_value.execute.side_effect = [
+        Mock(data=[returned]),
+        APIError({"message": "timeout", "code": "57014"}),
+        Mock(data=[]),
+        Mock(data=None),
+    ]
+
+    result = create_issues_bulk(rows, chunk_size=2)
+
+    assert [index for index, _ in result.created] == [0]
+    assert result.errors == [
+        (index, "Failed to create issue: insert returned no row") for index in (1, 2, 3)
+    ]
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issues_bulk_reports_unreachable_chunks(mock_get_client) -> None:
+    """A chunk that cannot reach the database fails alone; other chunks are kept."""
+    import httpx
+
+    mock_table = Mock()
+    mock_get_client.return_value.table.return_value = mock_table
+    rows = [{"description": f"Seeded sprint issue {n}"} for n in range(4)]
+    returned = [{**row, "id": n + 1, "adw_id": "abcd1234"} for n, row in enumerate(rows)]
+    mock_table.insert.return_value.execute.side_effect = [
+        Mock(data=returned[:2]),
+        httpx.ReadTimeout("timed out"),
+    ]
+
+    result = create_issues_bulk(rows, chunk_size=2)
+
+    assert [index for index, _ in result.created] == [0, 1]
+    assert result.errors == [
+        (index, "Failed to create issue (outcome unknown): timed out") for index in (2, 3)
+    ]
+
+
+@patch("rouge.core.database.get_client")
+def test_create_issues_bulk_reports_unreachable_rows_row_by_row(mock_get_client) -> None:
+    """A row retried one at a time that cannot reach the database is an error."""
+    import psycopg2
+    from postgrest.exceptions import APIError
+
+    mock_table = Mock()
+    mock_get_client.return_value.table.return_value = mock_table
+    rows = [{"description": f"Seeded sprint issue {n}"} for n in range(2)]
+    mock_table.insert.return_value.execute.side_effect = [
+        APIError({"message": "check violation", "code": "23514"}),
+        Mock(data=[{**rows[0], "id": 1, "adw_id": "abcd1234"}]),
+        psycopg2.OperationalError("server closed the connection"),
+    ]
+
+    result = create_issues_bulk(rows)
+
+    assert [index for index, _ in result.created] == [0]
+    assert result.errors == [
+        (1, "Failed to create issue (outcome unknown): server closed the connection")
+    ]
+
+
+def test_create_issues_bulk_rejects_unknown_fields() -> None:
+    """Unknown keys and wrongly typed values are row errors, not exceptions."""
+    with patch("rouge.core.database.get_client"):
+        result = create_issues_bulk(
+            [
+                {"description": "A valid description", "colour": "red"},
+                {"description": "A valid description", "priority": 500},
+                {"description": 42},
+            ]
+        )
+
+    assert result.created == []
+    assert [message for _, message in result.errors] == [
+        "Unknown field(s): colour",
+        "Priority must be between -100 and 100, got 500",
+        "Field 'description' must be a string",
+    ]
+
+
+@patch("rouge.core.database.get_client")
+def test_resolve_blob_refs_fetches_all_references_at_once(mock_get_client) -> None:
+    """Blob references anywhere in a payload are resolved with one query."""
+    query = Mock()
+    query.select.return_value = query
+    query.in_.return_value = query
+    query.execute.return_value = Mock(data=[{"hash": "aa", "content": "long plan"}])
+    mock_get_client.return_value.table.return_value = query
+    raw = {
+        "template": "build_plan",
+        "result": {"plan": {"$blob": "aa"}, "steps": [{"$blob": "aa"}, {"$blob": "bb"}]},
+    }
+
+    resolved = resolve_blob_refs(raw)
+
+    mock_get_client.return_value.table.assert_called_once_with("artifact_blobs")
+    query.in_.assert_called_once_with("hash", ["aa", "bb"])
+    assert resolved == {
+        "template": "build_plan",
+        "result": {"plan": "long plan", "steps": ["long plan", {"$blob": "bb"}]},
+    }
+    assert raw["result"]["plan"] == {"$blob": "aa"}
+
+
+@patch("rouge.core.database.get_client")
+def test_fetch_blobs_rejects_malformed_rows(mock_get_client) -> None:
+    """Rows that are not blob records raise instead of failing with a KeyError."""
+    query = Mock()
+    query.select.return_value = query
+    query.in_.return_value = query
+    query.execute.return_value = Mock(data=[{"hash": "aa", "content": "plan"}, "garbage"])
+    mock_get_client.return_value.table.return_value = query
+
+    with pytest.raises(ValueError, match="Invalid blob row at index 1"):
+        fetch_blobs(["aa", "bb"])
+
+
+@patch("rouge.core.database.get_client")
+def test_resolve_blob_refs_without_references(mock_get_client) -> None:
+    """Payloads without references are returned as is, without a query."""
+    raw = {"artifact": {"plan": "short", "meta": {"$blob": "aa", "extra": 1}}}
+
+    assert resolve_blob_refs(raw) is raw
+    mock_get_client.assert_not_called()
+
+
+@patch("rouge.core.database.get_client")
+def test_compact_workflow_comments_runs_batches_until_empty(mock_get_client) -> None:
+    """Batches are compacted one RPC call at a time and their totals summed."""
+    mock_get_client.return_value.rpc.return_value.execute.side_effect = [
+        Mock(data=[{"issue_id": 1, "comments_removed": 12, "bytes_reclaimed": 4000}]),
+        Mock(data=[{"issue_id": 2, "comments_removed": 3, "bytes_reclaimed": 500}]),
+        Mock(data=[]),
+    ]
+
+    result = compact_workflow_comments(7, batch_size=1)
+
+    assert (result.issues, result.comments_removed, result.bytes_reclaimed) == (2, 15, 4500)
+    assert result.batches == 2
+    mock_get_client.return_value.rpc.assert_called_with(
+        "compact_workflow_comments", {"p_older_than_days": 7, "p_batch_size": 1}
+    )
+    assert mock_get_client.return_value.rpc.call_count == 3
+
+
+@patch("rouge.core.database.get_client")
+def test_compact_workflow_comments_stops_at_max_batches(mock_get_client) -> None:
+    """max_batches bounds the number of RPC calls."""
+    mock_get_client.return_value.rpc.return_value.execute.return_value = Mock(
+        data=[{"issue_id": 1, "comments_removed": 2, "bytes_reclaimed": 10}]
+    )
+
+    result = compact_workflow_comments(max_batches=2)
+
+    assert result.batches == 2
+    assert result.comments_removed == 4
+    assert mock_get_client.return_value.rpc.call_count == 2
+
+
+@patch("rouge.core.database.get_client")
+def test_compact_workflow_comments_rejects_malformed_rows(mock_get_client) -> None:
+    """Rows that are not result records raise instead of failing with a TypeError."""
+    mock_get_client.return_value.rpc.return_value.execute.return_value = Mock(data=[[1, 2, 3]])
+
+    with pytest.raises(ValueError, match="Invalid compaction row at index 0"):
+        compact_workflow_comments()
+
+
+@patch("rouge.core.database.get_client")
+def test_compact_workflow_comments_wraps_api_errors(mock_get_client) -> None:
+    """RPC failures surface as ValueError."""
+    from postgrest.exceptions import APIError
+
+    mock_get_client.return_value.rpc.return_value.execute.side_effect = APIError(
+        {"message": "statement timeout"}
+    )
+
+    with pytest.raises(ValueError, match="Failed to compact workflow comments"):
+        compact_workflow_comments()
+    with pytest.raises(ValueError, match="batch_size must be >= 1"):
+        compact_workflow_comments(batch_size=0)
+
+
+@patch("rouge.core.database.get_client")
+def test_externalize_artifact_comment_blobs_walks_comments_by_id(mock_get_client) -> None:
+    """Each batch starts after the last comment id returned and totals are summed."""
+    rpc = mock_get_client.return_value.rpc
+    rpc.return_value.execute.side_effect = [
+        Mock(
+            data=[
+                {"comment_id": 4, "bytes_reclaimed": 3000},
+                {"comment_id": 9, "bytes_reclaimed": 0},
+            ]
+        ),
+        Mock(data=[{"comment_id": 12, "bytes_reclaimed": 500}]),
+        Mock(data=[]),
+    ]
+
+    result = externalize_artifact_comment_blobs(batch_size=2)
+
+    assert result == BlobBackfillResult(
+        comments_scanned=3, comments_rewritten=2, bytes_reclaimed=3500, batches=2
+    )
+    assert [c.args for c in rpc.call_args_list] == [
+        ("externalize_artifact_comment_blobs", {"p_after_id": after_id, "p_batch_size": 2})
+        for after_id in (0, 9, 12)
+    ]
+
+
+@patch("rouge.core.database.get_client")
+def test_externalize_artifact_comment_blobs_stops_at_max_batches(mock_get_client) -> None:
+    """max_batches bounds the number of RPC calls."""
+    mock_get_client.return_value.rpc.return_value.execute.side_effect = [
+        Mock(data=[{"comment_id": 1, "bytes_reclaimed": 10}]),
+        Mock(data=[{"comment_id": 2, "bytes_reclaimed": 10}]),
+    ]
+
+    result = externalize_artifact_comment_blobs(max_batches=2)
+
+    assert result.batches == 2
+    assert result.bytes_reclaimed == 20
+    assert mock_get_client.return_value.rpc.call_count == 2
+
+
+@patch("rouge.core.database.get_client")
+def test_externalize_artifact_comment_blobs_rejects_bad_input(mock_get_client) -> None:
+    """Malformed rows, RPC failures and bad arguments surface as ValueError."""
+    from postgrest.exceptions import APIError
+
+    execute = mock_get_client.return_value.rpc.return_value.execute
+    execute.return_value = Mock(data=[{"bytes_reclaimed": 10}])
+    with pytest.raises(ValueError, match="Invalid blob backfill row at index 0"):
+        externalize_artifact_comment_blobs()
+
+    execute.side_effect = APIError({"message": "statement timeout"})
+    with pytest.raises(ValueError, match="Failed to externalize artifact comment blobs"):
+        externalize_artifact_comment_blobs()
+    with pytest.raises(ValueError, match="batch_size must be >= 1"):
+        externalize_artifact_comment_blobs(batch_size=0)
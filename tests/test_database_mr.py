@@ -4,110 +4,70 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from rouge.core.database import list_mr_comments
+from rouge.core.database import iter_mr_comments, list_mr_comments, mr_cursor_for
 
 
-def _make_comment_row(
+def _make_entry_row(
     *,
-    id=1,
+    comment_id=1,
+    entry_index=1,
     issue_id=42,
     adw_id="adw-abc123",
-    comment="PR artifact",
-    source="artifact",
-    type="gh-pull-request",
     platform="github",
-    pull_requests=None,
-    created_at="2024-01-01T12:00:00",
+    repo="org/repo",
+    number=123,
+    url="https://github.com/org/repo/pull/123",
+    adopted=False,
+    created_at="2024-01-01T12:00:00+00:00",
 ) -> dict:
-    """Build a realistic comment row dict for mocking."""
-    if pull_requests is None:
-        pull_requests = [
-            {
-                "repo": "org/repo",
-                "number": 123,
-                "url": "https://github.com/org/repo/pull/123",
-                "adopted": False,
-            }
-        ]
+    """Build a realistic mr_comment_entries row dict for mocking."""
     return {
-        "id": id,
+        "comment_id": comment_id,
+        "entry_index": entry_index,
         "issue_id": issue_id,
         "adw_id": adw_id,
-        "comment": comment,
-        "source": source,
-        "type": type,
-        "raw": {
-            "artifact": {
-                "platform": platform,
-                "pull_requests": pull_requests,
-            }
-        },
+        "platform": platform,
+        "repo": repo,
+        "number": number,
+        "url": url,
+        "adopted": adopted,
         "created_at": created_at,
     }
 
 
-def _build_mock_chain(mock_client: Mock, data: list) -> dict[str, Mock]:
-    """Wire up the Supabase query chain and return the leaf mocks.
+def _build_mock_chain(mock_client: Mock, *pages: list) -> Mock:
+    """Wire up the view query chain; each execute() returns the next page.
 
-    Returns a dict of named mocks so callers can assert on intermediate calls.
+    Every builder method returns the same mock, so callers can assert on any
+    call in the chain.
     """
-    mock_table = Mock()
-    mock_select = Mock()
-    mock_eq_source = Mock()
-    mock_in = Mock()
-    mock_order = Mock()
-    mock_limit = Mock()
-    mock_offset = Mock()
-    mock_execute = Mock()
-
-    mock_client.table.return_value = mock_table
-    mock_table.select.return_value = mock_select
-    mock_select.eq.return_value = mock_eq_source
-    mock_eq_source.in_.return_value = mock_in
-    # .eq on mock_in handles the optional issue_id filter; it should return
-    # itself so the chain can continue to .order().
-    mock_in.eq.return_value = mock_in
-    mock_in.order.return_value = mock_order
-    mock_order.limit.return_value = mock_limit
-    mock_limit.offset.return_value = mock_offset
-    mock_execute.data = data
-    mock_offset.execute.return_value = mock_execute
-
-    return {
-        "table": mock_table,
-        "select": mock_select,
-        "eq_source": mock_eq_source,
-        "in_": mock_in,
-        "order": mock_order,
-        "limit": mock_limit,
-        "offset": mock_offset,
-        "execute": mock_execute,
-    }
+    query = Mock()
+    for method in ("select", "in_", "eq", "lte", "or_", "order", "limit", "offset"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [Mock(data=page) for page in pages]
+    mock_client.table.return_value = query
+    return query
 
 
 class TestListMrComments:
     """Tests for list_mr_comments()."""
 
     @patch("rouge.core.database.get_client")
-    def test_happy_path_two_comments(self, mock_get_client: Mock) -> None:
-        """Two comment rows each with one PR return two flattened dicts."""
+    def test_happy_path_two_entries(self, mock_get_client: Mock) -> None:
+        """Entry rows from the view map to result dicts."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
 
         rows = [
-            _make_comment_row(id=1, issue_id=42, adw_id="adw-abc123"),
-            _make_comment_row(
-                id=2,
+            _make_entry_row(comment_id=2, issue_id=42, adw_id="adw-abc123"),
+            _make_entry_row(
+                comment_id=1,
                 issue_id=43,
                 adw_id="adw-def456",
-                pull_requests=[
-                    {
-                        "repo": "org/other",
-                        "number": 456,
-                        "url": "https://github.com/org/other/pull/456",
-                        "adopted": True,
-                    }
-                ],
+                repo="org/other",
+                number=456,
+                url="https://github.com/org/other/pull/456",
+                adopted=True,
             ),
         ]
         _build_mock_chain(mock_client, rows)
@@ -122,6 +82,8 @@ class TestListMrComments:
         assert results[0]["number"] == 123
         assert results[0]["url"] == "https://github.com/org/repo/pull/123"
         assert results[0]["adopted"] is False
+        assert results[0]["comment_id"] == 2
+        assert results[0]["entry_index"] == 1
 
         assert results[1]["issue_id"] == 43
         assert results[1]["adw_id"] == "adw-def456"
@@ -129,95 +91,75 @@ class TestListMrComments:
         assert results[1]["adopted"] is True
 
     @patch("rouge.core.database.get_client")
-    def test_multi_pr_artifact(self, mock_get_client: Mock) -> None:
-        """One comment with two PRs produces two flattened rows."""
+    def test_reads_projected_view_columns(self, mock_get_client: Mock) -> None:
+        """The query targets the flattening view and never selects raw."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [
-            _make_comment_row(
-                pull_requests=[
-                    {
-                        "repo": "org/repo",
-                        "number": 1,
-                        "url": "https://github.com/org/repo/pull/1",
-                        "adopted": False,
-                    },
-                    {
-                        "repo": "org/repo",
-                        "number": 2,
-                        "url": "https://github.com/org/repo/pull/2",
-                        "adopted": True,
-                    },
-                ]
-            )
+        query = _build_mock_chain(mock_client, [])
+
+        list_mr_comments(limit=5, offset=10)
+
+        mock_client.table.assert_called_once_with("mr_comment_entries")
+        columns = query.select.call_args.args[0].split(",")
+        assert "raw" not in columns
+        assert "url" in columns
+        assert [c.args[0] for c in query.order.call_args_list] == [
+            "created_at",
+            "comment_id",
+            "entry_index",
         ]
-        _build_mock_chain(mock_client, rows)
-
-        results = list_mr_comments()
-
-        assert len(results) == 2
-        assert results[0]["number"] == 1
-        assert results[1]["number"] == 2
+        query.limit.assert_called_once_with(5)
+        query.offset.assert_called_once_with(10)
 
     @patch("rouge.core.database.get_client")
     def test_filter_by_issue_id(self, mock_get_client: Mock) -> None:
         """Passing issue_id inserts an extra .eq call."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [_make_comment_row(issue_id=5)]
-        mocks = _build_mock_chain(mock_client, rows)
+        query = _build_mock_chain(mock_client, [_make_entry_row(issue_id=5)])
 
         list_mr_comments(issue_id=5)
 
-        mocks["in_"].eq.assert_called_with("issue_id", 5)
+        query.eq.assert_called_with("issue_id", 5)
 
     @patch("rouge.core.database.get_client")
     def test_filter_by_platform_github(self, mock_get_client: Mock) -> None:
         """platform='github' filters to gh-pull-request only."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [_make_comment_row()]
-        mocks = _build_mock_chain(mock_client, rows)
+        query = _build_mock_chain(mock_client, [_make_entry_row()])
 
         list_mr_comments(platform="github")
 
-        mocks["eq_source"].in_.assert_called_with("type", ["gh-pull-request"])
+        query.in_.assert_called_with("type", ["gh-pull-request"])
 
     @patch("rouge.core.database.get_client")
     def test_filter_by_platform_gitlab(self, mock_get_client: Mock) -> None:
         """platform='gitlab' filters to glab-pull-request only."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [_make_comment_row(type="glab-pull-request", platform="gitlab")]
-        mocks = _build_mock_chain(mock_client, rows)
+        query = _build_mock_chain(mock_client, [_make_entry_row(platform="gitlab")])
 
         list_mr_comments(platform="gitlab")
 
-        mocks["eq_source"].in_.assert_called_with("type", ["glab-pull-request"])
+        query.in_.assert_called_with("type", ["glab-pull-request"])
 
     @patch("rouge.core.database.get_client")
     def test_no_platform_filter(self, mock_get_client: Mock) -> None:
         """platform=None includes both PR types."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [_make_comment_row()]
-        mocks = _build_mock_chain(mock_client, rows)
+        query = _build_mock_chain(mock_client, [_make_entry_row()])
 
         list_mr_comments(platform=None)
 
-        mocks["eq_source"].in_.assert_called_with("type", ["gh-pull-request", "glab-pull-request"])
+        query.in_.assert_called_with("type", ["gh-pull-request", "glab-pull-request"])
 
     @patch("rouge.core.database.get_client")
     def test_empty_results(self, mock_get_client: Mock) -> None:
-        """No matching comments returns an empty list."""
+        """No matching entries returns an empty list."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
         _build_mock_chain(mock_client, [])
 
         results = list_mr_comments()
@@ -229,19 +171,7 @@ class TestListMrComments:
         """Repo display uses owner/repo from URL when stored repo is only a basename."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
-
-        rows = [
-            _make_comment_row(
-                pull_requests=[
-                    {
-                        "repo": "rouge",
-                        "number": 123,
-                        "url": "https://github.com/bponghneng/rouge/pull/123",
-                        "adopted": False,
-                    }
-                ]
-            )
-        ]
+        rows = [_make_entry_row(repo="rouge", url="https://github.com/bponghneng/rouge/pull/123")]
         _build_mock_chain(mock_client, rows)
 
         results = list_mr_comments()
@@ -249,39 +179,22 @@ class TestListMrComments:
         assert results[0]["repo"] == "bponghneng/rouge"
 
     @patch("rouge.core.database.get_client")
-    def test_malformed_payload_missing_pull_requests(self, mock_get_client: Mock) -> None:
-        """Comment with raw missing artifact.pull_requests is skipped."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-
-        row = {
-            "id": 1,
-            "issue_id": 42,
-            "adw_id": "adw-abc123",
-            "comment": "PR artifact",
-            "source": "artifact",
-            "type": "gh-pull-request",
-            "raw": {"something_else": True},
-            "created_at": "2024-01-01T12:00:00",
-        }
-        _build_mock_chain(mock_client, [row])
-
-        results = list_mr_comments()
-
-        assert results == []
-
-    @patch("rouge.core.database.get_client")
-    def test_empty_pull_requests_array(self, mock_get_client: Mock) -> None:
-        """Comment with empty pull_requests list produces no rows."""
+    def test_cursor_seeks_past_entry(self, mock_get_client: Mock) -> None:
+        """A cursor resumes after an entry, including later entries of the same comment."""
         mock_client = Mock()
         mock_get_client.return_value = mock_client
+        query = _build_mock_chain(mock_client, [])
+        cursor = mr_cursor_for(_make_entry_row(comment_id=7, entry_index=2))
 
-        rows = [_make_comment_row(pull_requests=[])]
-        _build_mock_chain(mock_client, rows)
-
-        results = list_mr_comments()
+        list_mr_comments(cursor=cursor)
 
-        assert results == []
+        query.lte.assert_called_once_with("created_at", "2024-01-01T12:00:00+00:00")
+        ts = '"2024-01-01T12:00:00+00:00"'
+        query.or_.assert_called_once_with(
+            f"created_at.lt.{ts},"
+            f"and(created_at.eq.{ts},comment_id.lt.7),"
+            f"and(created_at.eq.{ts},comment_id.eq.7,entry_index.gt.2)"
+        )
 
     def test_validation_errors(self) -> None:
         """Invalid arguments raise ValueError without hitting the DB."""
@@ -296,3 +209,33 @@ class TestListMrComments:
 
         with pytest.raises(ValueError, match="platform must be"):
             list_mr_comments(platform="bitbucket")
+
+        with pytest.raises(ValueError, match="offset cannot be combined"):
+            list_mr_comments(offset=1, cursor=mr_cursor_for(_make_entry_row()))
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            list_mr_comments(cursor="not-a-cursor")
+
+
+class TestIterMrComments:
+    """Tests for iter_mr_comments()."""
+
+    @patch("rouge.core.database.get_client")
+    def test_pages_on_entries(self, mock_get_client: Mock) -> None:
+        """Pages advance by entry, so a comment's entries may span pages."""
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        query = _build_mock_chain(
+            mock_client,
+            [
+                _make_entry_row(comment_id=3, entry_index=1, number=1),
+                _make_entry_row(comment_id=3, entry_index=2, number=2),
+            ],
+            [_make_entry_row(comment_id=2, entry_index=1, number=3)],
+        )
+
+        results = list(iter_mr_comments(page_size=2))
+
+        assert [r["number"] for r in results] == [1, 2, 3]
+        assert query.execute.call_count == 2
+        assert "comment_id.eq.3,entry_index.gt.2" in query.or_.call_args.args[0]
@@ -3,19 +3,38 @@
 This module tests the database connection recovery mechanisms implemented across
 the worker stack, including:
 - Client reset functionality
+- HTTP connection pool configuration and statistics
 - Transient error detection and handling
 - Worker retry/backoff logic
 - State management during database failures
+- The circuit breaker in front of best-effort and critical database calls
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import httpx
+import psycopg2
 import pytest
 
-from rouge.core.database import get_client, reset_client
+from rouge.core import database
+from rouge.core.database import (
+    CircuitBreaker,
+    CircuitOpenError,
+    IssueStatusConflictError,
+    _build_http_client,
+    _get_http_client,
+    create_comment,
+    fetch_issue,
+    get_circuit_breaker,
+    get_client,
+    get_http_pool_stats,
+    reset_client,
+    transition_issue_status,
+)
+from rouge.core.models import Comment
 from rouge.worker.config import WorkerConfig
-from rouge.worker.database import get_next_issue
+from rouge.worker.database import get_next_issue, get_next_issues, release_issues, renew_leases
 from rouge.worker.exceptions import TransientDatabaseError
 from rouge.worker.worker import IssueWorker
 
@@ -29,13 +48,17 @@ def mock_env(monkeypatch: pytest.MonkeyPatch) -> None:
 
 @pytest.fixture
 def worker_config() -> WorkerConfig:
-    """Create a worker configuration for testing with retry settings."""
+    """Create a worker configuration for testing with retry settings.
+
+    Uses the fixed poll strategy so poll-cycle sleeps equal poll_interval.
+    """
     return WorkerConfig(
         worker_id="test-worker",
         poll_interval=5,
         log_level="DEBUG",
         db_retries=3,
         db_backoff_ms=100,
+        poll_strategy="fixed",
     )
 
 
@@ -88,6 +111,119 @@ class TestResetClient:
 
         assert database._client is None
 
+    def test_reset_client_closes_http_client(self, mock_env: None) -> None:
+        """Test that reset_client() closes the pooled HTTP client it replaces."""
+        database._client = None
+        database._http_client = None
+
+        with patch("rouge.core.database.create_client"):
+            get_client()
+        http_client = database._http_client
+        assert http_client is not None and not http_client.is_closed
+
+        reset_client()
+
+        assert http_client.is_closed
+        assert database._http_client is None
+
+    def test_get_client_shared_across_threads(self, mock_env: None) -> None:
+        """Test that concurrent first calls build a single client."""
+        reset_client()
+
+        with patch(
+            "rouge.core.database.create_client", side_effect=lambda *a, **k: Mock()
+        ) as mock_create:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = list(pool.map(lambda _: get_client(), range(32)))
+
+        assert mock_create.call_count == 1
+        assert all(client is clients[0] for client in clients)
+        reset_client()
+
+    def test_get_client_closes_http_client_when_creation_fails(self, mock_env: None) -> None:
+        """Test that a failed client creation does not leak its HTTP client."""
+        reset_client()
+        http_client = Mock()
+
+        with patch("rouge.core.database._get_http_client", return_value=http_client):
+            with patch("rouge.core.database.create_client", side_effect=RuntimeError("boom")):
+                with pytest.raises(RuntimeError):
+                    get_client()
+
+        http_client.close.assert_called_once()
+        assert database._client is None
+
+    def test_fork_discards_client_without_closing(self, mock_env: None) -> None:
+        """Test that a forked child forgets the client but leaves the parent's sockets open."""
+        reset_client()
+        with patch("rouge.core.database.create_client"):
+            get_client()
+        http_client = database._http_client
+
+        database._discard_client_after_fork()
+
+        assert database._client is None
+        assert database._http_client is None
+        assert not http_client.is_closed
+        http_client.close()
+
+
+class TestHttpClient:
+    """Tests for the pooled Supabase HTTP client."""
+
+    def test_build_http_client_configures_transport(self) -> None:
+        """Test that limits and connection retries are applied to the transport."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+
+        with patch("rouge.core.database.httpx.HTTPTransport") as mock_transport:
+            client = _build_http_client(10, False, limits=limits, retries=3)
+
+        mock_transport.assert_called_once_with(verify=False, http2=False, limits=limits, retries=3)
+        assert client.timeout == httpx.Timeout(10)
+        client.close()
+
+    def test_build_http_client_falls_back_without_h2(self) -> None:
+        """Test that HTTP/2 is disabled when the h2 package is missing."""
+        with patch("rouge.core.database.importlib.util.find_spec", return_value=None):
+            with patch("rouge.core.database.httpx.HTTPTransport") as mock_transport:
+                client = _build_http_client(10, True, http2=True)
+
+        assert mock_transport.call_args.kwargs["http2"] is False
+        client.close()
+
+    def test_get_http_client_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that pool settings come from SUPABASE_HTTP_* variables."""
+        monkeypatch.setenv("SUPABASE_HTTP_MAX_CONNECTIONS", "8")
+        monkeypatch.setenv("SUPABASE_HTTP_MAX_KEEPALIVE", "4")
+        monkeypatch.setenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY", "7.5")
+        monkeypatch.setenv("SUPABASE_HTTP2", "true")
+        monkeypatch.setenv("SUPABASE_HTTP_RETRIES", "1")
+
+        with patch("rouge.core.database._build_http_client") as mock_build:
+            _get_http_client()
+
+        kwargs = mock_build.call_args.kwargs
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=8, max_keepalive_connections=4, keepalive_expiry=7.5
+        )
+        assert kwargs["http2"] is True
+        assert kwargs["retries"] == 1
+
+    def test_pool_stats_track_client_lifecycle(self, mock_env: None) -> None:
+        """Test that pool stats report limits, idle pools, and resets."""
+        reset_client()
+        resets = get_http_pool_stats().resets
+
+        with patch("rouge.core.database.create_client"):
+            get_client()
+        stats = get_http_pool_stats()
+        reset_client()
+
+        assert stats.max_connections == 20
+        assert stats.connections == 0
+        assert stats.requests_sent == 0
+        assert get_http_pool_stats().resets == resets + 1
+
 
 class TestGetNextIssueTimeoutHandling:
     """Tests for get_next_issue() timeout and connection error handling."""
@@ -241,7 +377,7 @@ class TestWorkerRetriesOnTransientError:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] <= 2:
                 # Fail first 2 attempts
@@ -290,7 +426,7 @@ class TestWorkerRetriesOnTransientError:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             # Stop after two complete poll cycles (3 attempts each = 6 total)
             if call_count[0] >= worker.config.db_retries * 2:
@@ -337,7 +473,7 @@ class TestWorkerRetriesOnTransientError:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] <= 2:
                 raise transient_error
@@ -388,7 +524,7 @@ class TestWorkerContinuesAfterTransientError:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] == 1:
                 raise transient_error
@@ -398,7 +534,7 @@ class TestWorkerContinuesAfterTransientError:
 
         artifact_writes = []
 
-        def capture_write(artifact):
+        def capture_write(artifact, fsync=True):
             artifact_writes.append(artifact.model_copy(deep=True))
 
         with patch("rouge.worker.worker.read_worker_artifact", return_value=ready_artifact):
@@ -436,7 +572,7 @@ class TestWorkerContinuesAfterTransientError:
 
         call_count = [0]
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] == 1:
                 return (123, "Test issue", "pending", "full", None)
@@ -446,7 +582,7 @@ class TestWorkerContinuesAfterTransientError:
 
         artifact_writes = []
 
-        def capture_write(artifact):
+        def capture_write(artifact, fsync=True):
             artifact_writes.append(artifact.model_copy(deep=True))
             if artifact.state == "failed":
                 worker.running = False
@@ -492,7 +628,7 @@ class TestJitteredBackoff:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] <= worker.config.db_retries - 1:
                 raise transient_error
@@ -547,7 +683,7 @@ class TestJitteredBackoff:
             "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
         )
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             # Fail enough times to get 5+ backoff samples across 2 poll cycles
             if call_count[0] < 6:
@@ -615,3 +751,300 @@ class TestTransientDatabaseError:
         assert "Database connection failed" in error_str
         assert "ConnectTimeout" in error_str
         assert "Connect timeout" in error_str
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker state machine."""
+
+    def test_opens_once_failure_rate_is_reached(self) -> None:
+        """The circuit opens after min_calls outcomes at the failure rate."""
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=4, clock=FakeClock())
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+        stats = breaker.stats()
+        assert (stats.trips, stats.short_circuited, stats.failures, stats.calls) == (1, 1, 2, 4)
+
+    def test_old_failures_leave_the_window(self) -> None:
+        """Only outcomes inside the window count towards the failure rate."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=2, window=10, clock=clock)
+        breaker.record_failure()
+        clock.now += 11
+
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+    def test_half_open_probe_closes_or_reopens(self) -> None:
+        """After open_seconds one probe goes through and decides the next state."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_seconds=30, clock=clock)
+        breaker.record_failure()
+        assert breaker.retry_in() == 30
+
+        clock.now += 30
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.stats().trips == 2
+
+        clock.now += 30
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request()
+
+
+class TestCircuitBreakerCalls:
+    """Tests for how database functions use the circuit breaker."""
+
+    @staticmethod
+    def _open_circuit() -> None:
+        breaker = get_circuit_breaker()
+        for _ in range(breaker.min_calls):
+            breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_comment_insert_fails_fast_while_open(self) -> None:
+        """Best-effort comment inserts are skipped without touching the database."""
+        backend = Mock()
+        self._open_circuit()
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with pytest.raises(CircuitOpenError, match="circuit is open"):
+                create_comment(Comment(issue_id=1, comment="Step started"))
+
+        backend.insert_comment.assert_not_called()
+        assert get_circuit_breaker().stats().short_circuited == 1
+
+    def test_comment_insert_timeouts_open_the_circuit(self) -> None:
+        """Timed-out inserts count as failures; rejected ones do not."""
+        from postgrest.exceptions import APIError
+
+        backend = Mock()
+        backend.insert_comment.side_effect = [APIError({"message": "bad row"})] + [
+            httpx.ReadTimeout("timed out")
+        ] * 5
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            for _ in range(6):
+                with pytest.raises((ValueError, httpx.ReadTimeout)):
+                    create_comment(Comment(issue_id=1, comment="Step started"))
+
+        assert get_circuit_breaker().state == "open"
+
+    def test_fetch_issue_retries_with_backoff_while_open(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Critical reads are attempted even while open and retried on outages."""
+        monkeypatch.setenv("ROUGE_DB_RETRIES", "2")
+        backend = Mock()
+        backend.fetch_issue_rows.side_effect = [
+            httpx.ConnectError("refused"),
+            httpx.ReadTimeout("timed out"),
+            [{"id": 7, "description": "Fix it", "status": "pending"}],
+        ]
+        self._open_circuit()
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with patch("rouge.core.database.time.sleep") as mock_sleep:
+                issue = fetch_issue(7)
+
+        assert issue.id == 7
+        assert backend.fetch_issue_rows.call_count == 3
+        assert mock_sleep.call_count == 2
+        first, second = (c.args[0] for c in mock_sleep.call_args_list)
+        assert 0.25 <= first <= 0.5
+        assert 0.5 <= second <= 1.0
+        assert get_circuit_breaker().state == "closed"
+
+    def test_worker_skips_poll_cycle_while_open(self, worker: IssueWorker) -> None:
+        """The claim loop neither claims nor retries while the circuit is open."""
+        self._open_circuit()
+
+        with (
+            patch("rouge.worker.worker.get_next_issue") as mock_get_next,
+            patch("rouge.worker.worker.time.sleep") as mock_sleep,
+            patch("rouge.worker.worker.write_worker_artifact"),
+            patch.object(worker.metrics, "record_poll") as mock_record_poll,
+        ):
+            assert worker._poll_next_issue() is None
+
+        mock_get_next.assert_not_called()
+        mock_sleep.assert_not_called()
+        mock_record_poll.assert_called_once_with("error")
+
+    def test_worker_stops_retrying_once_circuit_opens(self, worker: IssueWorker) -> None:
+        """A circuit that opens during the claim retries ends the poll cycle."""
+        transient_error = TransientDatabaseError(
+            "Database connection timeout", original_error=httpx.ReadTimeout("timeout")
+        )
+
+        def fail_and_open_circuit(*_args, **_kwargs):
+            self._open_circuit()
+            raise transient_error
+
+        with (
+            patch("rouge.worker.worker.get_next_issue", side_effect=fail_and_open_circuit) as mock,
+            patch("rouge.worker.worker.reset_client"),
+            patch("rouge.worker.worker.time.sleep"),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            assert worker._poll_next_issue() is None
+
+        assert mock.call_count == 1
+
+    def test_claim_poll_failures_alone_open_the_circuit(self) -> None:
+        """Timed-out claim polls trip the breaker, after which polls are skipped."""
+        backend = Mock()
+        backend.rpc.side_effect = httpx.ReadTimeout("timed out")
+        breaker = get_circuit_breaker()
+
+        with (
+            patch("rouge.worker.database.get_backend", return_value=backend),
+            patch("rouge.worker.database.reset_client"),
+        ):
+            for _ in range(breaker.min_calls):
+                with pytest.raises(TransientDatabaseError):
+                    get_next_issue("test-worker")
+            assert breaker.state == "open"
+            assert get_next_issue("test-worker") is None
+            assert get_next_issues("test-worker", 5) == []
+
+        assert backend.rpc.call_count == breaker.min_calls
+        assert breaker.stats().short_circuited == 2
+
+    def test_worker_polls_alone_open_the_circuit(self, worker: IssueWorker) -> None:
+        """A worker whose polls keep timing out stops polling once the breaker opens."""
+        backend = Mock()
+        backend.rpc.side_effect = httpx.ReadTimeout("timed out")
+
+        with (
+            patch("rouge.worker.database.get_backend", return_value=backend),
+            patch("rouge.worker.database.reset_client"),
+            patch("rouge.worker.worker.reset_client"),
+            patch("rouge.worker.worker.time.sleep"),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            for _ in range(3):
+                assert worker._poll_next_issue() is None
+
+        assert get_circuit_breaker().state == "open"
+        assert backend.rpc.call_count == get_circuit_breaker().min_calls
+
+    def test_lease_upkeep_runs_while_open_and_feeds_the_breaker(self) -> None:
+        """Lease renewals are never refused, and their failures count."""
+        backend = Mock()
+        backend.rpc.side_effect = [httpx.ConnectError("refused"), [{"issue_id": 7}]]
+        self._open_circuit()
+
+        with patch("rouge.worker.database.get_backend", return_value=backend):
+            assert renew_leases("test-worker", [7], 600) is None
+            assert get_circuit_breaker().state == "open"
+            assert renew_leases("test-worker", [7], 600) == [7]
+
+        assert backend.rpc.call_count == 2
+        assert get_circuit_breaker().state == "closed"
+
+    def test_release_is_skipped_while_open(self) -> None:
+        """Releasing claims is best effort; expired leases hand them back later."""
+        backend = Mock()
+        self._open_circuit()
+
+        with patch("rouge.worker.database.get_backend", return_value=backend):
+            assert release_issues("test-worker", [7, 8]) == []
+
+        backend.rpc.assert_not_called()
+
+    def test_fetch_issue_raises_after_last_retry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The last outage error is raised once retries are used up."""
+        monkeypatch.setenv("ROUGE_DB_RETRIES", "1")
+        backend = Mock()
+        backend.fetch_issue_rows.side_effect = httpx.ConnectError("refused")
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with patch("rouge.core.database.time.sleep"):
+                with pytest.raises(httpx.ConnectError):
+                    fetch_issue(7)
+
+        assert backend.fetch_issue_rows.call_count == 2
+
+    def test_transition_retry_accepts_transition_applied_before_timeout(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A retried compare-and-set that finds its own result is not a conflict."""
+        monkeypatch.setenv("ROUGE_DB_RETRIES", "1")
+        backend = Mock()
+        backend.rpc.side_effect = [
+            httpx.ReadTimeout("timed out"),
+            [
+                {
+                    "previous_issue": {"id": 7, "description": "Fix it", "status": "started"},
+                    "issue": None,
+                }
+            ],
+        ]
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with patch("rouge.core.database.time.sleep"):
+                issue = transition_issue_status(7, "started", expected_status="claimed")
+
+        assert issue.status == "started"
+        assert backend.rpc.call_count == 2
+
+    def test_transition_retry_still_reports_real_conflicts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A retry that finds another status raises the conflict as before."""
+        monkeypatch.setenv("ROUGE_DB_RETRIES", "1")
+        backend = Mock()
+        backend.rpc.side_effect = [
+            psycopg2.OperationalError("server closed the connection"),
+            [
+                {
+                    "previous_issue": {"id": 7, "description": "Fix it", "status": "pending"},
+                    "issue": None,
+                }
+            ],
+        ]
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with patch("rouge.core.database.time.sleep"):
+                with pytest.raises(IssueStatusConflictError) as exc_info:
+                    transition_issue_status(7, "started", expected_status="claimed")
+
+        assert exc_info.value.actual_status == "pending"
+
+    def test_transition_first_attempt_conflict_is_not_reconciled(self) -> None:
+        """Without a retry, finding the target status is a genuine conflict."""
+        backend = Mock()
+        backend.rpc.return_value = [
+            {
+                "previous_issue": {"id": 7, "description": "Fix it", "status": "started"},
+                "issue": None,
+            }
+        ]
+
+        with patch("rouge.core.database.get_backend", return_value=backend):
+            with pytest.raises(IssueStatusConflictError):
+                transition_issue_status(7, "started", expected_status="claimed")
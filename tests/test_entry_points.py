@@ -0,0 +1,27 @@
+"""Tests that the console script entry points import cleanly.
+
+Each module is imported in a fresh interpreter, because an import cycle only
+shows up when its modules are imported in a particular order and the test
+session has already imported most of the package.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["rouge.cli.cli", "rouge.adw.cli", "rouge.worker.cli", "rouge.core.database"],
+)
+def test_module_imports_in_fresh_interpreter(module: str) -> None:
+    """Test the module imports on its own without an import cycle."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
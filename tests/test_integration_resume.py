@@ -183,7 +183,7 @@ class TestEndToEndResumeFlow:
                 assert "adw-resume-123" in result.output
 
                 # Verify issue status was updated to started
-                mock_update.assert_called_once_with(123, "started")
+                mock_update.assert_called_once_with(123, "started", expected_status="failed")
 
                 # Verify execute_adw_workflow was called with correct params
                 mock_execute.assert_called_once_with(
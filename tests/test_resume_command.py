@@ -326,7 +326,9 @@ class TestResumeCommandWorkflowInvocation:
             result = runner.invoke(app, ["resume", "888"])
 
             assert result.exit_code == 0
-            mock_transition_issue_status.assert_called_once_with(888, "started")
+            mock_transition_issue_status.assert_called_once_with(
+                888, "started", expected_status="failed"
+            )
 
     @patch("rouge.cli.resume.execute_adw_workflow")
     @patch("rouge.cli.resume.transition_issue_status")
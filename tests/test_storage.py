@@ -0,0 +1,223 @@
+"""Tests for the storage backends behind the hot database paths."""
+
+import gc
+from unittest.mock import MagicMock, Mock, patch
+
+import psycopg2
+import psycopg2.extras
+import pytest
+from postgrest.exceptions import APIError
+
+from rouge.core import database
+from rouge.core.database import get_backend, reset_client
+from rouge.core.storage import PostgresBackend, SupabaseBackend
+
+
+@pytest.fixture
+def fake_conn() -> MagicMock:
+    """Create a psycopg2-like connection whose cursor returns one row."""
+    conn = MagicMock()
+    conn.closed = 0
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.description = [("id",)]
+    cursor.fetchall.return_value = [{"id": 1}]
+    return conn
+
+
+@pytest.fixture
+def pool(fake_conn: MagicMock):
+    """Patch the psycopg2 pool to hand out the fake connection."""
+    with patch("rouge.core.storage.psycopg2.pool.ThreadedConnectionPool") as pool_cls:
+        pool_cls.return_value.getconn.return_value = fake_conn
+        yield pool_cls.return_value
+
+
+def _statements(conn: MagicMock) -> list[str]:
+    cursor = conn.cursor.return_value.__enter__.return_value
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+class TestPostgresBackend:
+    """Tests for PostgresBackend."""
+
+    def test_prepares_each_statement_once_per_connection(
+        self, pool: MagicMock, fake_conn: MagicMock
+    ) -> None:
+        """Repeated calls reuse the prepared statement and return plain dicts."""
+        backend = PostgresBackend("postgresql://db", pool_size=1)
+
+        assert backend.fetch_issue_rows(1, "*") == [{"id": 1}]
+        assert backend.fetch_issue_rows(2, "*") == [{"id": 1}]
+
+        statements = _statements(fake_conn)
+        assert len(statements) == 3
+        assert statements[0].startswith("prepare rouge_")
+        assert statements[0].endswith("as select * from public.issues where id = $1")
+        name = statements[0].split()[1]
+        assert statements[1:] == [f"execute {name}(%s)"] * 2
+        assert fake_conn.autocommit is True
+        assert pool.putconn.call_count == 2
+
+    def test_rpc_uses_named_arguments(self, pool: MagicMock, fake_conn: MagicMock) -> None:
+        """RPC parameters bind by name and dicts are sent as jsonb."""
+        backend = PostgresBackend("postgresql://db")
+
+        backend.rpc("transition_issue_status", {"p_issue_id": 3, "p_fields": {"branch": "b"}})
+
+        statements = _statements(fake_conn)
+        assert statements[0].endswith(
+            "as select * from public.transition_issue_status(p_issue_id => $1, p_fields => $2)"
+        )
+        cursor = fake_conn.cursor.return_value.__enter__.return_value
+        args = cursor.execute.call_args.args[1]
+        assert args[0] == 3
+        assert isinstance(args[1], psycopg2.extras.Json)
+
+    def test_insert_comments_binds_every_row(self, pool: MagicMock, fake_conn: MagicMock) -> None:
+        """A batch is one multi-row insert that can skip duplicate client keys."""
+        backend = PostgresBackend("postgresql://db")
+        rows = [
+            {"issue_id": 1, "comment": "a", "client_key": "k1"},
+            {"issue_id": 1, "comment": "b", "client_key": "k2"},
+        ]
+
+        backend.insert_comments(rows, ignore_duplicates=True)
+
+        statements = _statements(fake_conn)
+        assert statements[0].endswith(
+            "insert into public.comments (issue_id, comment, client_key) "
+            "values ($1, $2, $3), ($4, $5, $6) on conflict (client_key) do nothing returning *"
+        )
+        cursor = fake_conn.cursor.return_value.__enter__.return_value
+        assert cursor.execute.call_args.args[1] == [1, "a", "k1", 1, "b", "k2"]
+
+    def test_rejects_unsafe_identifiers(self, pool: MagicMock) -> None:
+        """Column and function names are never interpolated unchecked."""
+        backend = PostgresBackend("postgresql://db")
+
+        with pytest.raises(ValueError, match="Invalid SQL identifier"):
+            backend.update_issue_rows(1, {"status; drop table issues": "x"})
+        with pytest.raises(ValueError, match="Invalid SQL identifier"):
+            backend.rpc("Bad-Name", {})
+        pool.getconn.assert_not_called()
+
+    def test_connection_errors_discard_the_connection(
+        self, pool: MagicMock, fake_conn: MagicMock
+    ) -> None:
+        """A broken connection is closed and its statements prepared again later."""
+        backend = PostgresBackend("postgresql://db")
+        cursor = fake_conn.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = [None, psycopg2.OperationalError("server closed")]
+
+        with pytest.raises(psycopg2.OperationalError):
+            backend.issue_exists(1)
+
+        pool.putconn.assert_called_once_with(fake_conn, close=True)
+        cursor.execute.side_effect = None
+        backend.issue_exists(1)
+        assert _statements(fake_conn)[2].startswith("prepare rouge_")
+
+    def test_least_recently_used_statement_is_deallocated(
+        self, pool: MagicMock, fake_conn: MagicMock
+    ) -> None:
+        """A full connection deallocates its least recently used statement."""
+        backend = PostgresBackend("postgresql://db")
+
+        with patch("rouge.core.storage.MAX_PREPARED_STATEMENTS", 2):
+            backend.issue_exists(1)
+            backend.fetch_issue_rows(1, "*")
+            backend.issue_exists(2)
+            backend.rpc("touch_issue", {"p_issue_id": 1})
+
+        statements = _statements(fake_conn)
+        exists_name = statements[0].split()[1]
+        fetch_name = statements[2].split()[1]
+        assert statements[5] == f"deallocate {fetch_name}"
+        assert statements[6].startswith("prepare rouge_")
+        assert f"deallocate {exists_name}" not in statements
+        assert list(backend._prepared[fake_conn]) == [
+            exists_name,
+            statements[6].split()[1],
+        ]
+
+    def test_prepared_statements_are_forgotten_with_the_connection(self) -> None:
+        """A connection the pool drops takes its prepared statement names with it."""
+
+        class Pool:
+            def __init__(self, *_args: object) -> None:
+                self.conn: MagicMock | None = MagicMock(closed=0)
+
+            def getconn(self) -> MagicMock | None:
+                return self.conn
+
+            def putconn(self, conn: MagicMock, close: bool = False) -> None:
+                pass
+
+        with patch("rouge.core.storage.psycopg2.pool.ThreadedConnectionPool", Pool):
+            backend = PostgresBackend("postgresql://db")
+        backend.issue_exists(1)
+        assert len(backend._prepared) == 1
+
+        backend._pool.conn = None
+        gc.collect()
+
+        assert len(backend._prepared) == 0
+
+    def test_statement_errors_raise_api_error(self, pool: MagicMock, fake_conn: MagicMock) -> None:
+        """Errors reported by Postgres surface like PostgREST errors."""
+        backend = PostgresBackend("postgresql://db")
+        cursor = fake_conn.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = psycopg2.IntegrityError("duplicate key value")
+
+        with pytest.raises(APIError, match="duplicate key value"):
+            backend.insert_comment({"issue_id": 1, "comment": "a"})
+
+        pool.putconn.assert_called_once_with(fake_conn)
+
+
+class TestGetBackend:
+    """Tests for backend selection."""
+
+    def test_defaults_to_supabase(self) -> None:
+        """Without ROUGE_DB_BACKEND, calls go through the Supabase client."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = [{"issue_id": 1}]
+
+        with patch("rouge.core.database.get_client", return_value=mock_client):
+            backend = get_backend()
+            assert isinstance(backend, SupabaseBackend)
+            assert backend.rpc("reap_expired_leases", {"p_max_attempts": 3}) == [{"issue_id": 1}]
+
+        mock_client.rpc.assert_called_once_with("reap_expired_leases", {"p_max_attempts": 3})
+
+    def test_postgres_requires_database_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The postgres backend needs a connection string."""
+        monkeypatch.setenv("ROUGE_DB_BACKEND", "postgres")
+        monkeypatch.delenv("ROUGE_DATABASE_URL", raising=False)
+
+        with pytest.raises(ValueError, match="ROUGE_DATABASE_URL"):
+            get_backend()
+
+    def test_rejects_unknown_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Typos in ROUGE_DB_BACKEND fail loudly instead of falling back."""
+        monkeypatch.setenv("ROUGE_DB_BACKEND", "mysql")
+
+        with pytest.raises(ValueError, match="ROUGE_DB_BACKEND"):
+            get_backend()
+
+    def test_postgres_backend_is_shared_until_reset(
+        self, monkeypatch: pytest.MonkeyPatch, pool: MagicMock
+    ) -> None:
+        """One pool serves the process; reset_client() closes it."""
+        monkeypatch.setenv("ROUGE_DB_BACKEND", "postgres")
+        monkeypatch.setenv("ROUGE_DATABASE_URL", "postgresql://db")
+        monkeypatch.setenv("ROUGE_DATABASE_POOL_SIZE", "4")
+
+        backend = get_backend()
+        assert isinstance(backend, PostgresBackend)
+        assert get_backend() is backend
+
+        reset_client()
+
+        pool.closeall.assert_called_once()
+        assert database._postgres_backend is None
@@ -1,5 +1,6 @@
 """Tests for the CAPE issue worker daemon."""
 
+import itertools
 import os
 import subprocess
 import sys
@@ -9,6 +10,7 @@ import httpx
 import pytest
 from typer.testing import CliRunner
 
+from rouge.core.database import IssueStatusConflictError
 from rouge.worker import database
 from rouge.worker.cli import app as worker_app
 from rouge.worker.config import WorkerConfig
@@ -38,6 +40,19 @@ def worker(mock_env: None, worker_config: WorkerConfig) -> IssueWorker:
         return worker
 
 
+def artifact_rewritten_each_poll():
+    """Patch the change check so every poll iteration sees a rewritten state.json.
+
+    The worker only re-reads its artifact when the file changes; tests that
+    patch read_worker_artifact use this so the patched artifact is picked up.
+    """
+    signatures = itertools.count()
+    return patch(
+        "rouge.worker.worker.worker_artifact_signature",
+        side_effect=lambda _worker_id: (next(signatures), 0, 0),
+    )
+
+
 class TestIssueWorkerInit:
     """Tests for IssueWorker initialization."""
 
@@ -179,6 +194,98 @@ class TestGetNextIssue:
                 mock_reset.assert_called_once()
 
 
+class TestGetNextIssues:
+    """Tests for the batch-claim get_next_issues and release_issues functions."""
+
+    def test_get_next_issues_success(self, mock_env) -> None:
+        """Test claiming several issues in one RPC call."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = [
+            {
+                "issue_id": 1,
+                "issue_description": "First",
+                "issue_status": "claimed",
+                "issue_type": "thin",
+                "issue_adw_id": "adw-1",
+            },
+            {
+                "issue_id": 2,
+                "issue_description": "Second",
+                "issue_status": "claimed",
+                "issue_type": "direct",
+            },
+        ]
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            result = database.get_next_issues("test-worker", 5)
+
+        assert result == [
+            (1, "First", "claimed", "thin", "adw-1"),
+            (2, "Second", "claimed", "direct", None),
+        ]
+        mock_client.rpc.assert_called_once_with(
+            "get_and_lock_next_issues", {"p_worker_id": "test-worker", "p_limit": 5}
+        )
+
+    def test_get_next_issues_empty(self, mock_env) -> None:
+        """Test an empty queue returns an empty list."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = []
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.get_next_issues("test-worker", 5) == []
+
+    def test_get_next_issues_rejects_invalid_limit(self, mock_env) -> None:
+        """Test limit must be at least 1."""
+        with pytest.raises(ValueError, match="limit must be >= 1"):
+            database.get_next_issues("test-worker", 0)
+
+    def test_get_next_issues_database_error(self, mock_env) -> None:
+        """Test non-transient errors return an empty list."""
+        mock_client = Mock()
+        mock_client.rpc.side_effect = Exception("boom")
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.get_next_issues("test-worker", 5) == []
+
+    def test_get_next_issues_httpx_timeout(self, mock_env) -> None:
+        """Test transient errors reset the client and raise TransientDatabaseError."""
+        mock_client = Mock()
+        mock_client.rpc.side_effect = httpx.ReadTimeout("Request timed out")
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            with patch("rouge.worker.database.reset_client") as mock_reset:
+                with pytest.raises(TransientDatabaseError):
+                    database.get_next_issues("test-worker", 5)
+                mock_reset.assert_called_once()
+
+    def test_release_issues_success(self, mock_env) -> None:
+        """Test releasing claims returns the released IDs."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = [{"issue_id": 3}]
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.release_issues("test-worker", [3, 4]) == [3]
+
+        mock_client.rpc.assert_called_once_with(
+            "release_claimed_issues", {"p_worker_id": "test-worker", "p_issue_ids": [3, 4]}
+        )
+
+    def test_release_issues_empty_skips_rpc(self, mock_env) -> None:
+        """Test releasing nothing makes no RPC call."""
+        with patch("rouge.worker.database.get_client") as mock_get_client:
+            assert database.release_issues("test-worker", []) == []
+            mock_get_client.assert_not_called()
+
+    def test_release_issues_database_error(self, mock_env) -> None:
+        """Test release errors are logged and return an empty list."""
+        mock_client = Mock()
+        mock_client.rpc.side_effect = Exception("boom")
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.release_issues("test-worker", [3]) == []
+
+
 class TestExecuteWorkflow:
     """Tests for execute_workflow method."""
 
@@ -195,8 +302,12 @@ class TestExecuteWorkflow:
 
                 assert result is True
                 assert mock_update.call_count == 2
-                mock_update.assert_any_call(123, "started", worker.logger)
-                mock_update.assert_any_call(123, "completed", worker.logger)
+                mock_update.assert_any_call(
+                    123, "started", worker.logger, expected_status="claimed"
+                )
+                mock_update.assert_any_call(
+                    123, "completed", worker.logger, expected_status="started"
+                )
 
     def test_execute_workflow_failure(self, worker) -> None:
         """Test workflow execution failure."""
@@ -211,8 +322,10 @@ class TestExecuteWorkflow:
 
                 assert result is False
                 assert mock_update.call_count == 2
-                mock_update.assert_any_call(123, "started", worker.logger)
-                mock_update.assert_any_call(123, "failed", worker.logger)
+                mock_update.assert_any_call(
+                    123, "started", worker.logger, expected_status="claimed"
+                )
+                mock_update.assert_any_call(123, "failed", worker.logger, expected_status="started")
 
     def test_execute_workflow_timeout(self, worker) -> None:
         """Test workflow execution timeout."""
@@ -222,8 +335,10 @@ class TestExecuteWorkflow:
 
                 assert result is False
                 assert mock_update.call_count == 2
-                mock_update.assert_any_call(123, "started", worker.logger)
-                mock_update.assert_any_call(123, "failed", worker.logger)
+                mock_update.assert_any_call(
+                    123, "started", worker.logger, expected_status="claimed"
+                )
+                mock_update.assert_any_call(123, "failed", worker.logger, expected_status="started")
 
     def test_execute_workflow_exception(self, worker) -> None:
         """Test workflow execution with unexpected exception."""
@@ -233,14 +348,16 @@ class TestExecuteWorkflow:
 
                 assert result is False
                 assert mock_update.call_count == 2
-                mock_update.assert_any_call(123, "started", worker.logger)
-                mock_update.assert_any_call(123, "failed", worker.logger)
+                mock_update.assert_any_call(
+                    123, "started", worker.logger, expected_status="claimed"
+                )
+                mock_update.assert_any_call(123, "failed", worker.logger, expected_status="started")
 
     def test_execute_workflow_calls_started_before_subprocess(self, worker) -> None:
         """Test worker transitions issue to 'started' before launching subprocess."""
         call_order: list[str] = []
 
-        def track_update(_issue_id: int, status: str, _logger: object) -> None:
+        def track_update(_issue_id: int, status: str, _logger: object, **_kwargs: object) -> None:
             call_order.append(f"update:{status}")
 
         def track_subprocess(*_args: object, **_kwargs: object) -> Mock:
@@ -255,6 +372,36 @@ class TestExecuteWorkflow:
 
         assert call_order.index("update:started") < call_order.index("subprocess")
 
+    def test_execute_workflow_skips_issue_no_longer_claimed(self, worker) -> None:
+        """Test a rejected claimed -> started transition stops the workflow from running."""
+        with (
+            patch("subprocess.run") as mock_run,
+            patch(
+                "rouge.worker.worker.update_issue_status",
+                side_effect=IssueStatusConflictError(123, "claimed", "pending"),
+            ) as mock_update,
+        ):
+            assert worker.execute_workflow(123, "Test issue", "claimed", "full") is False
+
+        mock_run.assert_not_called()
+        mock_update.assert_called_once_with(
+            123, "started", worker.logger, expected_status="claimed"
+        )
+        assert worker.worker_artifact.state == "ready"
+        assert worker.worker_artifact.current_issue_id is None
+
+    def test_execute_workflow_logs_rejected_final_status(self, worker) -> None:
+        """Test a rejected started -> completed transition is logged as an error."""
+        conflict = IssueStatusConflictError(123, "started", "pending")
+        with (
+            patch("subprocess.run", return_value=Mock(returncode=0)),
+            patch("rouge.worker.worker.update_issue_status", side_effect=[True, conflict]),
+            patch.object(worker.logger, "error") as mock_error,
+        ):
+            assert worker.execute_workflow(123, "Test issue", "claimed", "full") is True
+
+        assert "STATUS_CONFLICT" in mock_error.call_args.args[0]
+
     def test_execute_workflow_command_format(self, worker) -> None:
         """Test workflow command is formatted correctly."""
         mock_result = Mock()
@@ -366,6 +513,23 @@ class TestUpdateIssueStatus:
             database.update_issue_status(123, "claimed")
             mock_transition.assert_called_once_with(123, "claimed")
 
+    def test_update_issue_status_passes_expected_status(self, mock_env) -> None:
+        """Test the compare-and-set guard is forwarded when given."""
+        with patch("rouge.worker.database._transition_issue_status") as mock_transition:
+            assert database.update_issue_status(123, "started", expected_status="claimed")
+            mock_transition.assert_called_once_with(123, "started", expected_status="claimed")
+
+    def test_update_issue_status_conflict_raises(self, mock_env) -> None:
+        """Test a lost compare-and-set is raised to the caller rather than swallowed."""
+        with (
+            patch(
+                "rouge.worker.database._transition_issue_status",
+                side_effect=IssueStatusConflictError(123, "claimed", "pending"),
+            ),
+            pytest.raises(IssueStatusConflictError),
+        ):
+            database.update_issue_status(123, "started", expected_status="claimed")
+
     def test_update_issue_status_database_error(self, mock_env) -> None:
         """Test handling database errors during status update."""
         with patch(
@@ -519,6 +683,39 @@ class TestCommandLineInterface:
             assert config.log_level == "DEBUG"
             mock_worker.run.assert_called_once()
 
+    def test_slots_from_cli(self, mock_env) -> None:
+        """Test --slots flag is parsed and passed to WorkerConfig."""
+        runner = CliRunner()
+
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(worker_app, ["--worker-id", "test-worker", "--slots", "4"])
+
+            assert result.exit_code == 0, result.output
+            config = mock_worker_class.call_args[0][0]
+            assert config.slots == 4
+
+    def test_slots_invalid_from_cli(self, mock_env) -> None:
+        """Test --slots rejects non-positive values."""
+        runner = CliRunner()
+
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(worker_app, ["--worker-id", "test-worker", "--slots", "0"])
+
+            assert result.exit_code == 1
+            assert "slots must be positive" in result.output
+            mock_worker_class.assert_not_called()
+
+    def test_claim_batch_from_cli(self, mock_env) -> None:
+        """Test --claim-batch flag is parsed and passed to WorkerConfig."""
+        runner = CliRunner()
+
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(worker_app, ["--worker-id", "test-worker", "--claim-batch", "8"])
+
+            assert result.exit_code == 0, result.output
+            config = mock_worker_class.call_args[0][0]
+            assert config.claim_batch_size == 8
+
     def test_workflow_timeout_from_cli(self, mock_env) -> None:
         """Test workflow-timeout flag is parsed and passed to WorkerConfig."""
         runner = CliRunner()
@@ -1085,6 +1282,16 @@ class TestWorkerConfig:
         with pytest.raises(ValueError, match="worker_id cannot contain path separators"):
             WorkerConfig(worker_id="parent/child", poll_interval=10)
 
+    def test_config_invalid_slots(self) -> None:
+        """Test configuration with a non-positive slot count."""
+        with pytest.raises(ValueError, match="slots must be positive"):
+            WorkerConfig(worker_id="test", slots=0)
+
+    def test_config_invalid_claim_batch_size(self) -> None:
+        """Test configuration with a non-positive claim batch size."""
+        with pytest.raises(ValueError, match="claim_batch_size must be positive"):
+            WorkerConfig(worker_id="test", claim_batch_size=0)
+
     def test_config_invalid_poll_interval(self) -> None:
         """Test configuration with invalid poll_interval."""
         with pytest.raises(ValueError, match="poll_interval must be positive"):
@@ -1116,7 +1323,7 @@ class TestWorkerStateTransitions:
                     # Mock the artifact writes to capture state changes
                     write_calls = []
 
-                    def capture_write(artifact):
+                    def capture_write(artifact, fsync=True):
                         write_calls.append(artifact.model_copy(deep=True))
 
                     with patch(
@@ -1144,7 +1351,7 @@ class TestWorkerStateTransitions:
                 with patch("rouge.worker.worker.make_adw_id", return_value="test-adw-456"):
                     write_calls = []
 
-                    def capture_write(artifact):
+                    def capture_write(artifact, fsync=True):
                         write_calls.append(artifact.model_copy(deep=True))
 
                     with patch(
@@ -1169,7 +1376,7 @@ class TestWorkerStateTransitions:
                 with patch("rouge.worker.worker.make_adw_id", return_value="test-adw-789"):
                     write_calls = []
 
-                    def capture_write(artifact):
+                    def capture_write(artifact, fsync=True):
                         write_calls.append(artifact.model_copy(deep=True))
 
                     with patch(
@@ -1192,7 +1399,7 @@ class TestWorkerStateTransitions:
                 with patch("rouge.worker.worker.make_adw_id", return_value="test-adw-timeout"):
                     write_calls = []
 
-                    def capture_write(artifact):
+                    def capture_write(artifact, fsync=True):
                         write_calls.append(artifact.model_copy(deep=True))
 
                     with patch(
@@ -1214,7 +1421,7 @@ class TestWorkerStateTransitions:
                 with patch("rouge.worker.worker.make_adw_id", return_value="test-adw-error"):
                     write_calls = []
 
-                    def capture_write(artifact):
+                    def capture_write(artifact, fsync=True):
                         write_calls.append(artifact.model_copy(deep=True))
 
                     with patch(
@@ -1236,7 +1443,7 @@ class TestWorkerStateTransitions:
 
         write_calls = []
 
-        def capture_write(artifact):
+        def capture_write(artifact, fsync=True):
             write_calls.append(artifact.model_copy(deep=True))
 
         with patch("subprocess.run", return_value=mock_result):
@@ -1350,7 +1557,7 @@ class TestWorkerPollLoopGating:
         worker.running = True
         call_count = [0]
 
-        def mock_get_next_issue(worker_id, logger):
+        def mock_get_next_issue(worker_id, logger, lease_seconds=None):
             call_count[0] += 1
             if call_count[0] >= 1:
                 # Stop after first poll to verify it was called
@@ -1465,6 +1672,7 @@ class TestWorkerPollLoopGating:
                 return ready_artifact
 
         with (
+            artifact_rewritten_each_poll(),
             patch("rouge.worker.worker.read_worker_artifact", side_effect=side_effect),
             patch("rouge.worker.worker.get_next_issue", return_value=None),
             patch("rouge.worker.worker.time"),
@@ -1482,12 +1690,15 @@ class TestWorkerPollLoopGating:
             if call_count[0] >= 2:
                 worker.running = False
 
-        with patch("rouge.worker.worker.read_worker_artifact", return_value=None):
-            with patch("rouge.worker.worker.time.sleep", side_effect=mock_sleep):
-                with patch("rouge.worker.worker.get_next_issue") as mock_get_next:
-                    worker.run()
+        with (
+            artifact_rewritten_each_poll(),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.time.sleep", side_effect=mock_sleep),
+            patch("rouge.worker.worker.get_next_issue") as mock_get_next,
+        ):
+            worker.run()
 
-                    mock_get_next.assert_not_called()
+        mock_get_next.assert_not_called()
 
 
 class TestWorkerResetCLI:
@@ -1547,3 +1758,400 @@ class TestWorkerResetCLI:
         assert result.exit_code == 0
         # Step 4 removed typer.echo; transition is now logged via transition_worker_artifact
         mock_transition.assert_called_once_with(working_artifact, "ready", clear_issue=True)
+
+
+@pytest.fixture
+def slot_worker(mock_env: None) -> IssueWorker:
+    """Create a worker configured with three concurrent slots."""
+    config = WorkerConfig(worker_id="test-slot-worker", poll_interval=5, log_level="DEBUG", slots=3)
+    with patch("rouge.worker.worker.read_worker_artifact", return_value=None):
+        with patch("rouge.worker.worker.write_worker_artifact"):
+            return IssueWorker(config)
+
+
+def _mock_process(pid: int, returncode: int | None = None) -> Mock:
+    """Create a Popen-like mock whose poll() returns returncode."""
+    process = Mock()
+    process.pid = pid
+    process.poll.return_value = returncode
+    return process
+
+
+class TestWorkerSlots:
+    """Tests for multi-slot concurrent execution."""
+
+    def test_new_artifact_has_configured_slots(self, slot_worker) -> None:
+        """Test a fresh multi-slot worker artifact tracks one entry per slot."""
+        assert slot_worker.worker_artifact is not None
+        assert [slot.index for slot in slot_worker.worker_artifact.slots] == [0, 1, 2]
+        assert all(slot.state == "idle" for slot in slot_worker.worker_artifact.slots)
+
+    def test_fill_slots_claims_until_slots_full(self, slot_worker) -> None:
+        """Test the worker keeps claiming while slots are free."""
+        issues = [(i, f"Issue {i}", "claimed", "thin", f"adw-{i}") for i in (1, 2, 3, 4)]
+        processes = [_mock_process(100 + i) for i in range(3)]
+
+        with (
+            patch("rouge.worker.worker.get_next_issue", side_effect=issues) as mock_next,
+            patch("rouge.worker.worker.subprocess.Popen", side_effect=processes) as mock_popen,
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            claimed = slot_worker._fill_slots()
+
+        assert claimed is True
+        assert mock_next.call_count == 3
+        assert mock_popen.call_count == 3
+        assert sorted(slot_worker._slot_processes) == [0, 1, 2]
+        for issue_id in (1, 2, 3):
+            mock_update.assert_any_call(
+                issue_id, "started", slot_worker.logger, expected_status="claimed"
+            )
+        slots = slot_worker.worker_artifact.slots
+        assert [slot.issue_id for slot in slots] == [1, 2, 3]
+        assert [slot.pid for slot in slots] == [100, 101, 102]
+        assert slot_worker.worker_artifact.state == "working"
+
+    def test_fill_slots_defers_poll_after_empty_queue(self, slot_worker) -> None:
+        """Test an empty poll defers further claims by the poll interval."""
+        with (
+            patch("rouge.worker.worker.get_next_issue", return_value=None) as mock_next,
+            patch("rouge.worker.worker.subprocess.Popen") as mock_popen,
+        ):
+            assert slot_worker._fill_slots() is False
+            assert slot_worker._fill_slots() is False
+
+        mock_next.assert_called_once()
+        mock_popen.assert_not_called()
+
+    def test_reap_slots_completes_finished_child(self, slot_worker) -> None:
+        """Test a finished child frees its slot and completes the issue."""
+        process = _mock_process(200)
+        with (
+            patch(
+                "rouge.worker.worker.get_next_issue",
+                side_effect=[(5, "d", "claimed", "full", "adw-5"), None],
+            ),
+            patch("rouge.worker.worker.subprocess.Popen", return_value=process),
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            slot_worker._fill_slots()
+            slot_worker._reap_slots()
+            assert slot_worker._slot_processes  # still running, nothing reaped
+
+            process.poll.return_value = 0
+            slot_worker._reap_slots()
+
+        assert slot_worker._slot_processes == {}
+        mock_update.assert_any_call(5, "completed", slot_worker.logger, expected_status="started")
+        assert slot_worker.worker_artifact.slots[0].state == "idle"
+        assert slot_worker.worker_artifact.state == "ready"
+
+    def test_reap_slots_marks_failed_child(self, slot_worker) -> None:
+        """Test a non-zero exit fails the issue and keeps slot details for debugging."""
+        process = _mock_process(300, returncode=2)
+        with (
+            patch(
+                "rouge.worker.worker.get_next_issue",
+                side_effect=[(6, "d", "claimed", "full", "adw-6"), None],
+            ),
+            patch("rouge.worker.worker.subprocess.Popen", return_value=process),
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            slot_worker._fill_slots()
+            slot_worker._reap_slots()
+
+        mock_update.assert_any_call(6, "failed", slot_worker.logger, expected_status="started")
+        slot = slot_worker.worker_artifact.slots[0]
+        assert slot.state == "failed"
+        assert slot.issue_id == 6
+        assert slot.adw_id == "adw-6"
+        assert slot_worker.worker_artifact.state == "failed"
+        assert slot_worker.worker_artifact.current_issue_id == 6
+
+    def test_reap_slots_kills_timed_out_child(self, slot_worker) -> None:
+        """Test children running past the workflow timeout are killed and failed."""
+        process = _mock_process(400)
+        with (
+            patch(
+                "rouge.worker.worker.get_next_issue",
+                side_effect=[(7, "d", "claimed", "full", "adw-7"), None],
+            ),
+            patch("rouge.worker.worker.subprocess.Popen", return_value=process),
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            slot_worker._fill_slots()
+            slot_worker._slot_processes[0].deadline = 0.0
+            slot_worker._reap_slots()
+
+        process.kill.assert_called_once()
+        process.wait.assert_called_once()
+        mock_update.assert_any_call(7, "failed", slot_worker.logger, expected_status="started")
+        assert slot_worker.worker_artifact.slots[0].state == "failed"
+
+    def test_start_slot_launch_failure_fails_issue(self, slot_worker) -> None:
+        """Test an OSError launching the child fails the issue and the slot."""
+        with (
+            patch("rouge.worker.worker.subprocess.Popen", side_effect=FileNotFoundError("uv")),
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            slot = slot_worker.worker_artifact.slots[0]
+            slot_worker._start_slot(slot, 8, "full", adw_id="adw-8")
+
+        mock_update.assert_any_call(8, "failed", slot_worker.logger, expected_status="started")
+        assert slot.state == "failed"
+        assert slot_worker._slot_processes == {}
+
+    def test_start_slot_frees_slot_when_issue_no_longer_claimed(self, slot_worker) -> None:
+        """Test a rejected claimed -> started transition launches nothing."""
+        with (
+            patch("rouge.worker.worker.subprocess.Popen") as mock_popen,
+            patch(
+                "rouge.worker.worker.update_issue_status",
+                side_effect=IssueStatusConflictError(8, "claimed", "pending"),
+            ),
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+        ):
+            slot_worker._heartbeat.track(8)
+            slot = slot_worker.worker_artifact.slots[0]
+            slot_worker._start_slot(slot, 8, "full", adw_id="adw-8")
+
+        mock_popen.assert_not_called()
+        assert slot.state == "idle"
+        assert slot_worker._heartbeat.held() == []
+        assert slot_worker._slot_processes == {}
+
+    def test_run_slots_drains_children_on_shutdown(self, slot_worker) -> None:
+        """Test the loop stops claiming on shutdown but waits for running children."""
+        process = _mock_process(500)
+        ready = slot_worker.worker_artifact.model_copy(deep=True)
+        sleeps = [0]
+
+        def fake_get_next_issue(_worker_id, _logger, lease_seconds=None):
+            slot_worker.running = False
+            return (9, "d", "claimed", "full", "adw-9")
+
+        def fake_sleep(_seconds):
+            sleeps[0] += 1
+            if sleeps[0] >= 2:
+                process.poll.return_value = 0
+
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=ready),
+            patch(
+                "rouge.worker.worker.get_next_issue", side_effect=fake_get_next_issue
+            ) as mock_next,
+            patch("rouge.worker.worker.subprocess.Popen", return_value=process),
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+            patch("rouge.worker.worker.time.sleep", side_effect=fake_sleep),
+        ):
+            slot_worker.run()
+
+        mock_next.assert_called_once()
+        mock_update.assert_any_call(9, "completed", slot_worker.logger, expected_status="started")
+        assert slot_worker._slot_processes == {}
+
+    def test_run_slots_gates_on_failed_state(self, slot_worker) -> None:
+        """Test a failed multi-slot worker does not poll until reset."""
+        failed = slot_worker.worker_artifact.model_copy(deep=True)
+        failed.state = "failed"
+
+        def fake_sleep(_seconds):
+            slot_worker.running = False
+
+        with (
+            artifact_rewritten_each_poll(),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=failed),
+            patch("rouge.worker.worker.get_next_issue") as mock_next,
+            patch("rouge.worker.worker.time.sleep", side_effect=fake_sleep),
+        ):
+            slot_worker.run()
+
+        mock_next.assert_not_called()
+
+
+@pytest.fixture
+def batch_worker(mock_env: None) -> IssueWorker:
+    """Create a worker that claims up to three issues per poll."""
+    config = WorkerConfig(
+        worker_id="test-batch-worker", poll_interval=5, log_level="DEBUG", claim_batch_size=3
+    )
+    with patch("rouge.worker.worker.read_worker_artifact", return_value=None):
+        with patch("rouge.worker.worker.write_worker_artifact"):
+            return IssueWorker(config)
+
+
+class TestWorkerClaimQueue:
+    """Tests for batch claiming into the worker's local claim queue."""
+
+    def test_poll_serves_batch_from_local_queue(self, batch_worker) -> None:
+        """Test one batch RPC feeds several polls."""
+        batch = [(i, f"Issue {i}", "claimed", "thin", None) for i in (1, 2, 3)]
+
+        with (
+            patch("rouge.worker.worker.get_next_issues", return_value=batch) as mock_batch,
+            patch("rouge.worker.worker.get_next_issue") as mock_single,
+        ):
+            polled = [batch_worker._poll_next_issue() for _ in range(3)]
+
+        assert polled == batch
+        mock_batch.assert_called_once_with(
+            "test-batch-worker", 3, batch_worker.logger, lease_seconds=600
+        )
+        mock_single.assert_not_called()
+
+    def test_poll_returns_none_for_empty_batch(self, batch_worker) -> None:
+        """Test an empty batch yields no issue."""
+        with patch("rouge.worker.worker.get_next_issues", return_value=[]):
+            assert batch_worker._poll_next_issue() is None
+
+    def test_release_claim_queue_releases_unprocessed(self, batch_worker) -> None:
+        """Test queued claims are released and the queue is emptied."""
+        batch = [(i, f"Issue {i}", "claimed", "thin", None) for i in (1, 2, 3)]
+
+        with (
+            patch("rouge.worker.worker.get_next_issues", return_value=batch),
+            patch("rouge.worker.worker.release_issues", return_value=[2, 3]) as mock_release,
+        ):
+            batch_worker._poll_next_issue()
+            batch_worker._release_claim_queue()
+
+        mock_release.assert_called_once_with("test-batch-worker", [2, 3], batch_worker.logger)
+        assert not batch_worker._claim_queue
+
+    def test_run_releases_queue_on_shutdown(self, batch_worker) -> None:
+        """Test claims still queued when the worker stops are released."""
+        ready = WorkerArtifact(worker_id="test-batch-worker", state="ready")
+        batch = [(i, f"Issue {i}", "claimed", "thin", None) for i in (1, 2, 3)]
+
+        def stop_after_first(*_args, **_kwargs):
+            batch_worker.running = False
+            return True
+
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=ready),
+            patch("rouge.worker.worker.get_next_issues", return_value=batch),
+            patch.object(batch_worker, "execute_workflow", side_effect=stop_after_first),
+            patch("rouge.worker.worker.release_issues", return_value=[2, 3]) as mock_release,
+        ):
+            batch_worker.run()
+
+        mock_release.assert_called_once_with("test-batch-worker", [2, 3], batch_worker.logger)
+
+    def test_run_releases_queue_when_failed(self, batch_worker) -> None:
+        """Test entering the failed state releases queued claims."""
+        failed = WorkerArtifact(worker_id="test-batch-worker", state="failed")
+        batch_worker._claim_queue.extend([(4, "Issue 4", "claimed", "thin", None)])
+
+        def fake_sleep(_seconds):
+            batch_worker.running = False
+
+        with (
+            artifact_rewritten_each_poll(),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=failed),
+            patch("rouge.worker.worker.time.sleep", side_effect=fake_sleep),
+            patch("rouge.worker.worker.release_issues", return_value=[4]) as mock_release,
+        ):
+            batch_worker.run()
+
+        mock_release.assert_called_once_with("test-batch-worker", [4], batch_worker.logger)
+
+
+class TestWorkerArtifactCache:
+    """Tests for the in-memory worker artifact and change-based reloads."""
+
+    def test_unchanged_file_is_not_reread(self, worker) -> None:
+        """Test the cached artifact is returned while the file signature is unchanged."""
+        worker._artifact_signature = (1, 100, 50)
+        with (
+            patch("rouge.worker.worker.worker_artifact_signature", return_value=(1, 100, 50)),
+            patch("rouge.worker.worker.read_worker_artifact") as mock_read,
+        ):
+            assert worker._read_artifact() is worker.worker_artifact
+
+        mock_read.assert_not_called()
+
+    def test_changed_file_is_reloaded(self, worker) -> None:
+        """Test an external edit such as ``rouge-worker reset`` is picked up."""
+        reset = WorkerArtifact(worker_id="test-worker", state="ready")
+        worker._artifact_signature = (1, 100, 50)
+        with (
+            patch("rouge.worker.worker.worker_artifact_signature", return_value=(2, 200, 50)),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=reset) as mock_read,
+        ):
+            assert worker._read_artifact() is reset
+
+        mock_read.assert_called_once_with("test-worker")
+        assert worker._artifact_signature == (2, 200, 50)
+
+    def test_unreadable_file_clears_signature(self, worker) -> None:
+        """Test a failed read forces a retry on the next iteration."""
+        worker._artifact_signature = (1, 100, 50)
+        with (
+            patch("rouge.worker.worker.worker_artifact_signature", return_value=(2, 200, 3)),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+        ):
+            assert worker._read_artifact() is None
+
+        assert worker._artifact_signature is None
+
+    def test_transition_respects_fsync_policy(self, mock_env) -> None:
+        """Test artifact_fsync='never' writes transitions without fsync."""
+        config = WorkerConfig(worker_id="test-worker", artifact_fsync="never")
+        with (
+            patch("rouge.worker.database.get_client"),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            never_worker = IssueWorker(config)
+
+        with patch("rouge.worker.worker_artifact.write_worker_artifact") as mock_write:
+            never_worker._transition_artifact("failed")
+
+        mock_write.assert_called_once_with(never_worker.worker_artifact, fsync=False)
+
+    def test_invalid_fsync_policy_rejected(self) -> None:
+        """Test an unknown artifact_fsync value fails validation."""
+        with pytest.raises(ValueError, match="artifact_fsync"):
+            WorkerConfig(worker_id="test-worker", artifact_fsync="sometimes")  # type: ignore[arg-type]
+
+
+class TestCommentSpoolReplay:
+    """Tests for replaying spooled comments between polls."""
+
+    def test_replay_runs_once_per_interval(self, worker) -> None:
+        """Test the spool is replayed at most once per replay interval."""
+        with patch("rouge.worker.worker.replay_comment_spool", return_value=(2, 0)) as mock_replay:
+            worker._replay_comment_spool()
+            worker._replay_comment_spool()
+
+        mock_replay.assert_called_once_with()
+
+    def test_replay_disabled_with_zero_interval(self, mock_env) -> None:
+        """Test comment_replay_interval=0 turns replay off."""
+        config = WorkerConfig(worker_id="test-worker", comment_replay_interval=0)
+        with (
+            patch("rouge.worker.database.get_client"),
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            worker = IssueWorker(config)
+
+        with patch("rouge.worker.worker.replay_comment_spool") as mock_replay:
+            worker._replay_comment_spool()
+        mock_replay.assert_not_called()
+
+    def test_replay_errors_do_not_escape(self, worker) -> None:
+        """Test a failing replay is logged and the worker carries on."""
+        with patch("rouge.worker.worker.replay_comment_spool", side_effect=OSError("disk")):
+            worker._replay_comment_spool()
+
+    def test_rejects_negative_replay_interval(self) -> None:
+        """Test comment_replay_interval must be non-negative."""
+        with pytest.raises(ValueError, match="comment_replay_interval"):
+            WorkerConfig(worker_id="test-worker", comment_replay_interval=-1)
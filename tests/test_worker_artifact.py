@@ -10,8 +10,10 @@ from pydantic import ValidationError
 
 from rouge.worker.worker_artifact import (
     WorkerArtifact,
+    WorkerSlot,
     read_worker_artifact,
     transition_worker_artifact,
+    worker_artifact_signature,
     write_worker_artifact,
 )
 
@@ -493,3 +495,105 @@ class TestTransitionWorkerArtifactLogging:
         assert artifact.state == "ready"
         assert artifact.current_issue_id is None
         assert artifact.current_adw_id is None
+
+    @patch("rouge.worker.worker_artifact.write_worker_artifact")
+    def test_transition_worker_artifact_clear_issue_resets_slots(self, _mock_write) -> None:
+        """Test that clear_issue returns every slot to idle."""
+        working_slot = WorkerSlot(index=0)
+        working_slot.assign(42, "adw-42")
+        failed_slot = WorkerSlot(index=1, state="failed", issue_id=43, adw_id="adw-43")
+        artifact = WorkerArtifact(
+            worker_id="w4",
+            state="failed",
+            slots=[working_slot, failed_slot],
+        )
+        transition_worker_artifact(artifact, "ready", clear_issue=True)
+        assert [slot.state for slot in artifact.slots] == ["idle", "idle"]
+        assert all(slot.issue_id is None and slot.started_at is None for slot in artifact.slots)
+
+
+class TestWorkerSlotModel:
+    """Tests for the WorkerSlot model."""
+
+    def test_slot_defaults_to_idle(self) -> None:
+        """Test a new slot is idle with no workflow details."""
+        slot = WorkerSlot(index=0)
+        assert slot.state == "idle"
+        assert slot.issue_id is None
+        assert slot.adw_id is None
+        assert slot.pid is None
+        assert slot.started_at is None
+
+    def test_slot_rejects_negative_index(self) -> None:
+        """Test slot index must be non-negative."""
+        with pytest.raises(ValidationError):
+            WorkerSlot(index=-1)
+
+    def test_slot_assign_sets_working_details(self) -> None:
+        """Test assign() marks the slot as working on an issue."""
+        slot = WorkerSlot(index=2)
+        slot.assign(7, "adw-7")
+        assert slot.state == "working"
+        assert slot.issue_id == 7
+        assert slot.adw_id == "adw-7"
+        assert isinstance(slot.started_at, datetime)
+
+    def test_artifact_slots_round_trip(self) -> None:
+        """Test slots survive JSON serialization."""
+        slot = WorkerSlot(index=1)
+        slot.assign(9, "adw-9")
+        slot.pid = 1234
+        artifact = WorkerArtifact(
+            worker_id="w5", state="working", slots=[WorkerSlot(index=0), slot]
+        )
+        restored = WorkerArtifact.model_validate_json(artifact.model_dump_json())
+        assert restored.slots == artifact.slots
+
+    def test_artifact_without_slots_field_loads(self) -> None:
+        """Test artifacts written before slots existed still load."""
+        data = json.dumps({"worker_id": "w6", "state": "ready"})
+        artifact = WorkerArtifact.model_validate_json(data)
+        assert artifact.slots == []
+
+
+class TestWorkerArtifactSignature:
+    """Tests for worker_artifact_signature and fsync control."""
+
+    @patch("rouge.worker.worker_artifact._get_worker_artifact_path")
+    def test_signature_missing_file_is_none(self, mock_get_path, tmp_path) -> None:
+        """Test a missing artifact has no signature."""
+        mock_get_path.return_value = tmp_path / "state.json"
+        assert worker_artifact_signature("w7") is None
+
+    def test_signature_invalid_worker_id_is_none(self) -> None:
+        """Test an invalid worker_id has no signature instead of raising."""
+        assert worker_artifact_signature("../escape") is None
+
+    @patch("rouge.worker.worker_artifact._get_worker_artifact_path")
+    def test_signature_changes_on_rewrite(self, mock_get_path, tmp_path) -> None:
+        """Test rewriting the artifact changes its signature."""
+        mock_get_path.return_value = tmp_path / "state.json"
+        artifact = WorkerArtifact(worker_id="w8", state="ready")
+        write_worker_artifact(artifact)
+        first = worker_artifact_signature("w8")
+        assert first is not None
+        assert worker_artifact_signature("w8") == first
+
+        artifact.state = "failed"
+        write_worker_artifact(artifact)
+        assert worker_artifact_signature("w8") != first
+
+    @patch("rouge.worker.worker_artifact.os.fsync")
+    @patch("rouge.worker.worker_artifact._get_worker_artifact_path")
+    def test_write_without_fsync(self, mock_get_path, mock_fsync, tmp_path) -> None:
+        """Test fsync=False still writes the artifact but skips fsync."""
+        artifact_path = tmp_path / "state.json"
+        mock_get_path.return_value = artifact_path
+        artifact = WorkerArtifact(worker_id="w9", state="ready")
+
+        assert write_worker_artifact(artifact, fsync=False) is True
+        mock_fsync.assert_not_called()
+        assert json.loads(artifact_path.read_text())["worker_id"] == "w9"
+
+        write_worker_artifact(artifact)
+        mock_fsync.assert_called_once()
@@ -0,0 +1,160 @@
+"""Tests for in-process (forked) workflow execution."""
+
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from rouge.worker.cli import app as worker_app
+from rouge.worker.config import WorkerConfig
+from rouge.worker.in_process import ForkedWorkflow, fork_supported
+from rouge.worker.worker import IssueWorker
+
+pytestmark = pytest.mark.skipif(not fork_supported(), reason="requires fork")
+
+
+def _succeed(*_args, **_kwargs) -> tuple[bool, None]:
+    return True, None
+
+
+def _fail(*_args, **_kwargs) -> tuple[bool, None]:
+    return False, None
+
+
+def _raise(*_args, **_kwargs) -> tuple[bool, None]:
+    raise RuntimeError("boom")
+
+
+def _hang(*_args, **_kwargs) -> tuple[bool, None]:
+    time.sleep(60)
+    return True, None
+
+
+@pytest.fixture
+def patched_child():
+    """Keep forked children from configuring real logging or Supabase clients."""
+    with (
+        patch("rouge.worker.in_process.setup_logger"),
+        patch("rouge.worker.in_process.reset_client"),
+    ):
+        yield
+
+
+@pytest.fixture
+def in_process_worker(monkeypatch: pytest.MonkeyPatch) -> IssueWorker:
+    """Create a worker configured for in-process execution."""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+    config = WorkerConfig(worker_id="test-in-process", in_process=True, workflow_timeout=30)
+    with (
+        patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+        patch("rouge.worker.worker.write_worker_artifact"),
+    ):
+        return IssueWorker(config)
+
+
+@pytest.mark.usefixtures("patched_child")
+class TestForkedWorkflow:
+    """Tests for ForkedWorkflow against real forked children."""
+
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        [(_succeed, 0), (_fail, 1), (_raise, 1)],
+    )
+    def test_exit_code_reflects_outcome(self, target, expected: int) -> None:
+        """Test the child exits 0 on success and 1 on failure or exception."""
+        with patch("rouge.worker.in_process.execute_adw_workflow", side_effect=target):
+            workflow = ForkedWorkflow(1, "adw12345", "full")
+            assert workflow.pid is not None
+            assert workflow.wait(timeout=10) == expected
+            assert workflow.poll() == expected
+
+    def test_wait_timeout_and_kill(self) -> None:
+        """Test wait raises TimeoutExpired and kill terminates the child."""
+        with patch("rouge.worker.in_process.execute_adw_workflow", side_effect=_hang):
+            workflow = ForkedWorkflow(1, "adw12345", "full")
+            with pytest.raises(subprocess.TimeoutExpired):
+                workflow.wait(timeout=0.1)
+            assert workflow.poll() is None
+            workflow.kill()
+            assert workflow.wait(timeout=10) < 0
+
+
+class TestInProcessWorker:
+    """Tests for the worker's in-process execution path."""
+
+    def test_success_completes_issue_without_subprocess(
+        self, in_process_worker: IssueWorker
+    ) -> None:
+        """Test a zero exit code completes the issue and never spawns rouge-adw."""
+        with (
+            patch("rouge.worker.worker.ForkedWorkflow") as mock_forked,
+            patch("rouge.worker.worker.subprocess.run") as mock_run,
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+        ):
+            mock_forked.return_value.wait.return_value = 0
+            result = in_process_worker.execute_workflow(7, "desc", "claimed", "full", "adw00007")
+
+        assert result is True
+        mock_run.assert_not_called()
+        mock_forked.assert_called_once_with(7, "adw00007", "full")
+        mock_forked.return_value.wait.assert_called_once_with(timeout=30)
+        assert [c.args[1] for c in mock_update.call_args_list] == ["started", "completed"]
+
+    def test_failure_fails_issue(self, in_process_worker: IssueWorker) -> None:
+        """Test a non-zero exit code fails the issue."""
+        with (
+            patch("rouge.worker.worker.ForkedWorkflow") as mock_forked,
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+        ):
+            mock_forked.return_value.wait.return_value = 1
+            result = in_process_worker.execute_workflow(7, "desc", "claimed", "full", "adw00007")
+
+        assert result is False
+        assert [c.args[1] for c in mock_update.call_args_list] == ["started", "failed"]
+
+    def test_timeout_kills_child_and_fails_issue(self, in_process_worker: IssueWorker) -> None:
+        """Test a workflow past the timeout is killed and the issue failed."""
+        with (
+            patch("rouge.worker.worker.ForkedWorkflow") as mock_forked,
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+        ):
+            handle = mock_forked.return_value
+            handle.wait.side_effect = [subprocess.TimeoutExpired("rouge-adw", 30), -9]
+            result = in_process_worker.execute_workflow(7, "desc", "claimed", "full", "adw00007")
+
+        assert result is False
+        handle.kill.assert_called_once()
+        assert [c.args[1] for c in mock_update.call_args_list] == ["started", "failed"]
+
+    def test_slots_launch_forked_children(self, in_process_worker: IssueWorker) -> None:
+        """Test slot mode launches forked children instead of rouge-adw processes."""
+        with (
+            patch("rouge.worker.worker.ForkedWorkflow") as mock_forked,
+            patch("rouge.worker.worker.subprocess.Popen") as mock_popen,
+        ):
+            process = in_process_worker._launch_workflow(7, "patch", "adw00007")
+
+        assert process is mock_forked.return_value
+        mock_forked.assert_called_once_with(7, "adw00007", "patch")
+        mock_popen.assert_not_called()
+
+    def test_in_process_flag_from_cli(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --in-process is parsed and passed to WorkerConfig."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+        runner = CliRunner()
+
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(worker_app, ["--worker-id", "test-worker", "--in-process"])
+
+        assert result.exit_code == 0, result.output
+        assert mock_worker_class.call_args[0][0].in_process is True
+
+    def test_config_requires_fork(self) -> None:
+        """Test in-process mode is rejected where fork is unavailable."""
+        with patch("rouge.worker.config.fork_supported", return_value=False):
+            with pytest.raises(ValueError, match="requires a platform that supports fork"):
+                WorkerConfig(worker_id="test", in_process=True)
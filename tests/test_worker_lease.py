@@ -0,0 +1,506 @@
+"""Tests for lease-based claims, the lease heartbeat, and the lease reaper."""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+import psycopg2
+import pytest
+from typer.testing import CliRunner
+
+from rouge.worker import database
+from rouge.worker.cli import app as worker_app
+from rouge.worker.config import WorkerConfig
+from rouge.worker.lease import LeaseHeartbeat
+from rouge.worker.worker import IssueWorker
+from rouge.worker.worker_artifact import WorkerArtifact
+
+
+@pytest.fixture
+def mock_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock environment variables for Supabase."""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+
+
+@pytest.fixture
+def heartbeat() -> LeaseHeartbeat:
+    """Create a heartbeat with a 30 second lease renewed every 10 seconds."""
+    return LeaseHeartbeat("worker-1", 30, 10)
+
+
+class TestLeaseDatabase:
+    """Tests for the lease RPC wrappers."""
+
+    def test_get_next_issue_passes_lease(self, mock_env) -> None:
+        """Test the claim RPC receives the lease duration when given."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = []
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            database.get_next_issue("worker-1", lease_seconds=120)
+
+        mock_client.rpc.assert_called_once_with(
+            "get_and_lock_next_issue", {"p_worker_id": "worker-1", "p_lease_seconds": 120}
+        )
+
+    def test_renew_leases_returns_renewed_ids(self, mock_env) -> None:
+        """Test renewal returns the IDs whose lease is still held."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = [{"issue_id": 1}]
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.renew_leases("worker-1", [1, 2], 30) == [1]
+
+        mock_client.rpc.assert_called_once_with(
+            "renew_issue_leases",
+            {"p_worker_id": "worker-1", "p_issue_ids": [1, 2], "p_lease_seconds": 30},
+        )
+
+    def test_renew_leases_empty_skips_rpc(self, mock_env) -> None:
+        """Test renewing nothing makes no RPC call."""
+        with patch("rouge.worker.database.get_client") as mock_get_client:
+            assert database.renew_leases("worker-1", [], 30) == []
+        mock_get_client.assert_not_called()
+
+    def test_renew_leases_error_returns_none(self, mock_env) -> None:
+        """Test a failed renewal is distinguishable from lost leases."""
+        mock_client = Mock()
+        mock_client.rpc.side_effect = Exception("boom")
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            assert database.renew_leases("worker-1", [1], 30) is None
+
+    def test_reap_expired_leases_parses_rows(self, mock_env) -> None:
+        """Test reaped rows become (issue_id, status, attempts, previous_owner)."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = [
+            {
+                "issue_id": 4,
+                "issue_status": "pending",
+                "issue_attempts": 1,
+                "previous_owner": "dead-worker",
+            },
+            {"issue_id": 5, "issue_status": "failed", "issue_attempts": 3},
+        ]
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            reaped = database.reap_expired_leases(3)
+
+        assert reaped == [(4, "pending", 1, "dead-worker"), (5, "failed", 3, None)]
+        mock_client.rpc.assert_called_once_with("reap_expired_leases", {"p_max_attempts": 3})
+
+    def test_reap_expired_leases_validates_and_propagates(self, mock_env) -> None:
+        """Test invalid attempts are rejected and RPC errors reach the caller."""
+        with pytest.raises(ValueError, match="max_attempts must be >= 1"):
+            database.reap_expired_leases(0)
+
+        mock_client = Mock()
+        mock_client.rpc.side_effect = RuntimeError("boom")
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            with pytest.raises(RuntimeError, match="boom"):
+                database.reap_expired_leases(3)
+
+
+class TestLeaseHeartbeat:
+    """Tests for LeaseHeartbeat."""
+
+    def test_track_and_untrack(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test held leases follow track and untrack calls."""
+        heartbeat.track(3, 1)
+        heartbeat.track(2)
+        heartbeat.untrack(3, 99)
+        assert heartbeat.held() == [1, 2]
+
+    def test_beat_renews_held_leases(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test a beat renews every held lease with the configured duration."""
+        heartbeat.track(1, 2)
+        with patch("rouge.worker.lease.renew_leases", return_value=[1, 2]) as mock_renew:
+            heartbeat.beat()
+
+        mock_renew.assert_called_once_with("worker-1", [1, 2], 30, heartbeat.logger)
+        assert heartbeat.held() == [1, 2]
+
+    def test_beat_drops_lost_leases(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test leases the database did not renew are dropped and reported."""
+        heartbeat.track(1, 2)
+        with (
+            patch("rouge.worker.lease.renew_leases", return_value=[2]),
+            patch.object(heartbeat.logger, "warning") as mock_warning,
+        ):
+            heartbeat.beat()
+
+        assert heartbeat.held() == [2]
+        assert heartbeat.lease_lost(1)
+        assert not heartbeat.lease_lost(2)
+        assert mock_warning.call_args.args[1] == [1]
+
+    def test_lost_lease_is_forgotten_when_untracked_or_reclaimed(
+        self, heartbeat: LeaseHeartbeat
+    ) -> None:
+        """Test the lost flag lasts only until the issue is untracked or claimed again."""
+        heartbeat.track(1, 2)
+        with patch("rouge.worker.lease.renew_leases", return_value=[]):
+            heartbeat.beat()
+        assert heartbeat.lease_lost(1) and heartbeat.lease_lost(2)
+
+        heartbeat.untrack(1)
+        heartbeat.track(2)
+        assert not heartbeat.lease_lost(1)
+        assert not heartbeat.lease_lost(2)
+
+    def test_beat_keeps_leases_when_renewal_fails(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test an RPC failure does not treat held leases as lost."""
+        heartbeat.track(1)
+        with patch("rouge.worker.lease.renew_leases", return_value=None):
+            heartbeat.beat()
+        assert heartbeat.held() == [1]
+
+    def test_beat_without_leases_skips_rpc(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test an idle worker makes no renewal calls."""
+        with patch("rouge.worker.lease.renew_leases") as mock_renew:
+            heartbeat.beat()
+        mock_renew.assert_not_called()
+
+    def test_reaper_runs_when_due(self) -> None:
+        """Test the in-worker reaper runs at most once per reap interval."""
+        heartbeat = LeaseHeartbeat("worker-1", 30, 10, reap_interval=60, max_attempts=5)
+        with patch("rouge.worker.lease.reap_expired_leases") as mock_reap:
+            heartbeat.beat()
+            heartbeat.beat()
+        mock_reap.assert_called_once_with(5, heartbeat.logger)
+
+    def test_reaper_errors_are_logged(self) -> None:
+        """Test a failing reaper does not break the heartbeat."""
+        heartbeat = LeaseHeartbeat("worker-1", 30, 10, reap_interval=60)
+        with (
+            patch("rouge.worker.lease.reap_expired_leases", side_effect=RuntimeError("down")),
+            patch.object(heartbeat.logger, "exception") as mock_exception,
+        ):
+            heartbeat.beat()
+        mock_exception.assert_called_once()
+
+    def test_reaper_disabled_by_default(self, heartbeat: LeaseHeartbeat) -> None:
+        """Test the reaper is left to another process unless configured."""
+        with patch("rouge.worker.lease.reap_expired_leases") as mock_reap:
+            heartbeat.beat()
+        mock_reap.assert_not_called()
+
+    def test_thread_renews_periodically(self) -> None:
+        """Test the background thread beats until stopped."""
+        heartbeat = LeaseHeartbeat("worker-1", 2, 0.01)
+        heartbeat.track(1)
+        with patch("rouge.worker.lease.renew_leases", return_value=[1]) as mock_renew:
+            heartbeat.start()
+            deadline = time.monotonic() + 5
+            while mock_renew.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            heartbeat.stop()
+        assert mock_renew.call_count >= 2
+
+    @pytest.mark.parametrize(
+        ("interval", "message"),
+        [(0, "interval must be positive"), (30, "interval must be less than lease_seconds")],
+    )
+    def test_rejects_invalid_interval(self, interval: float, message: str) -> None:
+        """Test the renewal interval must fit inside the lease."""
+        with pytest.raises(ValueError, match=message):
+            LeaseHeartbeat("worker-1", 30, interval)
+
+
+class TestWorkerLeases:
+    """Tests for lease tracking in the worker."""
+
+    @pytest.fixture
+    def lease_worker(self, mock_env) -> IssueWorker:
+        """Create a worker with a short lease."""
+        config = WorkerConfig(worker_id="lease-worker", lease_seconds=90, poll_strategy="fixed")
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            return IssueWorker(config)
+
+    def test_claim_is_leased_and_tracked(self, lease_worker: IssueWorker) -> None:
+        """Test claims request the configured lease and are renewed until finished."""
+        issue = (7, "desc", "claimed", "full", "adw-7")
+        with patch("rouge.worker.worker.get_next_issue", return_value=issue) as mock_next:
+            assert lease_worker._poll_next_issue() == issue
+
+        mock_next.assert_called_once_with("lease-worker", lease_worker.logger, lease_seconds=90)
+        assert lease_worker._heartbeat.held() == [7]
+
+        with patch.object(lease_worker, "_execute_workflow", return_value=("adw-7", True)):
+            lease_worker.execute_workflow(7, "desc", "claimed", "full", "adw-7")
+        assert lease_worker._heartbeat.held() == []
+
+    def test_failed_workflow_is_untracked(self, lease_worker: IssueWorker) -> None:
+        """Test a workflow that raises still stops renewing its lease."""
+        lease_worker._heartbeat.track(7)
+        with patch.object(lease_worker, "_execute_workflow", side_effect=RuntimeError("x")):
+            with pytest.raises(RuntimeError):
+                lease_worker.execute_workflow(7, "desc", "claimed", "full")
+        assert lease_worker._heartbeat.held() == []
+
+    def test_released_claims_are_untracked(self, lease_worker: IssueWorker) -> None:
+        """Test claims returned to pending stop being renewed."""
+        lease_worker._heartbeat.track(1, 2)
+        lease_worker._claim_queue.extend(
+            [(1, "d", "claimed", "full", None), (2, "d", "claimed", "full", None)]
+        )
+        with patch("rouge.worker.worker.release_issues", return_value=[1, 2]):
+            lease_worker._release_claim_queue()
+        assert lease_worker._heartbeat.held() == []
+
+    def test_run_starts_and_stops_heartbeat(self, lease_worker: IssueWorker) -> None:
+        """Test the heartbeat lives for the duration of the worker loop."""
+        lease_worker.running = False
+        with (
+            patch.object(lease_worker._heartbeat, "start") as mock_start,
+            patch.object(lease_worker._heartbeat, "stop") as mock_stop,
+        ):
+            lease_worker.run()
+        mock_start.assert_called_once()
+        mock_stop.assert_called_once()
+
+    def test_slot_finish_untracks(self, mock_env) -> None:
+        """Test a finished slot workflow stops renewing its lease."""
+        config = WorkerConfig(worker_id="lease-slots", slots=2)
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            worker = IssueWorker(config)
+        worker.worker_artifact = WorkerArtifact(worker_id="lease-slots", state="working")
+        worker._ensure_slots()
+        slot = worker.worker_artifact.slots[0]
+        slot.assign(7, "adw-7")
+        worker._heartbeat.track(7)
+        with patch("rouge.worker.worker.write_worker_artifact"):
+            worker._finish_slot(slot, success=True)
+        assert worker._heartbeat.held() == []
+
+    def test_lost_lease_skips_final_status(self, lease_worker: IssueWorker) -> None:
+        """Test a workflow whose lease was lost does not overwrite the issue status."""
+        lease_worker.worker_artifact = WorkerArtifact(worker_id="lease-worker", state="ready")
+        lease_worker._heartbeat.track(7)
+
+        def run_workflow(*_args, **_kwargs):
+            with patch("rouge.worker.lease.renew_leases", return_value=[]):
+                lease_worker._heartbeat.beat()
+            return Mock(returncode=0)
+
+        with (
+            patch("rouge.worker.worker.subprocess.run", side_effect=run_workflow),
+            patch("rouge.worker.worker.update_issue_status", return_value=True) as mock_update,
+            patch("rouge.worker.worker.write_worker_artifact"),
+            patch.object(lease_worker.logger, "error") as mock_error,
+        ):
+            assert lease_worker._execute_workflow(7, "full", "desc", adw_id="adw-7") == (
+                "adw-7",
+                True,
+            )
+
+        mock_update.assert_called_once_with(
+            7, "started", lease_worker.logger, expected_status="claimed"
+        )
+        assert "LEASE_LOST" in mock_error.call_args.args[0]
+
+    def test_slot_with_lost_lease_is_killed(self, mock_env) -> None:
+        """Test a slot child is killed once its lease is lost, without a status write."""
+        config = WorkerConfig(worker_id="lease-slots", slots=2)
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            worker = IssueWorker(config)
+        worker.worker_artifact = WorkerArtifact(worker_id="lease-slots", state="working")
+        worker._ensure_slots()
+        process = Mock(pid=4321)
+        process.poll.return_value = None
+        with (
+            patch("rouge.worker.worker.subprocess.Popen", return_value=process),
+            patch("rouge.worker.worker.update_issue_status", return_value=True) as mock_update,
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            worker._heartbeat.track(7)
+            worker._start_slot(worker.worker_artifact.slots[0], 7, "full", adw_id="adw-7")
+            with patch("rouge.worker.lease.renew_leases", return_value=[]):
+                worker._heartbeat.beat()
+            worker._reap_slots()
+
+        process.kill.assert_called_once()
+        mock_update.assert_called_once_with(7, "started", worker.logger, expected_status="claimed")
+        assert worker.worker_artifact.slots[0].state == "failed"
+        assert worker._heartbeat.held() == []
+
+
+class TestLeaseConfig:
+    """Tests for lease configuration and CLI options."""
+
+    def test_heartbeat_defaults_to_third_of_lease(self) -> None:
+        """Test the renewal interval defaults to a third of the lease."""
+        config = WorkerConfig(worker_id="test", lease_seconds=300)
+        assert config.heartbeat_interval == 100
+        assert WorkerConfig(worker_id="test").lease_seconds == 600
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"lease_seconds": 1}, "lease_seconds must be greater than 1"),
+            ({"heartbeat_interval": 0}, "heartbeat_interval must be positive"),
+            ({"lease_seconds": 60, "heartbeat_interval": 60}, "less than lease_seconds"),
+            ({"reap_interval": -1}, "reap_interval must be non-negative"),
+            ({"max_attempts": 0}, "max_attempts must be positive"),
+        ],
+    )
+    def test_rejects_invalid_values(self, kwargs: dict, message: str) -> None:
+        """Test invalid lease settings raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            WorkerConfig(worker_id="test", **kwargs)
+
+    def test_lease_options_from_cli(self, mock_env) -> None:
+        """Test lease options are parsed and passed to WorkerConfig."""
+        runner = CliRunner()
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(
+                worker_app,
+                [
+                    "--worker-id",
+                    "w",
+                    "--lease-seconds",
+                    "120",
+                    "--heartbeat-interval",
+                    "20",
+                    "--reap-interval",
+                    "60",
+                    "--max-attempts",
+                    "5",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        config = mock_worker_class.call_args[0][0]
+        assert (config.lease_seconds, config.heartbeat_interval) == (120, 20)
+        assert (config.reap_interval, config.max_attempts) == (60, 5)
+
+
+class TestReapLeasesCommand:
+    """Tests for the rouge-worker reap-leases command."""
+
+    def test_reports_reaped_issues(self) -> None:
+        """Test reaped issues are listed with their new status."""
+        runner = CliRunner()
+        reaped = [(4, "pending", 1, "dead-worker"), (5, "failed", 3, None)]
+        with patch("rouge.worker.cli.reap_expired_leases", return_value=reaped) as mock_reap:
+            result = runner.invoke(worker_app, ["reap-leases", "--max-attempts", "3"])
+
+        assert result.exit_code == 0, result.output
+        mock_reap.assert_called_once_with(3)
+        assert "Issue 4: pending (attempt 1, lease held by dead-worker)" in result.output
+        assert "Issue 5: failed (attempt 3, lease held by unknown)" in result.output
+
+    def test_reports_nothing_to_reap(self) -> None:
+        """Test an empty result is reported."""
+        runner = CliRunner()
+        with patch("rouge.worker.cli.reap_expired_leases", return_value=[]):
+            result = runner.invoke(worker_app, ["reap-leases"])
+        assert result.exit_code == 0
+        assert "No expired leases" in result.output
+
+    def test_rpc_error_exits_nonzero(self) -> None:
+        """Test reaper failures are reported with a non-zero exit code."""
+        runner = CliRunner()
+        with patch("rouge.worker.cli.reap_expired_leases", side_effect=RuntimeError("down")):
+            result = runner.invoke(worker_app, ["reap-leases"])
+        assert result.exit_code == 1
+        assert "Failed to reap expired leases: down" in result.output
+
+    def test_rejects_invalid_attempts(self) -> None:
+        """Test --max-attempts must be positive."""
+        runner = CliRunner()
+        result = runner.invoke(worker_app, ["reap-leases", "--max-attempts", "0"])
+        assert result.exit_code == 1
+
+
+@pytest.mark.skipif(
+    not os.getenv("ROUGE_TEST_DATABASE_URL"),
+    reason="Set ROUGE_TEST_DATABASE_URL to a migrated local Supabase Postgres to run",
+)
+def test_expired_lease_is_reaped_end_to_end() -> None:
+    """Test a claim whose lease lapses returns to pending with its attempt count."""
+    conn = psycopg2.connect(os.environ["ROUGE_TEST_DATABASE_URL"])
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "insert into public.issues (description, assigned_to) values (%s, %s) "
+                "returning id",
+                ("Lease end-to-end test issue", "lease-e2e-worker"),
+            )
+            row = cursor.fetchone()
+            assert row is not None
+            issue_id = row[0]
+            try:
+                cursor.execute(
+                    "select issue_id from public.get_and_lock_next_issue(%s, %s)",
+                    ("lease-e2e-worker", 60),
+                )
+                assert cursor.fetchone() == (issue_id,)
+                cursor.execute(
+                    "update public.issues set lease_expires_at = now() - interval '1 second' "
+                    "where id = %s",
+                    (issue_id,),
+                )
+                cursor.execute("select * from public.reap_expired_leases(3)")
+                reaped = {r[0]: r for r in cursor.fetchall()}
+                assert reaped[issue_id][1:] == ("pending", 1, "lease-e2e-worker")
+                cursor.execute(
+                    "select status, lease_owner, attempts from public.issues where id = %s",
+                    (issue_id,),
+                )
+                assert cursor.fetchone() == ("pending", None, 1)
+            finally:
+                cursor.execute("delete from public.issues where id = %s", (issue_id,))
+    finally:
+        conn.close()
+
+
+@pytest.mark.skipif(
+    not os.getenv("ROUGE_TEST_DATABASE_URL"),
+    reason="Set ROUGE_TEST_DATABASE_URL to a migrated local Supabase Postgres to run",
+)
+def test_released_claim_gives_back_its_attempt_end_to_end() -> None:
+    """Test releasing a claim that never started does not count as an attempt."""
+    conn = psycopg2.connect(os.environ["ROUGE_TEST_DATABASE_URL"])
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "insert into public.issues (description, assigned_to) values (%s, %s) "
+                "returning id",
+                ("Release end-to-end test issue", "release-e2e-worker"),
+            )
+            row = cursor.fetchone()
+            assert row is not None
+            issue_id = row[0]
+            try:
+                cursor.execute(
+                    "select issue_id from public.get_and_lock_next_issue(%s, %s)",
+                    ("release-e2e-worker", 60),
+                )
+                assert cursor.fetchone() == (issue_id,)
+                cursor.execute(
+                    "select issue_id from public.release_claimed_issues(%s, %s)",
+                    ("release-e2e-worker", [issue_id]),
+                )
+                assert cursor.fetchone() == (issue_id,)
+                cursor.execute(
+                    "select status, assigned_to, attempts from public.issues where id = %s",
+                    (issue_id,),
+                )
+                assert cursor.fetchone() == ("pending", "release-e2e-worker", 0)
+            finally:
+                cursor.execute("delete from public.issues where id = %s", (issue_id,))
+    finally:
+        conn.close()
@@ -0,0 +1,217 @@
+"""Tests for the worker metrics registry and the /metrics endpoint."""
+
+import subprocess
+import urllib.error
+import urllib.request
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rouge.core.database import CircuitBreakerStats, HttpPoolStats
+from rouge.worker.config import WorkerConfig
+from rouge.worker.exceptions import TransientDatabaseError
+from rouge.worker.metrics import Counter, Histogram, MetricsServer, WorkerMetrics
+from rouge.worker.worker import IssueWorker
+
+
+@pytest.fixture
+def mock_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock environment variables for Supabase."""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+
+
+@pytest.fixture
+def metrics_worker(mock_env: None) -> IssueWorker:
+    """Create a worker that serves metrics on a free loopback port."""
+    config = WorkerConfig(worker_id="test-metrics-worker", metrics_port=0, db_backoff_ms=1)
+    with (
+        patch("rouge.worker.database.get_client"),
+        patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+        patch("rouge.worker.worker.write_worker_artifact"),
+    ):
+        return IssueWorker(config)
+
+
+def _scrape(port: int) -> str:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain")
+        return response.read().decode("utf-8")
+
+
+class TestMetricFamilies:
+    """Tests for counter and histogram rendering."""
+
+    def test_counter_renders_labelled_series(self) -> None:
+        """Test counters render HELP/TYPE lines and one sample per label set."""
+        counter = Counter("jobs_total", "Jobs run", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="b")
+
+        assert counter.render() == [
+            "# HELP jobs_total Jobs run",
+            "# TYPE jobs_total counter",
+            'jobs_total{kind="a"} 1',
+            'jobs_total{kind="b"} 2',
+        ]
+
+    def test_counter_rejects_wrong_labels(self) -> None:
+        """Test recording with missing labels fails loudly."""
+        with pytest.raises(ValueError, match="expects labels"):
+            Counter("jobs_total", "Jobs run", ("kind",)).inc()
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test histogram buckets, sum, and count follow the exposition format."""
+        histogram = Histogram("latency_seconds", "Latency", (0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+
+        assert histogram.render()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+        ]
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test quotes in label values do not break the output."""
+        counter = Counter("jobs_total", "Jobs run", ("kind",))
+        counter.inc(kind='say "hi"')
+        assert counter.render()[-1] == 'jobs_total{kind="say \\"hi\\""} 1'
+
+    def test_state_gauge_marks_only_current_state(self) -> None:
+        """Test exactly one worker state is reported as active."""
+        metrics = WorkerMetrics()
+        metrics.set_state("working")
+        metrics.set_state("failed")
+
+        assert metrics.state.value(state="failed") == 1
+        assert metrics.state.value(state="working") == 0
+        assert metrics.state.value(state="ready") == 0
+
+    def test_render_reports_http_pool(self) -> None:
+        """Test each render refreshes the HTTP pool gauges from the live pool."""
+        stats = HttpPoolStats(
+            max_connections=20,
+            max_keepalive_connections=10,
+            connections=3,
+            idle_connections=2,
+            http2_connections=0,
+            requests_sent=40,
+            resets=1,
+        )
+        metrics = WorkerMetrics()
+
+        with patch("rouge.worker.metrics.get_http_pool_stats", return_value=stats):
+            text = metrics.render()
+
+        assert 'rouge_worker_http_connections{state="idle"} 2' in text
+        assert 'rouge_worker_http_connections{state="active"} 1' in text
+        assert "rouge_worker_http_client_resets 1" in text
+
+    def test_render_reports_circuit_breaker(self) -> None:
+        """Test each render refreshes the circuit breaker gauges."""
+        stats = CircuitBreakerStats(state="open", calls=6, failures=4, trips=2, short_circuited=17)
+        metrics = WorkerMetrics()
+
+        with patch("rouge.worker.metrics.get_circuit_breaker_stats", return_value=stats):
+            text = metrics.render()
+
+        assert 'rouge_worker_db_circuit_state{state="open"} 1' in text
+        assert 'rouge_worker_db_circuit_state{state="closed"} 0' in text
+        assert "rouge_worker_db_circuit_trips 2" in text
+        assert "rouge_worker_db_circuit_short_circuited 17" in text
+
+
+class TestMetricsServer:
+    """Tests for the stdlib HTTP metrics endpoint."""
+
+    def test_serves_metrics_and_404s_other_paths(self) -> None:
+        """Test /metrics returns the rendered registry and other paths 404."""
+        metrics = WorkerMetrics()
+        metrics.record_poll("hit")
+        server = MetricsServer(metrics, 0)
+        server.start()
+        try:
+            assert 'rouge_worker_polls_total{result="hit"} 1' in _scrape(server.port)
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other", timeout=5)
+            assert exc_info.value.code == 404
+        finally:
+            server.stop()
+
+    def test_config_rejects_invalid_port(self) -> None:
+        """Test metrics_port must be a valid TCP port."""
+        with pytest.raises(ValueError, match="metrics_port"):
+            WorkerConfig(worker_id="w", metrics_port=70000)
+
+
+class TestWorkerMetrics:
+    """Tests for metrics recorded by IssueWorker."""
+
+    def test_scrape_during_fake_workflow_run(self, metrics_worker) -> None:
+        """Test a scrape mid-workflow sees the working state, then the outcome."""
+        metrics_worker._start_metrics_server()
+        port = metrics_worker._metrics_server.port
+        scrapes = []
+
+        def fake_run(*_args, **_kwargs):
+            scrapes.append(_scrape(port))
+            return Mock(returncode=0)
+
+        try:
+            with (
+                patch(
+                    "rouge.worker.worker.get_next_issue",
+                    return_value=(7, "Issue 7", "claimed", "patch", None),
+                ),
+                patch("rouge.worker.worker.update_issue_status", return_value=True),
+                patch("rouge.worker.worker_artifact.write_worker_artifact"),
+                patch("subprocess.run", side_effect=fake_run),
+            ):
+                issue_id, description, status, issue_type, adw_id = (
+                    metrics_worker._poll_next_issue()
+                )
+                metrics_worker.execute_workflow(issue_id, description, status, issue_type, adw_id)
+            final = _scrape(port)
+        finally:
+            metrics_worker._close_resources()
+
+        assert 'rouge_worker_state{state="working"} 1' in scrapes[0]
+        assert 'rouge_worker_polls_total{result="hit"} 1' in scrapes[0]
+        assert "rouge_worker_poll_duration_seconds_count 1" in scrapes[0]
+        assert 'rouge_worker_state{state="ready"} 1' in final
+        assert 'rouge_worker_workflow_exits_total{issue_type="patch",exit_code="0"} 1' in final
+        assert 'rouge_worker_workflow_duration_seconds_count{issue_type="patch"} 1' in final
+
+    def test_timeout_is_counted(self, metrics_worker) -> None:
+        """Test a timed-out workflow increments the timeout counter, not exits."""
+        with (
+            patch("rouge.worker.worker.update_issue_status", return_value=True),
+            patch("rouge.worker.worker_artifact.write_worker_artifact"),
+            patch("subprocess.run", side_effect=subprocess.TimeoutExpired("rouge-adw", 1)),
+        ):
+            metrics_worker.execute_workflow(8, "Issue 8", "claimed", "full")
+
+        assert metrics_worker.metrics.workflow_timeouts.value(issue_type="full") == 1
+        assert metrics_worker.metrics.workflow_duration.count(issue_type="full") == 1
+        assert metrics_worker.metrics.state.value(state="failed") == 1
+
+    def test_transient_errors_are_counted(self, metrics_worker) -> None:
+        """Test each TransientDatabaseError and the exhausted poll are recorded."""
+        with (
+            patch(
+                "rouge.worker.worker.get_next_issue",
+                side_effect=TransientDatabaseError("connection reset", OSError("reset")),
+            ),
+            patch("rouge.worker.worker.reset_client"),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            assert metrics_worker._poll_next_issue() is None
+
+        metrics = metrics_worker.metrics
+        assert metrics.transient_db_errors.value() == metrics_worker.config.db_retries
+        assert metrics.polls.value(result="error") == 1
+        assert metrics.poll_duration.count() == metrics_worker.config.db_retries
@@ -0,0 +1,206 @@
+"""Tests for push-based issue dispatch via Postgres LISTEN/NOTIFY."""
+
+import json
+import os
+from collections import namedtuple
+from unittest.mock import MagicMock, Mock, patch
+
+import psycopg2
+import pytest
+
+from rouge.worker.config import WorkerConfig
+from rouge.worker.notify import (
+    ISSUE_NOTIFY_CHANNEL,
+    IssueNotificationListener,
+    get_database_url,
+)
+from rouge.worker.worker import IssueWorker
+
+Notify = namedtuple("Notify", ["pid", "channel", "payload"])
+
+
+def _payload(assigned_to: str, issue_id: int = 1) -> str:
+    return json.dumps({"issue_id": issue_id, "assigned_to": assigned_to})
+
+
+@pytest.fixture
+def fake_conn() -> MagicMock:
+    """Create a psycopg2-like connection with an empty notifies queue."""
+    conn = MagicMock()
+    conn.notifies = []
+    return conn
+
+
+@pytest.fixture
+def listener(fake_conn: MagicMock) -> IssueNotificationListener:
+    """Create a listener already holding the fake connection."""
+    listener = IssueNotificationListener("postgresql://test", "worker-1")
+    listener._conn = fake_conn
+    return listener
+
+
+class TestGetDatabaseUrl:
+    """Tests for ROUGE_DATABASE_URL resolution."""
+
+    def test_returns_trimmed_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the env var is returned without surrounding whitespace."""
+        monkeypatch.setenv("ROUGE_DATABASE_URL", "  postgresql://db  ")
+        assert get_database_url() == "postgresql://db"
+
+    def test_returns_none_when_unset_or_blank(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test missing and whitespace-only values resolve to None."""
+        monkeypatch.delenv("ROUGE_DATABASE_URL", raising=False)
+        assert get_database_url() is None
+        monkeypatch.setenv("ROUGE_DATABASE_URL", "   ")
+        assert get_database_url() is None
+
+
+class TestIssueNotificationListener:
+    """Tests for IssueNotificationListener."""
+
+    def test_connect_listens_on_channel(self) -> None:
+        """Test connect() opens an autocommit connection and issues LISTEN."""
+        conn = MagicMock()
+        cursor = conn.cursor.return_value.__enter__.return_value
+        with patch("rouge.worker.notify.psycopg2.connect", return_value=conn) as mock_connect:
+            listener = IssueNotificationListener("postgresql://test", "worker-1")
+            listener.connect()
+
+        mock_connect.assert_called_once_with("postgresql://test")
+        conn.set_isolation_level.assert_called_once()
+        cursor.execute.assert_called_once_with(f"LISTEN {ISSUE_NOTIFY_CHANNEL}")
+
+    def test_wait_returns_true_for_own_notification(
+        self, listener: IssueNotificationListener, fake_conn: MagicMock
+    ) -> None:
+        """Test a notification for this worker ends the wait."""
+
+        def deliver() -> None:
+            fake_conn.notifies.append(Notify(1, ISSUE_NOTIFY_CHANNEL, _payload("worker-1")))
+
+        fake_conn.poll.side_effect = deliver
+        with patch("rouge.worker.notify.select.select", return_value=([fake_conn], [], [])):
+            assert listener.wait(5) is True
+        assert fake_conn.notifies == []
+
+    def test_wait_ignores_other_workers(
+        self, listener: IssueNotificationListener, fake_conn: MagicMock
+    ) -> None:
+        """Test notifications for other workers and bad payloads do not wake the caller."""
+
+        def deliver() -> None:
+            fake_conn.notifies.append(Notify(1, ISSUE_NOTIFY_CHANNEL, _payload("worker-2")))
+            fake_conn.notifies.append(Notify(1, ISSUE_NOTIFY_CHANNEL, "not-json"))
+
+        fake_conn.poll.side_effect = deliver
+        with patch(
+            "rouge.worker.notify.select.select",
+            side_effect=[([fake_conn], [], []), ([], [], [])],
+        ):
+            assert listener.wait(5) is False
+
+    def test_wait_times_out(
+        self, listener: IssueNotificationListener, fake_conn: MagicMock
+    ) -> None:
+        """Test the wait returns False when nothing arrives."""
+        with patch("rouge.worker.notify.select.select", return_value=([], [], [])):
+            assert listener.wait(0.01) is False
+        fake_conn.poll.assert_not_called()
+
+    def test_wait_falls_back_to_sleep_when_connect_fails(self) -> None:
+        """Test an unreachable database degrades to a plain sleep."""
+        listener = IssueNotificationListener("postgresql://test", "worker-1")
+        with (
+            patch(
+                "rouge.worker.notify.psycopg2.connect",
+                side_effect=psycopg2.OperationalError("down"),
+            ),
+            patch("rouge.worker.notify.time.sleep") as mock_sleep,
+        ):
+            assert listener.wait(7) is False
+        mock_sleep.assert_called_once_with(7)
+
+    def test_wait_drops_broken_connection(
+        self, listener: IssueNotificationListener, fake_conn: MagicMock
+    ) -> None:
+        """Test a connection error closes the connection so the next wait reconnects."""
+        fake_conn.poll.side_effect = psycopg2.OperationalError("server closed")
+        with (
+            patch("rouge.worker.notify.select.select", return_value=([fake_conn], [], [])),
+            patch("rouge.worker.notify.time.sleep"),
+        ):
+            assert listener.wait(1) is False
+        fake_conn.close.assert_called_once()
+        assert listener._conn is None
+
+
+class TestWorkerListenMode:
+    """Tests for worker integration with the notification listener."""
+
+    def test_config_requires_database_url(self) -> None:
+        """Test listen mode cannot be enabled without a database URL."""
+        with pytest.raises(ValueError, match="database_url is required"):
+            WorkerConfig(worker_id="test", listen=True)
+
+    def test_idle_wait_uses_listener(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an idle worker blocks on the listener instead of sleeping."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+        config = WorkerConfig(
+            worker_id="test-listen-worker",
+            poll_interval=30,
+            poll_strategy="fixed",
+            listen=True,
+            database_url="postgresql://test",
+        )
+        with patch("rouge.worker.worker.write_worker_artifact"):
+            worker = IssueWorker(config)
+        worker._listener = Mock()
+        worker._next_slot_poll_at = 123.0
+
+        def stop(_timeout: float) -> bool:
+            worker.running = False
+            return True
+
+        worker._listener.wait.side_effect = stop
+        ready = worker.worker_artifact
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=ready),
+            patch("rouge.worker.worker.get_next_issue", return_value=None),
+            patch("rouge.worker.worker.time.sleep") as mock_sleep,
+        ):
+            worker.run()
+
+        worker._listener.wait.assert_called_once_with(30)
+        worker._listener.close.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert worker._next_slot_poll_at == 0.0
+
+
+@pytest.mark.skipif(
+    not os.getenv("ROUGE_TEST_DATABASE_URL"),
+    reason="Set ROUGE_TEST_DATABASE_URL to a migrated local Supabase Postgres to run",
+)
+def test_trigger_notifies_listener_end_to_end() -> None:
+    """Test the notify trigger wakes a listener against a real database."""
+    dsn = os.environ["ROUGE_TEST_DATABASE_URL"]
+    listener = IssueNotificationListener(dsn, "notify-e2e-worker")
+    listener.connect()
+    conn = psycopg2.connect(dsn)
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "insert into public.issues (description, assigned_to) values (%s, %s) "
+                "returning id",
+                ("Notify end-to-end test issue", "notify-e2e-worker"),
+            )
+            row = cursor.fetchone()
+            assert row is not None
+            try:
+                assert listener.wait(5) is True
+            finally:
+                cursor.execute("delete from public.issues where id = %s", (row[0],))
+    finally:
+        conn.close()
+        listener.close()
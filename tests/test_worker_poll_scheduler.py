@@ -0,0 +1,238 @@
+"""Tests for worker poll scheduling strategies."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from rouge.worker.config import WorkerConfig
+from rouge.worker.poll_scheduler import (
+    AdaptivePollScheduler,
+    FixedPollScheduler,
+    build_poll_scheduler,
+)
+from rouge.worker.worker import IssueWorker
+from rouge.worker.worker_artifact import WorkerArtifact
+
+
+class TestFixedPollScheduler:
+    """Tests for FixedPollScheduler."""
+
+    def test_constant_interval_after_miss_and_error(self) -> None:
+        """Test misses and errors always wait the configured interval."""
+        scheduler = FixedPollScheduler(10)
+        assert scheduler.record_miss() == 10
+        assert scheduler.record_miss() == 10
+        assert scheduler.record_error() == 10
+
+    def test_hit_repolls_immediately(self) -> None:
+        """Test a hit schedules the next poll immediately."""
+        scheduler = FixedPollScheduler(10)
+        assert scheduler.record_hit() == 0.0
+
+    def test_rejects_non_positive_interval(self) -> None:
+        """Test the interval must be positive."""
+        with pytest.raises(ValueError, match="interval must be positive"):
+            FixedPollScheduler(0)
+
+
+class TestAdaptivePollScheduler:
+    """Tests for AdaptivePollScheduler."""
+
+    def test_backoff_grows_to_ceiling_without_jitter(self) -> None:
+        """Test consecutive misses double the delay up to the ceiling."""
+        scheduler = AdaptivePollScheduler(1, 10, jitter=0)
+        delays = [scheduler.record_miss() for _ in range(6)]
+        assert delays == [1, 2, 4, 8, 10, 10]
+
+    def test_hit_resets_backoff(self) -> None:
+        """Test activity resets the backoff streak."""
+        scheduler = AdaptivePollScheduler(1, 60, jitter=0)
+        for _ in range(4):
+            scheduler.record_miss()
+        assert scheduler.record_hit() == 0.0
+        assert scheduler.record_miss() == 1
+
+    def test_errors_back_off_on_their_own_streak(self) -> None:
+        """Test errors back off independently of misses."""
+        scheduler = AdaptivePollScheduler(2, 60, jitter=0)
+        scheduler.record_miss()
+        scheduler.record_miss()
+        assert scheduler.record_error() == 2
+        assert scheduler.record_error() == 4
+
+    def test_jitter_stays_within_bounds_and_ceiling(self) -> None:
+        """Test jittered delays stay within ±jitter and never exceed the ceiling."""
+        scheduler = AdaptivePollScheduler(10, 30, jitter=0.2, rng=random.Random(42))
+        first = scheduler.record_miss()
+        assert 8 <= first <= 12
+        for _ in range(10):
+            assert scheduler.record_miss() <= 30
+
+    def test_counters_and_stats(self) -> None:
+        """Test hit, miss, and error counts are tracked and exported."""
+        scheduler = AdaptivePollScheduler(1, 10, jitter=0)
+        scheduler.record_hit()
+        scheduler.record_miss()
+        scheduler.record_miss()
+        scheduler.record_error()
+        stats = scheduler.stats()
+        assert stats.strategy == "adaptive"
+        assert (stats.hits, stats.misses, stats.errors) == (1, 2, 1)
+        assert stats.current_interval == 1
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"min_interval": 0, "max_interval": 10}, "min_interval must be positive"),
+            ({"min_interval": 5, "max_interval": 1}, "max_interval must be >= min_interval"),
+            ({"min_interval": 1, "max_interval": 10, "multiplier": 0.5}, "multiplier"),
+            ({"min_interval": 1, "max_interval": 10, "jitter": 1.0}, "jitter"),
+        ],
+    )
+    def test_rejects_invalid_parameters(self, kwargs: dict, message: str) -> None:
+        """Test invalid parameters raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            AdaptivePollScheduler(**kwargs)
+
+
+class TestBuildPollScheduler:
+    """Tests for build_poll_scheduler and its configuration."""
+
+    def test_builds_each_strategy(self) -> None:
+        """Test each strategy name maps to its scheduler class."""
+        assert isinstance(build_poll_scheduler("fixed", 10, 60), FixedPollScheduler)
+        adaptive = build_poll_scheduler("adaptive", 10, 60)
+        assert isinstance(adaptive, AdaptivePollScheduler)
+        assert adaptive.max_interval == 60
+
+    def test_rejects_unknown_strategy(self) -> None:
+        """Test unknown strategies raise ValueError."""
+        with pytest.raises(ValueError, match="poll_strategy must be one of"):
+            build_poll_scheduler("eager", 10, 60)  # type: ignore[arg-type]
+
+    def test_config_defaults(self) -> None:
+        """Test the adaptive strategy and a 60 second ceiling are the defaults."""
+        config = WorkerConfig(worker_id="test")
+        assert config.poll_strategy == "adaptive"
+        assert config.max_poll_interval == 60
+
+    def test_config_ceiling_follows_large_poll_interval(self) -> None:
+        """Test the default ceiling is never below poll_interval."""
+        config = WorkerConfig(worker_id="test", poll_interval=120)
+        assert config.max_poll_interval == 120
+
+    def test_config_rejects_ceiling_below_interval(self) -> None:
+        """Test an explicit ceiling below poll_interval is rejected."""
+        with pytest.raises(ValueError, match="max_poll_interval must be >= poll_interval"):
+            WorkerConfig(worker_id="test", poll_interval=30, max_poll_interval=10)
+
+    def test_config_rejects_unknown_strategy(self) -> None:
+        """Test unknown strategies are rejected by WorkerConfig."""
+        with pytest.raises(ValueError, match="poll_strategy must be one of"):
+            WorkerConfig(worker_id="test", poll_strategy="eager")  # type: ignore[arg-type]
+
+
+class TestWorkerPollScheduling:
+    """Tests for the worker loop driving the poll scheduler."""
+
+    @pytest.fixture
+    def worker(self, monkeypatch: pytest.MonkeyPatch) -> IssueWorker:
+        """Create a worker with a deterministic adaptive scheduler."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+        config = WorkerConfig(worker_id="test-poll-worker", poll_interval=2)
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            return IssueWorker(config, scheduler=AdaptivePollScheduler(2, 16, jitter=0))
+
+    def test_idle_loop_backs_off_and_publishes_stats(self, worker: IssueWorker) -> None:
+        """Test empty polls back off exponentially and land in the artifact."""
+        ready = WorkerArtifact(worker_id="test-poll-worker", state="ready")
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) >= 4:
+                worker.running = False
+
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=ready),
+            patch("rouge.worker.worker.get_next_issue", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact") as mock_write,
+            patch("rouge.worker.worker.time.sleep", side_effect=fake_sleep),
+        ):
+            worker.run()
+
+        assert sleeps == [2, 4, 8, 16]
+        mock_write.assert_not_called()
+        assert ready.poll is not None
+        assert ready.poll.misses == 4
+        assert ready.poll.current_interval == 16
+
+    def test_idle_poll_stats_are_written_at_a_bounded_interval(self, worker: IssueWorker) -> None:
+        """Test an idle worker writes poll counters once the persist interval passes."""
+        ready = WorkerArtifact(worker_id="test-poll-worker", state="ready")
+        worker.worker_artifact = ready
+        worker._artifact_written_at = 1000.0
+
+        with (
+            patch("rouge.worker.worker.write_worker_artifact") as mock_write,
+            patch("rouge.worker.worker.time.monotonic", return_value=1030.0),
+        ):
+            worker._publish_poll_stats()
+        mock_write.assert_not_called()
+
+        with (
+            patch("rouge.worker.worker.write_worker_artifact") as mock_write,
+            patch("rouge.worker.worker.time.monotonic", return_value=1060.0),
+        ):
+            worker._publish_poll_stats()
+        mock_write.assert_called_once_with(ready, fsync=False)
+        assert worker._artifact_written_at == 1060.0
+
+    def test_loop_repolls_immediately_after_work(self, worker: IssueWorker) -> None:
+        """Test a claimed issue is followed by an immediate poll and resets backoff."""
+        ready = WorkerArtifact(worker_id="test-poll-worker", state="ready")
+        issues = iter([None, (1, "d", "claimed", "thin", None), (2, "d", "claimed", "thin", None)])
+        sleeps: list[float] = []
+
+        def fake_get_next_issue(_worker_id, _logger, lease_seconds=None):
+            issue = next(issues, None)
+            if issue is None and sleeps:
+                worker.running = False
+            return issue
+
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=ready),
+            patch("rouge.worker.worker.get_next_issue", side_effect=fake_get_next_issue),
+            patch("rouge.worker.worker.write_worker_artifact"),
+            patch.object(worker, "execute_workflow", return_value=True) as mock_execute,
+            patch("rouge.worker.worker.time.sleep", side_effect=sleeps.append),
+        ):
+            worker.run()
+
+        assert mock_execute.call_count == 2
+        # One backoff sleep before work arrived, then back to the minimum after it
+        assert sleeps == [2, 2]
+        assert worker.scheduler.hits == 2
+
+    def test_artifact_read_failure_backs_off(self, worker: IssueWorker) -> None:
+        """Test unreadable artifacts use the scheduler's error backoff."""
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) >= 3:
+                worker.running = False
+
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.time.sleep", side_effect=fake_sleep),
+        ):
+            worker.run()
+
+        assert sleeps == [2, 4, 8]
+        assert worker.scheduler.errors == 3
@@ -0,0 +1,170 @@
+"""Tests for shared work pools and work stealing."""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from rouge.worker import database
+from rouge.worker.cli import app as worker_app
+from rouge.worker.config import WorkerConfig
+from rouge.worker.notify import IssueNotificationListener
+from rouge.worker.worker import IssueWorker
+
+
+@pytest.fixture
+def mock_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock environment variables for Supabase."""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+
+
+def _make_worker(**overrides) -> IssueWorker:
+    config = WorkerConfig(worker_id="worker-1", **overrides)
+    with (
+        patch("rouge.worker.database.get_client"),
+        patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+        patch("rouge.worker.worker.write_worker_artifact"),
+    ):
+        return IssueWorker(config)
+
+
+class TestPoolClaimRpc:
+    """Tests for the pool parameters sent to the claim RPCs."""
+
+    def test_get_next_issue_passes_pool_and_threshold(self, mock_env) -> None:
+        """Test pool options are forwarded to the single-issue claim."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = []
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            database.get_next_issue("worker-1", pool="builders", steal_threshold=5)
+
+        mock_client.rpc.assert_called_once_with(
+            "get_and_lock_next_issue",
+            {"p_worker_id": "worker-1", "p_pool": "builders", "p_steal_threshold": 5},
+        )
+
+    def test_get_next_issues_passes_pool(self, mock_env) -> None:
+        """Test pool options are forwarded to the batch claim alongside the limit."""
+        mock_client = Mock()
+        mock_client.rpc.return_value.execute.return_value.data = []
+
+        with patch("rouge.worker.database.get_client", return_value=mock_client):
+            database.get_next_issues("worker-1", 3, lease_seconds=60, pool="builders")
+
+        mock_client.rpc.assert_called_once_with(
+            "get_and_lock_next_issues",
+            {
+                "p_worker_id": "worker-1",
+                "p_lease_seconds": 60,
+                "p_pool": "builders",
+                "p_limit": 3,
+            },
+        )
+
+
+class TestPoolConfig:
+    """Tests for pool validation in WorkerConfig."""
+
+    @pytest.mark.parametrize("pool", ["", "two words"])
+    def test_rejects_blank_or_spaced_pool(self, pool: str) -> None:
+        """Test pool names must be non-empty and whitespace-free."""
+        with pytest.raises(ValueError, match="pool"):
+            WorkerConfig(worker_id="worker-1", pool=pool)
+
+    def test_rejects_pool_named_after_worker(self) -> None:
+        """Test a pool cannot reuse the worker's own ID."""
+        with pytest.raises(ValueError, match="differ"):
+            WorkerConfig(worker_id="worker-1", pool="worker-1")
+
+    def test_steal_threshold_requires_pool(self) -> None:
+        """Test stealing is only possible within a pool."""
+        with pytest.raises(ValueError, match="requires a pool"):
+            WorkerConfig(worker_id="worker-1", steal_threshold=2)
+
+    def test_rejects_negative_steal_threshold(self) -> None:
+        """Test a negative steal threshold is rejected."""
+        with pytest.raises(ValueError, match="non-negative"):
+            WorkerConfig(worker_id="worker-1", pool="builders", steal_threshold=-1)
+
+    def test_cli_passes_pool_options(self, mock_env) -> None:
+        """Test --pool and --steal-threshold reach the worker config."""
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker:
+            result = CliRunner().invoke(
+                worker_app,
+                ["--worker-id", "worker-1", "--pool", "builders", "--steal-threshold", "4"],
+            )
+
+        assert result.exit_code == 0, result.output
+        config = mock_worker.call_args.args[0]
+        assert config.pool == "builders"
+        assert config.steal_threshold == 4
+
+
+class TestPoolNotifications:
+    """Tests for pool-aware LISTEN/NOTIFY filtering."""
+
+    @pytest.mark.parametrize(
+        ("assigned_to", "expected"),
+        [("worker-1", True), ("builders", True), (None, True), ("worker-2", False)],
+    )
+    def test_pool_member_wakes_for_pool_and_unassigned(self, assigned_to, expected) -> None:
+        """Test pool workers wake for the pool and unassigned issues, not peers."""
+        listener = IssueNotificationListener("postgresql://test", "worker-1", pool="builders")
+        payload = json.dumps({"issue_id": 1, "assigned_to": assigned_to})
+        assert listener._is_for_worker(payload) is expected
+
+    def test_worker_without_pool_ignores_unassigned(self) -> None:
+        """Test workers outside a pool keep ignoring unassigned issues."""
+        listener = IssueNotificationListener("postgresql://test", "worker-1")
+        payload = json.dumps({"issue_id": 1, "assigned_to": None})
+        assert listener._is_for_worker(payload) is False
+
+
+class TestWorkerPoolClaims:
+    """Tests for how IssueWorker passes pool options when polling."""
+
+    def test_poll_passes_pool_options(self, mock_env) -> None:
+        """Test a pool worker claims with its pool and steal threshold."""
+        worker = _make_worker(pool="builders", steal_threshold=2, lease_seconds=90)
+
+        with patch("rouge.worker.worker.get_next_issue", return_value=None) as mock_get:
+            assert worker._poll_next_issue() is None
+
+        mock_get.assert_called_once_with(
+            "worker-1",
+            worker.logger,
+            lease_seconds=90,
+            pool="builders",
+            steal_threshold=2,
+        )
+
+    def test_poll_without_pool_omits_pool_options(self, mock_env) -> None:
+        """Test workers outside a pool claim exactly as before."""
+        worker = _make_worker()
+
+        with patch("rouge.worker.worker.get_next_issue", return_value=None) as mock_get:
+            worker._poll_next_issue()
+
+        mock_get.assert_called_once_with(
+            "worker-1", worker.logger, lease_seconds=worker.config.lease_seconds
+        )
+
+    def test_batch_poll_passes_pool(self, mock_env) -> None:
+        """Test batch claims carry the pool too."""
+        worker = _make_worker(pool="builders", claim_batch_size=4)
+
+        with patch("rouge.worker.worker.get_next_issues", return_value=[]) as mock_get:
+            worker._poll_next_issue()
+
+        assert mock_get.call_args.kwargs["pool"] == "builders"
+        assert "steal_threshold" not in mock_get.call_args.kwargs
+
+    def test_listener_receives_pool(self, mock_env) -> None:
+        """Test listen mode filters notifications by the worker's pool."""
+        with patch("rouge.worker.worker.IssueNotificationListener", MagicMock()) as mock_cls:
+            _make_worker(pool="builders", listen=True, database_url="postgresql://test")
+
+        assert mock_cls.call_args.kwargs["pool"] == "builders"
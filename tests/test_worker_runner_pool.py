@@ -0,0 +1,200 @@
+"""Tests for the pre-started warm runner pool."""
+
+import os
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from rouge.worker.cli import app as worker_app
+from rouge.worker.config import WorkerConfig
+from rouge.worker.in_process import fork_supported
+from rouge.worker.runner_pool import WarmRunnerPool
+from rouge.worker.worker import IssueWorker
+
+
+def _scripted_job(_issue_id: int, _adw_id: str, workflow_type: str) -> bool:
+    """Stand-in workflow whose behaviour is selected by workflow_type."""
+    if workflow_type == "crash":
+        os._exit(3)
+    if workflow_type == "hang":
+        time.sleep(60)
+    return workflow_type == "ok"
+
+
+@pytest.fixture
+def make_pool():
+    """Create forked pools with warm-up stubbed out, closing them afterwards."""
+    pools: list[WarmRunnerPool] = []
+
+    def factory(size: int = 1, max_jobs: int = 1, job=_scripted_job) -> WarmRunnerPool:
+        pool = WarmRunnerPool(size, max_jobs, start_method="fork", job=job)
+        pools.append(pool)
+        return pool
+
+    with patch("rouge.worker.runner_pool._warm_up"):
+        yield factory
+    for pool in pools:
+        pool.close()
+
+
+@pytest.mark.skipif(not fork_supported(), reason="requires fork")
+class TestWarmRunnerPool:
+    """Tests for WarmRunnerPool against real runner processes."""
+
+    def test_start_warms_idle_runners(self, make_pool) -> None:
+        """Test start() launches size runners that report ready."""
+        pool = make_pool(size=2)
+        pool.start()
+        assert pool.idle_count == 2
+        assert pool.wait_ready(timeout=10) is True
+
+    @pytest.mark.parametrize(("workflow_type", "expected"), [("ok", 0), ("fail", 1), ("crash", 3)])
+    def test_job_return_codes(self, make_pool, workflow_type: str, expected: int) -> None:
+        """Test success, failure, and a runner dying mid-job map to return codes."""
+        pool = make_pool()
+        job = pool.submit(1, "adw12345", workflow_type)
+        assert job.wait(timeout=10) == expected
+        assert job.poll() == expected
+
+    def test_runner_replaced_after_each_job(self, make_pool) -> None:
+        """Test a replacement is warmed while a job runs and runners are single-use."""
+        pool = make_pool()
+        pool.start()
+        first = pool.submit(1, "adw00001", "ok")
+        # The replacement starts as soon as the job is handed off
+        assert pool.idle_count == 1
+        first.wait(timeout=10)
+        second = pool.submit(2, "adw00002", "ok")
+        assert second.wait(timeout=10) == 0
+        assert second.pid != first.pid
+        assert pool.idle_count == 1
+
+    def test_runner_reused_up_to_max_jobs(self, make_pool) -> None:
+        """Test a runner serves max_jobs workflows before it is retired."""
+        pool = make_pool(max_jobs=2)
+        pool.start()
+        runner_pid = pool._idle[0].process.pid
+        jobs = []
+        for issue_id in (1, 2):
+            job = pool.submit(issue_id, f"adw0000{issue_id}", "ok")
+            job.wait(timeout=10)
+            jobs.append(job)
+        assert [job.pid for job in jobs] == [runner_pid, runner_pid]
+        assert [job.returncode for job in jobs] == [0, 0]
+        third = pool.submit(3, "adw00003", "ok")
+        third.wait(timeout=10)
+        assert third.pid != runner_pid
+
+    def test_wait_timeout_and_kill(self, make_pool) -> None:
+        """Test wait raises TimeoutExpired and kill terminates the runner."""
+        pool = make_pool()
+        job = pool.submit(1, "adw12345", "hang")
+        with pytest.raises(subprocess.TimeoutExpired):
+            job.wait(timeout=0.2)
+        assert job.poll() is None
+        job.kill()
+        assert job.wait(timeout=10) < 0
+
+    def test_closed_pool_rejects_jobs(self, make_pool) -> None:
+        """Test close() stops idle runners and later submissions fail."""
+        pool = make_pool(size=2)
+        pool.start()
+        runners = list(pool._idle)
+        pool.close()
+        assert pool.idle_count == 0
+        assert all(not runner.process.is_alive() for runner in runners)
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.submit(1, "adw12345", "ok")
+
+    def test_dead_idle_runner_is_replaced(self, make_pool) -> None:
+        """Test an idle runner that died is pruned and replaced on the next start."""
+        pool = make_pool()
+        pool.start()
+        runner = pool._idle[0]
+        runner.process.kill()
+        runner.process.join()
+        pool.start()
+        assert pool.idle_count == 1
+        assert pool._idle[0] is not runner
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [({"size": 0}, "size must be positive"), ({"size": 1, "max_jobs": 0}, "max_jobs")],
+    )
+    def test_rejects_invalid_parameters(self, kwargs: dict, message: str) -> None:
+        """Test invalid pool parameters raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            WarmRunnerPool(**kwargs)
+
+
+class TestWorkerWarmPool:
+    """Tests for worker integration with the warm runner pool."""
+
+    @pytest.fixture
+    def pool_worker(self, monkeypatch: pytest.MonkeyPatch) -> IssueWorker:
+        """Create a worker with a (not yet started) warm pool."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+        config = WorkerConfig(worker_id="test-pool", warm_pool=2, workflow_timeout=30)
+        with (
+            patch("rouge.worker.worker.read_worker_artifact", return_value=None),
+            patch("rouge.worker.worker.write_worker_artifact"),
+        ):
+            return IssueWorker(config)
+
+    def test_workflow_runs_on_pool(self, pool_worker: IssueWorker) -> None:
+        """Test claimed workflows are submitted to the pool, not spawned."""
+        with (
+            patch.object(pool_worker, "_runner_pool") as mock_pool,
+            patch("rouge.worker.worker.subprocess.run") as mock_run,
+            patch("rouge.worker.worker.update_issue_status") as mock_update,
+        ):
+            mock_pool.submit.return_value.wait.return_value = 0
+            result = pool_worker.execute_workflow(7, "desc", "claimed", "full", "adw00007")
+
+        assert result is True
+        mock_run.assert_not_called()
+        mock_pool.submit.assert_called_once_with(7, "adw00007", "full")
+        mock_pool.submit.return_value.wait.assert_called_once_with(timeout=30)
+        assert [c.args[1] for c in mock_update.call_args_list] == ["started", "completed"]
+
+    def test_run_starts_and_closes_pool(self, pool_worker: IssueWorker) -> None:
+        """Test the worker loop warms the pool up front and closes it on exit."""
+        pool_worker.running = False
+        with patch.object(pool_worker, "_runner_pool") as mock_pool:
+            pool_worker.run()
+
+        mock_pool.start.assert_called_once()
+        mock_pool.close.assert_called_once()
+
+    def test_warm_pool_from_cli(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --warm-pool options are parsed and passed to WorkerConfig."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
+        runner = CliRunner()
+
+        with patch("rouge.worker.cli.IssueWorker") as mock_worker_class:
+            result = runner.invoke(
+                worker_app,
+                ["--worker-id", "w", "--warm-pool", "3", "--warm-pool-max-jobs", "5"],
+            )
+
+        assert result.exit_code == 0, result.output
+        config = mock_worker_class.call_args[0][0]
+        assert (config.warm_pool, config.warm_pool_max_jobs) == (3, 5)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"warm_pool": -1}, "warm_pool must be non-negative"),
+            ({"warm_pool": 1, "warm_pool_max_jobs": 0}, "warm_pool_max_jobs must be positive"),
+            ({"warm_pool": 1, "in_process": True}, "mutually exclusive"),
+        ],
+    )
+    def test_config_validation(self, kwargs: dict, message: str) -> None:
+        """Test invalid warm pool settings are rejected."""
+        with pytest.raises(ValueError, match=message):
+            WorkerConfig(worker_id="test", **kwargs)
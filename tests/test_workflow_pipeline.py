@@ -307,6 +307,20 @@ class TestWorkflowRunner:
         assert step3.call_count == 1
         assert "Rerun requested for unknown step 'NonExistent', ignoring" in caplog.text
 
+    def test_run_logs_issue_cache_savings(self, caplog, tmp_path):
+        """The runner reports issue cache hits and misses for its pipeline type."""
+        runner = WorkflowRunner([DummyStep("Step 1")])
+
+        with caplog.at_level(logging.INFO):
+            with patch(_WORKING_DIR_PATCH, return_value=str(tmp_path)):
+                with patch("rouge.core.workflow.pipeline.invalidate_issue") as mock_invalidate:
+                    runner.run(issue_id=3, adw_id="test-cache-stats", pipeline_type="patch")
+
+        mock_invalidate.assert_called_once_with(3)
+        assert "Issue cache for patch pipeline: 0 hits (round trips saved), 0 misses" in (
+            caplog.text
+        )
+
 
 class TestGetPatchPipeline:
     def test_patch_pipeline_structure_no_platform(self, monkeypatch):